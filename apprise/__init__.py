@@ -55,6 +55,7 @@ from .common import (
     ConfigFormat,
     ContentIncludeMode,
     ContentLocation,
+    LengthUnit,
     NotifyFormat,
     NotifyImageSize,
     NotifyType,
@@ -69,6 +70,8 @@ from .logger import LOGGER_NAME, LogCapture, logger, logging
 from .manager_attachment import AttachmentManager
 from .manager_config import ConfigurationManager
 from .manager_plugins import NotificationManager
+from .metrics import AppriseMetrics, MetricsAggregator, MetricsExporter
+from .persistent_queue import PersistentQueue
 from .persistent_store import PersistentStore
 from .plugins.base import NotifyBase
 from .tag import AppriseTag
@@ -94,6 +97,7 @@ __all__ = [
     "AppriseAttachment",
     "AppriseConfig",
     "AppriseLocale",
+    "AppriseMetrics",
     "AppriseTag",
     "AttachBase",
     "AttachmentManager",
@@ -102,7 +106,10 @@ __all__ = [
     "ConfigurationManager",
     "ContentIncludeMode",
     "ContentLocation",
+    "LengthUnit",
     "LogCapture",
+    "MetricsAggregator",
+    "MetricsExporter",
     # Managers
     "NotificationManager",
     "NotifyBase",
@@ -111,6 +118,7 @@ __all__ = [
     # Reference
     "NotifyType",
     "OverflowMode",
+    "PersistentQueue",
     "PersistentStore",
     "PersistentStoreMode",
     "PrivacyMode",
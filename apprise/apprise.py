@@ -30,6 +30,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Iterator
 import concurrent.futures as cf
+import contextlib
 from itertools import chain
 import json
 import os
@@ -40,19 +41,23 @@ from . import __version__, common, plugins
 from .apprise_attachment import AppriseAttachment
 from .apprise_config import AppriseConfig
 from .asset import AppriseAsset
+from .attachment.memory import AttachMemory
 from .common import ContentLocation
 from .config.base import ConfigBase
-from .conversion import convert_between
+from .conversion import CONVERSION_CACHE, convert_between
 from .emojis import apply_emojis
 from .locale import AppriseLocale
 from .logger import logger
 from .manager_plugins import NotificationManager
+from .metrics import span
+from .persistent_queue import PersistentQueue, dump_tag
 from .plugins.base import NotifyBase
 from .tag import AppriseTag
 from .utils.cwe312 import cwe312_url
 from .utils.json import AppriseJSONEncoder
-from .utils.logic import is_exclusive_match
+from .utils.logic import TagIndex, TagMatcher
 from .utils.parse import parse_list, parse_urls
+from .utils.pool import WorkerPool
 
 # Grant access to our Notification Manager Singleton
 N_MGR = NotificationManager()
@@ -89,6 +94,9 @@ class Apprise:
         # Initialize a server list of URLs
         self.servers = []
 
+        # An inverted index of our services by the tags they carry
+        self._tag_index = TagIndex().sync(self.servers)
+
         # Assigns an central asset object that will be later passed into each
         # notification plugin.  Assets contain information such as the local
         # directory images can be found in. It can also identify remote
@@ -112,6 +120,29 @@ class Apprise:
         # restrictions.
         self.location = location
 
+        # Our worker pool; shared by every threaded notify() dispatch
+        self._pool = WorkerPool(
+            max_workers=self.asset.notify_max_workers,
+            key_max_workers=self.asset.notify_service_max_workers,
+        )
+
+    def close(self) -> None:
+        """Releases the worker threads used to send notifications in
+        parallel.
+
+        The Apprise object remains usable afterwards; new workers are simply
+        created the next time they are required.
+        """
+        self._pool.close()
+
+    def __enter__(self) -> Apprise:
+        """Support the 'with' statement."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Release our worker threads when leaving the 'with' statement."""
+        self.close()
+
     @staticmethod
     def instantiate(
         url: Union[str, dict],
@@ -308,6 +339,7 @@ class Apprise:
         elif isinstance(servers, (ConfigBase, NotifyBase, AppriseConfig)):
             # Go ahead and just add our plugin into our list
             self.servers.append(servers)
+            self._tag_index.add(servers)
             return True
 
         elif not isinstance(servers, (tuple, set, list)):
@@ -321,6 +353,7 @@ class Apprise:
             if isinstance(server, (ConfigBase, NotifyBase, AppriseConfig)):
                 # Go ahead and just add our plugin into our list
                 self.servers.append(server)
+                self._tag_index.add(server)
                 continue
 
             elif not isinstance(server, (str, dict)):
@@ -342,6 +375,7 @@ class Apprise:
 
             # Add our initialized plugin to our server listings
             self.servers.append(instance)
+            self._tag_index.add(instance)
 
         # Return our status
         return return_status
@@ -349,13 +383,18 @@ class Apprise:
     def clear(self) -> None:
         """Empties our server list."""
         self.servers[:] = []
+        self._tag_index.sync(self.servers)
 
     def find(
         self,
         tag: Any = common.MATCH_ALL_TAG,
         match_always: bool = True,
     ) -> Iterator[NotifyBase]:
-        """Returns a list of all servers matching against the tag specified."""
+        """Returns a list of all servers matching against the tag specified.
+
+        The tag may also be a TagMatcher that was previously compiled; in
+        which case the match_always it was compiled with is used instead.
+        """
 
         # Build our tag setup
         #   - top level entries are treated as an 'or'
@@ -368,8 +407,27 @@ class Apprise:
         #     tag=[('tagB', 'tagC')]          = tagB and tagC
 
         # A match_always flag allows us to pick up on our 'any' keyword
-        # and notify these services under all circumstances
-        match_always = common.MATCH_ALWAYS_TAG if match_always else None
+        # and notify these services under all circumstances.  The tag logic
+        # is only compiled once (if it wasn't already) for all of our servers.
+        matcher = TagMatcher.compile(
+            tag,
+            match_all=common.MATCH_ALL_TAG,
+            match_always=common.MATCH_ALWAYS_TAG if match_always else None,
+        )
+
+        # Use our tag index to identify the servers that could match
+        index = self._tag_index.sync(self.servers)
+        candidates = matcher.candidates(index)
+        if (
+            candidates is not None
+            and not index.configs
+            and not index.duplicates
+        ):
+            # Every server we need is indexed
+            for server in index.ordered(candidates):
+                if matcher.match(server.tags):
+                    yield server
+            return
 
         # Iterate over our loaded plugins
         for entry in self.servers:
@@ -377,6 +435,10 @@ class Apprise:
                 # load our servers
                 servers = entry.servers()
 
+            elif candidates is not None and id(entry) not in candidates:
+                # Can not match; skip it
+                continue
+
             else:
                 servers = [
                     entry,
@@ -384,12 +446,7 @@ class Apprise:
 
             for server in servers:
                 # Apply our tag matching based on our defined logic
-                if is_exclusive_match(
-                    logic=tag,
-                    data=server.tags,
-                    match_all=common.MATCH_ALL_TAG,
-                    match_always=match_always,
-                ):
+                if matcher.match(server.tags):
                     yield server
         return
 
@@ -401,21 +458,8 @@ class Apprise:
         call-level retry count.  When present it overrides each matched
         server's configured retry for this single notify() call.
         """
-        if tag is None or tag == common.MATCH_ALL_TAG:
-            return None
-        for entry in (
-            [tag] if isinstance(tag, (str, AppriseTag)) else list(tag)
-        ):
-            if isinstance(entry, (list, tuple, set)):
-                for tok in parse_list(entry):
-                    ft = AppriseTag.parse(tok)
-                    if ft.retry is not None:
-                        return ft.retry
-            else:
-                ft = AppriseTag.parse(str(entry))
-                if ft.retry is not None:
-                    return ft.retry
-        return None
+        retry_tokens = TagMatcher.compile(tag).retry_tokens
+        return retry_tokens[0].retry if retry_tokens else None
 
     @staticmethod
     def _filter_has_explicit_priority(tag):
@@ -427,20 +471,7 @@ class Apprise:
         When False, matched servers are grouped by their own tag priorities
         and dispatched in ascending order with early-True exit.
         """
-        if tag is None or tag == common.MATCH_ALL_TAG:
-            return False
-        for entry in (
-            [tag] if isinstance(tag, (str, AppriseTag)) else list(tag)
-        ):
-            if isinstance(entry, (list, tuple, set)):
-                for tok in parse_list(entry):
-                    if AppriseTag.parse(tok).has_priority:
-                        return True
-            else:
-                for tok in parse_list(str(entry)):
-                    if AppriseTag.parse(tok).has_priority:
-                        return True
-        return False
+        return TagMatcher.compile(tag).has_priority
 
     @staticmethod
     def _server_priority_for_tag_name(server, tag_name):
@@ -467,35 +498,22 @@ class Apprise:
           - no priority prefix  -> name-only match
           - explicit priority   -> name + priority-exact match
         """
-        if tag is None or tag == common.MATCH_ALL_TAG:
-            return None
-        for entry in (
-            [tag] if isinstance(tag, (str, AppriseTag)) else list(tag)
-        ):
-            tokens = (
-                parse_list(entry)
-                if isinstance(entry, (list, tuple, set))
-                else parse_list(str(entry))
-            )
-            for tok in tokens:
-                ft = AppriseTag.parse(tok)
-                if ft.retry is None:
-                    continue
-                tag_name = str(ft)
-                if not ft.has_priority:
-                    if tag_name in server.tags:
-                        return ft.retry
-                else:
-                    for stag in server.tags:
-                        if isinstance(stag, AppriseTag):
-                            if (
-                                str(stag) == tag_name
-                                and stag.priority == ft.priority
-                            ):
-                                return ft.retry
-                        else:
-                            if str(stag).lower() == tag_name:
-                                return ft.retry
+        for ft in TagMatcher.compile(tag).retry_tokens:
+            tag_name = str(ft)
+            if not ft.has_priority:
+                if tag_name in server.tags:
+                    return ft.retry
+            else:
+                for stag in server.tags:
+                    if isinstance(stag, AppriseTag):
+                        if (
+                            str(stag) == tag_name
+                            and stag.priority == ft.priority
+                        ):
+                            return ft.retry
+                    else:
+                        if str(stag).lower() == tag_name:
+                            return ft.retry
         return None
 
     @staticmethod
@@ -508,6 +526,11 @@ class Apprise:
         paths (sequential, threadpool, asyncio) pick it up automatically.
         Services with no matching retry token are left unchanged.
         """
+        tag = TagMatcher.compile(tag)
+        if not tag.retry_tokens:
+            # Nothing to inject
+            return list(all_calls)
+
         result = []
         for server, kwargs in all_calls:
             retry = Apprise._match_service_retry(server, tag)
@@ -530,37 +553,25 @@ class Apprise:
         When *tag* is MATCH_ALL_TAG or None, a single chain "" is built
         using the existing _server_priority_for_filter logic.
         """
-        if tag is None or tag == common.MATCH_ALL_TAG:
+        tag = TagMatcher.compile(tag)
+        if tag.is_all:
             chain: dict[int, list] = {}
             for server, kwargs in all_calls:
                 p = Apprise._server_priority_for_filter(server, tag)
                 chain.setdefault(p, []).append((server, kwargs))
             return {"": chain}
 
-        # Flatten OR tokens; AND groups are kept as a single opaque entry
-        # that falls through to the catch-all chain.
+        # OR tokens are flattened; AND groups are kept as a single opaque
+        # entry (an empty name) that falls through to the catch-all chain.
         #
         # The CLI wraps each --tag value in a list via parse_list(), so a
         # single --tag flag produces a single-element inner list such as
         # [["alerts:3"]].  A single-element list is always a plain OR token
-        # (there is nothing to AND against), so we treat it the same as a
+        # (there is nothing to AND against), so it is treated the same as a
         # bare string.  A multi-element inner list is a genuine AND condition
         # (the server must carry every tag in the group) and falls through to
         # the catch-all chain instead of getting its own independent chain.
-        or_tag_names: list[str] = []
-        for entry in (
-            [tag] if isinstance(tag, (str, AppriseTag)) else list(tag)
-        ):
-            if isinstance(entry, (list, tuple, set)):
-                flat = parse_list(*entry) if entry else []
-                if len(flat) == 1:
-                    # single OR token wrapped in a list (CLI convention)
-                    or_tag_names.append(str(AppriseTag.parse(flat[0])))
-                else:
-                    or_tag_names.append("")  # AND group placeholder
-            else:
-                for tok in parse_list(str(entry)):
-                    or_tag_names.append(str(AppriseTag.parse(tok)))
+        or_tag_names = tag.chain_names
 
         chains: dict[str, dict[int, list]] = {}
         for server, kwargs in all_calls:
@@ -591,20 +602,12 @@ class Apprise:
         match, the minimum (highest-precedence) priority is returned.
         Returns 0 when no matching priority tag is found.
         """
-        if tag is None or tag == common.MATCH_ALL_TAG:
+        tag = TagMatcher.compile(tag)
+        if tag.is_all:
             return 0
 
-        # Flatten the filter to a set of bare lowercase tag names.
-        filter_names = set()
-        for entry in (
-            [tag] if isinstance(tag, (str, AppriseTag)) else list(tag)
-        ):
-            if isinstance(entry, (list, tuple, set)):
-                for t in parse_list(entry):
-                    filter_names.add(str(AppriseTag.parse(t)))
-            else:
-                for t in parse_list(str(entry)):
-                    filter_names.add(str(AppriseTag.parse(t)))
+        # The filter flattened to a set of bare lowercase tag names.
+        filter_names = tag.names
 
         priorities = [
             stag.priority if isinstance(stag, AppriseTag) else 0
@@ -664,6 +667,13 @@ class Apprise:
         as turning a \n into an actual new line, etc.
         """
 
+        # Compile our tag filter once; it is shared by the server lookup and
+        # all of the dispatch decisions made below
+        tag = TagMatcher.compile(
+            tag,
+            match_always=common.MATCH_ALWAYS_TAG if match_always else None,
+        )
+
         try:
             all_calls = list(
                 self._create_notify_gen(
@@ -690,6 +700,20 @@ class Apprise:
         # to devops-tagged services, not to management-tagged services).
         all_calls = Apprise._inject_per_service_retries(all_calls, tag)
 
+        # Remote attachments are retrieved (concurrently) up front
+        self._prefetch_attachments(all_calls)
+
+        # Attachments are read and encoded once for every service notified
+        with Apprise._shared_attachments(all_calls):
+            return self._notify_calls(all_calls, tag)
+
+    def _notify_calls(
+        self,
+        all_calls: list[tuple[NotifyBase, dict[str, Any]]],
+        tag: Any,
+    ) -> bool:
+        """Dispatches the calls prepared by notify()."""
+
         if Apprise._filter_has_explicit_priority(tag):
             # Tag filter carries an explicit priority prefix (e.g. "2:alerts").
             # Skip the escalation chain: dispatch all matched services as a
@@ -702,7 +726,7 @@ class Apprise:
                 Apprise._notify_sequential(*sequential) if sequential else True
             )
             par_ok = (
-                Apprise._notify_parallel_threadpool(*parallel)
+                Apprise._notify_parallel_threadpool(*parallel, pool=self._pool)
                 if parallel
                 else True
             )
@@ -727,9 +751,36 @@ class Apprise:
             seq = [(s, k) for s, k in batch if not s.asset.async_mode]
             par = [(s, k) for s, k in batch if s.asset.async_mode]
             seq_ok = Apprise._notify_sequential(*seq) if seq else True
-            par_ok = Apprise._notify_parallel_threadpool(*par) if par else True
+            par_ok = (
+                Apprise._notify_parallel_threadpool(*par, pool=self._pool)
+                if par
+                else True
+            )
             return seq_ok and par_ok
 
+        def _submit_batch(batch):
+            """Submit one priority-group batch to our worker pool.
+
+            The sequential services of the batch share a single worker while
+            the parallel ones are each given their own.  Work is never
+            submitted from within a worker, so a bounded pool can not
+            deadlock waiting on itself.
+            """
+            seq = [(s, k) for s, k in batch if not s.asset.async_mode]
+            par = [(s, k) for s, k in batch if s.asset.async_mode]
+            futures = (
+                [self._pool.submit(Apprise._notify_sequential, *seq)]
+                if seq
+                else []
+            )
+            futures.extend(
+                self._pool.submit(
+                    Apprise._call_with_retry, s, k, key=s.__class__
+                )
+                for s, k in par
+            )
+            return futures
+
         # Per-chain state: priorities (sorted), groups dict, current index,
         # and a flag marking whether a successful group has been found.
         chain_states = {
@@ -773,27 +824,31 @@ class Apprise:
             else:
                 # Multiple active chains: run their current-priority batches
                 # concurrently so independent chains don't block each other.
-                with cf.ThreadPoolExecutor() as executor:
-                    future_map = {
-                        executor.submit(
-                            _run_batch,
-                            st["groups"][st["priorities"][st["idx"]]],
-                        ): (key, st)
-                        for key, st in active
-                    }
-                    for future in cf.as_completed(future_map):
-                        _, st = future_map[future]
+                pending = []
+                for _, st in active:
+                    try:
+                        futures = _submit_batch(
+                            st["groups"][st["priorities"][st["idx"]]]
+                        )
+                    except Exception:
+                        logger.exception("Unhandled Notification Exception")
+                        futures = None
+                    pending.append((st, futures))
+
+                for st, futures in pending:
+                    ok = futures is not None
+                    for future in futures or ():
                         try:
-                            ok = future.result()
+                            ok = future.result() and ok
                         except Exception:
                             logger.exception(
                                 "Unhandled Notification Exception"
                             )
                             ok = False
-                        if ok:
-                            st["succeeded"] = True
-                        else:
-                            st["idx"] += 1  # escalate to next priority
+                    if ok:
+                        st["succeeded"] = True
+                    else:
+                        st["idx"] += 1  # escalate to next priority
 
         return all(st["succeeded"] for st in chain_states.values())
 
@@ -803,6 +858,14 @@ class Apprise:
 
         The arguments are identical to those of Apprise.notify().
         """
+        if "tag" in kwargs:
+            # Compile our tag filter once (see notify())
+            kwargs["tag"] = TagMatcher.compile(
+                kwargs["tag"],
+                match_always=common.MATCH_ALWAYS_TAG
+                if kwargs.get("match_always", True)
+                else None,
+            )
         tag = kwargs.get("tag", common.MATCH_ALL_TAG)
 
         try:
@@ -817,6 +880,24 @@ class Apprise:
         # Inject per-service call-time retry overrides (same logic as notify).
         all_calls = Apprise._inject_per_service_retries(all_calls, tag)
 
+        # Remote attachments are retrieved (concurrently) up front without
+        # blocking our event loop
+        if Apprise._attachments(all_calls):
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._prefetch_attachments, all_calls
+            )
+
+        # Attachments are read and encoded once for every service notified
+        with Apprise._shared_attachments(all_calls):
+            return await self._async_notify_calls(all_calls, tag)
+
+    async def _async_notify_calls(
+        self,
+        all_calls: list[tuple[NotifyBase, dict[str, Any]]],
+        tag: Any,
+    ) -> bool:
+        """Dispatches the calls prepared by async_notify()."""
+
         if Apprise._filter_has_explicit_priority(tag):
             # Explicit priority prefix: flat dispatch, no escalation.
             sequential = [
@@ -905,6 +986,107 @@ class Apprise:
 
         return all(st["succeeded"] for st in chain_states.values())
 
+    def enqueue(
+        self,
+        body: Union[str, bytes],
+        title: Union[str, bytes] = "",
+        notify_type: Union[str, common.NotifyType] = common.NotifyType.INFO,
+        body_format: Optional[str] = None,
+        tag: Any = common.MATCH_ALL_TAG,
+        match_always: bool = True,
+        attach: Any = None,
+        interpret_escapes: Optional[bool] = None,
+    ) -> Optional[bool]:
+        """Queues a notification to all the plugins previously loaded and
+        returns immediately.
+
+        The notification is written to the persistent queue found within the
+        persistent storage path and is delivered later by a worker draining
+        the queue (see PersistentQueue).  Delivery follows the same retry and
+        escalation rules notify() does.
+
+        The queued notification must be deliverable by another process, so
+        the full URL of every matched service (including any passwords,
+        tokens or API keys it contains) is written to the queue in plain
+        text.  The persistent storage path should be protected accordingly.
+
+        This function returns True if the notification was queued, False if it
+        could not be, and None if there was nothing to notify as a result of
+        tag filtering.
+        """
+
+        if (
+            not self.asset.storage_path
+            or self.asset.storage_mode == common.PersistentStoreMode.MEMORY
+        ):
+            logger.warning(
+                "Notifications can not be queued without persistent storage"
+            )
+            return False
+
+        servers = [
+            {
+                "url": server.url(privacy=False),
+                "tag": [dump_tag(t) for t in server.tags],
+            }
+            for server in self.find(tag=tag, match_always=match_always)
+        ]
+
+        if not servers:
+            return None
+
+        attachments = []
+        if attach is not None:
+            if not isinstance(attach, AppriseAttachment):
+                attach = AppriseAttachment(
+                    attach, asset=self.asset, location=self.location
+                )
+
+            for attachment in attach:
+                if isinstance(attachment, AttachMemory):
+                    # Our content only exists within this process
+                    logger.warning(
+                        "Memory based attachments can not be queued"
+                    )
+                    return False
+
+                attachments.append(attachment.url(privacy=False))
+
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+
+        if isinstance(title, bytes):
+            title = title.decode("utf-8", errors="replace")
+
+        return bool(
+            PersistentQueue(self.asset.storage_path).put(
+                {
+                    "servers": servers,
+                    "body": body,
+                    "title": title or "",
+                    "notify_type": (
+                        notify_type.value
+                        if isinstance(notify_type, common.NotifyType)
+                        else notify_type
+                    ),
+                    "body_format": (
+                        body_format.value
+                        if isinstance(body_format, common.NotifyFormat)
+                        else body_format
+                    )
+                    or self.asset.body_format,
+                    "tag": dump_tag(tag),
+                    "match_always": match_always,
+                    "attach": attachments,
+                    "interpret_escapes": (
+                        self.asset.interpret_escapes
+                        if interpret_escapes is None
+                        else interpret_escapes
+                    ),
+                }
+            )
+        )
+
     def _create_notify_calls(self, *args, **kwargs):
         """Creates notifications for all the plugins loaded.
 
@@ -999,8 +1181,24 @@ class Apprise:
             else interpret_escapes
         )
 
+        metrics = self.asset.metrics
+        with span(metrics, "find"):
+            servers = list(self.find(tag, match_always=match_always))
+
+        # Identifies our content within our conversion cache
+        digests = (
+            (
+                CONVERSION_CACHE.digest(title or ""),
+                CONVERSION_CACHE.digest(body),
+            )
+            if self.asset.conversion_cache
+            and isinstance(body, str)
+            and isinstance(title or "", str)
+            else None
+        )
+
         # Iterate over our loaded plugins
-        for server in self.find(tag, match_always=match_always):
+        for server in servers:
             # If our code reaches here, we either did not define a tag (it
             # was set to None), or we did define a tag and the logic above
             # determined we need to notify the service it's associated with
@@ -1019,23 +1217,36 @@ class Apprise:
                 # pulled out of the notification
                 key += "-emojis"
 
+            if key not in conversion_title_map and digests:
+                # Content prepared identically before (on a previous call)
+                # is re-used as is
+                cached = CONVERSION_CACHE.get(
+                    (body_format, key, interpret_escapes, *digests)
+                )
+                if cached is not None:
+                    (
+                        conversion_title_map[key],
+                        conversion_body_map[key],
+                    ) = cached
+
             if key not in conversion_title_map:
                 # Prepare our title
                 conversion_title_map[key] = title if title else ""
 
-                # Conversion of title only occurs for services where the title
-                # is blended with the body (title_maxlen <= 0)
-                if conversion_title_map[key] and server.title_maxlen <= 0:
-                    conversion_title_map[key] = convert_between(
-                        body_format,
-                        server.notify_format,
-                        content=conversion_title_map[key],
-                    )
+                with span(metrics, "convert"):
+                    # Conversion of title only occurs for services where the
+                    # title is blended with the body (title_maxlen <= 0)
+                    if conversion_title_map[key] and server.title_maxlen <= 0:
+                        conversion_title_map[key] = convert_between(
+                            body_format,
+                            server.notify_format,
+                            content=conversion_title_map[key],
+                        )
 
-                # Our body is always converted no matter what
-                conversion_body_map[key] = convert_between(
-                    body_format, server.notify_format, content=body
-                )
+                    # Our body is always converted no matter what
+                    conversion_body_map[key] = convert_between(
+                        body_format, server.notify_format, content=body
+                    )
 
                 if interpret_escapes:
                     #
@@ -1068,11 +1279,21 @@ class Apprise:
                     # Convert our :emoji: definitions
                     #
 
-                    conversion_body_map[key] = apply_emojis(
-                        conversion_body_map[key]
-                    )
-                    conversion_title_map[key] = apply_emojis(
-                        conversion_title_map[key]
+                    with span(metrics, "emojis"):
+                        conversion_body_map[key] = apply_emojis(
+                            conversion_body_map[key]
+                        )
+                        conversion_title_map[key] = apply_emojis(
+                            conversion_title_map[key]
+                        )
+
+                if digests:
+                    CONVERSION_CACHE.put(
+                        (body_format, key, interpret_escapes, *digests),
+                        (conversion_title_map[key], conversion_body_map[key]),
+                        CONVERSION_CACHE.sizeof(
+                            conversion_title_map[key], conversion_body_map[key]
+                        ),
                     )
 
             kwargs = {
@@ -1084,6 +1305,38 @@ class Apprise:
             }
             yield (server, kwargs)
 
+    @staticmethod
+    def _shared_attachments(
+        all_calls: list[tuple[NotifyBase, dict[str, Any]]],
+    ) -> contextlib.AbstractContextManager:
+        """Returns a context during which the attachments common to all of the
+        calls memoize their encoded content (see AppriseAttachment.shared()).
+        """
+        attach = Apprise._attachments(all_calls)
+        return attach.shared() if attach else contextlib.nullcontext()
+
+    def _prefetch_attachments(
+        self,
+        all_calls: list[tuple[NotifyBase, dict[str, Any]]],
+    ) -> None:
+        """Retrieves the remote attachments common to all of the calls before
+        they are dispatched (see AppriseAttachment.prefetch())."""
+        attach = Apprise._attachments(all_calls)
+        if attach:
+            attach.prefetch(
+                timeout=self.asset.attach_prefetch_timeout,
+                max_workers=self.asset.attach_max_workers,
+            )
+
+    @staticmethod
+    def _attachments(
+        all_calls: list[tuple[NotifyBase, dict[str, Any]]],
+    ) -> Optional[AppriseAttachment]:
+        """Returns the attachments common to all of the calls (if any)."""
+        return next(
+            (k["attach"] for _, k in all_calls if k.get("attach")), None
+        )
+
     @staticmethod
     def _notify_sequential(*servers_kwargs):
         """Process a list of notify() calls sequentially and synchronously.
@@ -1091,7 +1344,8 @@ class Apprise:
         Each server is attempted once and then retried up to server.retry
         additional times on failure before moving on.  When server.wait is
         greater than zero, the process sleeps that many seconds between
-        each retry attempt.
+        each retry attempt; services rate limited by their upstream server
+        back off instead (see _retry_delay()).
 
         A per-call retry override may be injected into kwargs under the key
         ``_retry_override``; when present it takes precedence over the
@@ -1112,36 +1366,42 @@ class Apprise:
             retry = kwargs.pop("_retry_override", getattr(server, "retry", 0))
             wait = getattr(server, "wait", 0.0)
 
-            result = False
-            for attempt in range(retry + 1):
-                # Attempt delivery.  TypeError comes from Apprise's own
-                # validation; bare Exception guards against buggy or
-                # third-party plugins (including @notify decorators) that
-                # may raise unexpectedly.  Both are treated as failure so
-                # the retry loop can continue.
-                try:
-                    result = server.notify(**kwargs)
-                except TypeError:
-                    result = False
-                except Exception:
-                    logger.exception("Unhandled Notification Exception")
-                    result = False
-
-                if result:
-                    # Delivered successfully; no need to retry this server.
-                    break
+            with Apprise._span(server) as sp:
+                result = False
+                for attempt in range(retry + 1):
+                    # Attempt delivery.  TypeError comes from Apprise's
+                    # own validation; bare Exception guards against buggy or
+                    # third-party plugins (including @notify decorators)
+                    # that may raise unexpectedly.  Both are treated as
+                    # failure so the retry loop can continue.
+                    try:
+                        result = server.notify(**kwargs)
+                    except TypeError:
+                        result = False
+                    except Exception:
+                        logger.exception("Unhandled Notification Exception")
+                        result = False
+
+                    if result:
+                        # Delivered successfully; no need to retry this
+                        # server.
+                        break
+
+                    if attempt < retry:
+                        # Delivery failed and retries remain.  Log the
+                        # attempt number and pause before the next try.
+                        logger.warning(
+                            "Retry %d/%d for %s",
+                            attempt + 1,
+                            retry,
+                            server.service_name,
+                        )
+                        delay = Apprise._retry_delay(server, attempt, wait)
+                        if delay > 0:
+                            time.sleep(delay)
 
-                if attempt < retry:
-                    # Delivery failed and retries remain.  Log the attempt
-                    # number and pause before the next try.
-                    logger.warning(
-                        "Retry %d/%d for %s",
-                        attempt + 1,
-                        retry,
-                        server.service_name,
-                    )
-                    if wait > 0:
-                        time.sleep(wait)
+                sp.retries = attempt
+                sp.success = bool(result)
 
             # Optional-service check.
             #
@@ -1177,13 +1437,16 @@ class Apprise:
         return success
 
     @staticmethod
-    def _notify_parallel_threadpool(*servers_kwargs):
+    def _notify_parallel_threadpool(*servers_kwargs, pool=None):
         """Process a list of notify() calls in parallel via a thread pool.
 
         Each server runs in its own thread.  Within each thread, the server
         is retried up to server.retry additional times on failure with an
         optional server.wait second sleep between each attempt.
 
+        The workers are drawn from the provided WorkerPool so they can be
+        re-used across calls; a temporary pool is used if none is provided.
+
         Falls back to _notify_sequential() when only a single server is
         given to avoid the overhead of spawning a thread pool for one call.
 
@@ -1206,18 +1469,69 @@ class Apprise:
             "Notifying %d service(s) with threads.", len(servers_kwargs)
         )
 
-        def _call_with_retry(server, kwargs):
-            """Execute one server's notify() with retry/wait logic.
+        if pool is None:
+            # Use a temporary pool for the duration of this call
+            with WorkerPool() as pool:
+                return Apprise._notify_parallel_threadpool(
+                    *servers_kwargs, pool=pool
+                )
 
-            Runs inside a worker thread.  Pops ``_retry_override`` from
-            kwargs so it is never forwarded to the plugin's notify() call.
-            Exceptions are caught and treated as failures so the retry
-            loop continues even when a plugin raises unexpectedly.
-            """
-            # Pop the per-call override so it stays internal.
-            retry = kwargs.pop("_retry_override", getattr(server, "retry", 0))
-            wait = getattr(server, "wait", 0.0)
+        # Submit all server calls to the thread pool and collect results.
+        success = True
+        futures = [
+            pool.submit(
+                Apprise._call_with_retry, server, kwargs, key=server.__class__
+            )
+            for (server, kwargs) in servers_kwargs
+        ]
+
+        for future in cf.as_completed(futures):
+            # future.result() re-raises any exception that escaped
+            # _call_with_retry (should not happen given the inner
+            # try/except, but guard here as a safety net).
+            try:
+                success = success and future.result()
+            except Exception:
+                logger.exception("Unhandled Notification Exception")
+                success = False
+
+        return success
+
+    @staticmethod
+    def _span(server):
+        """Returns the metrics span timing the delivery to the server
+        provided (including all of its retries)."""
+        if not isinstance(server, NotifyBase) or server.asset.metrics is None:
+            return span(None, "notify")
+
+        return server.asset.metrics.span(
+            "notify", server.service_name, server.url_id()
+        )
+
+    @staticmethod
+    def _retry_delay(server, attempt, wait):
+        """Returns the number of seconds to wait for before retrying the
+        server provided; servers rate limited by their upstream back off
+        (see NotifyBase.retry_delay())."""
+        if isinstance(server, NotifyBase):
+            return server.retry_delay(attempt, wait)
+
+        return wait
 
+    @staticmethod
+    def _call_with_retry(server, kwargs):
+        """Execute one server's notify() with retry/wait logic.
+
+        Runs inside a worker thread of our pool.  Pops ``_retry_override``
+        from kwargs so it is never forwarded to the plugin's notify() call.
+        Exceptions are caught and treated as failures so the retry loop
+        continues even when a plugin raises unexpectedly.
+        """
+        # Pop the per-call override so it stays internal.
+        retry = kwargs.pop("_retry_override", getattr(server, "retry", 0))
+        wait = getattr(server, "wait", 0.0)
+
+        with Apprise._span(server) as sp:
             result = False
             for attempt in range(retry + 1):
                 # Same exception handling as _notify_sequential: TypeError
@@ -1232,7 +1546,7 @@ class Apprise:
                     result = False
 
                 if result:
-                    return True
+                    break
 
                 if attempt < retry:
                     logger.warning(
@@ -1241,54 +1555,38 @@ class Apprise:
                         retry,
                         server.service_name,
                     )
-                    if wait > 0:
-                        time.sleep(wait)
-
-            # Optional-service check (thread-pool path).
-            #
-            # All retry attempts for this server have been exhausted by the
-            # loop above.  If the final result is still False and the service
-            # is tagged as optional, return True from this worker function
-            # instead of False.  The caller (_notify_parallel_threadpool)
-            # collects each worker's return value via future.result() and
-            # ANDs them together; returning True here prevents this worker's
-            # failure from tainting the aggregate result.
-            #
-            # This is the thread-pool equivalent of the same check in
-            # _notify_sequential.  See the comment there for a full
-            # explanation of the getattr() guard and the retry interaction.
-            if not result and getattr(server, "optional", False):
-                logger.info(
-                    "Optional service '%s' failed; ignoring failure.",
-                    server.service_name,
-                )
-                # Return True so future.result() in the caller reports
-                # success for this optional worker thread.
-                return True
+                    delay = Apprise._retry_delay(server, attempt, wait)
+                    if delay > 0:
+                        time.sleep(delay)
 
-            # Every attempt for this service failed and it is not optional;
-            # propagate the failure to the caller.
-            return result
+            sp.retries = attempt
+            sp.success = bool(result)
 
-        # Submit all server calls to the thread pool and collect results.
-        with cf.ThreadPoolExecutor() as executor:
-            success = True
-            futures = [
-                executor.submit(_call_with_retry, server, kwargs)
-                for (server, kwargs) in servers_kwargs
-            ]
-
-            for future in cf.as_completed(futures):
-                # future.result() re-raises any exception that escaped
-                # _call_with_retry (should not happen given the inner
-                # try/except, but guard here as a safety net).
-                try:
-                    success = success and future.result()
-                except Exception:
-                    logger.exception("Unhandled Notification Exception")
-                    success = False
+        # Optional-service check (thread-pool path).
+        #
+        # All retry attempts for this server have been exhausted by the
+        # loop above.  If the final result is still False and the service
+        # is tagged as optional, return True from this worker function
+        # instead of False.  The caller (_notify_parallel_threadpool)
+        # collects each worker's return value via future.result() and
+        # ANDs them together; returning True here prevents this worker's
+        # failure from tainting the aggregate result.
+        #
+        # This is the thread-pool equivalent of the same check in
+        # _notify_sequential.  See the comment there for a full
+        # explanation of the getattr() guard and the retry interaction.
+        if not result and getattr(server, "optional", False):
+            logger.info(
+                "Optional service '%s' failed; ignoring failure.",
+                server.service_name,
+            )
+            # Return True so future.result() in the caller reports
+            # success for this optional worker thread.
+            return True
 
-            return success
+        # Every attempt for this service failed and it is not optional;
+        # propagate the failure to the caller.
+        return result
 
     @staticmethod
     async def _notify_parallel_asyncio(*servers_kwargs):
@@ -1329,32 +1627,38 @@ class Apprise:
             retry = kwargs.pop("_retry_override", getattr(server, "retry", 0))
             wait = getattr(server, "wait", 0.0)
 
-            result = False
-            for attempt in range(retry + 1):
-                # Mirror the exception handling from the synchronous paths:
-                # TypeError from Apprise's own validation layer and bare
-                # Exception for any plugin that raises unexpectedly are both
-                # treated as retriable failures rather than hard crashes.
-                try:
-                    result = await server.async_notify(**kwargs)
-                except TypeError:
-                    result = False
-                except Exception:
-                    logger.exception("Unhandled Notification Exception")
-                    result = False
+            with Apprise._span(server) as sp:
+                result = False
+                for attempt in range(retry + 1):
+                    # Mirror the exception handling from the synchronous
+                    # paths: TypeError from Apprise's own validation layer
+                    # and bare Exception for any plugin that raises
+                    # unexpectedly are both treated as retriable failures
+                    # rather than hard crashes.
+                    try:
+                        result = await server.async_notify(**kwargs)
+                    except TypeError:
+                        result = False
+                    except Exception:
+                        logger.exception("Unhandled Notification Exception")
+                        result = False
+
+                    if result:
+                        break
+
+                    if attempt < retry:
+                        logger.warning(
+                            "Retry %d/%d for %s",
+                            attempt + 1,
+                            retry,
+                            server.service_name,
+                        )
+                        delay = Apprise._retry_delay(server, attempt, wait)
+                        if delay > 0:
+                            await asyncio.sleep(delay)
 
-                if result:
-                    return True
-
-                if attempt < retry:
-                    logger.warning(
-                        "Retry %d/%d for %s",
-                        attempt + 1,
-                        retry,
-                        server.service_name,
-                    )
-                    if wait > 0:
-                        await asyncio.sleep(wait)
+                sp.retries = attempt
+                sp.success = bool(result)
 
             # Optional-service check (asyncio coroutine path).
             #
@@ -1580,7 +1884,9 @@ class Apprise:
             else:
                 offset = prev_offset + 1
                 if offset == index:
-                    return self.servers.pop(idx)
+                    server = self.servers.pop(idx)
+                    self._tag_index.remove(server)
+                    return server
 
             # Update our old offset
             prev_offset = offset
@@ -1646,8 +1952,13 @@ class Apprise:
     def __setstate__(self, state: dict[str, object]) -> None:
         """Pickle Support loads()"""
         self.servers = []
+        self._tag_index = TagIndex().sync(self.servers)
         self.asset = state["asset"]
         self.locale = state["locale"]
+        self._pool = WorkerPool(
+            max_workers=self.asset.notify_max_workers,
+            key_max_workers=self.asset.notify_service_max_workers,
+        )
 
         location = state.get("location")
         self.location = (
@@ -26,6 +26,8 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 from collections.abc import Iterator
+import concurrent.futures as cf
+import contextlib
 from typing import Any, Optional, Union
 
 from .asset import AppriseAsset
@@ -320,6 +322,64 @@ class AppriseAttachment:
             )
         )
 
+    @contextlib.contextmanager
+    def shared(self) -> Iterator["AppriseAttachment"]:
+        """A context during which the encoded content of every attachment is
+        memoized, so that it is only produced once no matter how many
+        services the attachments are sent to (see AttachBase.shared())."""
+        with contextlib.ExitStack() as stack:
+            for attachment in self.attachments:
+                stack.enter_context(attachment.shared())
+
+            yield self
+
+    def prefetch(
+        self,
+        timeout: Optional[float] = None,
+        max_workers: int = 8,
+    ) -> bool:
+        """Retrieves all of our remote (hosted) attachments concurrently.
+
+        Remote attachments are otherwise retrieved one after another the
+        first time they are accessed.  The timeout (in seconds) is shared by
+        all of the retrievals; those still running once it elapses carry on
+        in the background and anything accessing them waits on them.
+
+        True is returned if every remote attachment was retrieved.
+        """
+        pending = [
+            attachment
+            for attachment in self.attachments
+            if attachment.location == ContentLocation.HOSTED
+            and not attachment.exists(retrieve_if_missing=False)
+        ]
+
+        if not pending:
+            # Nothing to retrieve
+            return True
+
+        executor = cf.ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(pending))),
+            thread_name_prefix="apprise-attach",
+        )
+        futures = [executor.submit(entry.exists) for entry in pending]
+
+        # Our workers are released as soon as they are done; we do not wait
+        # on them beyond our timeout
+        executor.shutdown(wait=False)
+        done, not_done = cf.wait(futures, timeout=timeout)
+
+        if not_done:
+            logger.warning(
+                "%d remote attachment(s) were not retrieved within %.1fs",
+                len(not_done),
+                timeout,
+            )
+
+        return not not_done and all(
+            not future.exception() and future.result() for future in done
+        )
+
     def clear(self) -> None:
         """Empties our attachment list."""
         self.attachments[:] = []
@@ -147,6 +147,13 @@ class AppriseAsset:
     # to a new line.
     interpret_escapes = False
 
+    # When enabled, notification content prepared for a service (converted
+    # between formats, escaped and with its emojis applied) is kept in a
+    # process-wide cache so that repeated messages are only ever prepared
+    # once.  The content is retained in memory after notify() returns; call
+    # apprise.conversion.CONVERSION_CACHE.clear() to release it.
+    conversion_cache = False
+
     # Default number of retries after a first notification failure.
     # Individual plugins may override this via their ?retry= URL parameter
     # or the 'retry:' YAML key.  Clamped to [0, APPRISE_MAX_SERVICE_RETRY].
@@ -197,6 +204,91 @@ class AppriseAsset:
     # override this via the redirect= parameter.
     http_redirects = True
 
+    # When enabled, HTTP requests issued by the plugins are routed through a
+    # process-wide pool of keep-alive sessions (keyed by scheme, host, port
+    # and certificate verification).  Consecutive notifications sent to the
+    # same upstream server then re-use an already established connection
+    # instead of paying for a new TCP/TLS handshake each time.
+    http_pool = False
+
+    # The maximum number of connections kept alive for each pooled upstream
+    # server (only applicable if http_pool is set to True)
+    http_pool_maxsize = 10
+
+    # The number of seconds a pooled session may remain unused before it is
+    # released along with its connections (only applicable if http_pool is
+    # set to True).  Set this to a negative value to never release them.
+    http_pool_idle_timeout = 60.0
+
+    # When enabled, the (authenticated) connections established with SMTP
+    # servers are kept open in a process-wide pool (keyed by host, port,
+    # account and security mode) once an email has been sent.  The emails
+    # that follow through the same server and account then re-use them
+    # instead of performing a new TLS handshake and login each time.
+    smtp_pool = False
+
+    # The maximum number of idle connections kept open for each pooled SMTP
+    # server and account (only applicable if smtp_pool is set to True)
+    smtp_pool_maxsize = 4
+
+    # The number of seconds a pooled SMTP connection may remain unused
+    # before it is closed (only applicable if smtp_pool is set to True). Set
+    # this to a negative value to never close them.
+    smtp_pool_idle_timeout = 60.0
+
+    # When enabled (and the httpx library is installed), plugins that provide
+    # a native async_send() perform their network i/o directly on the asyncio
+    # event loop used by async_notify() instead of occupying a thread from
+    # the default executor for every request.
+    async_http = False
+
+    # The maximum number of worker threads an Apprise object uses to send
+    # notifications in parallel.  The workers are created once and re-used by
+    # every notify() call made afterwards.  Set this to None to use the
+    # default provided by Python's ThreadPoolExecutor.
+    notify_max_workers = None
+
+    # Optionally cap the number of worker threads that may be sending to the
+    # same notification service (plugin) at once.  Set this to zero (the
+    # default) to not impose any per-service limit.
+    notify_service_max_workers = 0
+
+    # The maximum number of worker threads used to retrieve the configuration
+    # referenced by the 'include' keyword.  All of the includes found at the
+    # same depth are retrieved concurrently.  Set this to 1 to retrieve them
+    # one after another.
+    config_max_workers = 8
+
+    # The maximum number of worker threads used to retrieve the remote
+    # (hosted) attachments of a notification.  They are all retrieved
+    # concurrently before the notification is sent rather than one after
+    # another by whichever service accesses them first.  Set this to 1 to
+    # retrieve them one after another.
+    attach_max_workers = 8
+
+    # The time (in seconds) the retrieval of all of the remote attachments of
+    # a notification may take before it is sent.  Retrievals still running
+    # past this point carry on in the background and the services accessing
+    # them wait on them.  Set this to None to wait for them all.
+    attach_prefetch_timeout = 30.0
+
+    # The rate limiter used to enforce the request rates of the plugins.
+    # Plugins sharing the same credentials (url_id) share the same budget.
+    # Set this to None to use the default process-wide (in memory) limiter.
+    rate_limiter = None
+
+    # When enabled (and persistent storage is available), the rate limits
+    # are tracked within the persistent storage directory so that they are
+    # respected by every process sharing it (and not just by this one).
+    # This is ignored if a rate_limiter was explicitly provided.
+    persistent_rate_limits = False
+
+    # Optionally collect the timing of each phase of the notifications sent
+    # (tag matching, conversion, overflow handling, the send() of each
+    # service, etc).  Set this to an AppriseMetrics object to have the spans
+    # handed to the exporters registered with it.
+    metrics = None
+
     # Optionally specify one or more path to attempt to scan for Python modules
     # By default, no paths are scanned.
     __plugin_paths = []
@@ -29,6 +29,8 @@ import base64
 import contextlib
 import mimetypes
 import os
+import tempfile
+import threading
 import time
 
 from .. import exception
@@ -68,6 +70,13 @@ class AttachBase(URLBase):
     # 1 GB = 1048576000 bytes
     max_file_size = 1048576000
 
+    # While shared (see shared()), the base64 encoding of our content is
+    # memoized so that it is only produced once regardless of how many
+    # services (and targets) it is sent to.  Encodings larger than this are
+    # spooled to disk instead of being held in memory.
+    # 4 MB = 4194304 bytes
+    max_shared_memory_size = 4194304
+
     # By default all attachments types are inaccessible.
     # Developers of items identified in the attachment plugin directory
     # are requried to set a location
@@ -151,6 +160,13 @@ class AttachBase(URLBase):
         # Track open file pointers
         self.__pointers = set()
 
+        # Our memoized base64 encoding (see shared()) and the signature of
+        # the content it was generated from
+        self.__shared = 0
+        self.__encoded = None
+        self.__encoded_signature = None
+        self.__lock = threading.RLock()
+
         # Set our cache flag; it can be True, False, None, or a (positive)
         # integer... nothing else
         if cache is not None:
@@ -292,7 +308,16 @@ class AttachBase(URLBase):
             # The file is not present
             pass
 
-        return False if not retrieve_if_missing else self.download()
+        if not retrieve_if_missing:
+            return False
+
+        metrics = self.asset.metrics
+        if metrics is None:
+            return self.download()
+
+        with metrics.span("attach", self.service_name) as sp:
+            sp.success = bool(self.download())
+            return sp.success
 
     def base64(self, encoding="ascii"):
         """Returns the attachment object as a base64 string otherwise None is
@@ -308,13 +333,11 @@ class AttachBase(URLBase):
             raise exception.AppriseFileNotFound("Attachment Missing")
 
         try:
-            with self.open() as f:
-                # Prepare our Attachment in Base64
-                return (
-                    base64.b64encode(f.read()).decode(encoding)
-                    if encoding
-                    else base64.b64encode(f.read())
-                )
+            # Prepare our Attachment in Base64
+            content = (
+                self.__shared_base64() if self.__shared else self.__base64()
+            )
+            return content.decode(encoding) if encoding else content
 
         except FileNotFoundError:
             # We no longer have a path to open
@@ -331,6 +354,60 @@ class AttachBase(URLBase):
                 "Attachment Access Error"
             ) from e
 
+    def __base64(self):
+        """Returns our content base64 encoded."""
+        with self.open() as f:
+            return base64.b64encode(f.read())
+
+    def __shared_base64(self):
+        """Returns our memoized base64 encoding; it is (re)generated if the
+        content it was built from has since changed."""
+        with self.__lock:
+            st = os.stat(self.download_path)
+            signature = (self.download_path, st.st_mtime_ns, st.st_size)
+            if self.__encoded and self.__encoded_signature == signature:
+                self.__encoded.seek(0)
+                return self.__encoded.read()
+
+            content = self.__base64()
+
+            self.__release()
+            self.__encoded = tempfile.SpooledTemporaryFile(  # noqa: SIM115
+                max_size=self.max_shared_memory_size
+            )
+            self.__encoded.write(content)
+            self.__encoded_signature = signature
+            return content
+
+    def __release(self):
+        """Releases our memoized encoding."""
+        if self.__encoded:
+            with contextlib.suppress(OSError):
+                self.__encoded.close()
+
+        self.__encoded = None
+        self.__encoded_signature = None
+
+    @contextlib.contextmanager
+    def shared(self):
+        """A context during which the encoding of our content is memoized.
+
+        Content shared with several services (or targets) is then read and
+        encoded only once; it is released as soon as the (outermost) context
+        is left.
+        """
+        with self.__lock:
+            self.__shared += 1
+
+        try:
+            yield self
+
+        finally:
+            with self.__lock:
+                self.__shared -= 1
+                if not self.__shared:
+                    self.__release()
+
     def invalidate(self):
         """Release any temporary data that may be open by child classes.
         Externally fetched content should be automatically cleaned up when this
@@ -348,6 +425,9 @@ class AttachBase(URLBase):
             with contextlib.suppress(OSError):
                 self.__pointers.pop().close()
 
+        with self.__lock:
+            self.__release()
+
         self.detected_name = None
         self.download_path = None
         self.detected_mimetype = None
@@ -387,6 +467,19 @@ class AttachBase(URLBase):
 
                 yield chunk
 
+    def base64_chunks(self, size=5242880):
+        """A Generator that yields our content base64 encoded one chunk at a
+        time; joined together, the chunks are identical to what
+        base64(encoding=None) returns.
+
+        The size identifies how much content is read (and encoded) at once;
+        it is rounded down to a multiple of 3 so that padding can only ever
+        appear at the very end.
+        """
+        size = max(3, size - size % 3)
+        for chunk in self.chunk(size):
+            yield base64.b64encode(chunk)
+
     def __enter__(self):
         """Support with keyword."""
         return self.open()
@@ -26,19 +26,166 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import contextlib
+import hashlib
+import json
 import os
 import re
+import shutil
 from tempfile import NamedTemporaryFile
 import threading
 
 import requests
 
-from ..common import ContentLocation
+from .. import exception
+from ..common import ContentLocation, PersistentStoreMode
 from ..locale import gettext_lazy as _
+from ..persistent_store import PersistentStore
 from ..url import PrivacyMode
 from ..utils.parse import URL_PATH_SAFE_CHARS
 from .base import AttachBase
 
+# The directory (within our persistent storage path) retrieved attachments
+# are cached in.  It can not be mistaken for a persistent storage namespace
+# (which must start with an alpha-numeric character).
+ATTACH_CACHE_DIR = "_attach"
+
+# The namespace (within the above directory) retrieved attachments are kept
+ATTACH_CACHE_NAMESPACE = "http"
+
+
+class HTTPContentCache:
+    """Keeps the content of retrieved attachments in persistent storage
+    along with the validators (ETag and/or Last-Modified) the server provided
+    with it.
+
+    Later retrievals of the same URL, even by another process, revalidate the
+    cached content with a conditional request instead of downloading it
+    again. Nothing is cached if persistent storage is not available.
+    """
+
+    # The maximum size (in bytes) of all of our cached content; everything is
+    # cleared out to make room once it is reached.  Content larger than this
+    # is never cached.
+    max_size = 33554432
+
+    def __init__(self, key: str, asset) -> None:
+        """Prepares the cache of the content identified by the key."""
+
+        self.asset = asset
+
+        # The path and key our content is kept under
+        self.path = None
+        self.key = None
+
+        # Our persistent store (lazily created)
+        self.__store = None
+
+        if (
+            not asset.storage_path
+            or asset.storage_mode == PersistentStoreMode.MEMORY
+        ):
+            return
+
+        self.key = hashlib.sha256(
+            key.encode("utf-8", "surrogatepass")
+        ).hexdigest()
+        self.path = os.path.join(asset.storage_path, ATTACH_CACHE_DIR)
+
+    @property
+    def store(self) -> PersistentStore:
+        """Returns the persistent store our content is kept in."""
+        if self.__store is None:
+            self.__store = PersistentStore(
+                namespace=ATTACH_CACHE_NAMESPACE,
+                path=self.path,
+                mode=self.asset.storage_mode,
+            )
+
+            # Our content may grow larger than what is otherwise kept in
+            # persistent storage
+            self.__store.max_file_size = self.max_size
+
+        return self.__store
+
+    def open(self):
+        """Returns a (meta, fd) tuple of our cached content or None if
+        nothing was cached.
+
+        Our content is preceded by a line of (JSON) meta data describing it;
+        the file descriptor returned is positioned past it. The content is
+        opened up front so that it remains intact should it be replaced while
+        our request to revalidate it is made.
+        """
+        if self.key is None or not os.path.isdir(self.path):
+            # Nothing was ever cached
+            return None
+
+        try:
+            fd = self.store.open(self.key, mode="rb")
+
+        except (exception.AppriseFileNotFound, exception.AppriseDiskIOError):
+            return None
+
+        try:
+            meta = json.loads(fd.readline())
+            if not isinstance(meta, dict) or not (
+                meta.get("etag") or meta.get("modified")
+            ):
+                raise ValueError("no validators")
+
+        except (OSError, ValueError):
+            fd.close()
+            return None
+
+        return (meta, fd)
+
+    def save(self, path: str, headers, **meta) -> bool:
+        """Caches the content found at the path if the headers the server
+        responded with allow for it to be revalidated later on."""
+        if self.key is None:
+            return False
+
+        etag = headers.get("ETag")
+        modified = headers.get("Last-Modified")
+        if (
+            not (etag or modified)
+            or "no-store" in headers.get("Cache-Control", "").lower()
+        ):
+            # Our content can not be revalidated (or should not be kept)
+            return False
+
+        try:
+            # Our meta data and content are kept together so that they are
+            # always replaced (by any process) as one
+            with open(path, "rb") as fd:
+                content = fd.read(self.max_size + 1)
+
+            data = (
+                json.dumps(
+                    {
+                        **meta,
+                        "etag": etag,
+                        "modified": modified,
+                        "size": len(content),
+                    }
+                ).encode("utf-8")
+                + b"\n"
+                + content
+            )
+
+            if len(data) > self.max_size:
+                # Too large to be cached
+                return False
+
+            if self.store.size(lazy=False) + len(data) > self.max_size:
+                # Make room for our new content
+                self.store.delete(all=True)
+
+            return self.store.write(data, key=self.key, compress=False)
+
+        except (OSError, exception.AppriseDiskIOError):
+            return False
+
 
 class AttachHTTP(AttachBase):
     """A wrapper for HTTP based attachment sources."""
@@ -58,9 +205,6 @@ class AttachHTTP(AttachBase):
     # Web based requests are remote/external to our current location
     location = ContentLocation.HOSTED
 
-    # thread safe loading
-    _lock = threading.Lock()
-
     def __init__(self, headers=None, **kwargs):
         """Initialize HTTP Object.
 
@@ -83,6 +227,9 @@ class AttachHTTP(AttachBase):
         # Where our content is written to upon a call to download.
         self._temp_file = None
 
+        # thread safe loading
+        self._lock = threading.Lock()
+
         # Our Query String Dictionary; we use this to track arguments
         # specified that aren't otherwise part of this class
         self.qsd = {
@@ -138,6 +285,36 @@ class AttachHTTP(AttachBase):
             # Ensure any existing content set has been invalidated
             self.invalidate()
 
+            # Content we retrieved before is revalidated rather than being
+            # downloaded all over again
+            cache = None
+            cached = None
+            if self.cache is not False:
+                cache = HTTPContentCache(
+                    "\0".join(
+                        (
+                            url,
+                            repr(auth),
+                            repr(sorted(self.qsd.items())),
+                            repr(sorted(headers.items())),
+                        )
+                    ),
+                    self.asset,
+                )
+                cached = cache.open()
+
+                if cached and 0 < self.max_file_size < cached[0]["size"]:
+                    # Our cached content exceeds our limits
+                    cached[1].close()
+                    cached = None
+
+            if cached:
+                if cached[0].get("etag"):
+                    headers["If-None-Match"] = cached[0]["etag"]
+
+                if cached[0].get("modified"):
+                    headers["If-Modified-Since"] = cached[0]["modified"]
+
             self.logger.debug(
                 "HTTP Attachment Fetch URL:"
                 f" {url} (cert_verify={self.verify_certificate!r})"
@@ -145,7 +322,7 @@ class AttachHTTP(AttachBase):
 
             try:
                 # Make our request
-                with requests.get(
+                with self.http.get(
                     url,
                     headers=headers,
                     auth=auth,
@@ -158,6 +335,24 @@ class AttachHTTP(AttachBase):
                     # Handle Errors
                     r.raise_for_status()
 
+                    if cached and r.status_code == 304:
+                        # Our cached content is still current
+                        meta, fd = cached
+
+                        self._temp_file = NamedTemporaryFile(delete=False)  # noqa: SIM115
+                        shutil.copyfileobj(fd, self._temp_file)
+                        self._temp_file.flush()
+
+                        self.detected_mimetype = meta.get("mimetype")
+                        self.detected_name = meta.get("name")
+                        self.download_path = self._temp_file.name
+
+                        self.logger.debug(
+                            "HTTP Attachment %s revalidated from cache",
+                            self.url(privacy=True),
+                        )
+                        return True
+
                     # raise_for_status() only covers 4xx/5xx; when redirect
                     # following is disabled any 3xx must be treated as a
                     # failure so we do not silently stream a redirect stub.
@@ -261,6 +456,15 @@ class AttachHTTP(AttachBase):
                     if not self.detected_name:
                         self.detected_name = os.path.basename(self.fullpath)
 
+                    if cache:
+                        # Keep our content for later revalidation
+                        cache.save(
+                            self.download_path,
+                            r.headers,
+                            name=self.detected_name,
+                            mimetype=self.detected_mimetype,
+                        )
+
             except requests.RequestException as e:
                 self.logger.error(
                     "A Connection error occurred retrieving HTTP "
@@ -290,6 +494,11 @@ class AttachHTTP(AttachBase):
                 # Return False (signifying a failure)
                 return False
 
+            finally:
+                if cached:
+                    # Release our cached content
+                    cached[1].close()
+
         # Return our success
         return True
 
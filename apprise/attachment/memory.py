@@ -116,6 +116,13 @@ class AttachMemory(AttachBase):
         self._data.seek(0, 0)
         return self._data
 
+    def chunk(self, size=5242880):
+        """A Generator that yield chunks of our content with the specified
+        size."""
+        content = self._data.getvalue()
+        for offset in range(0, len(content), size):
+            yield content[offset : offset + size]
+
     def __enter__(self):
         """Support with clause."""
         # Return our object
@@ -41,6 +41,7 @@ from . import (
     AppriseAsset,
     AppriseConfig,
     NotificationManager,
+    PersistentQueue,
     PersistentStore,
     __copyright__,
     __license__,
@@ -58,7 +59,7 @@ from .common import (
     PersistentStoreState,
 )
 from .logger import logger
-from .utils.disk import bytes_to_str, dir_size, path_decode
+from .utils.disk import bytes_to_str, path_decode
 from .utils.parse import GET_SCHEMA_RE, parse_list
 
 # By default we allow looking 1 level down recursively in Apprise configuration
@@ -90,6 +91,10 @@ DEFAULT_ENV_APPRISE_PLUGIN_PATH = "APPRISE_PLUGIN_PATH"
 # Defines the override path for the persistent storage
 DEFAULT_ENV_APPRISE_STORAGE_PATH = "APPRISE_STORAGE_PATH"
 
+# Defines the override path for the plugin index; set it to an empty string
+# to disable the index (and always load all of the plugins)
+DEFAULT_ENV_APPRISE_PLUGIN_INDEX_PATH = "APPRISE_PLUGIN_INDEX_PATH"
+
 # Defines our click context settings adding -h to the additional options that
 # can be specified to get the help menu to come up
 CONTEXT_SETTINGS = {"help_option_names": ["-h", "--help"]}
@@ -158,6 +163,11 @@ NOTIFY_FORMAT_CHOICES: tuple[NotifyFormat, ...] = (
 #
 DEFAULT_STORAGE_PATH = "~/.local/share/apprise/cache"
 
+#
+# Plugin Index; allows plugins to only be loaded when they are referenced
+#
+DEFAULT_PLUGIN_INDEX_PATH = "~/.cache/apprise/plugins.json"
+
 # Storage Mode
 DEFAULT_STORAGE_MODE = PersistentStoreMode.AUTO
 
@@ -220,6 +230,11 @@ if platform.system() == "Windows":
     #
     DEFAULT_STORAGE_PATH = "%APPDATA%/Apprise/cache"
 
+    #
+    # Plugin Index
+    #
+    DEFAULT_PLUGIN_INDEX_PATH = "%LOCALAPPDATA%/Apprise/plugins.json"
+
 
 class PersistentStorageMode:
     """Persistent Storage Modes."""
@@ -630,6 +645,29 @@ class CustomHelpCommand(click.Command):
         "sent using this mode."
     ),
 )
+# Note: queued notifications are written to disk with their full Apprise URLs
+#       (including any passwords, tokens or API keys they contain) so that
+#       they can be delivered later by another process.  Anyone who can read
+#       the persistent storage path can read these credentials.
+@click.option(
+    "--queue",
+    "-Q",
+    is_flag=True,
+    help=(
+        "Queue the notification in persistent storage and return "
+        "immediately; it is delivered later using --drain. Queued "
+        "notifications store their URLs (including any credentials) "
+        "unencrypted within the --storage-path (-S)."
+    ),
+)
+@click.option(
+    "--drain",
+    is_flag=True,
+    help=(
+        "Deliver all of the notifications previously queued using --queue "
+        "and exit."
+    ),
+)
 @click.option(
     "--details",
     "-l",
@@ -693,6 +731,8 @@ def main(
     tag,
     input_format,
     dry_run,
+    queue,
+    drain,
     recursion_depth,
     verbose,
     disable_async,
@@ -756,6 +796,14 @@ def main(
         asyncio_logger.addHandler(handler)
     asyncio_logger.setLevel(logger.level)
 
+    # Only load the plugins we reference (if our index is up to date)
+    index_path = os.environ.get(
+        DEFAULT_ENV_APPRISE_PLUGIN_INDEX_PATH, DEFAULT_PLUGIN_INDEX_PATH
+    ).strip()
+    NotificationManager().index_path = (
+        path_decode(index_path) if index_path else None
+    )
+
     # Log environment and runtime-dependency versions when debugging
     _log_runtime_env()
 
@@ -891,6 +939,32 @@ def main(
     # Create our Apprise object
     a = Apprise(asset=asset, debug=debug, location=ContentLocation.LOCAL)
 
+    if (queue or drain) and asset.storage_mode == PersistentStoreMode.MEMORY:
+        click.echo(
+            "The --queue (-Q) and --drain options require persistent "
+            "storage; they can not be used with a --storage-mode (-SM) of "
+            f"{PersistentStoreMode.MEMORY.value}."
+        )
+        click.echo("Try 'apprise --help' for more information.")
+        ctx.exit(2)
+
+    if drain:
+        # Deliver everything previously queued
+        pq = PersistentQueue(asset.storage_path)
+        if dry_run:
+            click.echo(f"{len(pq.keys())} notification(s) queued")
+            ctx.exit(0)
+
+        delivered, failed = pq.drain(asset=asset)
+        logger.info(
+            "Delivered %d queued notification(s); %d failed",
+            delivered,
+            failed,
+        )
+
+        # At least 1 queued notification failed to send
+        ctx.exit(1 if failed else 0)
+
     # Track if we are performing a storage action
     storage_action = bool(urls and "storage".startswith(urls[0]))
 
@@ -1170,7 +1244,7 @@ def main(
                 uids[id_]["plugins"].append(plugin)
 
         if action == PersistentStorageMode.LIST:
-            # Scope disk_scan based on what filters were provided:
+            # Scope disk_usage based on what filters were provided:
             #  - URL filters: scope to resolved plugin uids plus any
             #    plain uid-prefix strings; skip scan if none resolved
             #  - Plain-string or no filter: namespace=uid_filter_list
@@ -1182,21 +1256,21 @@ def main(
                     # URL filters yielded no plugins; skip the disk scan
                     detected_uid = {}
                 else:
-                    detected_uid = PersistentStore.disk_scan(
+                    detected_uid = PersistentStore.disk_usage(
                         # Use our asset path as already properly parsed
                         path=asset.storage_path,
                         namespace=_disk_ns,
                     )
             else:
-                detected_uid = PersistentStore.disk_scan(
+                detected_uid = PersistentStore.disk_usage(
                     # Use our asset path as it has already been properly
                     # parsed
                     path=asset.storage_path,
                     # Provide filter if specified; empty = all directories
                     namespace=uid_filter_list,
                 )
-            for id_ in detected_uid:
-                size, _ = dir_size(os.path.join(asset.storage_path, id_))
+            for id_, usage in detected_uid.items():
+                size = usage["size"]
                 if id_ in uids:
                     uids[id_]["state"] = PersistentStoreState.ACTIVE.value
                     uids[id_]["size"] = size
@@ -1261,7 +1335,7 @@ def main(
                 storage_prune_days = 0
 
             # Derive the namespace for disk_prune.  The scoping rules
-            # mirror those for disk_scan:
+            # mirror those for disk_usage:
             #   - URL filters: resolved plugin uids + any uid-prefix
             #     strings; empty means no-op (nothing to prune).
             #   - Tag filters: same scoping — resolved plugin uids + any
@@ -1302,7 +1376,8 @@ def main(
             body = click.get_text_stream("stdin").read()
 
         # now print it out
-        result = a.notify(
+        # Either send our notification now or queue it for later
+        result = (a.enqueue if queue else a.notify)(
             body=body,
             title=title,
             notify_type=notification_type,
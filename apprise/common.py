@@ -97,6 +97,21 @@ class OverflowMode(str, Enum):
 OVERFLOW_MODES: frozenset[str] = frozenset(e.value for e in OverflowMode)
 
 
+class LengthUnit(str, Enum):
+    """The unit a service measures its message limits (such as body_maxlen)
+    in."""
+
+    # Unicode characters (code points); the default
+    CHARS = "chars"
+
+    # Bytes once the content is encoded as UTF-8
+    UTF8 = "utf-8"
+
+    # 16-bit code units (UCS-2/UTF-16); characters outside of the Basic
+    # Multilingual Plane (such as most emojis) count twice
+    UCS2 = "ucs-2"
+
+
 class ConfigFormat(str, Enum):
     """A list of pre-defined config formats that can be passed via the apprise
     library."""
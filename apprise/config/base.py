@@ -27,17 +27,20 @@
 from __future__ import annotations
 
 from collections import deque
+import hashlib
+import json
 import os
 import re
 import time
 
 import yaml
 
-from .. import common, plugins
+from .. import __version__, common, plugins
 from ..asset import AppriseAsset
 from ..logger import logging
 from ..manager_config import ConfigurationManager
 from ..manager_plugins import NotificationManager
+from ..persistent_store import PersistentStore
 from ..tag import AppriseTag
 from ..url import URL_TOKEN_ALIASES, URLBase
 from ..utils.cwe312 import cwe312_url
@@ -48,8 +51,23 @@ from ..utils.parse import (
     parse_list,
     parse_urls,
 )
+from ..utils.pool import WorkerPool
 from ..utils.time import zoneinfo
 
+# Use the (much faster) libyaml based loader when it is available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# The directory (within our persistent storage path) compiled configuration
+# is kept in.  It can not be mistaken for a persistent storage namespace
+# (which must start with an alpha-numeric character).
+CONFIG_CACHE_DIR = "_config"
+
+# The namespace (within the above directory) compiled configuration is kept
+CONFIG_CACHE_NAMESPACE = "compiled"
+
+# How sets are identified within our compiled configuration
+CONFIG_CACHE_SET_KEY = "__set__"
+
 # Test whether token is valid or not
 VALID_TOKEN = re.compile(r"(?P<token>[a-z0-9][a-z0-9_]+)", re.I)
 
@@ -73,6 +91,275 @@ N_MGR = NotificationManager()
 C_MGR = ConfigurationManager()
 
 
+class ConfigReload:
+    """Tracks the notification services instantiated from a configuration
+    source, keyed by a fingerprint of the entry that produced them.
+
+    Handing the tracker of a previous load to the next one (see renew())
+    allows entries that did not change to keep their existing plugin
+    instance, and with it any state it holds (throttle timestamps, login
+    tokens, open connections, etc).  Only new or changed entries are
+    instantiated; whatever is left behind in the previous load is simply
+    released.
+    """
+
+    def __init__(
+        self, previous: dict[str, deque[object]] | None = None
+    ) -> None:
+        """Initialize our tracker from the services of a previous load."""
+
+        # The services of our previous load (by fingerprint)
+        self.previous = {} if previous is None else previous
+
+        # The services of our current load (by fingerprint)
+        self.loaded = {}
+
+        # The number of services carried over from our previous load
+        self.reused = 0
+
+    def renew(self) -> ConfigReload:
+        """Returns a new tracker primed with the services loaded by this
+        one."""
+        return ConfigReload(self.loaded)
+
+    @property
+    def removed(self) -> int:
+        """The number of services of the previous load that were not carried
+        over."""
+        return sum(len(p) for p in self.previous.values())
+
+    @staticmethod
+    def fingerprint(results: dict[str, object]) -> str | None:
+        """Generates a fingerprint of the parsed entry (URL, tags and options)
+        that a notification service is instantiated from.
+
+        None is returned if the entry could not be fingerprinted.
+        """
+
+        def default(obj: object) -> object:
+            if isinstance(obj, (set, frozenset)):
+                return sorted(str(v) for v in obj)
+            return str(obj)
+
+        entry = {k: v for k, v in results.items() if k != "asset"}
+        try:
+            payload = json.dumps(
+                # Services are never shared across assets
+                [id(results.get("asset")), entry],
+                sort_keys=True,
+                default=default,
+            )
+
+        except (TypeError, ValueError):
+            return None
+
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def instantiate(self, results: dict[str, object]) -> object:
+        """Returns the notification service for the parsed entry, re-using
+        the one of the previous load if the entry did not change.
+
+        Exceptions raised by the plugin are passed along to the caller.
+        """
+        fingerprint = self.fingerprint(results)
+        if fingerprint is None:
+            return N_MGR[results["schema"]](**results)
+
+        pool = self.previous.get(fingerprint)
+        if pool:
+            plugin = pool.popleft()
+            self.reused += 1
+
+        else:
+            plugin = N_MGR[results["schema"]](**results)
+
+        self.loaded.setdefault(fingerprint, deque()).append(plugin)
+        return plugin
+
+
+class ConfigCache:
+    """Keeps the compiled form of configuration content (the arguments each
+    of its notification plugins is instantiated with along with the
+    includes it references) in persistent storage.
+
+    Entries are keyed by a hash of the content so that later loads of the
+    same content, even by another process, skip parsing it altogether.
+    Nothing is cached if persistent storage is not available.
+    """
+
+    # Compiling only pays off for larger configuration; content with fewer
+    # entries than this is simply parsed every time
+    min_entries = 20
+
+    # The maximum size (in bytes) of our compiled configuration; everything
+    # is cleared out to make room once it is reached
+    max_size = 4194304
+
+    def __init__(
+        self,
+        content: str,
+        config_format: common.ConfigFormat,
+        asset: AppriseAsset,
+    ) -> None:
+        """Prepares the cache of the specified content."""
+
+        self.asset = asset
+
+        # The path and key our compiled content is kept under
+        self.path = None
+        self.key = None
+
+        # Our persistent store (lazily created)
+        self.__store = None
+
+        if (
+            not isinstance(content, str)
+            or not asset.storage_path
+            or asset.storage_mode == common.PersistentStoreMode.MEMORY
+        ):
+            return
+
+        # Anything our parsing depends on is part of our key
+        digest = hashlib.sha256()
+        for value in (
+            __version__,
+            config_format.value,
+            asset.secure_logging,
+            asset.tzinfo,
+            content,
+        ):
+            digest.update(str(value).encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+
+        self.key = digest.hexdigest()
+        self.path = os.path.join(asset.storage_path, CONFIG_CACHE_DIR)
+
+        # Our configuration can alter our asset; we cache these changes too
+        self._asset = dict(vars(asset))
+
+    @property
+    def store(self) -> PersistentStore:
+        """Returns the persistent store our compiled content is kept in."""
+        if self.__store is None:
+            self.__store = PersistentStore(
+                namespace=CONFIG_CACHE_NAMESPACE,
+                path=self.path,
+                mode=self.asset.storage_mode,
+            )
+
+            # Our compiled content may grow larger than what is otherwise
+            # kept in persistent storage
+            self.__store.max_file_size = self.max_size
+
+        return self.__store
+
+    def load(self) -> tuple[list[dict[str, object]], list[str]] | None:
+        """Returns the (preloaded, configs) compiled from our content or None
+        if it was not cached."""
+        if self.key is None or not os.path.isdir(self.path):
+            # Nothing was ever compiled
+            return None
+
+        data = self.store.read(self.key)
+        if not data:
+            return None
+
+        try:
+            compiled = json.loads(data, object_hook=self._decode)
+            preloaded = compiled["entries"]
+            configs = compiled["configs"]
+            changes = compiled["asset"]
+
+            if "_tzinfo" in changes:
+                changes["_tzinfo"] = zoneinfo(changes["_tzinfo"])
+                if changes["_tzinfo"] is None:
+                    raise ValueError("invalid timezone")
+
+            for entry in preloaded:
+                entry["results"]["asset"] = self.asset
+
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            ConfigBase.logger.warning(
+                "Ignoring invalid compiled configuration cache entry."
+            )
+            ConfigBase.logger.debug(f"Cache Exception: {e!s}")
+            return None
+
+        for key, value in changes.items():
+            setattr(self.asset, key, value)
+
+        ConfigBase.logger.trace(
+            "Loaded %d compiled configuration entries", len(preloaded)
+        )
+        return (preloaded, configs)
+
+    def save(
+        self, preloaded: list[dict[str, object]], configs: list[str]
+    ) -> bool:
+        """Caches the (preloaded, configs) compiled from our content."""
+        if self.key is None or len(preloaded) < self.min_entries:
+            return False
+
+        changes = {
+            key: value
+            for key, value in vars(self.asset).items()
+            if self._asset.get(key, self) is not value
+        }
+
+        if "_tzinfo" in changes:
+            changes["_tzinfo"] = getattr(changes["_tzinfo"], "key", None)
+
+        compiled = {
+            "entries": [
+                {
+                    **entry,
+                    "results": {
+                        k: v
+                        for k, v in entry["results"].items()
+                        if k != "asset"
+                    },
+                }
+                for entry in preloaded
+            ],
+            "configs": configs,
+            "asset": changes,
+        }
+
+        try:
+            data = json.dumps(compiled, default=self._encode)
+            if json.loads(data, object_hook=self._decode) != compiled:
+                # Something would not survive our round trip (tuples, etc)
+                raise ValueError("lossy conversion")
+
+        except (ValueError, TypeError) as e:
+            ConfigBase.logger.debug(
+                f"Configuration could not be compiled: {e!s}"
+            )
+            return False
+
+        if self.store.size(lazy=False) + len(data) > self.max_size:
+            # Make room for our new content
+            self.store.delete(all=True)
+
+        return self.store.write(data, key=self.key)
+
+    @staticmethod
+    def _encode(obj: object) -> object:
+        """Encodes the sets found in our compiled configuration."""
+        if isinstance(obj, (set, frozenset)):
+            return {CONFIG_CACHE_SET_KEY: sorted(obj, key=str)}
+
+        raise TypeError(f"{type(obj).__name__} can not be compiled")
+
+    @staticmethod
+    def _decode(obj: dict[str, object]) -> object:
+        """Decodes the sets found in our compiled configuration."""
+        if len(obj) == 1 and CONFIG_CACHE_SET_KEY in obj:
+            return set(obj[CONFIG_CACHE_SET_KEY])
+
+        return obj
+
+
 class ConfigBase(URLBase):
     """This is the base class for all supported configuration sources."""
 
@@ -155,6 +442,13 @@ class ConfigBase(URLBase):
         # Tracks previously loaded content for speed
         self._cached_servers = None
 
+        # Tracks the services instantiated by our last load so that they can
+        # be re-used by the next one if their entry did not change
+        self._reload = ConfigReload()
+
+        # Tracks the configuration we included on our last load (by URL)
+        self._includes = {}
+
         # Initialize our recursion value
         self.recursion = recursion
 
@@ -206,19 +500,122 @@ class ConfigBase(URLBase):
             # We already have cached results to return; use them
             return self._cached_servers
 
+        # Initialize our asset object
+        asset = asset if isinstance(asset, AppriseAsset) else self.asset
+
+        loaded = self._load_servers(asset, **kwargs)
+        if loaded is None:
+            # Our cached response object
+            self._cached_servers = []
+
+            # Set the time our content was cached at
+            self._cached_time = time.time()
+
+            # Nothing more to do; return our empty cache list
+            return self._cached_servers
+
+        #
+        # Include Processing
+        #
+        # Our included configuration is resolved one depth at a time; all of
+        # the sources found at the same depth are retrieved concurrently.
+        # The same source reached through several paths (at the same depth
+        # of recursion) is only ever retrieved once.
+        #
+
+        # The content loaded by each configuration source (by id)
+        content = {id(self): loaded}
+
+        # The configuration sources included by each source (by id)
+        includes = {}
+
+        # The configuration sources we've resolved (by URL and recursion)
+        resolved = {}
+
+        # The number of sources we can retrieve at once
+        workers = asset.config_max_workers
+        concurrent = workers is None or workers > 1
+
+        level = [self]
+        with WorkerPool(max_workers=workers if concurrent else 1) as pool:
+            while level:
+                pending = {}
+                for cfg in level:
+                    previous, cfg._includes = cfg._includes, {}
+                    includes[id(cfg)] = []
+                    for url in content[id(cfg)][1]:
+                        child = cfg._include(url, asset, resolved, previous)
+                        if child is None:
+                            continue
+
+                        includes[id(cfg)].append(child)
+                        if id(child) not in content:
+                            pending[id(child)] = child
+
+                if concurrent and len(pending) > 1:
+                    futures = {
+                        key: pool.submit(child._load_servers, asset)
+                        for key, child in pending.items()
+                    }
+                    for key, future in futures.items():
+                        content[key] = future.result()
+
+                else:
+                    for key, child in pending.items():
+                        content[key] = child._load_servers(asset)
+
+                for key in pending:
+                    if content[key] is None:
+                        # Nothing was loaded
+                        content[key] = ([], [])
+
+                level = list(pending.values())
+
+        def assemble(cfg: ConfigBase) -> list[plugins.NotifyBase]:
+            """Returns the services of a configuration source along with the
+            ones of everything it includes (in order)."""
+            servers = list(content[id(cfg)][0])
+            for child in includes[id(cfg)]:
+                servers.extend(assemble(child))
+            return servers
+
         # Our cached response object
-        self._cached_servers = []
+        self._cached_servers = assemble(self)
+
+        if self._cached_servers:
+            self.logger.info(
+                f"Loaded {len(self._cached_servers)} entries from"
+                f" {self.url(privacy=asset.secure_logging)}"
+            )
+        else:
+            self.logger.warning(
+                "Failed to load Apprise configuration from"
+                f" {self.url(privacy=asset.secure_logging)}"
+            )
+
+        # Set the time our content was cached at
+        self._cached_time = time.time()
+
+        return self._cached_servers
+
+    def _load_servers(
+        self,
+        asset: AppriseAsset,
+        **kwargs: object,
+    ) -> tuple[list[plugins.NotifyBase], list[str]] | None:
+        """Reads and parses our configuration (leaving anything it includes
+        unresolved).
+
+        Returns a tuple of our (servers, configs) or None if no content
+        could be read.
+        """
 
         # read() causes the child class to do whatever it takes for the
         # config plugin to load the data source and return unparsed content
         # None is returned if there was an error or simply no data
         content = self.read(**kwargs)
         if not isinstance(content, str):
-            # Set the time our content was cached at
-            self._cached_time = time.time()
-
-            # Nothing more to do; return our empty cache list
-            return self._cached_servers
+            return None
 
         # Our Configuration format uses a default if one wasn't one detected
         # or enfored.
@@ -231,136 +628,148 @@ class ConfigBase(URLBase):
         # Dynamically load our parse_ function based on our config format
         fn = getattr(ConfigBase, f"config_parse_{config_format.value}")
 
-        # Initialize our asset object
-        asset = asset if isinstance(asset, AppriseAsset) else self.asset
-
         # Execute our config parse function which always returns a tuple
-        # of our servers and our configuration
-        servers, configs = fn(content=content, asset=asset)
+        # of our servers and our configuration; unchanged entries re-use the
+        # services we instantiated on our previous load
+        reload = self._reload.renew()
+        servers, configs = fn(content=content, asset=asset, reload=reload)
 
         # Free memory
         del content
 
-        # Add entry to our server list
-        self._cached_servers.extend(servers)
-
-        # Configuration files were detected; recursively populate them
-        # If we have been configured to do so
-        for url in configs:
-            if self.recursion > 0:
-                # Attempt to acquire the schema at the very least to allow
-                # our configuration based urls.
-                schema = GET_SCHEMA_RE.match(url)
-                if schema is None:
-                    # Plan B is to assume we're dealing with a file
-                    schema = "file"
-                    if not os.path.isabs(url):
-                        # We're dealing with a relative path; prepend
-                        # our current config path
-                        url = os.path.join(self.config_path, url)
+        if reload.previous or reload.reused:
+            self.logger.debug(
+                "Reloaded %s: %d kept, %d added, %d removed",
+                self.url(privacy=asset.secure_logging),
+                reload.reused,
+                len(servers) - reload.reused,
+                reload.removed,
+            )
 
-                    url = f"{schema}://{URLBase.quote(url)}"
+        # Release whatever our previous load no longer references
+        self._reload = reload
+        reload.previous = {}
 
-                else:
-                    # Ensure our schema is always in lower case
-                    schema = schema.group("schema").lower()
+        return (servers, configs)
 
-                    # Some basic validation
-                    if schema not in C_MGR:
-                        ConfigBase.logger.error(
-                            f"Unsupported include schema {schema}."
-                        )
-                        continue
+    def _include(
+        self,
+        url: str,
+        asset: AppriseAsset,
+        resolved: dict[tuple[str, int], ConfigBase],
+        previous: dict[str, ConfigBase],
+    ) -> ConfigBase | None:
+        """Returns the configuration source identified by an include URL
+        found in our configuration, or None if it can not (or may not) be
+        included.
+
+        Sources are tracked in resolved so that the same one is shared by
+        every configuration that includes it.  The sources we included on
+        our previous load are re-used so that the services they loaded can
+        be re-used too.
+        """
 
-                # CWE-312 (Secure Logging) Handling
-                loggable_url = (
-                    url if not asset.secure_logging else cwe312_url(url)
-                )
+        if self.recursion <= 0:
+            # CWE-312 (Secure Logging) Handling
+            loggable_url = url if not asset.secure_logging else cwe312_url(url)
 
-                # Parse our url details of the server object as dictionary
-                # containing all of the information parsed from our URL
-                results = C_MGR[schema].parse_url(url)
-                if not results:
-                    # Failed to parse the server URL
-                    self.logger.error(
-                        f"Unparseable include URL {loggable_url}"
-                    )
-                    continue
+            self.logger.debug(
+                "Recursion limit reached; ignoring Include URL: %s",
+                loggable_url,
+            )
+            return None
 
-                # Handle cross inclusion based on allow_cross_includes rules
-                if (
-                    C_MGR[schema].allow_cross_includes
-                    == common.ContentIncludeMode.STRICT
-                    and schema not in self.schemas()
-                    and not self.insecure_includes
-                ) or C_MGR[
-                    schema
-                ].allow_cross_includes == common.ContentIncludeMode.NEVER:
-                    # Prevent the loading if insecure base protocols
-                    ConfigBase.logger.warning(
-                        f"Including {schema}:// based configuration is"
-                        f" prohibited. Ignoring URL {loggable_url}"
-                    )
-                    continue
+        # Attempt to acquire the schema at the very least to allow
+        # our configuration based urls.
+        schema = GET_SCHEMA_RE.match(url)
+        if schema is None:
+            # Plan B is to assume we're dealing with a file
+            schema = "file"
+            if not os.path.isabs(url):
+                # We're dealing with a relative path; prepend
+                # our current config path
+                url = os.path.join(self.config_path, url)
 
-                # Prepare our Asset Object
-                results["asset"] = asset
+            url = f"{schema}://{URLBase.quote(url)}"
 
-                # No cache is required because we're just lumping this in
-                # and associating it with the cache value we've already
-                # declared (prior to our recursion)
-                results["cache"] = False
+        else:
+            # Ensure our schema is always in lower case
+            schema = schema.group("schema").lower()
 
-                # Recursion can never be parsed from the URL; we decrement
-                # it one level
-                results["recursion"] = self.recursion - 1
+            # Some basic validation
+            if schema not in C_MGR:
+                ConfigBase.logger.error(
+                    f"Unsupported include schema {schema}."
+                )
+                return None
 
-                # Insecure Includes flag can never be parsed from the URL
-                results["insecure_includes"] = self.insecure_includes
+        # CWE-312 (Secure Logging) Handling
+        loggable_url = url if not asset.secure_logging else cwe312_url(url)
+
+        # Handle cross inclusion based on allow_cross_includes rules
+        if (
+            C_MGR[schema].allow_cross_includes
+            == common.ContentIncludeMode.STRICT
+            and schema not in self.schemas()
+            and not self.insecure_includes
+        ) or C_MGR[
+            schema
+        ].allow_cross_includes == common.ContentIncludeMode.NEVER:
+            # Prevent the loading if insecure base protocols
+            ConfigBase.logger.warning(
+                f"Including {schema}:// based configuration is"
+                f" prohibited. Ignoring URL {loggable_url}"
+            )
+            return None
 
-                try:
-                    # Attempt to create an instance of our plugin using the
-                    # parsed URL information
-                    cfg_plugin = C_MGR[results["schema"]](**results)
+        key = (url, self.recursion - 1)
+        cfg_plugin = resolved.get(key)
+        if cfg_plugin is not None:
+            # Already included elsewhere
+            self._includes[url] = cfg_plugin
+            return cfg_plugin
+
+        cfg_plugin = previous.get(url)
+        if cfg_plugin is None or cfg_plugin.asset is not asset:
+            # Parse our url details of the server object as dictionary
+            # containing all of the information parsed from our URL
+            results = C_MGR[schema].parse_url(url)
+            if not results:
+                # Failed to parse the server URL
+                self.logger.error(f"Unparseable include URL {loggable_url}")
+                return None
 
-                except Exception as e:
-                    # the arguments are invalid or can not be used.
-                    self.logger.error(
-                        f"Could not load include URL: {loggable_url}"
-                    )
-                    self.logger.debug(f"Loading Exception: {e!s}")
-                    continue
+            # Prepare our Asset Object
+            results["asset"] = asset
 
-                # if we reach here, we can now add this servers found
-                # in this configuration file to our list
-                self._cached_servers.extend(cfg_plugin.servers(asset=asset))
+            # No cache is required because we're just lumping this in
+            # and associating it with the cache value we've already
+            # declared (prior to our recursion)
+            results["cache"] = False
 
-            else:
-                # CWE-312 (Secure Logging) Handling
-                loggable_url = (
-                    url if not asset.secure_logging else cwe312_url(url)
-                )
+            # Recursion can never be parsed from the URL; we decrement
+            # it one level
+            results["recursion"] = self.recursion - 1
 
-                self.logger.debug(
-                    "Recursion limit reached; ignoring Include URL: %s",
-                    loggable_url,
-                )
+            # Insecure Includes flag can never be parsed from the URL
+            results["insecure_includes"] = self.insecure_includes
 
-        if self._cached_servers:
-            self.logger.info(
-                f"Loaded {len(self._cached_servers)} entries from"
-                f" {self.url(privacy=asset.secure_logging)}"
-            )
-        else:
-            self.logger.warning(
-                "Failed to load Apprise configuration from"
-                f" {self.url(privacy=asset.secure_logging)}"
-            )
+            try:
+                # Attempt to create an instance of our plugin using the
+                # parsed URL information
+                cfg_plugin = C_MGR[results["schema"]](**results)
 
-        # Set the time our content was cached at
-        self._cached_time = time.time()
+            except Exception as e:
+                # the arguments are invalid or can not be used.
+                self.logger.error(
+                    f"Could not load include URL: {loggable_url}"
+                )
+                self.logger.debug(f"Loading Exception: {e!s}")
+                return None
 
-        return self._cached_servers
+        resolved[key] = cfg_plugin
+        self._includes[url] = cfg_plugin
+        return cfg_plugin
 
     def read(self) -> str | None:
         """This object should be implimented by the child classes."""
@@ -641,6 +1050,7 @@ class ConfigBase(URLBase):
     def config_parse_text(
         content: str,
         asset: AppriseAsset | None = None,
+        reload: ConfigReload | None = None,
     ) -> tuple[list[object], list[str]]:
         """Parse the specified content as though it were a simple text file
         only containing a list of URLs.
@@ -652,6 +1062,9 @@ class ConfigBase(URLBase):
 
         You may also optionally associate an asset with the notification.
 
+        A reload tracker may be provided to re-use the services of a previous
+        load whose entries did not change.
+
         The file syntax is:
 
             #
@@ -675,6 +1088,69 @@ class ConfigBase(URLBase):
         # A list of loaded Notification Services
         servers = []
 
+        # Prepare our Asset Object
+        asset = asset if isinstance(asset, AppriseAsset) else AppriseAsset()
+
+        if reload is None:
+            # Nothing to re-use
+            reload = ConfigReload()
+
+        # Our content is only parsed if it was not compiled before
+        cache = ConfigCache(content, common.ConfigFormat.TEXT, asset)
+        compiled = cache.load()
+        if compiled is None:
+            compiled = ConfigBase.__compile_text(content, asset)
+            cache.save(*compiled)
+
+        preloaded, configs = compiled
+
+        #
+        # URL Processing
+        #
+        for entry in preloaded:
+            # Point to our results entry for easier reference below
+            results = entry["results"]
+
+            try:
+                # Attempt to create an instance of our plugin using the
+                # parsed URL information
+                plugin = reload.instantiate(results)
+
+                # Create log entry of loaded URL
+                ConfigBase.logger.debug(
+                    "Loaded URL: %s",
+                    plugin.url(privacy=results["asset"].secure_logging),
+                )
+
+            except Exception as e:
+                # the arguments are invalid or can not be used.
+                ConfigBase.logger.error(
+                    "Could not load URL {} on line {}.".format(
+                        entry["loggable_url"], entry["line"]
+                    )
+                )
+                ConfigBase.logger.debug(f"Loading Exception: {e!s}")
+                continue
+
+            # if we reach here, we successfully loaded our data
+            servers.append(plugin)
+
+        # Return what was loaded
+        return (servers, configs)
+
+    @staticmethod
+    def __compile_text(
+        content: str,
+        asset: AppriseAsset,
+    ) -> tuple[list[dict[str, object]], list[str]]:
+        """Parses the specified TEXT content (see config_parse_text()) into
+        the arguments each of its notification plugins is instantiated with.
+
+        Return a tuple that looks like (preloaded, configs) where:
+          - preloaded contains a list of the parsed entries
+          - configs contains a list of additional configuration files
+            referenced.
+        """
         # A list of additional configuration files referenced using
         # the include keyword
         configs = []
@@ -685,9 +1161,6 @@ class ConfigBase(URLBase):
         # Track our entries to preload
         preloaded = []
 
-        # Prepare our Asset Object
-        asset = asset if isinstance(asset, AppriseAsset) else AppriseAsset()
-
         # Define what a valid line should look like.
         # The tags group allows an optional leading "N:" priority prefix so
         # that entries like "2:endpoint=ntfy://..." are parsed correctly.
@@ -826,15 +1299,12 @@ class ConfigBase(URLBase):
         ConfigBase.__normalize_tag_groups(group_tags)
 
         #
-        # URL Processing
+        # Apply our tag groups if they're defined
         #
         for entry in preloaded:
             # Point to our results entry for easier reference below
             results = entry["results"]
 
-            #
-            # Apply our tag groups if they're defined
-            #
             for group, tags in group_tags.items():
                 # Detect if anything assigned to this tag also maps back to a
                 # group.  If so we want to add the group to our list
@@ -843,10 +1313,59 @@ class ConfigBase(URLBase):
                 ):
                     results["tag"].add(group)
 
+        return (preloaded, configs)
+
+    @staticmethod
+    def config_parse_yaml(
+        content: str,
+        asset: AppriseAsset | None = None,
+        reload: ConfigReload | None = None,
+    ) -> tuple[list[object], list[str]]:
+        """Parse the specified content as though it were a yaml file
+        specifically formatted for Apprise.
+
+        Return a tuple that looks like (servers, configs) where:
+          - servers contains a list of loaded notification plugins
+          - configs contains a list of additional configuration files
+            referenced.
+
+        You may optionally associate an asset with the notification.
+
+        A reload tracker may be provided to re-use the services of a previous
+        load whose entries did not change.
+        """
+
+        # A list of loaded Notification Services
+        servers = []
+
+        # Prepare our Asset Object
+        asset = asset if isinstance(asset, AppriseAsset) else AppriseAsset()
+
+        if reload is None:
+            # Nothing to re-use
+            reload = ConfigReload()
+
+        # Our content is only parsed if it was not compiled before
+        cache = ConfigCache(content, common.ConfigFormat.YAML, asset)
+        compiled = cache.load()
+        if compiled is None:
+            compiled = ConfigBase.__compile_yaml(content, asset)
+            cache.save(*compiled)
+
+        preloaded, configs = compiled
+
+        #
+        # URL Processing
+        #
+        for entry in preloaded:
+            # Point to our results entry for easier reference below
+            results = entry["results"]
+
+            # Now we generate our plugin
             try:
                 # Attempt to create an instance of our plugin using the
                 # parsed URL information
-                plugin = N_MGR[results["schema"]](**results)
+                plugin = reload.instantiate(results)
 
                 # Create log entry of loaded URL
                 ConfigBase.logger.debug(
@@ -857,9 +1376,8 @@ class ConfigBase(URLBase):
             except Exception as e:
                 # the arguments are invalid or can not be used.
                 ConfigBase.logger.error(
-                    "Could not load URL {} on line {}.".format(
-                        entry["loggable_url"], entry["line"]
-                    )
+                    "Could not load Apprise YAML configuration "
+                    "entry #{}, item #{}".format(entry["entry"], entry["item"])
                 )
                 ConfigBase.logger.debug(f"Loading Exception: {e!s}")
                 continue
@@ -867,28 +1385,22 @@ class ConfigBase(URLBase):
             # if we reach here, we successfully loaded our data
             servers.append(plugin)
 
-        # Return what was loaded
         return (servers, configs)
 
     @staticmethod
-    def config_parse_yaml(
+    def __compile_yaml(
         content: str,
-        asset: AppriseAsset | None = None,
-    ) -> tuple[list[object], list[str]]:
-        """Parse the specified content as though it were a yaml file
-        specifically formatted for Apprise.
+        asset: AppriseAsset,
+    ) -> tuple[list[dict[str, object]], list[str]]:
+        """Parses the specified YAML content (see config_parse_yaml()) into
+        the arguments each of its notification plugins is instantiated with.
 
-        Return a tuple that looks like (servers, configs) where:
-          - servers contains a list of loaded notification plugins
+        Return a tuple that looks like (preloaded, configs) where:
+          - preloaded contains a list of the parsed entries
           - configs contains a list of additional configuration files
             referenced.
-
-        You may optionally associate an asset with the notification.
         """
 
-        # A list of loaded Notification Services
-        servers = []
-
         # A list of additional configuration files referenced using
         # the include keyword
         configs = []
@@ -901,10 +1413,11 @@ class ConfigBase(URLBase):
 
         try:
             # Load our data (safely)
-            result = yaml.load(content, Loader=yaml.SafeLoader)
+            result = yaml.load(content, Loader=YAML_LOADER)
 
         except (
             AttributeError,
+            TypeError,
             yaml.parser.ParserError,
             yaml.error.MarkedYAMLError,
         ) as e:
@@ -932,7 +1445,6 @@ class ConfigBase(URLBase):
         #
         # global asset object
         #
-        asset = asset if isinstance(asset, AppriseAsset) else AppriseAsset()
 
         # Prepare our default timezone
         default_timezone = asset.tzinfo
@@ -1517,15 +2029,12 @@ class ConfigBase(URLBase):
         ConfigBase.__normalize_tag_groups(group_tags)
 
         #
-        # URL Processing
+        # Apply our tag groups if they're defined
         #
         for entry in preloaded:
             # Point to our results entry for easier reference below
             results = entry["results"]
 
-            #
-            # Apply our tag groups if they're defined
-            #
             for group, tags in group_tags.items():
                 # Detect if anything assigned to this tag also maps back to a
                 # group.  If so we want to add the group to our list
@@ -1534,32 +2043,7 @@ class ConfigBase(URLBase):
                 ):
                     results["tag"].add(group)
 
-            # Now we generate our plugin
-            try:
-                # Attempt to create an instance of our plugin using the
-                # parsed URL information
-                plugin = N_MGR[results["schema"]](**results)
-
-                # Create log entry of loaded URL
-                ConfigBase.logger.debug(
-                    "Loaded URL: %s",
-                    plugin.url(privacy=results["asset"].secure_logging),
-                )
-
-            except Exception as e:
-                # the arguments are invalid or can not be used.
-                ConfigBase.logger.error(
-                    "Could not load Apprise YAML configuration "
-                    "entry #{}, item #{}".format(entry["entry"], entry["item"])
-                )
-                ConfigBase.logger.debug(f"Loading Exception: {e!s}")
-                continue
-
-            # if we reach here, we successfully loaded our data
-            servers.append(plugin)
-
-        preloaded.clear()
-        return (servers, configs)
+        return (preloaded, configs)
 
     def pop(self, index: int = -1) -> object:
         """Removes an indexed Notification Service from the stack and returns
@@ -31,6 +31,7 @@ import re
 from ..common import ConfigFormat, ContentIncludeMode
 from ..locale import gettext_lazy as _
 from ..utils.disk import path_decode
+from ..utils.parse import parse_bool
 from .base import ConfigBase
 
 
@@ -46,14 +47,25 @@ class ConfigFile(ConfigBase):
     # Configuration file inclusion can only be of the same type
     allow_cross_includes = ContentIncludeMode.STRICT
 
-    def __init__(self, path, **kwargs):
+    def __init__(self, path, watch=False, **kwargs):
         """Initialize File Object.
 
         headers can be a dictionary of key/value pairs that you want to
         additionally include as part of the server headers to post with
+
+        If watch is set, the file (and any local file it includes) is polled
+        for changes (modification time and size) every time our servers are
+        requested; the configuration is reloaded as soon as it changes
+        regardless of our cache setting.
         """
         super().__init__(**kwargs)
 
+        # Poll our file for changes
+        self.watch = parse_bool(watch)
+
+        # The signature of our file as it was when we last read it
+        self._signature = None
+
         # Store our file path as it was set
         self.path = path_decode(path)
 
@@ -85,6 +97,9 @@ class ConfigFile(ConfigBase):
             # A format was enforced; make sure it's passed back with the url
             params["format"] = self.config_format
 
+        if self.watch:
+            params["watch"] = "yes"
+
         return "file://{path}{params}".format(
             path=self.quote(self.__original_path),
             params=f"?{self.urlencode(params)}" if params else "",
@@ -96,6 +111,9 @@ class ConfigFile(ConfigBase):
 
         response = None
 
+        # Track the state of the file we're about to read
+        self._signature = self.signature()
+
         try:
             if (
                 self.max_buffer_size > 0
@@ -154,6 +172,36 @@ class ConfigFile(ConfigBase):
         # Return our response object
         return response
 
+    def signature(self):
+        """Returns the modification time and size of our file or None if it
+        could not be accessed."""
+        try:
+            stat = os.stat(self.path)
+
+        except OSError:
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def modified(self):
+        """Returns True if our file, or any local file we included, changed
+        since it was last read."""
+        if self.signature() != self._signature:
+            return True
+
+        return any(
+            cfg.modified()
+            for cfg in self._includes.values()
+            if isinstance(cfg, ConfigFile)
+        )
+
+    def expired(self):
+        """Returns True if our configuration should be reloaded.
+
+        Watched files are also considered expired as soon as they change.
+        """
+        return super().expired() or (self.watch and self.modified())
+
     @staticmethod
     def parse_url(url):
         """Parses the URL so that we can handle all different file paths and
@@ -169,4 +217,8 @@ class ConfigFile(ConfigBase):
             return None
 
         results["path"] = ConfigFile.unquote(match.group("path"))
+
+        if "watch" in results["qsd"]:
+            results["watch"] = parse_bool(results["qsd"]["watch"])
+
         return results
@@ -25,14 +25,18 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import hashlib
+import json
 import re
+import threading
 
 import requests
 
-from ..common import ConfigFormat, ContentIncludeMode
+from ..common import ConfigFormat, ContentIncludeMode, PersistentStoreMode
 from ..locale import gettext_lazy as _
+from ..persistent_store import PersistentStore
 from ..url import PrivacyMode
-from ..utils.parse import URL_PATH_SAFE_CHARS
+from ..utils.parse import URL_PATH_SAFE_CHARS, parse_bool
 from .base import ConfigBase
 
 # Support YAML formats
@@ -47,6 +51,9 @@ MIME_IS_YAML = re.compile(r"(text|application)/(x-)?yaml", re.I)
 # text/html
 MIME_IS_TEXT = re.compile(r"text/(plain|html)", re.I)
 
+# The persistent storage key our last retrieved configuration is kept under
+HTTP_CONFIG_STORE_KEY = "config"
+
 
 class ConfigHTTP(ConfigBase):
     """A wrapper for HTTP based configuration sources."""
@@ -69,14 +76,46 @@ class ConfigHTTP(ConfigBase):
     # Configuration file inclusion can always include this type
     allow_cross_includes = ContentIncludeMode.ALWAYS
 
-    def __init__(self, headers=None, **kwargs):
+    def __init__(self, headers=None, swr=False, **kwargs):
         """Initialize HTTP Object.
 
         headers can be a dictionary of key/value pairs that you want to
         additionally include as part of the server headers to post with
+
+        The last configuration retrieved is revalidated with the server
+        (using its ETag and/or Last-Modified validators) instead of being
+        downloaded again.  If persistent storage is available, a copy of it
+        (and its validators) is kept there so that new processes can start
+        from it too; like the rest of the persistent storage, this copy is
+        not encrypted.
+
+        When swr (stale-while-revalidate) is set, a previously retrieved
+        configuration is used as is while it is revalidated in the
+        background; the new content is picked up by the next call to
+        servers() once it arrives.
         """
         super().__init__(**kwargs)
 
+        # Serve stale content while revalidating in the background
+        self.swr = parse_bool(swr)
+
+        # The content last retrieved, its detected format and the
+        # validators the server provided along with it
+        self._content = None
+        self._content_format = None
+        self._etag = None
+        self._last_modified = None
+
+        # Set when a background refresh retrieved new content
+        self._refreshed = False
+
+        # Our background refresh (if one is running)
+        self._refresh = None
+        self._refresh_lock = threading.Lock()
+
+        # Our persistent store (once it has been initialized)
+        self.__store = None
+
         self.schema = "https" if self.secure else "http"
 
         self.fullpath = kwargs.get("fullpath")
@@ -106,6 +145,9 @@ class ConfigHTTP(ConfigBase):
             "cache": cache,
         }
 
+        if self.swr:
+            params["swr"] = "yes"
+
         # Extend our parameters
         params.update(self.url_parameters(privacy=privacy, *args, **kwargs))
 
@@ -148,6 +190,31 @@ class ConfigHTTP(ConfigBase):
         """Perform retrieval of the configuration based on the specified
         request."""
 
+        # Whatever a background refresh retrieved is now being read
+        self._refreshed = False
+
+        if self._content is None:
+            # Start from the copy a previous process may have left for us
+            self._load()
+
+        if self.swr and self._content is not None:
+            # Use what we have while we check for something newer
+            content = self._content
+            self._apply_format()
+            self._revalidate()
+            return content
+
+        return self._fetch()
+
+    def expired(self):
+        """Returns True if our configuration should be (re-)read; this is
+        always the case once a background refresh retrieved new content."""
+        return self._refreshed or super().expired()
+
+    def _fetch(self):
+        """Retrieves (or revalidates) our configuration and returns it;
+        None is returned if it could not be."""
+
         # prepare XML Object
         headers = {
             "User-Agent": self.app_id,
@@ -156,6 +223,14 @@ class ConfigHTTP(ConfigBase):
         # Apply any/all header over-rides defined
         headers.update(self.headers)
 
+        if self._content is not None:
+            # Only have our configuration sent back to us if it changed
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
         auth = None
         if self.user:
             auth = (self.user, self.password)
@@ -181,7 +256,7 @@ class ConfigHTTP(ConfigBase):
 
         try:
             # Make our request
-            with requests.post(
+            with self.http.post(
                 url,
                 headers=headers,
                 auth=auth,
@@ -190,6 +265,20 @@ class ConfigHTTP(ConfigBase):
                 allow_redirects=self.redirects,
                 stream=True,
             ) as r:
+                if r.status_code == requests.codes.not_modified or (
+                    r.status_code == requests.codes.precondition_failed
+                    and "If-None-Match" in headers
+                ):
+                    # Our configuration has not changed; since we POST our
+                    # request, a matching ETag may also be reported as a
+                    # failed precondition
+                    self.logger.debug(
+                        "HTTP configuration unchanged: "
+                        f"{self.url(privacy=True)}"
+                    )
+                    self._apply_format()
+                    return self._content
+
                 # Handle Errors
                 r.raise_for_status()
 
@@ -241,19 +330,27 @@ class ConfigHTTP(ConfigBase):
                     # Return None - buffer execeeded
                     return None
 
-                # Detect config format based on mime if the format isn't
-                # already enforced
+                # Detect config format based on mime
                 content_type = r.headers.get(
                     "Content-Type", "application/octet-stream"
                 )
-                if self.config_format is None and content_type:
+                content_format = None
+                if content_type:
                     if MIME_IS_YAML.match(content_type) is not None:
                         # YAML data detected based on header content
-                        self.default_config_format = ConfigFormat.YAML
+                        content_format = ConfigFormat.YAML
 
                     elif MIME_IS_TEXT.match(content_type) is not None:
                         # TEXT data detected based on header content
-                        self.default_config_format = ConfigFormat.TEXT
+                        content_format = ConfigFormat.TEXT
+
+                # Keep our content (and validators) for next time
+                self._content = response
+                self._content_format = content_format
+                self._etag = r.headers.get("ETag")
+                self._last_modified = r.headers.get("Last-Modified")
+                self._apply_format()
+                self._save()
 
         except requests.RequestException as e:
             self.logger.error(
@@ -268,6 +365,119 @@ class ConfigHTTP(ConfigBase):
         # Return our response object
         return response
 
+    def _apply_format(self):
+        """Uses the format detected with our content unless one is already
+        enforced."""
+        if self.config_format is None and self._content_format:
+            self.default_config_format = self._content_format
+
+    def _revalidate(self):
+        """Revalidates our configuration in the background (unless we are
+        already doing so)."""
+        with self._refresh_lock:
+            if self._refresh is not None and self._refresh.is_alive():
+                return
+
+            self._refresh = threading.Thread(
+                target=self.__refresh_worker, daemon=True
+            )
+            self._refresh.start()
+
+    def __refresh_worker(self):
+        """Retrieves our configuration and flags it if it changed."""
+        previous = self._content
+        content = self._fetch()
+        if content is not None and content != previous:
+            # Have servers() pick up our new content
+            self._refreshed = True
+
+    @property
+    def store(self):
+        """Returns the persistent store our configuration is kept in or None
+        if persistent storage is not available."""
+        if (
+            not self.asset.storage_path
+            or self.asset.storage_mode == PersistentStoreMode.MEMORY
+        ):
+            return None
+
+        if self.__store is None:
+            self.__store = PersistentStore(
+                namespace=self.url_id(),
+                path=self.asset.storage_path,
+                mode=self.asset.storage_mode,
+            )
+
+        return self.__store
+
+    @property
+    def _store_key(self):
+        """Returns the persistent storage key of our configuration; the
+        headers we send may alter the response we get back."""
+        if not self.headers:
+            return HTTP_CONFIG_STORE_KEY
+
+        digest = hashlib.sha256(
+            json.dumps(sorted(self.headers.items())).encode(self.encoding)
+        ).hexdigest()
+        return f"{HTTP_CONFIG_STORE_KEY}-{digest[:8]}"
+
+    def _load(self):
+        """Loads the configuration left in persistent storage (if any)."""
+        store = self.store
+        if store is None:
+            return
+
+        data = store.read(self._store_key)
+        if not data:
+            return
+
+        try:
+            entry = json.loads(data)
+            content = entry["content"]
+            content_format = entry.get("format")
+            if not isinstance(content, str):
+                raise TypeError("content must be a string")
+
+            content_format = (
+                ConfigFormat(content_format) if content_format else None
+            )
+
+        except (ValueError, TypeError, KeyError, AttributeError) as e:
+            self.logger.warning(
+                "Ignoring the invalid HTTP configuration cache of "
+                f"{self.url(privacy=True)}"
+            )
+            self.logger.debug(f"Cache Exception: {e!s}")
+            return
+
+        self._content = content
+        self._content_format = content_format
+        self._etag = entry.get("etag")
+        self._last_modified = entry.get("last_modified")
+
+    def _save(self):
+        """Writes our configuration to persistent storage (if available)."""
+        store = self.store
+        if store is None:
+            return
+
+        store.write(
+            json.dumps(
+                {
+                    "content": self._content,
+                    "format": (
+                        self._content_format.value
+                        if self._content_format
+                        else None
+                    ),
+                    "etag": self._etag,
+                    "last_modified": self._last_modified,
+                }
+            ),
+            key=self._store_key,
+        )
+
     @staticmethod
     def parse_url(url):
         """Parses the URL and returns enough arguments that can allow us to re-
@@ -283,4 +493,8 @@ class ConfigHTTP(ConfigBase):
         results["headers"] = results["qsd-"]
         results["headers"].update(results["qsd+"])
 
+        # Stale-while-revalidate
+        if "swr" in results["qsd"]:
+            results["swr"] = parse_bool(results["qsd"]["swr"])
+
         return results
@@ -26,9 +26,12 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 from bisect import bisect_left
+from collections import OrderedDict
 import contextlib
+import hashlib
 from html.parser import HTMLParser
 import re
+import threading
 
 from markdown import markdown
 
@@ -77,6 +80,96 @@ class _ParaBreak:
         self.in_quote = in_quote
 
 
+class ConversionCache:
+    """A bounded, thread-safe LRU cache of converted content.
+
+    The cache is bounded by the number of bytes of content it holds rather
+    than by its number of entries; the least recently used entries are
+    evicted first.  Hits and misses are counted so that the effectiveness
+    of the cache can be monitored.
+    """
+
+    def __init__(self, max_size=4194304):
+        """Initialize our cache; max_size is defined in bytes."""
+
+        # The maximum number of bytes we hold on to
+        self.max_size = max_size
+
+        # The number of bytes we currently hold on to
+        self.size = 0
+
+        # Our counters
+        self.hits = 0
+        self.misses = 0
+
+        # Our entries; the most recently used ones are kept at the end
+        self._entries = OrderedDict()
+
+        # Guards our entries and counters
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def sizeof(*content):
+        """Returns the number of bytes the content provided is measured at
+        against our max_size."""
+        return sum(len(c.encode("utf-8", "surrogatepass")) for c in content)
+
+    @staticmethod
+    def digest(content):
+        """Returns the digest content is identified by within our keys."""
+        return hashlib.blake2b(
+            content.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+    def get(self, key):
+        """Returns the value cached under key or None if there isn't one."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size):
+        """Caches a value (that is size bytes large) under key."""
+        if size > self.max_size:
+            # We'd have to evict everything else to make room for it
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+
+            self._entries[key] = (value, size)
+            self.size += size
+
+            while self.size > self.max_size:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self):
+        """Removes all of our entries and resets our counters."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        """Returns the number of entries cached."""
+        return len(self._entries)
+
+
+# The cache our prepared notification content is kept in; it is shared by
+# every Apprise object of this process that enables it (see
+# AppriseAsset.conversion_cache)
+CONVERSION_CACHE = ConversionCache()
+
+
 def convert_between(from_format, to_format, content):
     """Converts between different suported formats. If no conversion exists, or
     the selected one fails, the original text will be returned.
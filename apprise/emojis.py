@@ -25,7 +25,6 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-import re
 import time
 
 from .logger import logger
@@ -2146,46 +2145,108 @@ EMOJI_MAP = {
     DELIM + r"wales" + DELIM: "🏴󠁧󠁢󠁷󠁬󠁳󠁿",
 }
 
-# Define our singletons
-EMOJI_COMPILED_MAP = None
-# List of (compiled_fullmatch_pattern, emoji) for resolving alternation keys
-_EMOJI_PATTERN_LIST = None
+# Our alias (the name found between our delimiters) to emoji lookup table.
+# It is generated from EMOJI_MAP the first time it is needed.
+EMOJI_ALIAS_MAP = None
+
+# The length of the longest alias found in EMOJI_ALIAS_MAP
+EMOJI_ALIAS_MAXLEN = 0
+
+
+def expand_aliases(pattern):
+    """Returns every string matched by an EMOJI_MAP pattern.
+
+    Only the (small) subset of regular expressions used by EMOJI_MAP is
+    understood: literals, escaped characters, groups, alternation and the
+    optional (?) quantifier.
+    """
+
+    def sequence(i):
+        # Parse everything up to the end of our group or alternative
+        results = [""]
+        while i < len(pattern) and pattern[i] not in "|)":
+            if pattern[i] == "(":
+                options, i = alternation(i + 1)
+                # Skip over our closing bracket
+                i += 1
+
+            elif pattern[i] == "\\":
+                options, i = [pattern[i + 1]], i + 2
+
+            else:
+                options, i = [pattern[i]], i + 1
+
+            if i < len(pattern) and pattern[i] == "?":
+                options, i = ["", *options], i + 1
+
+            results = [r + o for r in results for o in options]
+
+        return results, i
+
+    def alternation(i):
+        results, i = sequence(i)
+        while i < len(pattern) and pattern[i] == "|":
+            options, i = sequence(i + 1)
+            results.extend(options)
+
+        return results, i
+
+    return alternation(0)[0]
 
 
 def apply_emojis(content):
     """Takes the content and swaps any matched emoji's found with their utf-8
     encoded mapping."""
 
-    global EMOJI_COMPILED_MAP, _EMOJI_PATTERN_LIST
+    global EMOJI_ALIAS_MAP, EMOJI_ALIAS_MAXLEN
 
-    if EMOJI_COMPILED_MAP is None:
+    if EMOJI_ALIAS_MAP is None:
         t_start = time.time()
-        # Perform our compilation
-        EMOJI_COMPILED_MAP = re.compile(
-            r"(" + "|".join(EMOJI_MAP.keys()) + r")", re.IGNORECASE
-        )
-
-        # - EMOJI_MAP keys are regex patterns (e.g. ":(\+1|thumbsup):")
-        # - x.group() from a match cannot be used as a dict key directly.
-        #
-        # Build a per-entry compiled pattern for fullmatch lookups so
-        # alternation/optional-group keys resolve correctly.
-        _EMOJI_PATTERN_LIST = [
-            (re.compile(r"(?:" + pat + r")", re.IGNORECASE), emoji)
-            for pat, emoji in EMOJI_MAP.items()
-        ]
-        logger.trace(f"Emoji engine loaded in {time.time() - t_start:.4f}s")
 
-    def _lookup(m):
-        text = m.group()
-        for pat, emoji in _EMOJI_PATTERN_LIST:
-            if pat.fullmatch(text):
-                return emoji
-        return text
+        # Expand our patterns into every alias they match; the first
+        # pattern to define an alias wins
+        alias_map = {}
+        for pattern, emoji in EMOJI_MAP.items():
+            for alias in expand_aliases(pattern):
+                alias_map.setdefault(alias.strip(DELIM).lower(), emoji)
 
-    try:
-        return EMOJI_COMPILED_MAP.sub(_lookup, content)
+        EMOJI_ALIAS_MAXLEN = max(len(alias) for alias in alias_map)
+        EMOJI_ALIAS_MAP = alias_map
+        logger.trace(f"Emoji engine loaded in {time.time() - t_start:.4f}s")
 
-    except TypeError:
+    if not isinstance(content, str):
         # No change; but force string return
         return ""
+
+    # Our content is tokenized in a single pass; every delimiter we come
+    # across opens a potential :alias: that the next one closes
+    result = []
+    copied = 0
+    start = content.find(DELIM)
+    while start >= 0:
+        end = content.find(DELIM, start + 1)
+        if end < 0:
+            break
+
+        emoji = (
+            EMOJI_ALIAS_MAP.get(content[start + 1 : end].lower())
+            if end - start - 1 <= EMOJI_ALIAS_MAXLEN
+            else None
+        )
+
+        if emoji is None:
+            # Our closing delimiter may open the next alias
+            start = end
+            continue
+
+        result.append(content[copied:start])
+        result.append(emoji)
+        copied = end + 1
+        start = content.find(DELIM, copied)
+
+    if not result:
+        # Nothing to swap
+        return content
+
+    result.append(content[copied:])
+    return "".join(result)
@@ -28,6 +28,7 @@
 import contextlib
 import hashlib
 import inspect
+import json
 import os
 from os.path import abspath, dirname, join
 import re
@@ -61,6 +62,10 @@ class PluginManager(metaclass=Singleton):
     # For filtering our result when scanning a module
     module_filter_re = re.compile(r"^(?P<name>((?!_)[A-Za-z0-9]+))$")
 
+    # Used for the detection of additional Notify Services objects
+    # The .py extension is optional as we support loading directories too
+    module_re = re.compile(r"^(?P<name>(?!base|_)[a-z0-9_]+)(\.py)?$", re.I)
+
     # thread safe loading
     _lock = threading.Lock()
 
@@ -122,6 +127,21 @@ class PluginManager(metaclass=Singleton):
         # Track loaded module paths to prevent from loading them again
         self._loaded = set()
 
+        # An optional path to a JSON file used to index the schemas provided
+        # by each of our native modules.  The index is written the first
+        # time all of our modules are scanned and is re-used afterwards (for
+        # as long as none of them change) so that only the modules whose
+        # schemas are actually looked up need to be imported.
+        self.index_path = None
+
+        # Indexed schemas whose module has not been imported yet; the
+        # structure looks like {'schema': 'module.py'}
+        self._index = {}
+
+        # Indexed modules not imported yet; the structure looks like
+        # {'module.py': ['schema1', 'schema2']}
+        self._pending = {}
+
     def unload_modules(self, disable_native=False):
         """Reset our object and unload all modules."""
 
@@ -155,6 +175,8 @@ class PluginManager(metaclass=Singleton):
             # Reset our variables
             self._schema_map = {}
             self._custom_module_map = {}
+            self._index = {}
+            self._pending = {}
             if disable_native:
                 self._module_map = {}
 
@@ -187,24 +209,44 @@ class PluginManager(metaclass=Singleton):
                 self._schema_map = {}
                 self._custom_module_map = {}
 
-            # Used for the detection of additional Notify Services objects
-            # The .py extension is optional as we support loading directories
-            # too
-            module_re = re.compile(
-                r"^(?P<name>(?!base|_)[a-z0-9_]+)(\.py)?$", re.I
-            )
+            # Our native modules can be indexed
+            native = module_path == self.module_path
 
             t_start = time.time()
+            index = self._read_index() if native else None
+            if index is not None:
+                # Defer the import of each module until one of its schemas is
+                # looked up for the first time
+                self._pending = index
+                self._index = {
+                    schema: f
+                    for f, schemas in self._pending.items()
+                    for schema in schemas
+                }
+
+                # Track the directory loaded so we never load it again
+                self._loaded.add(module_path)
+
+                logger.debug(
+                    f"{len(self._pending)} {self.name}(s) and"
+                    f" {len(self._index)} Schema(s) indexed in"
+                    f" {time.time() - t_start:.4f}s"
+                )
+
+                self._build_dep_counter()
+                return
+
+            # Track the schemas provided by each module we load
+            index = {}
+
             for f in os.listdir(module_path):
-                tl_start = time.time()
-                match = module_re.match(f)
+                match = self.module_re.match(f)
                 if not match:
                     # keep going
                     continue
 
                 # Store our notification/plugin name:
                 module_name = match.group("name")
-                module_pyname = f"{module_name_prefix}.{module_name}"
 
                 if module_name in self._module_map:
                     logger.warning(
@@ -213,89 +255,16 @@ class PluginManager(metaclass=Singleton):
                         module_name,
                         os.path.join(module_path, f),
                     )
-                    continue
-
-                try:
-                    module = __import__(
-                        module_pyname,
-                        globals(),
-                        locals(),
-                        fromlist=[module_name],
-                    )
-
-                except ImportError:
-                    # No problem, we can try again another way...
-                    module = import_module(
-                        os.path.join(module_path, f), module_pyname
-                    )
-                    if not module:
-                        # logging found in import_module and not needed here
-                        continue
-
-                module_class = None
-                for m_class in [
-                    obj
-                    for obj in dir(module)
-                    if self.module_filter_re.match(obj)
-                ]:
-                    # Get our plugin
-                    plugin = getattr(module, m_class)
-                    if not hasattr(plugin, "app_id"):
-                        # Filter out non-notification modules
-                        logger.trace(
-                            "(%s.%s) import failed; no app_id defined in %s",
-                            self.name,
-                            m_class,
-                            os.path.join(module_path, f),
-                        )
-                        continue
-
-                    # Add our plugin name to our module map
-                    self._module_map[module_name] = {
-                        "plugin": {plugin},
-                        "module": module,
-                        "path": f"{module_name_prefix}.{module_name}",
-                        "native": True,
-                    }
-
-                    fn = getattr(plugin, "schemas", None)
-                    schemas = set() if not callable(fn) else fn(plugin)
-
-                    # map our schema to our plugin
-                    for schema in schemas:
-                        if schema in self._schema_map:
-                            logger.error(
-                                f"{self.name} schema ({schema}) mismatch"
-                                " detected -"
-                                f" {self._schema_map[schema]} already maps to"
-                                f" {plugin}"
-                            )
-                            continue
-
-                        # Assign plugin
-                        self._schema_map[schema] = plugin
-
-                    # Store our class
-                    module_class = m_class
-                    break
 
-                if not module_class:
-                    # Not a library we can load as it doesn't follow the simple
-                    # rule that the class must bear the same name as the
-                    # notification file itself.
-                    logger.trace(
-                        "%s (%s) import failed; no filename/Class "
-                        "match found in %s",
-                        self.name,
-                        module_name,
-                        os.path.join(module_path, f),
-                    )
+                    # Our index would be incomplete
+                    index = None
                     continue
 
-                logger.trace(
-                    f"{self.name} {module_name} loaded"
-                    f" in {time.time() - tl_start:.6f}s"
+                schemas = self._load_module(
+                    f, module_name, module_name_prefix, module_path
                 )
+                if schemas is not None and index is not None:
+                    index[f] = sorted(schemas)
 
             # Track the directory loaded so we never load it again
             self._loaded.add(module_path)
@@ -306,12 +275,264 @@ class PluginManager(metaclass=Singleton):
                 f" {time.time() - t_start:.4f}s"
             )
 
+            if native:
+                # Nothing remains to be loaded
+                self._pending = {}
+                self._index = {}
+                if index is not None:
+                    self._write_index(index)
+
             # Build the runtime dependency reference counter so that
             # disable() can evict libraries when their last user is
             # disabled.  This is done here (inside the lock) by iterating
             # _module_map directly to avoid a recursive lock acquisition.
             self._build_dep_counter()
 
+    def _load_module(self, f, module_name, module_name_prefix, module_path):
+        """Imports a single module found in module_path and maps the schemas
+        of the plugin it contains.
+
+        The schemas associated with the plugin are returned, otherwise None is
+        returned if the module could not be loaded.
+        """
+        t_start = time.time()
+        module_pyname = f"{module_name_prefix}.{module_name}"
+
+        try:
+            module = __import__(
+                module_pyname,
+                globals(),
+                locals(),
+                fromlist=[module_name],
+            )
+
+        except ImportError:
+            # No problem, we can try again another way...
+            module = import_module(os.path.join(module_path, f), module_pyname)
+            if not module:
+                # logging found in import_module and not needed here
+                return None
+
+        for m_class in [
+            obj for obj in dir(module) if self.module_filter_re.match(obj)
+        ]:
+            # Get our plugin
+            plugin = getattr(module, m_class)
+            if not hasattr(plugin, "app_id"):
+                # Filter out non-notification modules
+                logger.trace(
+                    "(%s.%s) import failed; no app_id defined in %s",
+                    self.name,
+                    m_class,
+                    os.path.join(module_path, f),
+                )
+                continue
+
+            # Add our plugin name to our module map
+            self._module_map[module_name] = {
+                "plugin": {plugin},
+                "module": module,
+                "path": module_pyname,
+                "native": True,
+            }
+
+            fn = getattr(plugin, "schemas", None)
+            schemas = set() if not callable(fn) else fn(plugin)
+
+            # map our schema to our plugin
+            for schema in schemas:
+                if schema in self._schema_map:
+                    logger.error(
+                        f"{self.name} schema ({schema}) mismatch"
+                        " detected -"
+                        f" {self._schema_map[schema]} already maps to"
+                        f" {plugin}"
+                    )
+                    continue
+
+                # Assign plugin
+                self._schema_map[schema] = plugin
+
+            logger.trace(
+                f"{self.name} {module_name} loaded"
+                f" in {time.time() - t_start:.6f}s"
+            )
+            return schemas
+
+        # Not a library we can load as it doesn't follow the simple rule that
+        # the class must bear the same name as the notification file itself.
+        logger.trace(
+            "%s (%s) import failed; no filename/Class match found in %s",
+            self.name,
+            module_name,
+            os.path.join(module_path, f),
+        )
+        return None
+
+    def _index_signature(self):
+        """Generates a signature of our native module path.
+
+        The signature is made up of the modification time of every module
+        found; a change to any of them invalidates a previously written index.
+        """
+        signature = {}
+        for f in os.listdir(self.module_path):
+            if not self.module_re.match(f):
+                continue
+
+            path = os.path.join(self.module_path, f)
+            if not os.path.isdir(path):
+                signature[f] = os.stat(path).st_mtime_ns
+                continue
+
+            # Track the most recent change made within a package
+            signature[f] = max(
+                (
+                    os.stat(os.path.join(root, name)).st_mtime_ns
+                    for root, _, files in os.walk(path)
+                    for name in files
+                    if name.endswith(".py")
+                ),
+                default=0,
+            )
+
+        return signature
+
+    def _read_index(self):
+        """Returns the modules (and the schemas they provide) stored in our
+        index file.
+
+        None is returned if there is no index or if it is out of date.
+        """
+        if not self.index_path:
+            return None
+
+        try:
+            with open(self.index_path, encoding="utf-8") as fp:
+                content = json.load(fp)
+
+            if (
+                content["path"] != self.module_path
+                or content["python"] != list(sys.version_info[:2])
+                or content["signature"] != self._index_signature()
+            ):
+                logger.debug(
+                    "%s index %s is out of date", self.name, self.index_path
+                )
+                return None
+
+            return {
+                f: list(schemas)
+                for f, schemas in content["modules"].items()
+                if self.module_re.match(f)
+            }
+
+        except FileNotFoundError:
+            # No index generated yet
+            return None
+
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.debug(
+                "%s index %s could not be read: %s",
+                self.name,
+                self.index_path,
+                str(e),
+            )
+
+        return None
+
+    def _write_index(self, index):
+        """Writes the modules (and the schemas they provide) to our index
+        file."""
+        if not self.index_path:
+            return False
+
+        content = {
+            "path": self.module_path,
+            "python": list(sys.version_info[:2]),
+            "signature": self._index_signature(),
+            "modules": index,
+        }
+
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(dirname(self.index_path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                json.dump(content, fp)
+
+            # Atomically replace any previous index
+            os.replace(tmp_path, self.index_path)
+
+        except OSError as e:
+            logger.debug(
+                "%s index %s could not be written: %s",
+                self.name,
+                self.index_path,
+                str(e),
+            )
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            return False
+
+        logger.trace("%s index written to %s", self.name, self.index_path)
+        return True
+
+    def _load_pending(self, f=None):
+        """Imports the indexed module(s) that have not been loaded yet.
+
+        If no module is specified, all of them are loaded.  This must be
+        called while holding our lock.
+        """
+        for f_ in [f] if f else list(self._pending):
+            schemas = self._pending.pop(f_, None)
+            if schemas is None:
+                # Already handled
+                continue
+
+            for schema in schemas:
+                self._index.pop(schema, None)
+
+            module_name = self.module_re.match(f_).group("name")
+            if module_name in self._module_map:
+                continue
+
+            if (
+                self._load_module(
+                    f_, module_name, self.module_name_prefix, self.module_path
+                )
+                is None
+            ):
+                continue
+
+            # Account for our newly loaded plugin(s)
+            for plugin in self._module_map[module_name]["plugin"]:
+                if getattr(plugin, "enabled", False):
+                    self._update_dep_counter(plugin, +1)
+
+    def _resolve(self, schema=None):
+        """Ensures the plugin associated with the schema specified is loaded.
+
+        If no schema is specified, all of our indexed plugins are loaded.
+        """
+        if not self:
+            # Lazy load
+            self.load_modules()
+
+        if schema is None:
+            if self._pending:
+                with self._lock:
+                    self._load_pending()
+            return
+
+        if schema in self._schema_map or schema not in self._index:
+            # Nothing further to do
+            return
+
+        with self._lock:
+            f = self._index.get(schema)
+            if f is not None:
+                self._load_pending(f)
+
     def module_detection(self, paths, cache=True):
         """Leverage the @notify decorator and load all objects found matching
         this."""
@@ -613,9 +834,8 @@ class PluginManager(metaclass=Singleton):
 
     def plugins(self, include_disabled=True):
         """Return all of our loaded plugins."""
-        if not self:
-            # Lazy load
-            self.load_modules()
+        # Ensure all of our plugins are loaded
+        self._resolve()
 
         for module in self._module_map.values():
             for plugin in module["plugin"]:
@@ -629,9 +849,8 @@ class PluginManager(metaclass=Singleton):
         if include_disabled == True, then even disabled notifications are
         returned
         """
-        if not self:
-            # Lazy load
-            self.load_modules()
+        # Ensure all of our plugins are loaded
+        self._resolve()
 
         # Return our list
         return (
@@ -728,6 +947,8 @@ class PluginManager(metaclass=Singleton):
             self.load_modules()
 
         for schema in schemas:
+            # Ensure the plugin associated with our schema is loaded
+            self._resolve(schema)
             if schema not in self._schema_map:
                 continue
 
@@ -791,9 +1012,8 @@ class PluginManager(metaclass=Singleton):
 
     def __contains__(self, schema):
         """Checks if a schema exists."""
-        if not self:
-            # Lazy load
-            self.load_modules()
+        # Ensure the plugin associated with our schema is loaded
+        self._resolve(schema)
 
         return schema in self._schema_map
 
@@ -841,9 +1061,8 @@ class PluginManager(metaclass=Singleton):
         intact in sys.modules.
         """
 
-        if not self:
-            # Lazy load
-            self.load_modules()
+        # Ensure the plugin associated with our schema is loaded
+        self._resolve(schema)
 
         # Get our plugin (otherwise we throw a KeyError) which is intended on
         # unmap action that doesn't align.
@@ -902,25 +1121,22 @@ class PluginManager(metaclass=Singleton):
 
     def __getitem__(self, schema):
         """Returns the indexed plugin identified by the schema specified."""
-        if not self:
-            # Lazy load
-            self.load_modules()
+        # Ensure the plugin associated with our schema is loaded
+        self._resolve(schema)
 
         return self._schema_map[schema]
 
     def __iter__(self):
         """Returns an iterator so we can iterate over our loaded modules."""
-        if not self:
-            # Lazy load
-            self.load_modules()
+        # Ensure all of our plugins are loaded
+        self._resolve()
 
         return iter(self._module_map.values())
 
     def __len__(self):
         """Returns the number of modules/plugins loaded."""
-        if not self:
-            # Lazy load
-            self.load_modules()
+        # Ensure all of our plugins are loaded
+        self._resolve()
 
         return len(self._module_map)
 
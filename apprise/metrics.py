@@ -0,0 +1,368 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import annotations
+
+from collections import deque
+import contextlib
+import contextvars
+import math
+import threading
+import time
+from typing import Any, Callable, Optional, Union
+
+from .logger import logger
+
+# The phases of a notification timing spans are emitted for:
+#   find      - tag matching (and the loading of any configuration)
+#   convert   - the conversion of the body/title to the service format
+#   emojis    - the substitution of :emoji: definitions
+#   overflow  - the title/body overflow handling (truncate, split, etc)
+#   attach    - the retrieval of an attachment
+#   send      - a single call to the send() of a service
+#   notify    - the delivery to a service (including all of its retries)
+METRICS_PHASES = (
+    "find",
+    "convert",
+    "emojis",
+    "overflow",
+    "attach",
+    "send",
+    "notify",
+)
+
+# The percentiles reported by the MetricsAggregator
+METRICS_PERCENTILES = (50, 95, 99)
+
+# The span currently open within our context; the bytes sent over HTTP
+# while it is open are accounted to it
+CURRENT_SPAN: contextvars.ContextVar[Optional[Span]] = contextvars.ContextVar(
+    "apprise_metrics_span", default=None
+)
+
+
+class Span:
+    """The timing (and outcome) of one phase of a notification."""
+
+    __slots__ = (
+        "bytes_sent",
+        "duration",
+        "name",
+        "parent",
+        "retries",
+        "service",
+        "started",
+        "success",
+        "url_id",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        service: Optional[str] = None,
+        url_id: Optional[str] = None,
+        parent: Optional[Span] = None,
+    ) -> None:
+        """Initialize our span."""
+
+        # The phase (see METRICS_PHASES) and the service it applies to (if
+        # the phase is specific to one)
+        self.name = name
+        self.service = None if service is None else str(service)
+        self.url_id = url_id
+
+        # The span we were opened within (if any)
+        self.parent = parent
+
+        # The time (since the epoch) our span was opened and the number of
+        # seconds it remained open for
+        self.started = time.time()
+        self.duration = 0.0
+
+        # Our outcome; spans that raise an exception are never successful
+        self.success = True
+        self.retries = 0
+        self.bytes_sent = 0
+
+    def __repr__(self) -> str:
+        """Returns a printable version of our span."""
+        return (
+            f"<Span name={self.name!r} service={self.service!r} "
+            f"duration={self.duration:.6f} success={self.success} "
+            f"retries={self.retries} bytes_sent={self.bytes_sent}>"
+        )
+
+
+class MetricsExporter:
+    """The interface every exporter provided to AppriseMetrics implements.
+
+    Exporters are handed each span as it is closed; possibly from several
+    threads at once.  They should hand the span off (to Prometheus,
+    OpenTelemetry, etc) quickly since notifications wait on them.
+    """
+
+    def export(self, span: Span) -> None:
+        """Handles a closed span."""
+        raise NotImplementedError(
+            "export() is not implemented by the child class."
+        )
+
+
+class MetricsAggregator(MetricsExporter):
+    """An exporter that keeps the statistics of every phase (and service) in
+    memory.
+
+    The most recent durations (up to samples) are kept to report the
+    percentiles from.
+    """
+
+    def __init__(self, samples: int = 1024) -> None:
+        """Initialize our aggregator."""
+        self.samples = samples
+
+        # Our statistics keyed by (name, service)
+        self._stats: dict[tuple[str, Optional[str]], dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Accounts for the span provided."""
+        with self._lock:
+            stats = self._stats.get((span.name, span.service))
+            if stats is None:
+                stats = {
+                    "count": 0,
+                    "failures": 0,
+                    "retries": 0,
+                    "bytes_sent": 0,
+                    "total": 0.0,
+                    "durations": deque(maxlen=self.samples),
+                }
+                self._stats[(span.name, span.service)] = stats
+
+            stats["count"] += 1
+            stats["failures"] += 0 if span.success else 1
+            stats["retries"] += span.retries
+            stats["bytes_sent"] += span.bytes_sent
+            stats["total"] += span.duration
+            stats["durations"].append(span.duration)
+
+    def stats(
+        self, name: str, service: Optional[str] = None
+    ) -> Optional[dict[str, Union[int, float]]]:
+        """Returns the statistics of the phase specified or None if it has
+        not been seen yet.
+
+        If no service is specified, the statistics of every service are
+        combined.
+        """
+        with self._lock:
+            entries = [
+                stats
+                for key, stats in self._stats.items()
+                if key[0] == name and (service is None or key[1] == service)
+            ]
+
+            if not entries:
+                return None
+
+            result: dict[str, Union[int, float]] = {
+                key: sum(stats[key] for stats in entries)
+                for key in ("count", "failures", "retries", "bytes_sent")
+            }
+            result["total"] = sum(stats["total"] for stats in entries)
+            durations = sorted(d for s in entries for d in s["durations"])
+
+        result["mean"] = result["total"] / result["count"]
+        for pct in METRICS_PERCENTILES:
+            # Nearest rank
+            rank = max(1, math.ceil(pct / 100.0 * len(durations)))
+            result[f"p{pct}"] = durations[rank - 1]
+
+        return result
+
+    def summary(self) -> dict[tuple[str, Optional[str]], dict[str, Any]]:
+        """Returns the statistics of every phase and service seen keyed by
+        (name, service)."""
+        with self._lock:
+            keys = list(self._stats)
+
+        return {key: self.stats(*key) for key in keys}
+
+    def clear(self) -> None:
+        """Discards all of our statistics."""
+        with self._lock:
+            self._stats.clear()
+
+
+class CallbackExporter(MetricsExporter):
+    """Adapts a plain function (taking a span) to our exporter interface."""
+
+    def __init__(self, callback: Callable[[Span], None]) -> None:
+        """Initialize our exporter."""
+        self.callback = callback
+
+    def export(self, span: Span) -> None:
+        """Hands the span to our callback."""
+        self.callback(span)
+
+
+class AppriseMetrics:
+    """Collects the timing spans emitted while notifications are sent and
+    hands them to each of the exporters registered.
+
+    Assign an instance to AppriseAsset.metrics to enable it:
+
+        metrics = AppriseMetrics(MetricsAggregator())
+        apobj = Apprise(asset=AppriseAsset(metrics=metrics))
+
+    Exporters are either MetricsExporter objects or plain functions taking
+    the span closed as their only argument.
+    """
+
+    def __init__(
+        self, *exporters: Union[MetricsExporter, Callable[[Span], None]]
+    ) -> None:
+        """Initialize our metrics."""
+        self.exporters: list[MetricsExporter] = []
+        for exporter in exporters:
+            self.add(exporter)
+
+    def add(
+        self, exporter: Union[MetricsExporter, Callable[[Span], None]]
+    ) -> MetricsExporter:
+        """Registers an exporter and returns it."""
+        if not isinstance(exporter, MetricsExporter):
+            if not callable(exporter):
+                raise TypeError(
+                    f"An invalid metrics exporter ({exporter!r}) was "
+                    "specified."
+                )
+            exporter = CallbackExporter(exporter)
+
+        # Copied so that spans being emitted are never affected
+        self.exporters = [*self.exporters, exporter]
+        return exporter
+
+    def remove(self, exporter: MetricsExporter) -> None:
+        """Unregisters an exporter previously added."""
+        self.exporters = [
+            e
+            for e in self.exporters
+            if e is not exporter and getattr(e, "callback", None) != exporter
+        ]
+
+    def emit(self, span: Span) -> None:
+        """Hands a closed span to all of our exporters."""
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+
+            except Exception as e:
+                # Never let an exporter get in the way of our notifications
+                logger.warning(
+                    "Metrics exporter %s failed: %s",
+                    type(exporter).__name__,
+                    e,
+                )
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        name: str,
+        service: Optional[str] = None,
+        url_id: Optional[str] = None,
+    ):
+        """Times the body of a with block and emits it as a span once it
+        exits.
+
+        The HTTP request bytes sent while the span is open are accounted to
+        it (and to the span it was opened within).
+        """
+        span = Span(name, service, url_id, parent=CURRENT_SPAN.get())
+        token = CURRENT_SPAN.set(span)
+        started = time.perf_counter()
+        try:
+            yield span
+
+        except BaseException:
+            span.success = False
+            raise
+
+        finally:
+            span.duration = time.perf_counter() - started
+            CURRENT_SPAN.reset(token)
+            if span.parent is not None:
+                span.parent.bytes_sent += span.bytes_sent
+
+            self.emit(span)
+
+
+def span(
+    metrics: Optional[AppriseMetrics],
+    name: str,
+    service: Optional[str] = None,
+    url_id: Optional[str] = None,
+):
+    """Returns metrics.span() or a context manager that does nothing if
+    no metrics are being collected."""
+    if metrics is None:
+        return contextlib.nullcontext(Span(name, service, url_id))
+
+    return metrics.span(name, service, url_id)
+
+
+def request_size(r: Any) -> int:
+    """Returns the size of the body of the request the (requests or httpx)
+    response provided was received for; zero if it can not be determined."""
+
+    request = getattr(r, "request", None)
+    body = getattr(request, "body", None)
+    if body is None:
+        try:
+            # httpx
+            body = getattr(request, "content", None)
+
+        except Exception:
+            # The content of a streamed request can not be accessed
+            return 0
+
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+
+    # Streamed (or unknown) content
+    return 0
+
+
+def account(r: Any) -> None:
+    """Accounts for the request the response provided was received for
+    against the span currently open (if any)."""
+    current = CURRENT_SPAN.get()
+    if current is not None:
+        current.bytes_sent += request_size(r)
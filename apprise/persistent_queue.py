@@ -0,0 +1,566 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import annotations
+
+from collections import deque
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Optional
+import uuid
+
+from .logger import logger
+from .tag import AppriseTag
+from .utils.disk import path_decode
+from .utils.pool import WorkerPool
+
+# The directory (within the persistent storage path) our queue is kept in.
+# It can not be mistaken for a persistent storage namespace (which must start
+# with an alpha-numeric character) and is therefore left alone when the
+# storage is pruned.
+QUEUE_DIR = "_queue"
+
+# The version of the job files we write
+QUEUE_JOB_VERSION = 1
+
+
+def dump_tag(tag):
+    """Returns the tag filter provided in a form that can be written to JSON
+    without losing any of its priority or retry details."""
+
+    if isinstance(tag, AppriseTag):
+        value = str(tag)
+        if tag.has_priority:
+            value = f"{tag.priority}:{value}"
+
+        if tag.retry is not None:
+            value = f"{value}:{tag.retry}"
+
+        return value
+
+    if isinstance(tag, (list, tuple, set)):
+        return [dump_tag(t) for t in tag]
+
+    # Compiled filters (TagMatcher) keep the logic they were created with
+    logic = getattr(tag, "logic", tag)
+    return logic if logic is tag else dump_tag(logic)
+
+
+class PersistentQueue:
+    """A durable queue of notifications waiting to be delivered.
+
+    Every notification is kept in its own job file so that it survives a
+    restart.  The layout mirrors that of the PersistentStore:
+
+        <path>/_queue/tmp/   jobs being written
+        <path>/_queue/var/   jobs waiting to be delivered
+        <path>/_queue/run/   jobs a worker is currently delivering
+
+    Job files are named after the time they are due so that a directory
+    listing is also our delivery order.  A worker claims a job by moving it
+    into the run/ directory; a rename is atomic, so a job can only ever be
+    claimed once, even when several processes drain the same queue.
+
+    A job is only removed once it has been delivered.  Jobs left behind in
+    the run/ directory by a worker that never finished (e.g. the process was
+    killed) are returned to the queue once their lease expires; delivery is
+    therefore at-least-once.  The lease of a job is renewed before and after
+    each of its services is notified, so it only needs to outlive the
+    slowest single service rather than the whole delivery.
+    """
+
+    # Our Temporary working directory
+    temp_dir = "tmp"
+
+    # The directory our pending jobs are placed in
+    data_dir = "var"
+
+    # The directory our claimed jobs are placed in
+    active_dir = "run"
+
+    # Our job file extension
+    extension = ".job"
+
+    # File encoding to use
+    encoding = "utf-8"
+
+    # The number of seconds a worker may go without renewing the lease of a
+    # job (see renew()) before it is considered abandoned and is returned to
+    # the queue
+    lease = 600.0
+
+    # The number of times we attempt to deliver a job before giving up on it
+    max_attempts = 5
+
+    # The delay (in seconds) before a failed job is retried; it is doubled
+    # with each failed attempt up until retry_max_wait is reached
+    retry_backoff = 30.0
+    retry_max_wait = 3600.0
+
+    # How often (in seconds) our background workers check for new jobs when
+    # the queue is empty
+    poll_interval = 1.0
+
+    # The default number of workers used to drain our queue
+    workers = 4
+
+    def __init__(self, path: str) -> None:
+        """Initialize our queue within the persistent storage path provided."""
+
+        self.__base_path = os.path.join(path_decode(path), QUEUE_DIR)
+        self.__temp_path = os.path.join(self.__base_path, self.temp_dir)
+        self.__data_path = os.path.join(self.__base_path, self.data_dir)
+        self.__active_path = os.path.join(self.__base_path, self.active_dir)
+
+        # The pending jobs we last listed; consumed by claim()
+        self.__backlog = deque()
+        self.__lock = threading.Lock()
+
+        # Our background workers (see start())
+        self.__stop = threading.Event()
+        self.__threads = []
+
+    def put(self, job: dict[str, Any], delay: float = 0.0) -> Optional[str]:
+        """Writes the job provided to our queue and returns its key.
+
+        The job is not delivered before the delay (in seconds) has passed.
+        None is returned if the job could not be written.
+        """
+
+        job = dict(job)
+        job.setdefault("version", QUEUE_JOB_VERSION)
+        job.setdefault("created", time.time())
+        job.setdefault("attempts", 0)
+
+        key = "{:014d}-{}".format(
+            int((time.time() + max(0.0, delay)) * 1000), uuid.uuid4().hex
+        )
+
+        if not self.__write(job, os.path.join(self.__data_path, key)):
+            return None
+
+        logger.trace("Queued notification job: %s", key)
+        return key
+
+    def claim(self) -> Optional[tuple[str, dict[str, Any]]]:
+        """Claims the next job that is due and returns it as a (key, job)
+        tuple.  None is returned if there is nothing to deliver."""
+
+        now_ms = int(time.time() * 1000)
+
+        # We only list our queue once per call; a job we failed to claim is
+        # otherwise listed (and attempted) again forever
+        listed = False
+        while True:
+            with self.__lock:
+                if not self.__backlog and not listed:
+                    self.__backlog.extend(self.__listdir(self.__data_path))
+                    listed = True
+
+                if not self.__backlog:
+                    return None
+
+                key = self.__backlog[0]
+                if int(key.split("-", 1)[0]) > now_ms:
+                    # Nothing is due yet; we list our queue again on our
+                    # next call so that new jobs are picked up
+                    self.__backlog.clear()
+                    return None
+
+                self.__backlog.popleft()
+
+            path = os.path.join(self.__active_path, key + self.extension)
+            try:
+                os.makedirs(self.__active_path, exist_ok=True)
+                os.rename(
+                    os.path.join(self.__data_path, key + self.extension), path
+                )
+
+            except FileNotFoundError:
+                # Another worker beat us to it
+                continue
+
+            except OSError as e:
+                logger.warning("Could not claim queued job: %s", key)
+                logger.debug("Persistent Queue Exception: %s", str(e))
+                continue
+
+            # Our lease starts now
+            self.renew(key)
+
+            try:
+                with open(path, encoding=self.encoding) as fp:
+                    job = json.load(fp)
+
+                if not isinstance(job, dict):
+                    raise ValueError("Unexpected job content")
+
+            except (OSError, ValueError) as e:
+                logger.warning("Discarding unreadable queued job: %s", key)
+                logger.debug("Persistent Queue Exception: %s", str(e))
+                self.complete(key)
+                continue
+
+            return key, job
+
+    def complete(self, key: str) -> None:
+        """Removes a claimed job from our queue."""
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(os.path.join(self.__active_path, key + self.extension))
+
+    def renew(self, key: str) -> bool:
+        """Renews the lease of a claimed job so that it is not recovered
+        while we are still delivering it.
+
+        False is returned if the job is no longer claimed by anyone.
+        """
+        try:
+            os.utime(os.path.join(self.__active_path, key + self.extension))
+
+        except FileNotFoundError:
+            return False
+
+        except OSError as e:
+            logger.warning("Could not renew the lease of queued job: %s", key)
+            logger.debug("Persistent Queue Exception: %s", str(e))
+            return False
+
+        return True
+
+    def release(self, key: str, job: dict[str, Any]) -> Optional[str]:
+        """Returns a claimed job whose delivery failed to our queue so that it
+        can be retried later.
+
+        The job is discarded once it has been attempted max_attempts times.
+        The new key of the job is returned, otherwise None if it was
+        discarded.
+        """
+
+        job = dict(job)
+        job["attempts"] = int(job.get("attempts", 0)) + 1
+
+        new_key = None
+        if job["attempts"] < self.max_attempts:
+            new_key = self.put(
+                job,
+                delay=min(
+                    self.retry_backoff * 2 ** (job["attempts"] - 1),
+                    self.retry_max_wait,
+                ),
+            )
+
+        else:
+            logger.warning(
+                "Discarding queued notification %s after %d attempt(s)",
+                key,
+                job["attempts"],
+            )
+
+        if new_key is not None or job["attempts"] >= self.max_attempts:
+            # The job was either re-queued or discarded; otherwise we leave
+            # it where it is so it is recovered once its lease expires
+            self.complete(key)
+
+        return new_key
+
+    def recover(self, lease: Optional[float] = None) -> int:
+        """Returns any claimed jobs whose lease expired back to our queue and
+        returns the number of jobs that were recovered."""
+
+        expiry = time.time() - (self.lease if lease is None else lease)
+
+        count = 0
+        for key in self.__listdir(self.__active_path):
+            path = os.path.join(self.__active_path, key + self.extension)
+            try:
+                if os.stat(path).st_mtime > expiry:
+                    continue
+
+                os.makedirs(self.__data_path, exist_ok=True)
+                os.rename(
+                    path, os.path.join(self.__data_path, key + self.extension)
+                )
+
+            except FileNotFoundError:
+                # The job was completed (or recovered) by someone else
+                continue
+
+            except OSError as e:
+                logger.warning("Could not recover queued job: %s", key)
+                logger.debug("Persistent Queue Exception: %s", str(e))
+                continue
+
+            logger.debug("Recovered abandoned queued job: %s", key)
+            count += 1
+
+        return count
+
+    def deliver(
+        self, job: dict[str, Any], asset: Any = None, key: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """Sends the notification described by the job provided.
+
+        The services the notification could not be delivered to are returned
+        so that only they are retried; an empty list is returned once there
+        is nothing left to deliver.
+
+        If the key of the claimed job is provided, its lease is renewed as
+        each of its services is notified.
+        """
+
+        # Avoid a circular import
+        from .apprise import Apprise
+
+        a = Apprise(asset=asset)
+
+        # The index of each of the services we attempted and delivered to
+        attempted = set()
+        delivered = set()
+
+        def _track(index, notify):
+            """Wraps the notify() call of a service to track its outcome."""
+
+            def _notify(*args, **kwargs):
+                attempted.add(index)
+                if key is not None:
+                    self.renew(key)
+
+                try:
+                    result = notify(*args, **kwargs)
+
+                finally:
+                    if key is not None:
+                        self.renew(key)
+
+                if result:
+                    delivered.add(index)
+                return result
+
+            return _notify
+
+        servers = job.get("servers", [])
+        for index, entry in enumerate(servers):
+            server = Apprise.instantiate(
+                entry["url"], asset=a.asset, tag=entry.get("tag")
+            )
+            if server is None:
+                # This service can never be delivered to; there is no point
+                # in retrying it
+                continue
+
+            server.notify = _track(index, server.notify)
+            a.add(server)
+
+        if not a:
+            logger.warning("Queued notification has no services to notify")
+            return []
+
+        try:
+            result = a.notify(
+                body=job.get("body", ""),
+                title=job.get("title", ""),
+                notify_type=job.get("notify_type"),
+                body_format=job.get("body_format"),
+                tag=job.get("tag"),
+                match_always=job.get("match_always", True),
+                attach=job.get("attach") or None,
+                interpret_escapes=job.get("interpret_escapes"),
+            )
+
+        finally:
+            a.close()
+
+        if result is not False:
+            # Delivered (or nothing left that matches our filter)
+            return []
+
+        # Only the services that failed are retried; those that succeeded
+        # (or were never needed by an escalation chain) are not notified
+        # again.  If we can't tell which failed we retry everything that was
+        # not delivered.
+        failed = attempted - delivered
+        return [
+            entry
+            for index, entry in enumerate(servers)
+            if index in failed or (not failed and index not in delivered)
+        ]
+
+    def drain(
+        self, asset: Any = None, workers: Optional[int] = None
+    ) -> tuple[int, int]:
+        """Delivers every job that is currently due using a pool of workers.
+
+        Returns a (delivered, failed) tuple of the number of jobs processed.
+        Failed jobs are returned to the queue to be retried later.
+        """
+
+        # Anything abandoned by a previous run is picked up again
+        self.recover()
+
+        workers = max(1, self.workers if workers is None else workers)
+        with WorkerPool(max_workers=workers) as pool:
+            futures = [pool.submit(self._work, asset) for _ in range(workers)]
+            results = [f.result() for f in futures]
+
+        return (
+            sum(delivered for delivered, _ in results),
+            sum(failed for _, failed in results),
+        )
+
+    def start(self, asset: Any = None, workers: Optional[int] = None) -> None:
+        """Starts delivering queued jobs in the background until stop() is
+        called."""
+
+        if self.__threads:
+            # Already running
+            return
+
+        self.__stop.clear()
+        self.recover()
+
+        workers = max(1, self.workers if workers is None else workers)
+        for no in range(workers):
+            thread = threading.Thread(
+                target=self._work,
+                args=(asset, self.__stop),
+                name=f"apprise-queue-{no}",
+                daemon=True,
+            )
+            thread.start()
+            self.__threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops our background workers; any job being delivered is given the
+        chance to finish first."""
+
+        self.__stop.set()
+        threads, self.__threads = self.__threads, []
+        for thread in threads:
+            thread.join(timeout)
+
+    def _work(
+        self, asset: Any = None, stop: Optional[threading.Event] = None
+    ) -> tuple[int, int]:
+        """Delivers jobs until our queue is empty (or until stop is set when
+        one is provided) and returns a (delivered, failed) tuple."""
+
+        delivered = failed = 0
+        while stop is None or not stop.is_set():
+            entry = self.claim()
+            if entry is None:
+                if stop is None:
+                    break
+
+                stop.wait(self.poll_interval)
+                continue
+
+            key, job = entry
+            try:
+                pending = self.deliver(job, asset=asset, key=key)
+
+            except Exception as e:
+                # A job must never take down our worker
+                logger.warning("Queued notification %s failed", key)
+                logger.debug("Persistent Queue Exception: %s", str(e))
+                pending = job.get("servers", [])
+
+            if not pending:
+                self.complete(key)
+                delivered += 1
+
+            else:
+                # Only the services we failed to notify are retried
+                self.release(key, dict(job, servers=pending))
+                failed += 1
+
+        return delivered, failed
+
+    def keys(self, active: bool = False) -> list[str]:
+        """Returns the keys of the jobs waiting in our queue in the order they
+        will be delivered.  Set active to True to list the jobs being
+        delivered instead."""
+        return self.__listdir(
+            self.__active_path if active else self.__data_path
+        )
+
+    def __write(self, job, path):
+        """Writes our job to a temporary file before moving it into place."""
+        ntf = None
+        try:
+            os.makedirs(self.__temp_path, exist_ok=True)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+            ntf = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                mode="w",
+                dir=self.__temp_path,
+                encoding=self.encoding,
+                delete=False,
+            )
+            with ntf:
+                json.dump(job, ntf, separators=(",", ":"))
+                ntf.flush()
+                os.fsync(ntf.fileno())
+
+            os.rename(ntf.name, path + self.extension)
+
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not write queued notification")
+            logger.debug("Persistent Queue Exception: %s", str(e))
+
+            if ntf is not None:
+                with contextlib.suppress(OSError):
+                    os.unlink(ntf.name)
+
+            return False
+
+        return True
+
+    def __listdir(self, path):
+        """Returns the sorted job keys found in the directory provided."""
+        try:
+            return sorted(
+                entry[: -len(self.extension)]
+                for entry in os.listdir(path)
+                if entry.endswith(self.extension)
+            )
+
+        except FileNotFoundError:
+            return []
+
+    def __len__(self) -> int:
+        """Returns the number of jobs in our queue (including those being
+        delivered)."""
+        return len(self.keys()) + len(self.keys(active=True))
+
+    @property
+    def path(self) -> str:
+        """Returns the path our queue is kept in."""
+        return self.__base_path
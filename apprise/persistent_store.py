@@ -25,10 +25,13 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import atexit
 import base64
 import binascii
 import builtins
+import concurrent.futures as cf
 import contextlib
+import copy
 from datetime import datetime, timedelta, timezone
 import glob
 import gzip
@@ -38,8 +41,10 @@ import json
 import os
 import re
 import tempfile
+import threading
 import time
-from typing import Any, Optional, Union
+from typing import Any, ClassVar, Optional, Union
+import uuid
 import zlib
 
 from . import exception
@@ -49,7 +54,18 @@ from .common import (
     PersistentStoreMode,
 )
 from .logger import logger
-from .utils.disk import path_decode
+from .utils.disk import dir_usage, path_decode
+from .utils.ratelimit import RATELIMIT_STORAGE_DIR, FileRateLimiter
+
+try:
+    import fcntl
+
+    # Our cache can be safely shared between processes
+    FILE_LOCK_SUPPORT = True
+
+except ImportError:
+    # Our cache is only protected within this process
+    FILE_LOCK_SUPPORT = False
 
 # Used for writing/reading time stored in cache file
 EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
@@ -325,6 +341,312 @@ class CacheJSONEncoder(json.JSONEncoder):
         return super().default(entry)
 
 
+class NamespaceLock:
+    """A (re-entrant) lock on a namespace directory.
+
+    It is shared by all of the stores (within our process) using the same
+    namespace, and held across processes through the namespace directory
+    itself where file locking is supported.
+    """
+
+    # Our locks by namespace directory
+    __locks: ClassVar[dict[str, "NamespaceLock"]] = {}
+    __locks_lock = threading.Lock()
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Initialize our lock; path is the namespace directory to lock."""
+        self.path = path
+        self.__lock = threading.RLock()
+
+        # The file descriptor our process lock is held through (if any)
+        self.__fd = None
+
+        # Incremented every time the cache of our namespace is written by a
+        # store within our process
+        self.generation = 0
+
+    @classmethod
+    def instance(cls, path: Optional[str]) -> "NamespaceLock":
+        """Returns the lock shared by everyone using the namespace path."""
+        if not path:
+            # Nothing to share
+            return cls()
+
+        with cls.__locks_lock:
+            lock = cls.__locks.get(path)
+            if lock is None:
+                lock = cls.__locks[path] = cls(path)
+            return lock
+
+    @contextlib.contextmanager
+    def hold(self, shared: bool = True):
+        """Holds our lock; other processes are locked out too if shared is
+        set."""
+        with self.__lock:
+            fd = None
+            if (
+                FILE_LOCK_SUPPORT
+                and shared
+                and self.path
+                and self.__fd is None
+            ):
+                try:
+                    fd = os.open(self.path, os.O_RDONLY)
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+
+                except OSError as e:
+                    # Our directory is missing (it is recreated on our next
+                    # flush) or can not be locked
+                    logger.trace("Persistent Storage Lock Exception: %s", e)
+                    if fd is not None:
+                        os.close(fd)
+                        fd = None
+
+                self.__fd = fd
+
+            try:
+                yield
+
+            finally:
+                if fd is not None:
+                    # Releases our lock
+                    self.__fd = None
+                    os.close(fd)
+
+
+class PersistentStoreCatalog:
+    """An index of the namespaces found within a storage path.
+
+    The size of each namespace is tracked along with the modification times
+    of its newest (last accessed) and oldest files; this allows the storage
+    path to be listed and pruned without having to walk every namespace in
+    it.
+
+    Stores append their changes to the catalog as they are flushed and it is
+    rewritten (compacted) once it grows large enough.  A catalog is only
+    ever created from a full scan of the storage path so that it can be
+    trusted to reference every namespace within it.
+    """
+
+    # Our catalog file (kept at the root of our storage path)
+    filename = "_catalog.psindex"
+
+    # Our catalog is rewritten once it holds this many more records than it
+    # has namespaces
+    compact_threshold = 1024
+
+    def __init__(self, path: str) -> None:
+        """Initialize our catalog for the storage path provided."""
+        self.path = path
+        self.catalog_file = os.path.join(path, self.filename)
+
+    def exists(self) -> bool:
+        """Returns True if our catalog exists."""
+        return os.path.isfile(self.catalog_file)
+
+    def load(self) -> Optional[dict[str, tuple]]:
+        """Returns our catalog as a dictionary of namespaces each mapped to a
+        tuple of (size, newest, oldest).
+
+        None is returned if there is no catalog (or it can not be read).
+        """
+        try:
+            with open(self.catalog_file, "rb") as f:
+                (entries, records) = self.__parse(f)
+
+        except FileNotFoundError:
+            # No catalog
+            return None
+
+        except OSError as e:
+            logger.warning(
+                "Could not read persistent storage catalog: %s",
+                self.catalog_file,
+            )
+            logger.debug("Persistent Storage Exception: %s", str(e))
+            return None
+
+        if records > len(entries) + self.compact_threshold:
+            # Time to tidy up
+            self.__compact()
+
+        return entries
+
+    def save(self, entries: dict[str, tuple]) -> bool:
+        """(Re)writes our catalog as a whole."""
+        content = b"".join(
+            self.__record(namespace, usage)
+            for namespace, usage in entries.items()
+        )
+
+        try:
+            (fd, tmp_path) = tempfile.mkstemp(
+                prefix="._catalog", suffix=".tmp", dir=self.path
+            )
+
+        except OSError as e:
+            logger.warning(
+                "Could not write persistent storage catalog: %s",
+                self.catalog_file,
+            )
+            logger.debug("Persistent Storage Exception: %s", str(e))
+            return False
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+
+            os.replace(tmp_path, self.catalog_file)
+
+        except OSError as e:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+            logger.warning(
+                "Could not write persistent storage catalog: %s",
+                self.catalog_file,
+            )
+            logger.debug("Persistent Storage Exception: %s", str(e))
+            return False
+
+        logger.trace(
+            "Persistent storage catalog written (%d namespaces): %s",
+            len(entries),
+            self.catalog_file,
+        )
+        return True
+
+    def update(self, entries: dict[str, Optional[tuple]]) -> bool:
+        """Appends the namespaces provided to our catalog; each is mapped to a
+        tuple of (size, newest, oldest) or None if it was removed.
+
+        Nothing is done (and False is returned) if there is no catalog.
+        """
+        if not entries:
+            # Nothing to do
+            return True
+
+        content = b"".join(
+            self.__record(namespace, usage)
+            for namespace, usage in entries.items()
+        )
+
+        for _ in range(3):
+            try:
+                # Our catalog is never created here
+                fd = os.open(self.catalog_file, os.O_WRONLY | os.O_APPEND)
+
+            except FileNotFoundError:
+                # No catalog
+                return False
+
+            except OSError as e:
+                logger.debug(
+                    "Persistent storage catalog inaccessible: %s",
+                    self.catalog_file,
+                )
+                logger.debug("Persistent Storage Exception: %s", str(e))
+                return False
+
+            try:
+                if FILE_LOCK_SUPPORT:
+                    # Keeps us from appending while our catalog is rewritten
+                    fcntl.flock(fd, fcntl.LOCK_SH)
+                    if (
+                        os.fstat(fd).st_ino
+                        != os.stat(self.catalog_file).st_ino
+                    ):
+                        # Our catalog was rewritten in the meantime
+                        continue
+
+                # Each update is written at once
+                os.write(fd, content)
+                return True
+
+            except OSError as e:
+                logger.debug(
+                    "Persistent storage catalog inaccessible: %s",
+                    self.catalog_file,
+                )
+                logger.debug("Persistent Storage Exception: %s", str(e))
+                return False
+
+            finally:
+                os.close(fd)
+
+        # We never caught up with our catalog
+        return False
+
+    def __compact(self) -> bool:
+        """Rewrites our catalog to hold only the last record of each
+        namespace."""
+        try:
+            with open(self.catalog_file, "rb") as f:
+                if FILE_LOCK_SUPPORT:
+                    # Hold back those appending to our catalog
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+                (entries, _) = self.__parse(f)
+                return self.save(entries)
+
+        except OSError as e:
+            logger.debug(
+                "Persistent storage catalog inaccessible: %s",
+                self.catalog_file,
+            )
+            logger.debug("Persistent Storage Exception: %s", str(e))
+            return False
+
+    def __parse(self, f) -> tuple[dict[str, tuple], int]:
+        """Parses the catalog records found in the file provided and returns
+        a tuple of the (entries, records) found."""
+        entries = {}
+        records = 0
+        for line in f:
+            records += 1
+            try:
+                record = json.loads(line.decode(PersistentStore.encoding))
+                namespace = record["n"]
+                if "s" not in record:
+                    # Our namespace was removed
+                    entries.pop(namespace, None)
+                    continue
+
+                entries[namespace] = (
+                    int(record["s"]),
+                    None if record["a"] is None else float(record["a"]),
+                    None if record["o"] is None else float(record["o"]),
+                )
+
+            except (
+                UnicodeDecodeError,
+                ValueError,
+                TypeError,
+                KeyError,
+            ):
+                # A record that was only partially written
+                logger.trace(
+                    "Ignoring corrupted persistent storage catalog record: %s",
+                    self.catalog_file,
+                )
+
+        return (entries, records)
+
+    @staticmethod
+    def __record(namespace: str, usage: Optional[tuple]) -> bytes:
+        """Returns the catalog record of a namespace."""
+        record = {"n": namespace}
+        if usage is not None:
+            record.update({"s": usage[0], "a": usage[1], "o": usage[2]})
+
+        return (
+            json.dumps(record, separators=(",", ":")).encode(
+                PersistentStore.encoding
+            )
+            + b"\n"
+        )
+
+
 class PersistentStore:
     """An object to make working with persistent storage easier.
 
@@ -361,12 +683,42 @@ class PersistentStore:
     # Identify our backup file extension
     __backup_extension = "._psbak"
 
+    # Identify our journal file extension
+    __journal_extension = ".psjournal"
+
+    # The first entry of every journal identifies it by this key; a cache
+    # file records the journal it was last merged with under the same key so
+    # that a journal left behind after being merged is never applied twice
+    __journal_key = "\x00journal"
+
+    # Changes made to our cache are appended to a journal kept alongside it
+    # rather than having all of it rewritten every time it is flushed.  The
+    # journal is merged back into our cache once it grows larger than this
+    # (in bytes) or the cache itself; whichever is larger.  Set this to zero
+    # to always have the cache rewritten as a whole.
+    journal_size = 65536
+
     # Used to verify the key specified is valid
     #  - must start with an alpha_numeric
     #  - following optional characters can include period, underscore and
     #    equal
     __valid_key = re.compile(r"[a-z0-9][a-z0-9._-]*", re.I)
 
+    # The frequency (in seconds) at which a store records its usage in the
+    # catalog of its storage path; pending usage is also recorded by
+    # flush(force=True) and by catalog_flush() (called when we exit)
+    catalog_interval = 60
+
+    # The namespaces (by path) whose usage is yet to be recorded in the
+    # catalog of their storage path
+    __catalog_deferred: ClassVar[set[str]] = set()
+    __catalog_deferred_lock = threading.Lock()
+
+    # The frequency (in seconds) at which a store checks if its cache was
+    # changed on disk by another process; changes made by other stores
+    # within our own process are always picked up immediately
+    refresh_interval = 1.0
+
     # Reference only
     __not_found_ref = (None, None)
 
@@ -386,6 +738,11 @@ class PersistentStore:
         # error checking below
         self.__mode = None
 
+        # Set when our usage is yet to be recorded in the catalog of our
+        # storage path (and when it last was)
+        self.__catalog_pending = False
+        self.__catalog_time = 0.0
+
         # Populated only once and after size() is called
         self.__exclude_list = None
 
@@ -420,6 +777,27 @@ class PersistentStore:
         # Tracks when we have content to flush
         self.__dirty = False
 
+        # The keys of the cache entries changed since our last flush; this is
+        # set to None if all of our cache is to be rewritten instead
+        self.__changes = set()
+
+        # The (uncompressed) size of our cache when it was last read/written
+        self.__cache_raw_size = 0
+
+        # The state of our cache on disk when we last read/wrote it
+        self.__version = None
+
+        # The identifier of the journal our cache file was last merged with
+        self.__merged = None
+
+        # Serializes the loading, changing and flushing of our cache
+        self.__lock = NamespaceLock.instance(self.__base_path)
+
+        # The generation of our namespace lock and the time our cache was
+        # last compared against what is on disk
+        self.__generation = 0
+        self.__refresh_time = 0.0
+
         # A caching value to track persistent storage disk size
         self.__cache_size = None
         self.__cache_files = {}
@@ -647,6 +1025,10 @@ class PersistentStore:
         self.__cache_size = None
         self.__cache_files.clear()
 
+        # Update our catalog
+        self.__catalog_pending = True
+        self.__catalog_update()
+
         # Content installed
         return True
 
@@ -822,15 +1204,21 @@ class PersistentStore:
         if self._cache is None and not self.__load_cache():
             return default
 
+        # Pick up what was changed by others since
+        self.__refresh()
+
+        # Our cache may be swapped out from underneath us; work with the one
+        # we have now
+        cache = self._cache
         if (
-            key in self._cache
+            key in cache
             and self.__mode != PersistentStoreMode.MEMORY
             and not self.__dirty
         ):
             # ensure we renew our content
             self.__renew.add(self.cache_file)
 
-        return self._cache[key].value if self._cache.get(key) else default
+        return cache[key].value if cache.get(key) else default
 
     def set(
         self,
@@ -846,20 +1234,22 @@ class PersistentStore:
             return False
 
         cache = CacheObject(value, expires, persistent=persistent)
-        # Fetch our cache value
-        try:
-            if lazy and cache == self._cache[key]:
-                # We're done; nothing further to do
-                return True
+        with self.__mutex():
+            # Fetch our cache value
+            try:
+                if lazy and cache == self._cache[key]:
+                    # We're done; nothing further to do
+                    return True
 
-        except KeyError:
-            pass
+            except KeyError:
+                pass
 
-        # Store our new cache
-        self._cache[key] = CacheObject(value, expires, persistent=persistent)
+            # Store our new cache
+            self._cache[key] = cache
+            self.__track(key)
 
-        # Set our dirty flag
-        self.__dirty = persistent
+            # Set our dirty flag
+            self.__dirty = persistent
 
         if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
             # Flush changes to disk
@@ -879,25 +1269,29 @@ class PersistentStore:
         if self._cache is None and not self.__load_cache():
             return False
 
-        if args:
-            for arg in args:
-                try:
-                    del self._cache[arg]
+        with self.__mutex():
+            if args:
+                for arg in args:
+                    try:
+                        del self._cache[arg]
+                        self.__track(arg)
 
-                    # Set our dirty flag (if not set already)
-                    self.__dirty = True
+                        # Set our dirty flag (if not set already)
+                        self.__dirty = True
 
-                except KeyError:
-                    pass
+                    except KeyError:
+                        pass
 
-        elif self._cache:
-            # Request to remove everything and there is something to remove
+            elif self._cache:
+                # Request to remove everything and there is something to
+                # remove
 
-            # Set our dirty flag (if not set already)
-            self.__dirty = True
+                # Set our dirty flag (if not set already)
+                self.__dirty = True
+                self.__track()
 
-            # Reset our object
-            self._cache.clear()
+                # Reset our object
+                self._cache.clear()
 
         if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
             # Flush changes to disk
@@ -909,17 +1303,19 @@ class PersistentStore:
             return False
 
         change = False
-        for key in list(self._cache.keys()):
-            if key not in self:
-                # It's identified as being expired
-                if not change and self._cache[key].persistent:
-                    # track change only if content was persistent
-                    change = True
-
-                    # Set our dirty flag
-                    self.__dirty = True
+        with self.__mutex():
+            for key in list(self._cache.keys()):
+                if not self._cache[key]:
+                    # It's identified as being expired
+                    if not change and self._cache[key].persistent:
+                        # track change only if content was persistent
+                        change = True
+
+                        # Set our dirty flag
+                        self.__dirty = True
 
-                del self._cache[key]
+                    del self._cache[key]
+                    self.__track(key)
 
         if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
             # Flush changes to disk
@@ -927,35 +1323,61 @@ class PersistentStore:
 
         return change
 
-    def __load_cache(self, _recovery=False):
-        """Loads our cache.
+    def __load_cache(self) -> bool:
+        """Loads our cache."""
+        with self.__locked():
+            if self._cache is not None:
+                # Loaded by another thread while we waited on our lock
+                return True
+
+            self.__generation = self.__lock.generation
+            self.__refresh_time = time.monotonic()
+            (result, cache) = self.__read_cache()
+            self.__version = self.__disk_version()
+            if cache is not None:
+                self._cache = cache
+            return result
+
+    def __read_cache(self, _recovery=False) -> tuple[bool, Optional[dict]]:
+        """Reads our cache from disk.
+
+        A tuple of (result, cache) is returned; cache is None if nothing could
+        be read at all.  The cache returned is never assigned here so that it
+        can be swapped in (by the caller) at once.
 
         _recovery is reserved for internal usage and should not be changed
         """
 
         # Prepare our dirty flag
         self.__dirty = False
+        self.__changes = set()
 
         if self.__mode == PersistentStoreMode.MEMORY:
             # Nothing further to do
-            self._cache = {}
-            return True
+            return (True, {})
 
         # Prepare our cache file
         cache_file = self.cache_file
+        cache = None
         try:
             with gzip.open(cache_file, "rb") as f:
                 # Read our ontent from disk
-                self._cache = {}
-                for k, v in json.loads(f.read().decode(self.encoding)).items():
+                cache = {}
+                content = f.read()
+                self.__cache_raw_size = len(content)
+
+                entries = json.loads(content.decode(self.encoding))
+                self.__merged = entries.pop(self.__journal_key, None)
+                for k, v in entries.items():
                     co = CacheObject.instantiate(v)
                     if co:
                         # Verify our object before assigning it
-                        self._cache[k] = co
+                        cache[k] = co
 
                     elif not self.__dirty:
                         # Track changes from our loadset
                         self.__dirty = True
+                        self.__track()
 
         except (
             UnicodeDecodeError,
@@ -970,7 +1392,14 @@ class PersistentStore:
                 "Corrupted access persistent cache content: %s", cache_file
             )
 
+            # Nothing can be journaled against what we could not load
+            self.__track()
+
             if not _recovery:
+                # Our journal can not be applied to what we could not load
+                with contextlib.suppress(OSError):
+                    os.unlink(self.journal_file)
+
                 try:
                     os.unlink(cache_file)
                     logger.trace(
@@ -990,14 +1419,16 @@ class PersistentStore:
                         cache_file,
                     )
                     logger.debug("Persistent Storage Exception: %s", str(e))
-                    return False
-                return self.__load_cache(_recovery=True)
+                    return (False, cache)
+                return self.__read_cache(_recovery=True)
 
-            return False
+            return (False, cache)
 
         except FileNotFoundError:
-            # No problem; no cache to load
-            self._cache = {}
+            # No problem; no cache to load.  A journal is only ever kept
+            # alongside a cache file; one found without it is stale
+            self.__merged = None
+            return (True, {})
 
         except OSError as e:
             # Permission error of some kind or disk problem...
@@ -1007,10 +1438,247 @@ class PersistentStore:
                 os.path.basename(self.__base_path),
             )
             logger.debug("Persistent Storage Exception: %s", str(e))
-            return False
+
+            # Nothing can be journaled against what we could not load
+            self.__track()
+            return (False, cache)
+
+        # Apply the changes journaled since our cache was last written
+        self.__load_journal(cache)
 
         # Ensure our dirty flag is set to False
-        return True
+        return (True, cache)
+
+    def __load_journal(self, cache: dict) -> None:
+        """Applies the changes found in our journal to the cache provided."""
+
+        try:
+            with open(self.journal_file, "rb") as f:
+                for no, line in enumerate(f):
+                    try:
+                        changes = json.loads(line.decode(self.encoding))
+                        if not isinstance(changes, dict):
+                            raise TypeError("Journal entry not expected dict")
+
+                        if (
+                            no == 0
+                            and self.__journal_key in changes
+                            and changes.pop(self.__journal_key)
+                            == self.__merged
+                        ):
+                            # Our journal was already merged into our cache
+                            # file; it just wasn't removed yet
+                            return
+
+                    except (UnicodeDecodeError, ValueError, TypeError):
+                        # An entry that was only partially written; our cache
+                        # is rewritten (without it) on our next flush
+                        logger.debug(
+                            "Ignoring corrupted persistent journal entry: %s",
+                            self.journal_file,
+                        )
+                        self.__dirty = True
+                        self.__track()
+                        continue
+
+                    for k, v in changes.items():
+                        co = None if v is None else CacheObject.instantiate(v)
+                        if co:
+                            cache[k] = co
+                            continue
+
+                        # A removed (or invalid) entry
+                        cache.pop(k, None)
+                        if v is not None and not self.__dirty:
+                            # Track changes from our loadset
+                            self.__dirty = True
+                            self.__track()
+
+        except FileNotFoundError:
+            # No problem; nothing was journaled
+            pass
+
+        except OSError as e:
+            # Permission error of some kind or disk problem...
+            logger.warning(
+                "Could not load persistent journal for namespace %s",
+                os.path.basename(self.__base_path),
+            )
+            logger.debug("Persistent Storage Exception: %s", str(e))
+
+    def __refresh(self) -> None:
+        """Picks up the changes made to our cache on disk (by another process
+        or store) since we last read or wrote it."""
+        if self._cache is None or self.__mode == PersistentStoreMode.MEMORY:
+            # Nothing to do
+            return
+
+        generation = self.__lock.generation
+        now = time.monotonic()
+        if (
+            generation == self.__generation
+            and now - self.__refresh_time < self.refresh_interval
+        ):
+            # Nothing was written from within our process since we last
+            # looked and it is not yet time to look for other processes
+            return
+
+        self.__refresh_time = now
+        if self.__disk_version() != self.__version:
+            with self.__locked():
+                self.__sync()
+
+        self.__generation = generation
+
+    def __sync(self) -> None:
+        """Merges the changes made to our cache on disk since we last read or
+        wrote it with our own (pending) changes.
+
+        Our lock must be held.
+        """
+        self.__generation = self.__lock.generation
+        version = self.__disk_version()
+        if version == self.__version:
+            # Nothing changed
+            return
+
+        if self.__changes is None:
+            # Our cache is rewritten as a whole; it takes precedence over
+            # what is on disk
+            self.__version = version
+            return
+
+        # Our own changes (along with what is never written to disk)
+        changes = self.__changes
+        dirty = self.__dirty
+        ours = {k: self._cache.get(k) for k in changes}
+        ours.update(
+            {k: v for k, v in list(self._cache.items()) if not v.persistent}
+        )
+
+        logger.trace(
+            "Merging persistent cache changed on disk: %s", self.cache_file
+        )
+
+        # Our merged cache is built aside and swapped in at once
+        (_, cache) = self.__read_cache()
+        self.__version = self.__disk_version()
+        if cache is None:
+            # We could not read anything back
+            cache = {}
+            self.__track()
+
+        for k, v in ours.items():
+            if v is None:
+                cache.pop(k, None)
+
+            else:
+                cache[k] = v
+
+        self._cache = cache
+        if changes:
+            self.__track(*changes)
+        self.__dirty = dirty or self.__dirty
+
+    def __disk_version(self) -> Optional[tuple]:
+        """Returns the state of our cache (and its journal) on disk."""
+        if self.__mode == PersistentStoreMode.MEMORY:
+            # We are never written to disk
+            return None
+
+        version = []
+        for path in (self.cache_file, self.journal_file):
+            try:
+                st = os.stat(path)
+                version.append((st.st_ino, st.st_size, st.st_mtime_ns))
+
+            except OSError:
+                version.append(None)
+
+        return tuple(version)
+
+    def __locked(self):
+        """Holds our lock; the same lock is held by any other process (or
+        store) loading or flushing the cache of our namespace."""
+        return self.__lock.hold(
+            shared=self.__mode != PersistentStoreMode.MEMORY
+        )
+
+    def __mutex(self):
+        """Holds our lock within our process only; it is held while our cache
+        is changed."""
+        return self.__lock.hold(shared=False)
+
+    def __catalog_update(self, force: bool = False) -> None:
+        """Records our usage in the catalog of our storage path (if one
+        exists)."""
+        if not self.__catalog_pending or self.__mode in (
+            None,
+            PersistentStoreMode.MEMORY,
+        ):
+            # Nothing to do
+            return
+
+        now = time.time()
+        if not force and now - self.__catalog_time < self.catalog_interval:
+            # Not yet; it is recorded later on (at the latest when we exit)
+            with self.__catalog_deferred_lock:
+                self.__catalog_deferred.add(self.__base_path)
+            return
+
+        self.__catalog_pending = False
+        self.__catalog_time = now
+
+        with self.__catalog_deferred_lock:
+            self.__catalog_deferred.discard(self.__base_path)
+
+        self.__catalog_record(self.__base_path)
+
+    @staticmethod
+    def __catalog_record(base_path: str) -> None:
+        """Records the usage of the namespace directory provided in the
+        catalog of its storage path (if one exists)."""
+        catalog = PersistentStoreCatalog(os.path.dirname(base_path))
+        if not catalog.exists():
+            # Catalogs are only ever created from a full scan
+            return
+
+        (size, newest, oldest, _) = dir_usage(base_path)
+        catalog.update(
+            {
+                os.path.basename(base_path): (
+                    None
+                    if newest is None and not os.path.isdir(base_path)
+                    else (size, newest, oldest)
+                )
+            }
+        )
+
+    @classmethod
+    def catalog_flush(cls) -> None:
+        """Records the usage our stores have yet to record in the catalog of
+        their storage path (see catalog_interval).
+
+        This is called automatically when our process exits.
+        """
+        with cls.__catalog_deferred_lock:
+            paths = sorted(cls.__catalog_deferred)
+            cls.__catalog_deferred.clear()
+
+        for path in paths:
+            cls.__catalog_record(path)
+
+    def __track(self, *keys: str) -> None:
+        """Tracks the keys of the cache entries changed since our last flush.
+
+        If no keys are specified, all of our cache is rewritten the next time
+        it is flushed.
+        """
+        if not keys:
+            self.__changes = None
+
+        elif self.__changes is not None:
+            self.__changes.update(keys)
 
     def __prepare(self, flush=True):
         """Prepares a working environment."""
@@ -1069,6 +1737,7 @@ class PersistentStore:
                 if self._cache:
                     # Recovery taking place
                     self.__dirty = True
+                    self.__track()
                     logger.warning(
                         "The persistent storage environment was disrupted"
                     )
@@ -1082,12 +1751,45 @@ class PersistentStore:
         force: bool = False,
         _recovery: bool = False,
     ) -> bool:
-        """Save's our cache to disk."""
+        """Save's our cache to disk.
+
+        Anything changed on disk (by another process or store) since our cache
+        was loaded is merged with our own changes first.
+        """
 
         if self._cache is None or self.__mode == PersistentStoreMode.MEMORY:
-            # nothing to do
+            # nothing to do beyond recording any usage still pending
+            self.__catalog_update(force=force)
             return True
 
+        with self.__locked():
+            if self.__dirty:
+                self.__sync()
+
+            result = self.__flush(force=force, _recovery=_recovery)
+            version = self.__disk_version()
+            if version != self.__version:
+                # Our cache changed on disk; let the other stores within our
+                # process know
+                self.__catalog_pending = True
+                self.__lock.generation += 1
+                self.__generation = self.__lock.generation
+            self.__version = version
+
+        # Update our catalog
+        self.__catalog_update(force=force)
+        return result
+
+    def __flush(
+        self,
+        force: bool = False,
+        _recovery: bool = False,
+    ) -> bool:
+        """Writes our cache to disk.
+
+        _recovery is reserved for internal usage and should not be changed
+        """
+
         while self.__renew:
             # update our files
             path = self.__renew.pop()
@@ -1168,11 +1870,27 @@ class PersistentStore:
                 )
                 logger.debug("Persistent Storage Exception: %s", str(e))
                 return False
+
+            if not self.__journal_tidy():
+                return False
+
+            # Ensure our dirty flag is set to False
+            self.__dirty = False
+            self.__changes = set()
             return True
 
+        if not force and self.__changes:
+            changes, self.__changes = self.__changes, set()
+            if self.__journal_append(changes):
+                # Our changes were journaled
+                self.__dirty = False
+                return True
+
         #
-        # If we get here, we need to update our file based cache
+        # If we get here, we need to update our file based cache (merging
+        # our journal back into it)
         #
+        self.__changes = None
 
         # ntf = NamedTemporaryFile
         ntf = None
@@ -1191,7 +1909,7 @@ class PersistentStore:
             # This happens if the directory path is gone preventing the file
             # from being created...
             if not _recovery:
-                return self.flush(force=True, _recovery=True)
+                return self.__flush(force=True, _recovery=True)
 
             # We've already made our best effort to recover if we are here in
             # our code base... we're going to have to exit
@@ -1216,20 +1934,27 @@ class PersistentStore:
             return False
 
         try:
+            entries = {
+                k: v
+                for k, v in list(self._cache.items())
+                if v and v.persistent
+            }
+
+            # Identify the journal we're merging (if any)
+            merged = self.__journal_id()
+            if merged:
+                entries[self.__journal_key] = merged
+
+            content = json.dumps(
+                entries,
+                separators=(",", ":"),
+                cls=CacheJSONEncoder,
+            ).encode(self.encoding)
+
             # write our content currently saved to disk to our temporary file
             with gzip.open(ntf.name, "wb") as f:
                 # Write our content to disk
-                f.write(
-                    json.dumps(
-                        {
-                            k: v
-                            for k, v in self._cache.items()
-                            if v and v.persistent
-                        },
-                        separators=(",", ":"),
-                        cls=CacheJSONEncoder,
-                    ).encode(self.encoding)
-                )
+                f.write(content)
 
         except TypeError as e:
             # JSON object contains content that can not be encoded to disk
@@ -1258,6 +1983,9 @@ class PersistentStore:
             # Early Exit
             return False
 
+        # Our journal is merged into our new cache file; it is only removed
+        # once our new cache file is in place (it is identified as merged in
+        # the meantime)
         if not self.__move(ntf.name, cache_file):
             # Attempt to restore things as they were
 
@@ -1267,6 +1995,137 @@ class PersistentStore:
 
         # Ensure our dirty flag is set to False
         self.__dirty = False
+        self.__changes = set()
+        self.__cache_raw_size = len(content)
+        self.__merged = merged
+
+        # A journal we could not remove is never applied again (or appended
+        # to); it is removed again on our next flush
+        self.__journal_tidy()
+        return True
+
+    def __journal_append(self, changes) -> bool:
+        """Appends the cache entries changed since our last flush to our
+        journal.
+
+        False is returned if they could not be; or if our journal grew large
+        enough that it should be merged back into our cache file instead.
+        """
+        if self.journal_size <= 0 or not os.path.isfile(self.cache_file):
+            # There is nothing to apply our journal to
+            return False
+
+        try:
+            content = (
+                json.dumps(
+                    {
+                        k: v if v and v.persistent else None
+                        for k, v in (
+                            (k, self._cache.get(k)) for k in sorted(changes)
+                        )
+                    },
+                    separators=(",", ":"),
+                    cls=CacheJSONEncoder,
+                ).encode(self.encoding)
+                + b"\n"
+            )
+
+            with open(self.journal_file, "a+b") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size + len(content) > max(
+                    self.journal_size, self.__cache_raw_size
+                ):
+                    # Time to merge our journal back into our cache file
+                    return False
+
+                if not size:
+                    # Identify our new journal
+                    content = (
+                        json.dumps(
+                            {self.__journal_key: uuid.uuid4().hex},
+                            separators=(",", ":"),
+                        ).encode(self.encoding)
+                        + b"\n"
+                        + content
+                    )
+
+                elif self.__merged and self.__journal_read_id(f) == (
+                    self.__merged
+                ):
+                    # Our journal was already merged (but not removed); it
+                    # is never appended to
+                    return False
+
+                # Each entry is written at once
+                f.write(content)
+
+        except TypeError as e:
+            # JSON object contains content that can not be encoded to disk
+            logger.debug("Persistent Storage Exception: %s", str(e))
+            return False
+
+        except OSError as e:
+            logger.debug(
+                "Persistent journal inaccessible: %s", self.journal_file
+            )
+            logger.debug("Persistent Storage Exception: %s", str(e))
+            return False
+
+        logger.trace(
+            "Journaled %d persistent cache change(s): %s",
+            len(changes),
+            self.journal_file,
+        )
+
+        # Unset our size lazy setting
+        self.__cache_size = None
+        self.__cache_files.clear()
+
+        return True
+
+    def __journal_id(self) -> Optional[str]:
+        """Returns the identifier of our journal (if one exists)."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                return self.__journal_read_id(f)
+
+        except OSError:
+            # No journal (or one we can not read)
+            return None
+
+    def __journal_read_id(self, f) -> Optional[str]:
+        """Returns the identifier found at the start of the (open) journal
+        provided."""
+        f.seek(0)
+        try:
+            header = json.loads(f.readline().decode(self.encoding))
+            return header.get(self.__journal_key)
+
+        except (UnicodeDecodeError, ValueError, AttributeError):
+            # A journal without an identifier
+            return None
+
+    def __journal_tidy(self) -> bool:
+        """Removes our journal (if present)."""
+        try:
+            os.unlink(self.journal_file)
+            logger.trace(
+                "Removed persistent cache journal: %s", self.journal_file
+            )
+
+        except FileNotFoundError:
+            # no worries; we were removing it anyway
+            pass
+
+        except OSError as e:
+            # Permission error of some kind or disk problem...
+            # There is nothing we can do at this point
+            logger.warning(
+                "Could not remove persistent cache journal: %s",
+                self.journal_file,
+            )
+            logger.debug("Persistent Storage Exception: %s", str(e))
+            return False
 
         return True
 
@@ -1315,13 +2174,7 @@ class PersistentStore:
             if exclude:
                 self.__cache_files[exclude] = [
                     path
-                    for path in filter(
-                        os.path.isfile,
-                        glob.glob(
-                            os.path.join(self.__base_path, "**", "*"),
-                            recursive=True,
-                        ),
-                    )
+                    for path in self.__scan()
                     if next(
                         (False for p in self.__exclude_list if p.match(path)),
                         True,
@@ -1329,15 +2182,7 @@ class PersistentStore:
                 ]
 
             else:  # No exclusion list applied
-                self.__cache_files[exclude] = list(
-                    filter(
-                        os.path.isfile,
-                        glob.glob(
-                            os.path.join(self.__base_path, "**", "*"),
-                            recursive=True,
-                        ),
-                    )
-                )
+                self.__cache_files[exclude] = self.__scan()
 
         except OSError:
             # We can't access the directory or it does not exist
@@ -1345,6 +2190,33 @@ class PersistentStore:
 
         return self.__cache_files[exclude]
 
+    def __scan(self) -> list[str]:
+        """Returns the files found within our namespace directory (and the
+        directories within it); hidden entries are ignored."""
+        files = []
+        pending = [self.__base_path]
+        while pending:
+            dirpath = pending.pop()
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        if entry.name.startswith("."):
+                            continue
+
+                        with contextlib.suppress(OSError):
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+
+                            elif entry.is_file():
+                                files.append(entry.path)
+
+            except OSError:
+                if dirpath == self.__base_path:
+                    # We can't access the directory or it does not exist
+                    raise
+
+        return files
+
     @staticmethod
     def disk_scan(
         path: str,
@@ -1355,11 +2227,16 @@ class PersistentStore:
 
         logger.trace("Persistent path can of: %s", path)
 
-        def is_namespace(x):
+        def is_namespace(entry):
             """Validate what was detected is a valid namespace."""
-            return os.path.isdir(
-                os.path.join(path, x)
-            ) and PersistentStore.__valid_key.match(x)
+            try:
+                return entry.is_dir(
+                    follow_symlinks=False
+                ) and PersistentStore.__valid_key.match(entry.name)
+
+            except OSError:
+                # It was removed (or is otherwise inaccessible)
+                return False
 
         # Handle our namespace searching
         if namespace:
@@ -1373,11 +2250,15 @@ class PersistentStore:
                 )
 
         try:
-            # Acquire all of the files in question
+            # Acquire all of the directories in question; the type of each
+            # is known without having to stat() it
+            with os.scandir(path) as it:
+                detected = [entry.name for entry in it if is_namespace(entry)]
+
             namespaces = (
                 [
                     ns
-                    for ns in filter(is_namespace, os.listdir(path))
+                    for ns in detected
                     if not namespace
                     or next(
                         (True for n in namespace if ns.startswith(n)), False
@@ -1385,9 +2266,7 @@ class PersistentStore:
                 ]
                 if closest
                 else [
-                    ns
-                    for ns in filter(is_namespace, os.listdir(path))
-                    if not namespace or ns in namespace
+                    ns for ns in detected if not namespace or ns in namespace
                 ]
             )
 
@@ -1405,6 +2284,82 @@ class PersistentStore:
 
         return namespaces
 
+    @staticmethod
+    def disk_usage(
+        path: str,
+        namespace: Optional[Union[str, list[str]]] = None,
+        closest: bool = True,
+        max_workers: int = 8,
+    ) -> dict[str, dict[str, Union[int, float, None]]]:
+        """Returns the namespaces detected in the path provided along with
+        their disk usage.
+
+        Each namespace is mapped to a dictionary holding its size (in bytes)
+        and the modification times (as timestamps) of its newest and oldest
+        files.
+
+        The usage of each namespace is looked up in the catalog of our path;
+        those missing from it are scanned (in parallel) and added to it. A
+        catalog is created if the path is scanned as a whole.
+        """
+
+        # Get our namespaces
+        namespaces = PersistentStore.disk_scan(path, namespace, closest)
+
+        catalog = PersistentStoreCatalog(path)
+        entries = catalog.load()
+        usage = {} if entries is None else entries
+
+        # Scan what we do not know about yet
+        missing = [ns for ns in namespaces if ns not in usage]
+        if missing:
+            logger.trace(
+                "Persistent path scan of %d namespace(s): %s",
+                len(missing),
+                path,
+            )
+
+            def scan(ns):
+                (size, newest, oldest, _) = dir_usage(os.path.join(path, ns))
+                return (size, newest, oldest)
+
+            with cf.ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(missing))),
+                thread_name_prefix="apprise-storage",
+            ) as executor:
+                scanned = dict(zip(missing, executor.map(scan, missing)))
+
+        else:
+            scanned = {}
+
+        if entries is None:
+            if not namespace and namespaces:
+                # We scanned everything; build our catalog from it
+                catalog.save(scanned)
+
+        elif not namespace:
+            # Keep our catalog up to date with what we found
+            detected = set(namespaces)
+            scanned.update(
+                dict.fromkeys(
+                    (ns for ns in entries if ns not in detected), None
+                )
+            )
+            catalog.update(scanned)
+
+        else:
+            catalog.update(scanned)
+
+        usage = {**usage, **scanned}
+        return {
+            ns: {
+                "size": usage[ns][0],
+                "newest": usage[ns][1],
+                "oldest": usage[ns][2],
+            }
+            for ns in namespaces
+        }
+
     @staticmethod
     def disk_prune(
         path: str,
@@ -1422,18 +2377,35 @@ class PersistentStore:
 
         if action is not set to False, directories to be removed are returned
         only
+
+        namespaces are looked up in the catalog of our path (if one exists)
+        and only those holding files old enough to be pruned are scanned.
+
+        the (expired) rate limit buckets kept in our path are removed too
+        when no namespace is specified.
         """
 
         # Prepare our File Expiry
-        expires = (
-            datetime.now() - timedelta(seconds=expires)
-            if isinstance(expires, (float, int)) and expires >= 0
-            else PersistentStore.default_file_expiry
+        expires = datetime.now() - timedelta(
+            seconds=(
+                expires
+                if isinstance(expires, (float, int)) and expires >= 0
+                else PersistentStore.default_file_expiry
+            )
         )
 
+        # Track whether or not our path is pruned as a whole
+        scoped = bool(namespace)
+
         # Get our namespaces
         namespaces = PersistentStore.disk_scan(path, namespace)
 
+        catalog = PersistentStoreCatalog(path)
+        entries = catalog.load()
+
+        # The usage of the namespaces we scanned
+        updates = {}
+
         # Track matches
         map_ = {}
 
@@ -1441,6 +2413,15 @@ class PersistentStore:
             # Prepare our map
             map_[namespace] = []
 
+            usage = entries.get(namespace) if entries else None
+            if (
+                usage
+                and usage[2] is not None
+                and expires < datetime.fromtimestamp(usage[2])
+            ):
+                # Nothing in this namespace is old enough to be pruned
+                continue
+
             # Reference Directories
             base_dir = os.path.join(path, namespace)
             data_dir = os.path.join(base_dir, PersistentStore.data_dir)
@@ -1459,6 +2440,11 @@ class PersistentStore:
                     f"{PersistentStore.__cache_key}"
                     f"{PersistentStore.__backup_extension}",
                 ),
+                os.path.join(
+                    base_dir,
+                    f"{PersistentStore.__cache_key}"
+                    f"{PersistentStore.__journal_extension}",
+                ),
             ]
 
             # Update our files (applying what was defined above too)
@@ -1467,6 +2453,8 @@ class PersistentStore:
                 + re.escape(PersistentStore.__extension)
                 + r"|"
                 + re.escape(PersistentStore.__backup_extension)
+                + r"|"
+                + re.escape(PersistentStore.__journal_extension)
                 + r")$"
             )
 
@@ -1596,6 +2584,37 @@ class PersistentStore:
                         except OSError:
                             # do nothing;
                             pass
+
+            if action:
+                (size, newest, oldest, _) = dir_usage(base_dir)
+                updates[namespace] = (
+                    None
+                    if newest is None and not os.path.isdir(base_dir)
+                    else (size, newest, oldest)
+                )
+
+        if action:
+            # Keep our catalog up to date
+            if entries is not None:
+                if not scoped:
+                    detected = set(namespaces)
+                    updates.update(
+                        dict.fromkeys(
+                            (ns for ns in entries if ns not in detected), None
+                        )
+                    )
+                catalog.update(updates)
+
+            elif not scoped and namespaces:
+                # We scanned everything; build our catalog from it
+                catalog.save({k: v for k, v in updates.items() if v})
+
+            if not scoped:
+                # Drop the rate limit buckets that are full again too
+                FileRateLimiter.instance(
+                    os.path.join(path, RATELIMIT_STORAGE_DIR)
+                ).prune()
+
         return map_
 
     def size(
@@ -1639,17 +2658,14 @@ class PersistentStore:
         if self._cache is None and not self.__load_cache():
             raise KeyError("Could not initialize cache")
 
-        try:
+        with self.__mutex():
             if self._cache[key].persistent:
                 # Set our dirty flag in advance
                 self.__dirty = True
 
             # Store our new cache
             del self._cache[key]
-
-        except KeyError:
-            # Nothing to do
-            raise
+            self.__track(key)
 
         if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
             # Flush changes to disk
@@ -1666,7 +2682,11 @@ class PersistentStore:
         if self._cache is None and not self.__load_cache():
             return False
 
-        return key in self._cache and self._cache[key]
+        # Pick up what was changed by others since
+        self.__refresh()
+
+        cache = self._cache
+        return key in cache and bool(cache[key])
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Sets a cache value without disrupting existing settings in place."""
@@ -1674,16 +2694,20 @@ class PersistentStore:
         if self._cache is None and not self.__load_cache():
             raise KeyError("Could not initialize cache")
 
-        if key not in self._cache and not self.set(key, value):
-            raise KeyError("Could not set cache")
-
-        else:
-            # Update our value
-            self._cache[key].set(value)
+        with self.__mutex():
+            if key not in self._cache and not self.set(key, value):
+                raise KeyError("Could not set cache")
 
-            if self._cache[key].persistent:
-                # Set our dirty flag in advance
-                self.__dirty = True
+            else:
+                # Update our value; our cache objects are never altered in
+                # place as they may be shared with other stores
+                self._cache[key] = copy.copy(self._cache[key])
+                self._cache[key].set(value)
+                self.__track(key)
+
+                if self._cache[key].persistent:
+                    # Set our dirty flag in advance
+                    self.__dirty = True
 
         if self.__dirty and self.__mode == PersistentStoreMode.FLUSH:
             # Flush changes to disk
@@ -1709,6 +2733,9 @@ class PersistentStore:
             # There are no keys to return
             return {}.keys()
 
+        # Pick up what was changed by others since
+        self.__refresh()
+
         return self._cache.keys()
 
     def delete(
@@ -1732,6 +2759,8 @@ class PersistentStore:
             + re.escape(self.__backup_extension)
             + r"|"
             + re.escape(self.__extension)
+            + r"|"
+            + re.escape(self.__journal_extension)
             + r")$",
             re.I,
         )
@@ -1749,6 +2778,7 @@ class PersistentStore:
             self._cache.clear()
             # Reset dirt flag
             self.__dirty = False
+            self.__changes = set()
 
         for path in self.files(exclude=False):
             # Some information we use to validate the actions of our clean()
@@ -1845,6 +2875,10 @@ class PersistentStore:
         self.__cache_size = None
         self.__cache_files.clear()
 
+        # Update our catalog
+        self.__catalog_pending = True
+        self.__catalog_update(force=True)
+
         return not has_error
 
     @property
@@ -1855,6 +2889,14 @@ class PersistentStore:
             f"{self.__cache_key}{self.__extension}",
         )
 
+    @property
+    def journal_file(self) -> str:
+        """Returns the full path to the journal of our cache file."""
+        return os.path.join(
+            self.__base_path,
+            f"{self.__cache_key}{self.__journal_extension}",
+        )
+
     @property
     def path(self) -> Optional[str]:
         """Returns the full path to the namespace directory."""
@@ -1864,3 +2906,7 @@ class PersistentStore:
     def mode(self) -> PersistentStoreMode:
         """Returns the Persistent Storage mode."""
         return self.__mode
+
+
+# Record the usage our stores have yet to record before we exit
+atexit.register(PersistentStore.catalog_flush)
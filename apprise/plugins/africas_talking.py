@@ -327,7 +327,7 @@ class NotifyAfricasTalking(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     notify_url,
                     data=payload,
                     headers=headers,
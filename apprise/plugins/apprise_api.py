@@ -397,7 +397,7 @@ class NotifyAppriseAPI(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=payload,
                 headers=headers,
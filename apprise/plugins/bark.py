@@ -531,7 +531,7 @@ class NotifyBark(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=json.dumps(request_payload),
                     headers=headers,
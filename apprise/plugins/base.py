@@ -27,11 +27,15 @@
 
 import asyncio
 from collections.abc import Generator
+import contextvars
 from datetime import tzinfo
 from functools import partial
 import math
+import random
 import re
+import threading
 from typing import Any, ClassVar, Optional, TypedDict, Union
+import weakref
 from zoneinfo import ZoneInfo
 
 from ..apprise_attachment import AppriseAttachment
@@ -40,6 +44,7 @@ from ..common import (
     APPRISE_MAX_SERVICE_WAIT,
     NOTIFY_FORMATS,
     OVERFLOW_MODES,
+    LengthUnit,
     NotifyFormat,
     NotifyImageSize,
     NotifyType,
@@ -47,12 +52,30 @@ from ..common import (
     PersistentStoreMode,
 )
 from ..locale import Translatable, gettext_lazy as _
+from ..metrics import account, span
 from ..persistent_store import PersistentStore
 from ..url import URLBase
-from ..utils.format import smart_split
+from ..utils.format import smart_split, text_fit, text_length
+from ..utils.http import HTTP_RATELIMIT_CODES, ratelimit_wait
 from ..utils.parse import parse_bool
 from ..utils.time import zoneinfo
 
+# The number of seconds the upstream server asked each service (by id()) to
+# wait for before retrying (zero if unknown).  A new mapping is started by
+# every notify() call so that concurrent notifications made through the same
+# service never see (or consume) each other's rate limits.
+RATELIMIT_HINTS: contextvars.ContextVar[Optional[dict[int, float]]] = (
+    contextvars.ContextVar("apprise_ratelimit_hints", default=None)
+)
+
+# The persistent stores in use (by storage path, url identifier and mode); all
+# of the services sharing the same url identifier share (and keep in sync) the
+# same store rather than each loading (and flushing) their own copy of it.
+_PERSISTENT_STORES: "weakref.WeakValueDictionary[tuple, PersistentStore]" = (
+    weakref.WeakValueDictionary()
+)
+_PERSISTENT_STORES_LOCK = threading.Lock()
+
 
 class RequirementsSpec(TypedDict, total=False):
     """Defines our plugin requirements."""
@@ -185,6 +208,11 @@ class NotifyBase(URLBase):
     # The maximum allowable characters allowed in the body per message
     body_maxlen = 32768
 
+    # The unit body_maxlen is measured in; services that limit the encoded
+    # size of a message (rather than its characters) can measure it in
+    # UTF-8 bytes or UCS-2 code units instead
+    body_maxlen_unit = LengthUnit.CHARS
+
     # Defines the maximum allowable characters in the title; set this to zero
     # if a title can't be used. Titles that are not used but are defined are
     # automatically placed into the body
@@ -226,6 +254,15 @@ class NotifyBase(URLBase):
     # no per-plugin value is set.  Always in [0.0, APPRISE_MAX_SERVICE_WAIT].
     service_wait = 0.0
 
+    # When the upstream server rate limits us (see http_response()), retries
+    # back off exponentially starting from the larger of the service wait
+    # and this number of seconds
+    ratelimit_backoff = 1.0
+
+    # The longest we will wait for (in seconds) for an upstream server's rate
+    # limit window to re-open
+    ratelimit_max_wait = 60.0
+
     # When set to True, a delivery failure for this individual service is
     # silently absorbed by all three dispatch paths (sequential, thread-pool,
     # and asyncio coroutine).  The overall notify() / async_notify() call
@@ -287,6 +324,12 @@ class NotifyBase(URLBase):
     # isn't set in the same call to your notify() function.
     attachment_support = False
 
+    # Services able to stream their attachments (see apprise.utils.stream)
+    # do so once their combined size exceeds this; their content is then
+    # sent as it is read rather than being loaded into memory first.
+    # 5 MB = 5242880 bytes
+    attachment_stream_threshold = 5242880
+
     # Default Title HTML Tagging
     # When a title is specified for a notification service that doesn't accept
     # titles, by default apprise tries to give a plesant view and convert the
@@ -699,6 +742,9 @@ class NotifyBase(URLBase):
 
     def notify(self, *args: Any, **kwargs: Any) -> bool:
         """Performs notification."""
+        # Track the rate limits reported during this notification only
+        RATELIMIT_HINTS.set({})
+
         try:
             # Build a list of dictionaries that can be used to call send().
             send_calls = list(self._build_send_calls(*args, **kwargs))
@@ -710,11 +756,14 @@ class NotifyBase(URLBase):
         else:
             # Loop through each call, one at a time. (Use a list rather than a
             # generator to call all the partials, even in case of a failure.)
-            the_calls = [self.send(**kwargs2) for kwargs2 in send_calls]
+            the_calls = [self._timed_send(**kwargs2) for kwargs2 in send_calls]
             return all(the_calls)
 
     async def async_notify(self, *args: Any, **kwargs: Any) -> bool:
         """Performs notification for asynchronous callers."""
+        # Track the rate limits reported during this notification only
+        RATELIMIT_HINTS.set({})
+
         try:
             # Build a list of dictionaries that can be used to call send().
             send_calls = list(self._build_send_calls(*args, **kwargs))
@@ -724,20 +773,35 @@ class NotifyBase(URLBase):
             return False
 
         else:
-            loop = asyncio.get_event_loop()
-
-            # Wrap each call in a coroutine that uses the default executor.
-            # TODO: In the future, allow plugins to supply a native
-            # async_send() method.
-            async def do_send(**kwargs2):
-                send = partial(self.send, **kwargs2)
-                result = await loop.run_in_executor(None, send)
-                return result
-
-            # gather() all calls in parallel.
-            the_cors = (do_send(**kwargs2) for kwargs2 in send_calls)
+            # gather() all calls in parallel; plugins that do not provide a
+            # native async_send() have their send() run in the default
+            # executor.
+            the_cors = (
+                self._timed_async_send(**kwargs2) for kwargs2 in send_calls
+            )
             return all(await asyncio.gather(*the_cors))
 
+    def _timed_send(self, **kwargs: Any) -> bool:
+        """Calls send() within a timing span (if metrics are collected)."""
+        metrics = self.asset.metrics
+        if metrics is None:
+            return self.send(**kwargs)
+
+        with metrics.span("send", self.service_name, self.url_id()) as sp:
+            sp.success = bool(self.send(**kwargs))
+            return sp.success
+
+    async def _timed_async_send(self, **kwargs: Any) -> bool:
+        """Awaits async_send() within a timing span (if metrics are
+        collected)."""
+        metrics = self.asset.metrics
+        if metrics is None:
+            return await self.async_send(**kwargs)
+
+        with metrics.span("send", self.service_name, self.url_id()) as sp:
+            sp.success = bool(await self.async_send(**kwargs))
+            return sp.success
+
     def _build_send_calls(
         self,
         body: Optional[str] = None,
@@ -748,8 +812,8 @@ class NotifyBase(URLBase):
         body_format: Optional[NotifyFormat] = None,
         **kwargs: Any,
     ) -> Generator[dict[str, Any], None, None]:
-        """Get a list of dictionaries that can be used to call send() or (in
-        the future) async_send()."""
+        """Get a list of dictionaries that can be used to call send() or
+        async_send()."""
 
         if not self.enabled:
             # Deny notifications issued to services that are disabled
@@ -807,9 +871,15 @@ class NotifyBase(URLBase):
             attach_ = attach
 
         # Apply our overflow (if defined)
-        for chunk in self._apply_overflow(
-            body=body, title=title, overflow=overflow, body_format=body_format
-        ):
+        with span(self.asset.metrics, "overflow", self.service_name):
+            chunks = self._apply_overflow(
+                body=body,
+                title=title,
+                overflow=overflow,
+                body_format=body_format,
+            )
+
+        for chunk in chunks:
             # Send notification
             yield {
                 "body": chunk["body"],
@@ -943,16 +1013,21 @@ class NotifyBase(URLBase):
                 else (self.body_maxlen - overflow_buffer)
             )
 
+        # Measure our body in the unit the service limits it by
+        unit = self.body_maxlen_unit
+        body_len = text_length(body, unit)
+
         # If the body fits, we are done
-        if body_maxlen > 0 and len(body) <= body_maxlen:
+        if body_maxlen > 0 and body_len <= body_maxlen:
             response.append({"body": body, "title": title})
             return response
 
         # TRUNCATE mode: hard truncation (no smart-splitting)
         if overflow == OverflowMode.TRUNCATE:
+            body = body[: text_fit(body, 0, body_maxlen, unit)]
             response.append(
                 {
-                    "body": body[:body_maxlen].lstrip("\r\n\x0b\x0c").rstrip(),
+                    "body": body.lstrip("\r\n\x0b\x0c").rstrip(),
                     "title": title,
                 }
             )
@@ -980,7 +1055,7 @@ class NotifyBase(URLBase):
             # Decide whether to show a counter (legacy condition)
             show_counter = (
                 title
-                and len(body) > body_maxlen
+                and body_len > body_maxlen
                 and (
                     (
                         self.overflow_amalgamate_title
@@ -1011,6 +1086,7 @@ class NotifyBase(URLBase):
                 body,
                 effective_body_maxlen,
                 body_format,
+                unit,
             )
             count = len(chunks)
 
@@ -1060,6 +1136,7 @@ class NotifyBase(URLBase):
                     body,
                     body_maxlen,
                     body_format,
+                    unit,
                 )
                 first_body = first_chunks[0] if first_chunks else ""
                 consumed = len(first_body)
@@ -1090,6 +1167,7 @@ class NotifyBase(URLBase):
                     remainder,
                     self.body_maxlen,
                     body_format,
+                    unit,
                 )
                 for chunk_body in more_chunks:
                     response.append(
@@ -1101,6 +1179,73 @@ class NotifyBase(URLBase):
 
         return response
 
+    def http_response(self, r: Any) -> None:
+        """Inspects every response received through self.http (and
+        self.async_http) for signs of the upstream server rate limiting us.
+
+        The rate limit budget we share with everyone using the same
+        credentials is deferred until the server is ready to accept requests
+        again.  If our request was rejected, the retry_delay() of the
+        notification is adjusted too.
+
+        The size of the request made is also accounted to the metrics span
+        currently open (if metrics are being collected).
+        """
+        if self.asset.metrics is not None:
+            # Account for the bytes we sent
+            account(r)
+
+        headers = getattr(r, "headers", None)
+        if headers is None:
+            # Not something we can inspect
+            return
+
+        status_code = getattr(r, "status_code", None)
+        throttled, wait = ratelimit_wait(status_code, headers)
+        if not throttled:
+            return
+
+        if wait is not None:
+            wait = min(wait, self.ratelimit_max_wait)
+            self.defer(wait)
+
+        if status_code in HTTP_RATELIMIT_CODES:
+            self.logger.debug(
+                "%s is rate limiting us%s",
+                self.service_name,
+                "" if wait is None else f"; retry in {wait:.2f}s",
+            )
+            hints = RATELIMIT_HINTS.get()
+            if hints is None:
+                # We were not called through notify()
+                hints = {}
+                RATELIMIT_HINTS.set(hints)
+
+            hints[id(self)] = wait or 0.0
+
+    def retry_delay(self, attempt: int, wait: float) -> float:
+        """Returns the number of seconds to wait for before retrying a failed
+        notification (attempt starts at zero).
+
+        The service wait is used unless the upstream server rate limited our
+        last attempt; in which case we honour the time it asked us to wait
+        for or otherwise back off exponentially.  A little jitter is always
+        added so that the services sharing the same upstream server do not
+        all retry at once.
+        """
+        hints = RATELIMIT_HINTS.get()
+        hint = None if hints is None else hints.pop(id(self), None)
+        if hint is None:
+            return wait
+
+        delay = (
+            hint
+            if hint > 0
+            else max(wait, self.ratelimit_backoff) * (2**attempt)
+        )
+        delay = min(delay, self.ratelimit_max_wait)
+        return delay + random.uniform(0, delay * 0.1)
+
     def send(
         self,
         body: str,
@@ -1113,6 +1258,35 @@ class NotifyBase(URLBase):
             "send() is not implemented by the child class."
         )
 
+    async def async_send(
+        self,
+        body: str,
+        title: str = "",
+        notify_type: NotifyType = NotifyType.INFO,
+        **kwargs: Any,
+    ) -> bool:
+        """The asynchronous counterpart of send() used by async_notify().
+
+        By default send() is simply run in the default executor.  Plugins can
+        override this with a native implementation that awaits its network
+        i/o through self.async_http (and self.async_throttle()) instead of
+        occupying a worker thread for the duration of the request.
+        """
+        # Our context is carried over so that the rate limits reported to
+        # http_response() are tracked against this notification
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            contextvars.copy_context().run,
+            partial(
+                self.send,
+                body=body,
+                title=title,
+                notify_type=notify_type,
+                **kwargs,
+            ),
+        )
+
     def __len__(self):
         """Returns the number of HTTP requests this instance will make,
         factoring in the configured retry count.
@@ -1305,14 +1479,36 @@ class NotifyBase(URLBase):
         And clear them:
          del self.store['key']
         """
-        if self.__store is None:
-            # Initialize our persistent store for use
+        if self.__store is not None:
+            return self.__store
+
+        namespace = self.url_id()
+        if (
+            not namespace
+            or not self.asset.storage_path
+            or self.asset.storage_mode == PersistentStoreMode.MEMORY
+        ):
+            # Initialize our (private) persistent store for use
             self.__store = PersistentStore(
-                namespace=self.url_id(),
+                namespace=namespace,
                 path=self.asset.storage_path,
                 mode=self.asset.storage_mode,
             )
+            return self.__store
+
+        key = (self.asset.storage_path, namespace, self.asset.storage_mode)
+        with _PERSISTENT_STORES_LOCK:
+            store = _PERSISTENT_STORES.get(key)
+            if store is None:
+                # Initialize our persistent store for use
+                store = PersistentStore(
+                    namespace=namespace,
+                    path=self.asset.storage_path,
+                    mode=self.asset.storage_mode,
+                )
+                _PERSISTENT_STORES[key] = store
 
+        self.__store = store
         return self.__store
 
     @property
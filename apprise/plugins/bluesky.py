@@ -555,7 +555,7 @@ class NotifyBlueSky(NotifyBase):
         content = {}
 
         # acquire our request mode
-        fn = requests.post if method == "POST" else requests.get
+        fn = self.http.post if method == "POST" else self.http.get
         try:
             r = fn(
                 url,
@@ -516,7 +516,7 @@ class NotifyBrevo(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=dumps(payload),
                     headers=headers,
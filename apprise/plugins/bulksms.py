@@ -338,7 +338,7 @@ class NotifyBulkSMS(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=json.dumps(payload),
                     headers=headers,
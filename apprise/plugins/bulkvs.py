@@ -250,7 +250,7 @@ class NotifyBulkVS(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=json.dumps(payload),
                     headers=headers,
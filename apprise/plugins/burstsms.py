@@ -309,7 +309,7 @@ class NotifyBurstSMS(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=payload,
                     headers=headers,
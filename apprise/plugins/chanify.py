@@ -126,7 +126,7 @@ class NotifyChanify(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url.format(token=self.token),
                 data=payload,
                 headers=headers,
@@ -212,7 +212,7 @@ class NotifyChime(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=dumps(payload),
                 headers=headers,
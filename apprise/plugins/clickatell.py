@@ -224,7 +224,7 @@ class NotifyClickatell(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.get(
+                r = self.http.get(
                     self.notify_url,
                     params=params,
                     headers=headers,
@@ -202,7 +202,7 @@ class NotifyClickSend(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=dumps(payload),
                     auth=(self.user, self.password),
@@ -33,6 +33,7 @@ from ..common import NotifyImageSize, NotifyType
 from ..locale import gettext_lazy as _
 from ..url import PrivacyMode
 from ..utils.parse import URL_PATH_SAFE_CHARS
+from ..utils.stream import multipart_body
 from .base import NotifyBase
 
 
@@ -302,6 +303,14 @@ class NotifyForm(NotifyBase):
         # Apply any/all header over-rides defined
         headers.update(self.headers)
 
+        # Large attachments are streamed rather than loaded into memory
+        stream = bool(
+            attach
+            and self.attachment_support
+            and self.method != "GET"
+            and sum(len(a) for a in attach) > self.attachment_stream_threshold
+        )
+
         # Track our potential attachments
         files = []
         if attach and self.attachment_support:
@@ -329,9 +338,14 @@ class NotifyForm(NotifyBase):
                                     if attachment.name
                                     else f"file{no:03}.dat"
                                 ),
-                                # file handle safely closed in
-                                # `finally`; inline open intentional
-                                open(attachment.path, "rb"),  # noqa: SIM115
+                                # streamed attachments are read as they are
+                                # sent; otherwise the file handle is safely
+                                # closed in `finally`
+                                (
+                                    attachment
+                                    if stream
+                                    else open(attachment.path, "rb")  # noqa: SIM115
+                                ),
                                 attachment.mimetype,
                             ),
                         )
@@ -396,12 +410,19 @@ class NotifyForm(NotifyBase):
         if self.method == "GET":
             payload.update(self.params)
 
+        data = payload if self.method != "GET" else None
+        if stream:
+            # Our attachments are sent as they are read
+            data = multipart_body(payload, files)
+            headers["Content-Type"] = data.content_type
+            files = []
+
         try:
-            r = requests.request(
+            r = self.http.request(
                 self.method,
                 url,
                 files=files if files else None,
-                data=payload if self.method != "GET" else None,
+                data=data,
                 params=payload if self.method == "GET" else self.params,
                 headers=headers,
                 auth=auth,
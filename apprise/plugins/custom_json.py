@@ -36,6 +36,7 @@ from ..locale import gettext_lazy as _
 from ..url import PrivacyMode
 from ..utils.parse import URL_PATH_SAFE_CHARS
 from ..utils.sanitize import sanitize_payload
+from ..utils.stream import json_body
 from .base import NotifyBase
 
 
@@ -213,6 +214,79 @@ class NotifyJSON(NotifyBase):
     ):
         """Perform JSON Notification."""
 
+        prepared = self._prepare_request(body, title, notify_type, attach)
+        if prepared is None:
+            # Logging already handled
+            return False
+
+        url, request = prepared
+
+        # Always call throttle before any remote server i/o is made
+        self.throttle()
+
+        try:
+            r = self.http.request(self.method, url, **request)
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                "A Connection error occurred sending JSON "
+                f"notification to {self.host}."
+            )
+            self.logger.debug(f"Socket Exception: {e!s}")
+
+            # Return; we're done
+            return False
+
+        return self._handle_response(r)
+
+    async def async_send(
+        self,
+        body,
+        title="",
+        notify_type=NotifyType.INFO,
+        attach=None,
+        **kwargs,
+    ):
+        """Perform JSON Notification without blocking the event loop."""
+
+        if attach and self.attachment_support:
+            # Attachments may require blocking i/o to be read (or downloaded)
+            return await super().async_send(
+                body, title, notify_type, attach=attach, **kwargs
+            )
+
+        prepared = self._prepare_request(body, title, notify_type, attach)
+        if prepared is None:
+            # Logging already handled
+            return False
+
+        url, request = prepared
+
+        # Always call throttle before any remote server i/o is made
+        await self.async_throttle()
+
+        try:
+            r = await self.async_http.request(self.method, url, **request)
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                "A Connection error occurred sending JSON "
+                f"notification to {self.host}."
+            )
+            self.logger.debug(f"Socket Exception: {e!s}")
+
+            # Return; we're done
+            return False
+
+        return self._handle_response(r)
+
+    def _prepare_request(self, body, title, notify_type, attach=None):
+        """Prepares our JSON request returning a tuple of the URL to notify
+        and the keyword arguments to pass along with it.
+
+        None is returned if the request could not be prepared.
+        """
+
         # Prepare HTTP Headers
         headers = {
             "User-Agent": self.app_id,
@@ -222,6 +296,13 @@ class NotifyJSON(NotifyBase):
         # Apply any/all header over-rides defined
         headers.update(self.headers)
 
+        # Large attachments are streamed rather than loaded into memory
+        stream = bool(
+            attach
+            and self.attachment_support
+            and sum(len(a) for a in attach) > self.attachment_stream_threshold
+        )
+
         # Track our potential attachments
         attachments = []
         if attach and self.attachment_support:
@@ -233,7 +314,7 @@ class NotifyJSON(NotifyBase):
                         "Could not access Custom JSON attachment"
                         f" {attachment.url(privacy=True)}."
                     )
-                    return False
+                    return None
 
                 try:
                     attachments.append(
@@ -243,7 +324,9 @@ class NotifyJSON(NotifyBase):
                                 if attachment.name
                                 else f"file{no:03}.dat"
                             ),
-                            "base64": attachment.base64(),
+                            "base64": (
+                                attachment if stream else attachment.base64()
+                            ),
                             "mimetype": attachment.mimetype,
                         }
                     )
@@ -254,7 +337,7 @@ class NotifyJSON(NotifyBase):
                         "Could not access Custom JSON attachment"
                         f" {attachment.url(privacy=True)}."
                     )
-                    return False
+                    return None
 
                 self.logger.debug(
                     "Appending Custom JSON attachment"
@@ -309,55 +392,39 @@ class NotifyJSON(NotifyBase):
             )
             self.logger.debug("JSON Payload: %s", sanitize_payload(payload))
 
-        # Always call throttle before any remote server i/o is made
-        self.throttle()
-
-        try:
-            r = requests.request(
-                self.method,
-                url,
-                data=dumps(payload),
-                params=self.params,
-                headers=headers,
-                auth=auth,
-                verify=self.verify_certificate,
-                timeout=self.request_timeout,
-                allow_redirects=self.redirects,
-            )
-            if r.status_code < 200 or r.status_code >= 300:
-                # We had a problem
-                status_str = NotifyJSON.http_response_code_lookup(
-                    r.status_code
-                )
-
-                self.logger.warning(
-                    "Failed to send JSON %s notification: %s%serror=%s.",
-                    self.method,
-                    status_str,
-                    ", " if status_str else "",
-                    r.status_code,
-                )
+        return url, {
+            "data": json_body(payload) if stream else dumps(payload),
+            "params": self.params,
+            "headers": headers,
+            "auth": auth,
+            "verify": self.verify_certificate,
+            "timeout": self.request_timeout,
+            "allow_redirects": self.redirects,
+        }
 
-                self.logger.debug(
-                    "Response Details:\r\n%r", (r.content or b"")[:2000]
-                )
+    def _handle_response(self, r):
+        """Interprets the response returned by our JSON server."""
 
-                # Return; we're done
-                return False
+        if r.status_code < 200 or r.status_code >= 300:
+            # We had a problem
+            status_str = NotifyJSON.http_response_code_lookup(r.status_code)
 
-            else:
-                self.logger.info("Sent JSON %s notification.", self.method)
-
-        except requests.RequestException as e:
             self.logger.warning(
-                "A Connection error occurred sending JSON "
-                f"notification to {self.host}."
+                "Failed to send JSON %s notification: %s%serror=%s.",
+                self.method,
+                status_str,
+                ", " if status_str else "",
+                r.status_code,
+            )
+
+            self.logger.debug(
+                "Response Details:\r\n%r", (r.content or b"")[:2000]
             )
-            self.logger.debug(f"Socket Exception: {e!s}")
 
             # Return; we're done
             return False
 
+        self.logger.info("Sent JSON %s notification.", self.method)
         return True
 
     @property
@@ -405,7 +405,7 @@ class NotifyXML(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.request(
+            r = self.http.request(
                 self.method,
                 url,
                 data=payload,
@@ -267,7 +267,7 @@ class NotifyD7Networks(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=dumps(payload),
                     headers=headers,
@@ -240,7 +240,7 @@ class NotifyDingTalk(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=dumps(payload),
                 headers=headers,
@@ -508,6 +508,141 @@ class NotifyDiscord(NotifyBase):
     ) -> bool:
         """Perform Discord Notification."""
 
+        prepared = self._prepare_messages(
+            body=body, title=title, notify_type=notify_type, **kwargs
+        )
+        if prepared is None:
+            # gen_payload() already logged the error; bail early
+            return False
+
+        payload, params, messages = prepared
+        for message, message_params in messages:
+            if not self._send(message, params=message_params):
+                # We failed to post our message
+                return False
+
+        if attach and self.attachment_support:
+            # Update our payload; the idea is to preserve it's other detected
+            # and assigned values for re-use here too
+            payload.update(
+                {
+                    # Text-To-Speech
+                    "tts": False,
+                    # Wait until the upload has posted itself before continuing
+                    "wait": True,
+                }
+            )
+
+            #
+            # Remove our text/title based content for attachment use
+            #
+            payload.pop("embeds", None)
+            payload.pop("content", None)
+            payload.pop("allow_mentions", None)
+
+            #
+            # Build attachment batches in strict serial order.
+            # Each batch respects the per-message attachment count and
+            # total byte limits.  When batch=False every attachment is
+            # its own message (legacy one-per-message behaviour).
+            #
+            max_per = self.discord_max_attachments if self.batch else 1
+
+            batches: list[list[AttachBase]] = []
+            current: list[AttachBase] = []
+            current_size = 0
+
+            for attachment in attach:
+                # Size is only needed for byte-limit batching; skip the
+                # stat()/download() it triggers when batching is off
+                size = (
+                    (len(attachment) if attachment else 0) if self.batch else 0
+                )
+
+                if current and (
+                    len(current) >= max_per
+                    or (
+                        self.batch
+                        and current_size + size > self.discord_max_attach_bytes
+                    )
+                ):
+                    # Current batch is full; flush and start a new one
+                    batches.append(current)
+                    current = []
+                    current_size = 0
+
+                current.append(attachment)
+                current_size += size
+
+            # current always holds at least the last attachment here
+            batches.append(current)
+
+            #
+            # Send each attachment batch
+            #
+            for batch in batches:
+                if not self._send(payload, params=params, attach=batch):
+                    # We failed to post our attachment batch
+                    return False
+
+        # Otherwise return
+        return True
+
+    async def async_send(
+        self,
+        body: str,
+        title: str = "",
+        notify_type: NotifyType = NotifyType.INFO,
+        attach: list[AttachBase] | None = None,
+        **kwargs: Any,
+    ) -> bool:
+        """Perform Discord Notification without blocking the event loop."""
+
+        if attach and self.attachment_support:
+            # Attachments are opened (and possibly downloaded) in a blocking
+            # fashion; let our executor based default take care of these
+            return await super().async_send(
+                body,
+                title=title,
+                notify_type=notify_type,
+                attach=attach,
+                **kwargs,
+            )
+
+        prepared = self._prepare_messages(
+            body=body, title=title, notify_type=notify_type, **kwargs
+        )
+        if prepared is None:
+            # gen_payload() already logged the error; bail early
+            return False
+
+        for message, message_params in prepared[2]:
+            if not await self._async_send(message, params=message_params):
+                # We failed to post our message
+                return False
+
+        return True
+
+    def _prepare_messages(
+        self,
+        body: str,
+        title: str = "",
+        notify_type: NotifyType = NotifyType.INFO,
+        **kwargs: Any,
+    ) -> (
+        tuple[
+            dict[str, Any],
+            dict[str, str] | None,
+            list[tuple[dict[str, Any], dict[str, str] | None]],
+        ]
+        | None
+    ):
+        """Returns a tuple of our base payload, our posting parameters and
+        the list of (payload, params) text messages to post in order.
+
+        None is returned if our template could not be applied.
+        """
+
         payload: dict[str, Any] = {
             "tts": self.tts,
             # If Text-To-Speech is set to True, then we do not want to wait
@@ -534,6 +669,9 @@ class NotifyDiscord(NotifyBase):
         # Associate our thread_id with our message
         params = {"thread_id": self.thread_id} if self.thread_id else None
 
+        # The text based messages to post
+        messages: list[tuple[dict[str, Any], dict[str, str] | None]] = []
+
         # Template mode bypasses ping detection and embed construction;
         # the template defines the complete payload content.
         if not self.template:
@@ -562,15 +700,11 @@ class NotifyDiscord(NotifyBase):
                 **kwargs,
             )
             if template_payload is False:
-                # gen_payload() already logged the error; bail early
-                return False
+                return None
 
             # Merge template content over our base payload
             payload.update(template_payload)
-
-            if not self._send(payload, params=params):
-                # We failed to post our message
-                return False
+            messages.append((payload, params))
 
         elif body:
             # Track extra embed fields (if used)
@@ -637,87 +771,29 @@ class NotifyDiscord(NotifyBase):
                     body if not title else f"{title}\r\n{body}"
                 ) + payload.get("content", "")
 
-            if not self._send(payload, params=params):
-                # We failed to post our message
-                return False
+            messages.append((payload, params))
 
             # Send remaining fields (if any)
-            if fields:
-                payload["embeds"][0]["description"] = ""
-                for i in range(0, len(fields), self.discord_max_fields):
-                    payload["embeds"][0]["fields"] = fields[
-                        i : i + self.discord_max_fields
-                    ]
-                    if not self._send(payload):
-                        # We failed to post our message
-                        return False
-
-        if attach and self.attachment_support:
-            # Update our payload; the idea is to preserve it's other detected
-            # and assigned values for re-use here too
-            payload.update(
-                {
-                    # Text-To-Speech
-                    "tts": False,
-                    # Wait until the upload has posted itself before continuing
-                    "wait": True,
-                }
-            )
-
-            #
-            # Remove our text/title based content for attachment use
-            #
-            payload.pop("embeds", None)
-            payload.pop("content", None)
-            payload.pop("allow_mentions", None)
-
-            #
-            # Build attachment batches in strict serial order.
-            # Each batch respects the per-message attachment count and
-            # total byte limits.  When batch=False every attachment is
-            # its own message (legacy one-per-message behaviour).
-            #
-            max_per = self.discord_max_attachments if self.batch else 1
-
-            batches: list[list[AttachBase]] = []
-            current: list[AttachBase] = []
-            current_size = 0
-
-            for attachment in attach:
-                # Size is only needed for byte-limit batching; skip the
-                # stat()/download() it triggers when batching is off
-                size = (
-                    (len(attachment) if attachment else 0) if self.batch else 0
-                )
-
-                if current and (
-                    len(current) >= max_per
-                    or (
-                        self.batch
-                        and current_size + size > self.discord_max_attach_bytes
+            for i in range(0, len(fields), self.discord_max_fields):
+                messages.append(
+                    (
+                        {
+                            **payload,
+                            "embeds": [
+                                {
+                                    **payload["embeds"][0],
+                                    "description": "",
+                                    "fields": fields[
+                                        i : i + self.discord_max_fields
+                                    ],
+                                }
+                            ],
+                        },
+                        None,
                     )
-                ):
-                    # Current batch is full; flush and start a new one
-                    batches.append(current)
-                    current = []
-                    current_size = 0
-
-                current.append(attachment)
-                current_size += size
-
-            # current always holds at least the last attachment here
-            batches.append(current)
-
-            #
-            # Send each attachment batch
-            #
-            for batch in batches:
-                if not self._send(payload, params=params, attach=batch):
-                    # We failed to post our attachment batch
-                    return False
+                )
 
-        # Otherwise return
-        return True
+        return payload, params, messages
 
     def _send(
         self,
@@ -729,42 +805,10 @@ class NotifyDiscord(NotifyBase):
     ) -> bool:
         """Wrapper to the requests (post) object."""
 
-        # Our headers
-        headers = {
-            "User-Agent": self.app_id,
-        }
-
-        # Construct Notify URL
-        notify_url = (
-            f"{self.notify_url}/{self.webhook_id}/{self.webhook_token}"
-        )
-
-        self.logger.debug(
-            "Discord POST URL:"
-            f" {notify_url} (cert_verify={self.verify_certificate!r})"
-        )
-        self.logger.debug(f"Discord Payload: {payload!s}")
-
-        wait: float | None = None
-
-        if self.ratelimit_remaining <= 0.0:
-            # Determine how long we should wait for or if we should wait at
-            # all. This isn't fool-proof because we can't be sure the client
-            # time (calling this script) is completely synced up with the
-            # Discord server.  One would hope we're on NTP and our clocks are
-            # the same allowing this to role smoothly:
-
-            now = datetime.now(timezone.utc).replace(tzinfo=None)
-            if now < self.ratelimit_reset:
-                # We need to throttle for the difference in seconds
-                wait = abs(
-                    (
-                        self.ratelimit_reset - now + self.clock_skew
-                    ).total_seconds()
-                )
+        notify_url, headers = self._prepare_request(payload)
 
         # Always call throttle before any remote server i/o is made;
-        self.throttle(wait=wait)
+        self.throttle(wait=self._ratelimit_wait())
 
         # File handles opened for this call; all closed in `finally`
         handles: list[Any] = []
@@ -822,7 +866,7 @@ class NotifyDiscord(NotifyBase):
             else:
                 headers["Content-Type"] = "application/json; charset=utf-8"
 
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 params=params,
                 data=(
@@ -837,76 +881,18 @@ class NotifyDiscord(NotifyBase):
                 allow_redirects=self.redirects,
             )
 
-            # Handle rate limiting (if specified)
-            try:
-                # Store our rate limiting (if provided)
-                self.ratelimit_remaining = float(
-                    r.headers.get("X-RateLimit-Remaining")
-                )
-                self.ratelimit_reset = datetime.fromtimestamp(
-                    int(r.headers.get("X-RateLimit-Reset")), timezone.utc
-                ).replace(tzinfo=None)
-
-            except (TypeError, ValueError):
-                # This is returned if we could not retrieve this
-                # information gracefully accept this state and move on
-                pass
-
-            if r.status_code not in (
-                requests.codes.ok,
-                requests.codes.no_content,
-            ):
-                # We had a problem
-                status_str = NotifyBase.http_response_code_lookup(
-                    r.status_code
-                )
-
-                if (
-                    r.status_code == requests.codes.too_many_requests
-                    and rate_limit > 0
-                ):
-                    # handle rate limiting
-                    self.logger.warning(
-                        "Discord rate limiting in effect; "
-                        "blocking for %.2f second(s)",
-                        self.ratelimit_remaining,
-                    )
-
-                    # Try one more time before failing
-                    return self._send(
-                        payload=payload,
-                        attach=attach,
-                        params=params,
-                        rate_limit=rate_limit - 1,
-                        **kwargs,
-                    )
-
-                self.logger.warning(
-                    "Failed to send Discord %s: %s%serror=%s.",
-                    (
-                        "{} attachment(s)".format(len(attach))
-                        if attach
-                        else "notification"
-                    ),
-                    status_str,
-                    ", " if status_str else "",
-                    r.status_code,
-                )
-
-                self.logger.debug(
-                    "Response Details:\r\n%r", (r.content or b"")[:2000]
+            result = self._handle_response(r, attach, rate_limit)
+            if result is None:
+                # Try one more time before failing
+                return self._send(
+                    payload=payload,
+                    attach=attach,
+                    params=params,
+                    rate_limit=rate_limit - 1,
+                    **kwargs,
                 )
 
-                # Return; we're done
-                return False
-
-            else:
-                if attach:
-                    self.logger.info(
-                        "Sent Discord %d attachment(s).", len(attach)
-                    )
-                else:
-                    self.logger.info("Sent Discord notification.")
+            return result
 
         except requests.RequestException as e:
             self.logger.warning(
@@ -927,6 +913,159 @@ class NotifyDiscord(NotifyBase):
             for handle in handles:
                 handle.close()
 
+    async def _async_send(
+        self,
+        payload: dict[str, Any],
+        params: dict[str, str] | None = None,
+        rate_limit: int = 1,
+    ) -> bool:
+        """The asynchronous counterpart of _send() for text messages."""
+
+        notify_url, headers = self._prepare_request(payload)
+        headers["Content-Type"] = "application/json; charset=utf-8"
+
+        # Always call throttle before any remote server i/o is made;
+        await self.async_throttle(wait=self._ratelimit_wait())
+
+        try:
+            r = await self.async_http.post(
+                notify_url,
+                params=params,
+                data=dumps(payload),
+                headers=headers,
+                verify=self.verify_certificate,
+                timeout=self.request_timeout,
+                allow_redirects=self.redirects,
+            )
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                "A Connection error occurred posting to Discord."
+            )
+            self.logger.debug(f"Socket Exception: {e!s}")
+            return False
+
+        result = self._handle_response(r, None, rate_limit)
+        if result is None:
+            # Try one more time before failing
+            return await self._async_send(
+                payload=payload, params=params, rate_limit=rate_limit - 1
+            )
+
+        return result
+
+    def _prepare_request(
+        self, payload: dict[str, Any]
+    ) -> tuple[str, dict[str, str]]:
+        """Returns a tuple of the URL to notify and the headers to post with
+        it."""
+
+        # Our headers
+        headers = {
+            "User-Agent": self.app_id,
+        }
+
+        # Construct Notify URL
+        notify_url = (
+            f"{self.notify_url}/{self.webhook_id}/{self.webhook_token}"
+        )
+
+        self.logger.debug(
+            "Discord POST URL:"
+            f" {notify_url} (cert_verify={self.verify_certificate!r})"
+        )
+        self.logger.debug(f"Discord Payload: {payload!s}")
+
+        return notify_url, headers
+
+    def _ratelimit_wait(self) -> float | None:
+        """Returns the number of seconds we must wait for (if any) to respect
+        the rate limits last reported by Discord."""
+
+        if self.ratelimit_remaining <= 0.0:
+            # Determine how long we should wait for or if we should wait at
+            # all. This isn't fool-proof because we can't be sure the client
+            # time (calling this script) is completely synced up with the
+            # Discord server.  One would hope we're on NTP and our clocks are
+            # the same allowing this to role smoothly:
+
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            if now < self.ratelimit_reset:
+                # We need to throttle for the difference in seconds
+                return abs(
+                    (
+                        self.ratelimit_reset - now + self.clock_skew
+                    ).total_seconds()
+                )
+
+        return None
+
+    def _handle_response(
+        self, r: Any, attach: list[AttachBase] | None, rate_limit: int
+    ) -> bool | None:
+        """Interprets the response returned by Discord.
+
+        None is returned if we were rate limited and should try again.
+        """
+
+        # Handle rate limiting (if specified)
+        try:
+            # Store our rate limiting (if provided)
+            self.ratelimit_remaining = float(
+                r.headers.get("X-RateLimit-Remaining")
+            )
+            self.ratelimit_reset = datetime.fromtimestamp(
+                int(r.headers.get("X-RateLimit-Reset")), timezone.utc
+            ).replace(tzinfo=None)
+
+        except (TypeError, ValueError):
+            # This is returned if we could not retrieve this
+            # information gracefully accept this state and move on
+            pass
+
+        if r.status_code not in (
+            requests.codes.ok,
+            requests.codes.no_content,
+        ):
+            # We had a problem
+            status_str = NotifyBase.http_response_code_lookup(r.status_code)
+
+            if (
+                r.status_code == requests.codes.too_many_requests
+                and rate_limit > 0
+            ):
+                # handle rate limiting
+                self.logger.warning(
+                    "Discord rate limiting in effect; "
+                    "blocking for %.2f second(s)",
+                    self.ratelimit_remaining,
+                )
+                return None
+
+            self.logger.warning(
+                "Failed to send Discord %s: %s%serror=%s.",
+                (
+                    "{} attachment(s)".format(len(attach))
+                    if attach
+                    else "notification"
+                ),
+                status_str,
+                ", " if status_str else "",
+                r.status_code,
+            )
+
+            self.logger.debug(
+                "Response Details:\r\n%r", (r.content or b"")[:2000]
+            )
+
+            # Return; we're done
+            return False
+
+        if attach:
+            self.logger.info("Sent Discord %d attachment(s).", len(attach))
+        else:
+            self.logger.info("Sent Discord notification.")
+
         return True
 
     def url(self, privacy: bool = False, *args: Any, **kwargs: Any) -> str:
@@ -311,7 +311,7 @@ class NotifyDot(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 api_url,
                 data=json.dumps(payload),
                 headers=headers,
@@ -268,7 +268,7 @@ class NotifyEight00com(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=dumps(payload),
                 headers=sms_headers,
@@ -373,7 +373,7 @@ class NotifyEight00com(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
 
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=data,
                 headers=headers,
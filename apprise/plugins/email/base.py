@@ -25,7 +25,6 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-import contextlib
 from datetime import datetime
 from email.header import Header
 from email.mime.application import MIMEApplication
@@ -33,6 +32,7 @@ from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import format_datetime, formataddr, make_msgid
+import hashlib
 import re
 import smtplib
 import ssl
@@ -60,6 +60,7 @@ from .common import (
     SecureMailMode,
     WebBaseLogin,
 )
+from .pool import SMTP_CONNECTION_EXCEPTIONS, SMTPConnectionPool
 
 
 class PGPMode:
@@ -514,6 +515,7 @@ class NotifyEmail(NotifyBase):
                 verify_certificate=self.verify_certificate,
                 request_timeout=self.request_timeout,
                 allow_redirects=self.redirects,
+                http=self.http,
             )
             if self.use_wkd
             else None
@@ -663,45 +665,28 @@ class NotifyEmail(NotifyBase):
         # bind the socket variable to the current namespace
         socket = None
 
+        # Connections are kept open (and re-used) if pooling is enabled
+        pool = SMTPConnectionPool() if self.asset.smtp_pool else None
+
+        # Set if our connection was re-used from our pool
+        reused = False
+
+        # Set once our connection can no longer be trusted
+        broken = False
+
         # Always call throttle before any remote server i/o is made
         self.throttle()
 
-        # Build an SSL context that honours our verify_certificate setting so
-        # that SMTPS/STARTTLS connections actually validate the remote server's
-        # certificate (and hostname) instead of silently accepting any
-        # certificate presented to us.
-        context = ssl.create_default_context()
-        if not self.verify_certificate:
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-
         try:
-            self.logger.debug("Connecting to remote SMTP server...")
-            socket_func = smtplib.SMTP
-            socket_args = {}
-            if self.secure_mode == SecureMailMode.SSL:
-                self.logger.debug("Securing connection with SSL...")
-                socket_func = smtplib.SMTP_SSL
-                socket_args["context"] = context
-
-            socket = socket_func(
-                self.smtp_host,
-                self.port,
-                None,
-                timeout=self.socket_connect_timeout,
-                **socket_args,
-            )
-
-            if self.secure_mode == SecureMailMode.STARTTLS:
-                # Handle Secure Connections
-                self.logger.debug("Securing connection with STARTTLS...")
-                socket.starttls(context=context)
+            if pool is None:
+                socket = self._smtp_connect()
 
-            self.logger.trace("Login ID: {}".format(self.user))
-            if self.user and self.password:
-                # Apply Login credentials
-                self.logger.debug("Applying user credentials...")
-                socket.login(self.user, self.password)
+            else:
+                (socket, reused) = pool.acquire(
+                    self.smtp_pool_key,
+                    self._smtp_connect,
+                    idle_timeout=self.asset.smtp_pool_idle_timeout,
+                )
 
             # Prepare our headers
             headers = {
@@ -730,13 +715,30 @@ class NotifyEmail(NotifyBase):
                 tzinfo=self.tzinfo,
             ):
                 try:
-                    socket.sendmail(
-                        self.from_addr[1], message.to_addrs, message.body
-                    )
+                    try:
+                        socket.sendmail(
+                            self.from_addr[1], message.to_addrs, message.body
+                        )
+
+                    except smtplib.SMTPServerDisconnected:
+                        if not reused:
+                            raise
+
+                        # Our pooled connection was dropped by the server
+                        # since it was last checked; reconnect and try again
+                        self.logger.debug(
+                            "Pooled SMTP connection lost; reconnecting..."
+                        )
+                        SMTPConnectionPool.quit(socket)
+                        (socket, reused) = (None, False)
+                        socket = self._smtp_connect()
+                        socket.sendmail(
+                            self.from_addr[1], message.to_addrs, message.body
+                        )
 
                     self.logger.info("Sent Email to %s", message.recipient)
 
-                except (OSError, smtplib.SMTPException, RuntimeError) as e:
+                except SMTP_CONNECTION_EXCEPTIONS as e:
                     self.logger.warning(
                         'Sending email to "%s" failed.', message.recipient
                     )
@@ -745,7 +747,18 @@ class NotifyEmail(NotifyBase):
                     # Mark as failure
                     has_error = True
 
-        except (OSError, smtplib.SMTPException, RuntimeError) as e:
+                    if not isinstance(
+                        e,
+                        (
+                            smtplib.SMTPResponseException,
+                            smtplib.SMTPRecipientsRefused,
+                        ),
+                    ):
+                        # Only errors the server replied with leave our
+                        # connection usable
+                        broken = True
+
+        except SMTP_CONNECTION_EXCEPTIONS as e:
             self.logger.warning(
                 'Connection error while submitting email to "%s"',
                 self.smtp_host,
@@ -754,6 +767,7 @@ class NotifyEmail(NotifyBase):
 
             # Mark as failure
             has_error = True
+            broken = True
 
         except AppriseEmailException as e:
             self.logger.debug(f"Socket Exception: {e}")
@@ -762,21 +776,86 @@ class NotifyEmail(NotifyBase):
             has_error = True
 
         finally:
-            # Gracefully terminate the connection with the server
             if socket is not None:
-                with contextlib.suppress(
-                    OSError, smtplib.SMTPException, RuntimeError
-                ):
-                    # Handles a failed TLS handshake that may have already
-                    # invalidated the socket.
-                    socket.quit()
-                    pass
+                if pool is not None and not broken:
+                    # Keep our connection open for the emails that follow
+                    pool.release(
+                        self.smtp_pool_key,
+                        socket,
+                        maxsize=self.asset.smtp_pool_maxsize,
+                    )
+
+                else:
+                    # Gracefully terminate the connection with the server
+                    SMTPConnectionPool.quit(socket)
 
         # Reduce our dictionary (eliminate expired keys if any)
         self.pgp.prune()
 
         return not has_error
 
+    def _smtp_connect(self):
+        """Establishes (and authenticates) a new connection with our SMTP
+        server."""
+
+        # Build an SSL context that honours our verify_certificate setting so
+        # that SMTPS/STARTTLS connections actually validate the remote server's
+        # certificate (and hostname) instead of silently accepting any
+        # certificate presented to us.
+        context = ssl.create_default_context()
+        if not self.verify_certificate:
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+
+        self.logger.debug("Connecting to remote SMTP server...")
+        socket_func = smtplib.SMTP
+        socket_args = {}
+        if self.secure_mode == SecureMailMode.SSL:
+            self.logger.debug("Securing connection with SSL...")
+            socket_func = smtplib.SMTP_SSL
+            socket_args["context"] = context
+
+        socket = socket_func(
+            self.smtp_host,
+            self.port,
+            None,
+            timeout=self.socket_connect_timeout,
+            **socket_args,
+        )
+
+        try:
+            if self.secure_mode == SecureMailMode.STARTTLS:
+                # Handle Secure Connections
+                self.logger.debug("Securing connection with STARTTLS...")
+                socket.starttls(context=context)
+
+            self.logger.trace("Login ID: {}".format(self.user))
+            if self.user and self.password:
+                # Apply Login credentials
+                self.logger.debug("Applying user credentials...")
+                socket.login(self.user, self.password)
+
+        except SMTP_CONNECTION_EXCEPTIONS:
+            # Gracefully terminate the connection with the server
+            SMTPConnectionPool.quit(socket)
+            raise
+
+        return socket
+
+    @property
+    def smtp_pool_key(self):
+        """Returns the key our connections are pooled under; only those
+        established with the same server, account (and credentials) and
+        security settings are ever shared."""
+        return (
+            self.smtp_host.lower(),
+            self.port,
+            self.user,
+            hashlib.sha256((self.password or "").encode("utf-8")).hexdigest(),
+            self.secure_mode,
+            self.verify_certificate,
+        )
+
     def url(self, privacy=False, *args, **kwargs):
         """
         Returns the URL built dynamically based on specified arguments.
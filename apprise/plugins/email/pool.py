@@ -0,0 +1,197 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import contextlib
+import smtplib
+import threading
+import time
+from typing import Callable, Optional
+
+from ...logger import logger
+from ...utils.singleton import Singleton
+
+# The default number of idle connections kept open per SMTP server (and
+# account)
+SMTP_POOL_MAXSIZE = 4
+
+# The default number of seconds a pooled connection may sit unused before it
+# is closed
+SMTP_POOL_IDLE_TIMEOUT = 60.0
+
+# The exceptions that leave an SMTP connection unusable
+SMTP_CONNECTION_EXCEPTIONS = (OSError, smtplib.SMTPException, RuntimeError)
+
+
+class SMTPConnectionPool(metaclass=Singleton):
+    """A process-wide registry of open (and authenticated) SMTP connections.
+
+    Connections are keyed by (host, port, user, credentials, security mode,
+    certificate verification) so that consecutive emails relayed through the
+    same server and account re-use an already established session instead
+    of performing a new TLS handshake and login each time.
+
+    A connection is only ever used by one sender at a time.  Idle connections
+    are probed (NOOP) before they are handed out again; those the server
+    dropped in the meantime are replaced transparently.  Connections that
+    have not been used for longer than their idle timeout are closed the next
+    time the registry is accessed.
+    """
+
+    def __init__(self) -> None:
+        # Our registry; each key maps to a list of [connection, last_used]
+        # entries (the most recently used last)
+        self._idle: dict[tuple, list] = {}
+
+        # Connections can be requested by several worker threads at once
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        key: tuple,
+        connect: Callable[[], smtplib.SMTP],
+        idle_timeout: float = SMTP_POOL_IDLE_TIMEOUT,
+    ) -> tuple[smtplib.SMTP, bool]:
+        """Returns a tuple of (connection, reused) for the key provided.
+
+        An idle connection is re-used if one is still alive, otherwise a new
+        one is established by calling connect().
+        """
+        while True:
+            with self._lock:
+                expired = self._expire(time.monotonic(), idle_timeout)
+                entries = self._idle.get(key)
+                smtp = entries.pop()[0] if entries else None
+                if not entries:
+                    self._idle.pop(key, None)
+
+            SMTPConnectionPool.quit(*expired)
+            if smtp is None:
+                # Nothing (left) to re-use
+                break
+
+            try:
+                # Make sure the server did not drop us in the meantime
+                if smtp.noop()[0] == 250:
+                    logger.trace(
+                        "SMTP pool re-using connection to %s:%s", *key[:2]
+                    )
+                    return (smtp, True)
+
+            except SMTP_CONNECTION_EXCEPTIONS as e:
+                logger.trace("SMTP pool connection lost: %s", e)
+
+            SMTPConnectionPool.quit(smtp)
+
+        logger.trace("SMTP pool connecting to %s:%s", *key[:2])
+        return (connect(), False)
+
+    def release(
+        self,
+        key: tuple,
+        smtp: smtplib.SMTP,
+        maxsize: int = SMTP_POOL_MAXSIZE,
+    ) -> None:
+        """Returns a (healthy) connection to our pool so that it can be
+        re-used."""
+        with self._lock:
+            entries = self._idle.setdefault(key, [])
+            entries.append([smtp, time.monotonic()])
+            # Keep only the most recently used connections
+            excess = [entry[0] for entry in entries[: -max(1, maxsize)]]
+            del entries[: -max(1, maxsize)]
+
+        SMTPConnectionPool.quit(*excess)
+
+    def prune(self, idle_timeout: float = SMTP_POOL_IDLE_TIMEOUT) -> int:
+        """Closes and removes all connections idle for longer than the
+        specified idle_timeout.
+
+        Returns the number of connections that were closed.
+        """
+        with self._lock:
+            expired = self._expire(time.monotonic(), idle_timeout)
+
+        SMTPConnectionPool.quit(*expired)
+        return len(expired)
+
+    def close(self) -> None:
+        """Closes and removes every pooled connection."""
+        with self._lock:
+            connections = [
+                entry[0]
+                for entries in self._idle.values()
+                for entry in entries
+            ]
+            self._idle.clear()
+
+        SMTPConnectionPool.quit(*connections)
+
+    def _expire(self, reference: float, idle_timeout: float) -> list:
+        """Removes expired entries from our registry and returns their
+        connections; the caller is expected to hold our lock."""
+
+        if idle_timeout is None or idle_timeout < 0:
+            # Eviction disabled
+            return []
+
+        expired = []
+        for key in list(self._idle.keys()):
+            entries = self._idle[key]
+            expired.extend(
+                entry[0]
+                for entry in entries
+                if (reference - entry[1]) > idle_timeout
+            )
+            entries[:] = [
+                entry
+                for entry in entries
+                if (reference - entry[1]) <= idle_timeout
+            ]
+            if not entries:
+                del self._idle[key]
+
+        return expired
+
+    @staticmethod
+    def quit(*connections: Optional[smtplib.SMTP]) -> None:
+        """Gracefully terminates the connections provided."""
+        for smtp in connections:
+            if smtp is None:
+                continue
+
+            try:
+                smtp.quit()
+
+            except SMTP_CONNECTION_EXCEPTIONS:
+                # Handles a failed TLS handshake (or a server that went away)
+                # that may have already invalidated the socket; it is
+                # released regardless
+                with contextlib.suppress(*SMTP_CONNECTION_EXCEPTIONS):
+                    smtp.close()
+
+    def __len__(self) -> int:
+        """Returns the number of idle connections held."""
+        return sum(len(entries) for entries in self._idle.values())
@@ -201,7 +201,7 @@ class NotifyEmby(NotifyBase):
         )
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 headers=headers,
                 data=dumps(payload),
@@ -370,7 +370,7 @@ class NotifyEmby(NotifyBase):
         )
 
         try:
-            r = requests.get(
+            r = self.http.get(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
@@ -453,7 +453,7 @@ class NotifyEmby(NotifyBase):
             f" {url} (cert_verify={self.verify_certificate!r})"
         )
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
@@ -557,7 +557,7 @@ class NotifyEmby(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     session_url,
                     data=dumps(payload),
                     headers=headers,
@@ -287,7 +287,7 @@ class NotifyEnigma2(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.get(
+            r = self.http.get(
                 url,
                 params=params,
                 headers=headers,
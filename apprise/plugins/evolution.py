@@ -419,7 +419,7 @@ class NotifyEvolution(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=dumps(payload),
                     headers=headers,
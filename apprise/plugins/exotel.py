@@ -474,7 +474,7 @@ class NotifyExotel(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     notify_url,
                     auth=auth,
                     data=payload.copy(),
@@ -267,6 +267,7 @@ class NotifyFCM(NotifyBase):
             timeout=self.request_timeout,
             redirects=self.redirects,
             verify_certificate=self.verify_certificate,
+            http=self.http,
         )
 
         if self.mode == FCMMode.OAuth2:
@@ -484,7 +485,7 @@ class NotifyFCM(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     notify_url.format(project=self.project),
                     data=dumps(payload),
                     headers=headers,
@@ -69,8 +69,14 @@ class GoogleOAuth:
         timeout=(5, 4),
         verify_certificate=True,
         redirects=True,
+        http=None,
     ):
-        """Initialize our OAuth object."""
+        """Initialize our OAuth object.
+
+        Requests are made through the requests styled http object provided
+        (such as the http property of a plugin); otherwise the requests module
+        is used.
+        """
 
         # Wether or not to verify ssl
         self.verify_certificate = verify_certificate
@@ -84,6 +90,9 @@ class GoogleOAuth:
         # assign our user-agent if defined
         self.user_agent = user_agent
 
+        # The object our HTTP requests are made through
+        self.http = requests if http is None else http
+
         # initialize our other object variables
         self.__reset()
 
@@ -277,7 +286,7 @@ class GoogleOAuth:
 
         logger.info("Refreshing FCM Access Token")
         try:
-            r = requests.post(
+            r = self.http.post(
                 token_uri,
                 data=http_payload,
                 headers=http_headers,
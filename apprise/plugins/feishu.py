@@ -137,7 +137,7 @@ class NotifyFeishu(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url.format(token=self.token),
                 data=dumps(payload).encode("utf-8"),
                 headers=headers,
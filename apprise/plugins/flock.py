@@ -267,7 +267,7 @@ class NotifyFlock(NotifyBase):
         # Always call throttle before any remote server i/o is made
         self.throttle()
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=dumps(payload),
                 headers=headers,
@@ -202,7 +202,7 @@ class NotifyFlowtriq(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=dumps(payload),
                 headers=headers,
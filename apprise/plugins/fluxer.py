@@ -673,7 +673,7 @@ class NotifyFluxer(NotifyBase):
                 headers["Content-Type"] = "application/json; charset=utf-8"
                 data = dumps(payload)
 
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 params=params,
                 data=data,
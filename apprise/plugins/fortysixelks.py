@@ -218,7 +218,7 @@ class Notify46Elks(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=payload,
                     headers=headers,
@@ -145,7 +145,7 @@ class NotifyFreeMobile(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=dumps(payload).encode("utf-8"),
                 headers=headers,
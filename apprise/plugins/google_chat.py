@@ -472,7 +472,7 @@ class NotifyGoogleChat(NotifyBase):
         # Always call throttle before any remote server i/o is made
         self.throttle()
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 params=params,
                 data=dumps(payload),
@@ -197,6 +197,55 @@ class NotifyGotify(NotifyBase):
     def send(self, body, title="", notify_type=NotifyType.INFO, **kwargs):
         """Perform Gotify Notification."""
 
+        url, request = self._prepare_request(body, title)
+
+        # Always call throttle before the requests are made
+        self.throttle()
+
+        try:
+            r = self.http.post(url, **request)
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                "A Connection error occurred sending Gotify "
+                f"notification to {self.host}."
+            )
+            self.logger.debug(f"Socket Exception: {e!s}")
+
+            # Mark our failure
+            return False
+
+        return self._handle_response(r)
+
+    async def async_send(
+        self, body, title="", notify_type=NotifyType.INFO, **kwargs
+    ):
+        """Perform Gotify Notification without blocking the event loop."""
+
+        url, request = self._prepare_request(body, title)
+
+        # Always call throttle before the requests are made
+        await self.async_throttle()
+
+        try:
+            r = await self.async_http.post(url, **request)
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                "A Connection error occurred sending Gotify "
+                f"notification to {self.host}."
+            )
+            self.logger.debug(f"Socket Exception: {e!s}")
+
+            # Mark our failure
+            return False
+
+        return self._handle_response(r)
+
+    def _prepare_request(self, body, title):
+        """Returns a tuple of the URL to notify and the keyword arguments to
+        pass along with it."""
+
         url = f"{self.schema}://{self.host}"
         if self.port:
             url += f":{self.port}"
@@ -228,50 +277,35 @@ class NotifyGotify(NotifyBase):
         )
         self.logger.debug(f"Gotify Payload: {payload!s}")
 
-        # Always call throttle before the requests are made
-        self.throttle()
+        return url, {
+            "data": dumps(payload),
+            "headers": headers,
+            "verify": self.verify_certificate,
+            "timeout": self.request_timeout,
+            "allow_redirects": self.redirects,
+        }
 
-        try:
-            r = requests.post(
-                url,
-                data=dumps(payload),
-                headers=headers,
-                verify=self.verify_certificate,
-                timeout=self.request_timeout,
-                allow_redirects=self.redirects,
-            )
-            if r.status_code != requests.codes.ok:
-                # We had a problem
-                status_str = NotifyGotify.http_response_code_lookup(
-                    r.status_code
-                )
+    def _handle_response(self, r):
+        """Interprets the response returned by the Gotify server."""
 
-                self.logger.warning(
-                    "Failed to send Gotify notification: {}{}error={}.".format(
-                        status_str, ", " if status_str else "", r.status_code
-                    )
-                )
+        if r.status_code != requests.codes.ok:
+            # We had a problem
+            status_str = NotifyGotify.http_response_code_lookup(r.status_code)
 
-                self.logger.debug(
-                    "Response Details:\r\n%r", (r.content or b"")[:2000]
+            self.logger.warning(
+                "Failed to send Gotify notification: {}{}error={}.".format(
+                    status_str, ", " if status_str else "", r.status_code
                 )
+            )
 
-                # Mark our failure
-                return False
-
-            else:
-                self.logger.info("Sent Gotify notification.")
-
-        except requests.RequestException as e:
-            self.logger.warning(
-                "A Connection error occurred sending Gotify "
-                f"notification to {self.host}."
+            self.logger.debug(
+                "Response Details:\r\n%r", (r.content or b"")[:2000]
             )
-            self.logger.debug(f"Socket Exception: {e!s}")
 
             # Mark our failure
             return False
 
+        self.logger.info("Sent Gotify notification.")
         return True
 
     @property
@@ -242,7 +242,7 @@ class NotifyGroupMe(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=dumps(payload),
                 headers=headers,
@@ -322,7 +322,7 @@ class NotifyGroupMe(NotifyBase):
             # Guard 2: OSError is caught by the except below
             fh = attachment.open()
 
-            r = requests.post(
+            r = self.http.post(
                 self.groupme_image_url,
                 data=fh,
                 headers=headers,
@@ -370,7 +370,7 @@ class NotifyHomeAssistant(NotifyBase):
         # Always call throttle before any remote server i/o is made
         self.throttle()
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=dumps(payload),
                 headers=headers,
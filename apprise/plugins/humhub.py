@@ -343,7 +343,7 @@ class NotifyHumHub(NotifyBase):
             else:
                 _headers = headers or {}
 
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=payload,
                 headers=_headers,
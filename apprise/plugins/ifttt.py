@@ -240,7 +240,7 @@ class NotifyIFTTT(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=dumps(payload),
                     headers=headers,
@@ -606,7 +606,7 @@ class NotifyJira(NotifyBase):
         has_error = False
 
         # Default method is to post
-        method = requests.post
+        method = self.http.post
 
         # For indexing in persistent store
         key = hashlib.sha1(
@@ -707,7 +707,7 @@ class NotifyJira(NotifyBase):
                 if action == JiraAlertAction.DELETE:
                     # Update our URL
                     url = f"{notify_url}/{request_id}"
-                    method = requests.delete
+                    method = self.http.delete
 
                 elif action == JiraAlertAction.ACKNOWLEDGE:
                     url = f"{notify_url}/{request_id}/acknowledge"
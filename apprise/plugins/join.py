@@ -311,7 +311,7 @@ class NotifyJoin(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=payload,
                     headers=headers,
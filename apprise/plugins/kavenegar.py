@@ -240,7 +240,7 @@ class NotifyKavenegar(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     params=payload,
                     headers=headers,
@@ -267,7 +267,7 @@ class NotifyXBMC(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=payload,
                 headers=headers,
@@ -322,7 +322,7 @@ class NotifyKook(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=dumps(payload),
                 headers={
@@ -426,7 +426,7 @@ class NotifyKook(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     endpoint,
                     data=dumps(payload),
                     headers=headers,
@@ -521,7 +521,7 @@ class NotifyKook(NotifyBase):
                     self.throttle()
 
                     try:
-                        r = requests.post(
+                        r = self.http.post(
                             endpoint,
                             data=dumps(payload),
                             headers=headers,
@@ -611,7 +611,7 @@ class NotifyKook(NotifyBase):
             # Throttle before the network request
             self.throttle()
 
-            r = requests.post(
+            r = self.http.post(
                 self.asset_url,
                 headers={
                     "User-Agent": self.app_id,
@@ -831,7 +831,7 @@ class NotifyLametric(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=dumps(payload),
                 headers=headers,
@@ -122,7 +122,7 @@ class NotifyLark(NotifyBase):
         # Always call throttle before any remote server i/o is made
         self.throttle()
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.webhook_url,
                 headers=headers,
                 data=json.dumps(payload),
@@ -461,7 +461,7 @@ class NotifyMailerSend(NotifyBase):
             # Always call throttle before any remote server I/O
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=dumps(payload),
                     headers=headers,
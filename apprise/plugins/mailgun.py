@@ -549,7 +549,7 @@ class NotifyMailgun(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     auth=("api", self.apikey),
                     data=payload,
@@ -1068,7 +1068,7 @@ class NotifyMastodon(NotifyBase):
         self.throttle(wait=wait)
 
         # acquire our request mode
-        fn = requests.post if method == "POST" else requests.get
+        fn = self.http.post if method == "POST" else self.http.get
 
         try:
             r = fn(
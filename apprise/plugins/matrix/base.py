@@ -45,6 +45,7 @@ from markdown import markdown
 import requests
 
 from ...common import (
+    LengthUnit,
     NotifyFormat,
     NotifyImageSize,
     NotifyType,
@@ -228,6 +229,10 @@ class NotifyMatrix(NotifyBase):
     # Webhooks do not create direct room events, so retain v1's 65,000 limit.
     body_maxlen_webhook = 65000
 
+    # Matrix limits events by their encoded size; measuring the body in UTF-8
+    # bytes keeps multi-byte content within the limits above when split.
+    body_maxlen_unit = LengthUnit.UTF8
+
     # Throttle a wee-bit to avoid thrashing
     request_rate_per_sec = 0.5
 
@@ -738,7 +743,7 @@ class NotifyMatrix(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 # Keep Unicode compact instead of expanding it to \u escapes.
                 # Replace invalid code points before requests encodes the body.
@@ -1952,9 +1957,9 @@ class NotifyMatrix(NotifyBase):
 
         # fetch function
         fn = (
-            requests.post
+            self.http.post
             if method == "POST"
-            else (requests.put if method == "PUT" else requests.get)
+            else (self.http.put if method == "PUT" else self.http.get)
         )
 
         # Always call throttle before any remote server i/o is made
@@ -2966,7 +2971,7 @@ class NotifyMatrix(NotifyBase):
 
         # Upload the ciphertext to the media server.
         # The encrypted bytes are posted directly rather than from a file
-        # path, so we call requests.post() directly instead of _fetch().
+        # path, so we call self.http.post() directly instead of _fetch().
         headers = {
             "User-Agent": self.app_id,
             "Content-Type": "application/octet-stream",
@@ -2999,7 +3004,7 @@ class NotifyMatrix(NotifyBase):
 
         self.throttle()
         try:
-            r = requests.post(
+            r = self.http.post(
                 upload_url,
                 data=ciphertext,
                 params={"filename": attachment.name or "file"},
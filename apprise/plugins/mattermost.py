@@ -367,7 +367,7 @@ class NotifyMattermost(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.get(
+            r = self.http.get(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
@@ -545,7 +545,7 @@ class NotifyMattermost(NotifyBase):
 
                         try:
                             self.throttle()
-                            r = requests.post(
+                            r = self.http.post(
                                 upload_url,
                                 data={"channel_id": target},
                                 headers=upload_headers,
@@ -659,7 +659,7 @@ class NotifyMattermost(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=dumps(payload),
                     headers=headers,
@@ -206,7 +206,7 @@ class NotifyMessageBird(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=payload,
                     headers=headers,
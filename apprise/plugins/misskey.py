@@ -254,7 +254,7 @@ class NotifyMisskey(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 api_url,
                 headers=headers,
                 data=dumps(payload),
@@ -282,7 +282,7 @@ class NotifyMSG91(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=dumps(payload),
                 headers=headers,
@@ -334,7 +334,7 @@ class NotifyNextcloud(NotifyBase):
 
         try:
             # Prepare our request object
-            request = requests.post if target else requests.get
+            request = self.http.post if target else self.http.get
 
             r = request(
                 url,
@@ -217,7 +217,7 @@ class NotifyNextcloudTalk(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     notify_url,
                     data=dumps(payload),
                     headers=headers,
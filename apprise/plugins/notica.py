@@ -231,7 +231,7 @@ class NotifyNotica(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url.format(token=self.token),
                 data=payload,
                 headers=headers,
@@ -359,7 +359,7 @@ class NotifyNotifiarr(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=dumps(payload),
                 headers=headers,
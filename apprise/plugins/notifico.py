@@ -440,7 +440,7 @@ class NotifyNotifico(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.get(
+            r = self.http.get(
                 notify_url,
                 auth=auth,
                 params=payload,
@@ -351,7 +351,7 @@ class NotifyNotifyre(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 NOTIFYRE_SMS_URL,
                 data=dumps(payload),
                 headers=headers,
@@ -522,7 +522,7 @@ class NotifyNotifyre(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     NOTIFYRE_FAX_URL,
                     data=dumps(payload),
                     headers=headers,
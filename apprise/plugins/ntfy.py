@@ -451,12 +451,7 @@ class NotifyNtfy(NotifyBase):
             return False
 
         # Acquire image_url
-        image_url = self.image_url(notify_type)
-
-        if self.include_image and (image_url or self.avatar_url):
-            image_url = self.avatar_url if self.avatar_url else image_url
-        else:
-            image_url = None
+        image_url = self._icon_url(notify_type)
 
         # Create a copy of the topics
         topics = list(self.topics)
@@ -507,6 +502,80 @@ class NotifyNtfy(NotifyBase):
 
         return not has_error
 
+    async def async_send(
+        self,
+        body,
+        title="",
+        notify_type=NotifyType.INFO,
+        attach=None,
+        **kwargs,
+    ):
+        """Perform ntfy Notification without blocking the event loop."""
+
+        if attach and self.attachment_support:
+            # Attachments are read from disk (or fetched remotely); let our
+            # executor based default take care of these
+            return await super().async_send(
+                body,
+                title=title,
+                notify_type=notify_type,
+                attach=attach,
+                **kwargs,
+            )
+
+        if not len(self.topics):
+            # We have nothing to notify; we're done
+            self.logger.warning("There are no ntfy topics to notify")
+            return False
+
+        # Acquire image_url
+        image_url = self._icon_url(notify_type)
+
+        # error tracking (used for function return)
+        has_error = False
+
+        # Create a copy of the topics
+        topics = list(self.topics)
+        while len(topics) > 0:
+            # Retrieve our topic
+            topic = topics.pop()
+
+            prepared = self._prepare_request(
+                topic, body=body, title=title, image_url=image_url
+            )
+            if not prepared:
+                has_error = True
+                continue
+
+            notify_url, request, source = prepared
+
+            # Always call throttle before any remote server i/o is made
+            await self.async_throttle()
+            try:
+                r = await self.async_http.post(notify_url, **request)
+
+            except requests.RequestException as e:
+                self._handle_exception(e, notify_url, source)
+                has_error = True
+                continue
+
+            okay, _response = self._handle_response(r, topic, notify_url)
+            if not okay:
+                # Mark our failure, but contiue to move on
+                has_error = True
+
+        return not has_error
+
+    def _icon_url(self, notify_type):
+        """Returns the icon (if any) to associate with our notification."""
+
+        image_url = self.image_url(notify_type)
+
+        if self.include_image and (image_url or self.avatar_url):
+            return self.avatar_url if self.avatar_url else image_url
+
+        return None
+
     def _send(
         self,
         topic,
@@ -518,6 +587,34 @@ class NotifyNtfy(NotifyBase):
     ):
         """Wrapper to the requests (post) object."""
 
+        prepared = self._prepare_request(
+            topic, body=body, title=title, attach=attach, image_url=image_url
+        )
+        if not prepared:
+            return False, None
+
+        notify_url, request, source = prepared
+
+        # Always call throttle before any remote server i/o is made
+        self.throttle()
+        try:
+            r = self.http.post(notify_url, **request)
+            return self._handle_response(r, topic, notify_url)
+
+        except (requests.RequestException, OSError) as e:
+            self._handle_exception(e, notify_url, source)
+
+        return False, None
+
+    def _prepare_request(
+        self, topic, body=None, title=None, attach=None, image_url=None
+    ):
+        """Returns a tuple of the URL to notify, the keyword arguments to
+        pass along with it and the payload source (for error reporting).
+
+        None is returned if the request could not be prepared.
+        """
+
         # Prepare our headers
         headers = {
             "User-Agent": self.app_id,
@@ -542,7 +639,7 @@ class NotifyNtfy(NotifyBase):
             elif self.auth == NtfyAuth.TOKEN:
                 if not self.token:
                     self.logger.warning("No Ntfy Token was specified")
-                    return False, None
+                    return None
 
                 # Set Token
                 headers["Authorization"] = f"Bearer {self.token}"
@@ -613,9 +710,6 @@ class NotifyNtfy(NotifyBase):
             f" {notify_url} (cert_verify={self.verify_certificate!r})"
         )
 
-        # Default response type
-        response = None
-
         if not attach:
             data = dumps(data)
             if len(data) > self.ntfy_json_upstream_size_limit:
@@ -637,100 +731,103 @@ class NotifyNtfy(NotifyBase):
                     ),
                 )
 
-                # Recursively send the message body as an attachment instead
-                return self._send(
+                # Recursively prepare the message body as an attachment
+                return self._prepare_request(
                     topic=topic,
                     body="",
                     title="",
                     attach=attach,
                     image_url=image_url,
-                    **kwargs,
                 )
 
         self.logger.debug(f"ntfy Payload: {virt_payload!s}")
         self.logger.debug(f"ntfy Headers: {headers!s}")
 
-        # Always call throttle before any remote server i/o is made
-        self.throttle()
-        try:
-            r = requests.post(
-                notify_url,
-                params=params if params else None,
-                data=data,
-                headers=headers,
-                auth=auth,
-                verify=self.verify_certificate,
-                timeout=self.request_timeout,
-                allow_redirects=self.redirects,
-            )
+        return (
+            notify_url,
+            {
+                "params": params if params else None,
+                "data": data,
+                "headers": headers,
+                "auth": auth,
+                "verify": self.verify_certificate,
+                "timeout": self.request_timeout,
+                "allow_redirects": self.redirects,
+            },
+            attach if attach else virt_payload,
+        )
 
-            if r.status_code != requests.codes.ok:
-                # We had a problem
-                status_str = NotifyBase.http_response_code_lookup(
-                    r.status_code
-                )
+    def _handle_response(self, r, topic, notify_url):
+        """Interprets the response returned by the ntfy server; a tuple of
+        the status and the parsed response (if any) is returned."""
 
-                # set up our status code to use
-                status_code = r.status_code
+        # Default response type
+        response = None
 
-                try:
-                    # Update our status response if we can
-                    response = loads(r.content)
-                    status_str = response.get("error", status_str)
-                    status_code = int(response.get("code", status_code))
+        if r.status_code != requests.codes.ok:
+            # We had a problem
+            status_str = NotifyBase.http_response_code_lookup(r.status_code)
 
-                except (AttributeError, TypeError, ValueError):
-                    # ValueError = r.content is Unparsable
-                    # TypeError = r.content is None
-                    # AttributeError = r is None
+            # set up our status code to use
+            status_code = r.status_code
 
-                    # We could not parse JSON response.
-                    # We will just use the status we already have.
-                    self.logger.debug(
-                        "Failed to parse ntfy JSON response; body: %r",
-                        (r.content or b"")[:2000],
-                    )
-                    pass
+            try:
+                # Update our status response if we can
+                response = loads(r.content)
+                status_str = response.get("error", status_str)
+                status_code = int(response.get("code", status_code))
 
-                self.logger.warning(
-                    "Failed to send ntfy notification to topic '{}': "
-                    "{}{}error={}.".format(
-                        topic,
-                        status_str,
-                        ", " if status_str else "",
-                        status_code,
-                    )
-                )
+            except (AttributeError, TypeError, ValueError):
+                # ValueError = r.content is Unparsable
+                # TypeError = r.content is None
+                # AttributeError = r is None
 
+                # We could not parse JSON response.
+                # We will just use the status we already have.
                 self.logger.debug(
-                    "Response Details:\r\n%r", (r.content or b"")[:2000]
+                    "Failed to parse ntfy JSON response; body: %r",
+                    (r.content or b"")[:2000],
                 )
+                pass
 
-                return False, response
+            self.logger.warning(
+                "Failed to send ntfy notification to topic '{}': "
+                "{}{}error={}.".format(
+                    topic,
+                    status_str,
+                    ", " if status_str else "",
+                    status_code,
+                )
+            )
+
+            self.logger.debug(
+                "Response Details:\r\n%r", (r.content or b"")[:2000]
+            )
+
+            return False, response
 
-            # otherwise we were successful
-            self.logger.info(f"Sent ntfy notification to '{notify_url}'.")
+        # otherwise we were successful
+        self.logger.info(f"Sent ntfy notification to '{notify_url}'.")
 
-            return True, response
+        return True, response
 
-        except requests.RequestException as e:
+    def _handle_exception(self, e, notify_url, source):
+        """Logs a failure raised while posting our ntfy payload."""
+
+        if isinstance(e, requests.RequestException):
             self.logger.warning(
                 f"A Connection error occurred sending ntfy:{notify_url} "
                 + "notification."
             )
             self.logger.debug(f"Socket Exception: {e!s}")
+            return
 
-        except OSError as e:
-            self.logger.warning(
-                "An I/O error occurred while handling {}.".format(
-                    attach.name
-                    if isinstance(attach, AttachBase)
-                    else virt_payload
-                )
+        self.logger.warning(
+            "An I/O error occurred while handling {}.".format(
+                source.name if isinstance(source, AttachBase) else source
             )
-            self.logger.debug(f"I/O Exception: {e!s}")
-
-        return False, response
+        )
+        self.logger.debug(f"I/O Exception: {e!s}")
 
     @property
     def url_identifier(self):
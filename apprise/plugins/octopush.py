@@ -357,7 +357,7 @@ class NotifyOctopush(NotifyBase):
             self.logger.debug("Octopush Payload: {}".format(payload))
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=dumps(payload),
                     headers=headers,
@@ -1153,9 +1153,9 @@ class NotifyOffice365(NotifyBase):
 
         # fetch function
         req = (
-            requests.post
+            self.http.post
             if method == "POST"
-            else (requests.put if method == "PUT" else requests.get)
+            else (self.http.put if method == "PUT" else self.http.get)
         )
 
         try:
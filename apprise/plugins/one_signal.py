@@ -466,7 +466,7 @@ class NotifyOneSignal(NotifyBase):
                 # Always call throttle before any remote server i/o is made
                 self.throttle()
                 try:
-                    r = requests.post(
+                    r = self.http.post(
                         self.notify_url,
                         data=dumps(payload),
                         headers=headers,
@@ -612,7 +612,7 @@ class NotifyOpsgenie(NotifyBase):
         has_error = False
 
         # Default method is to post
-        method = requests.post
+        method = self.http.post
 
         # For indexing in persistent store
         key = hashlib.sha1(
@@ -713,7 +713,7 @@ class NotifyOpsgenie(NotifyBase):
                 if action == OpsgenieAlertAction.DELETE:
                     # Update our URL
                     url = f"{notify_url}/{request_id}"
-                    method = requests.delete
+                    method = self.http.delete
 
                 elif action == OpsgenieAlertAction.ACKNOWLEDGE:
                     url = f"{notify_url}/{request_id}/acknowledge"
@@ -400,7 +400,7 @@ class NotifyPagerDuty(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=dumps(payload),
                 headers=headers,
@@ -269,7 +269,7 @@ class NotifyPagerTree(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=dumps(payload),
                 headers=headers,
@@ -230,7 +230,7 @@ class NotifyParsePlatform(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=dumps(payload),
                 headers=headers,
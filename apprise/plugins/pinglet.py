@@ -354,7 +354,7 @@ class NotifyPinglet(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=dumps(payload),
                 headers=headers,
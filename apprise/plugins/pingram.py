@@ -829,7 +829,7 @@ class NotifyPingram(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=dumps(payload),
                     headers=headers,
@@ -222,7 +222,7 @@ class NotifyProwl(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
@@ -345,7 +345,7 @@ class NotifyPushBullet(NotifyBase):
                     )
                 }
 
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=data,
                 headers=headers,
@@ -143,7 +143,7 @@ class NotifyPushDeer(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=payload,
                 timeout=self.request_timeout,
@@ -210,7 +210,7 @@ class NotifyPushjet(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 params=params,
                 data=dumps(payload),
@@ -134,7 +134,7 @@ class NotifyPushMe(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 params=params,
                 headers=headers,
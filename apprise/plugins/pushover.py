@@ -734,7 +734,7 @@ class NotifyPushover(NotifyBase):
                     )
                 }
 
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
@@ -392,7 +392,7 @@ class NotifyPushplus(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     headers=headers,
                     # Encode explicitly for non-ASCII (e.g. Chinese) chars
@@ -746,7 +746,7 @@ class NotifyPushSafer(NotifyBase):
 
         try:
             # Open our attachment path if required:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=payload,
                 headers=headers,
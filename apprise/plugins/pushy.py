@@ -239,7 +239,7 @@ class NotifyPushy(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     notify_url,
                     data=dumps(payload),
                     headers=headers,
@@ -115,7 +115,7 @@ class NotifyQQ(NotifyBase):
 
         self.throttle()
         try:
-            response = requests.post(
+            response = self.http.post(
                 self.webhook_url,
                 headers=headers,
                 data=payload,
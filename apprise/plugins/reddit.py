@@ -589,7 +589,7 @@ class NotifyReddit(NotifyBase):
 
         # acquire our request mode
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=payload,
                 auth=(
@@ -632,7 +632,7 @@ class NotifyReddit(NotifyBase):
                     return (False, {})
 
                 # Try again
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=payload,
                     headers=headers,
@@ -264,7 +264,7 @@ class NotifyRevolt(NotifyBase):
         self.throttle(wait=wait)
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=dumps(payload),
                 headers=headers,
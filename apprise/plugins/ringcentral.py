@@ -689,7 +689,7 @@ class NotifyRingCentral(NotifyBase):
 
         content = None
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=payload,
                 headers=headers,
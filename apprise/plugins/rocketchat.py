@@ -557,7 +557,7 @@ class NotifyRocketChat(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 api_url,
                 data=dumps(payload),
                 headers=headers,
@@ -614,7 +614,7 @@ class NotifyRocketChat(NotifyBase):
         api_url = "{}/{}".format(self.api_url, "api/v1/login")
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 api_url,
                 data=payload,
                 verify=self.verify_certificate,
@@ -690,7 +690,7 @@ class NotifyRocketChat(NotifyBase):
         api_url = "{}/{}".format(self.api_url, "api/v1/logout")
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 api_url,
                 headers=self.headers,
                 verify=self.verify_certificate,
@@ -110,7 +110,7 @@ class NotifyServerChan(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=payload,
                 verify=self.verify_certificate,
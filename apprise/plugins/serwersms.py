@@ -302,7 +302,7 @@ class NotifySerwerSMS(NotifyBase):
             self.logger.debug("SerwerSMS Payload: %s", fields)
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=dumps(fields),
                     headers=headers,
@@ -431,7 +431,7 @@ class NotifySerwerSMS(NotifyBase):
             self.logger.debug("SerwerSMS MMS Fields: %s", fields)
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url_mms,
                     data=fields,
                     headers=headers,
@@ -217,7 +217,7 @@ class NotifySeven(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=json.dumps(payload),
                     headers=headers,
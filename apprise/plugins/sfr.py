@@ -288,7 +288,7 @@ class NotifySFR(NotifyBase):
             self.logger.debug(f"SFR Payload: {payload}")
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     params=payload,
                     verify=self.verify_certificate,
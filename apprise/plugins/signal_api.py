@@ -362,7 +362,7 @@ class NotifySignalAPI(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     notify_url,
                     auth=auth,
                     data=dumps(payload),
@@ -263,7 +263,7 @@ class NotifySimplePush(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
@@ -319,7 +319,7 @@ class NotifySinch(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=json.dumps(payload),
                     headers=headers,
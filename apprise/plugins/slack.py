@@ -909,6 +909,222 @@ class NotifySlack(NotifyBase):
         # error tracking (used for function return)
         has_error = False
 
+        prepared = self._prepare_payload(
+            body,
+            title,
+            notify_type=notify_type,
+            body_format=body_format,
+            **kwargs,
+        )
+        if not prepared:
+            return False
+
+        url, payload = prepared
+        if self.mode in (SlackMode.WORKFLOW, SlackMode.WORKFLOW_TRIGGER):
+            # _send() returns False on error, non-False on success
+            return self._send(url, payload) is not False
+
+        if (
+            attach
+            and self.attachment_support
+            and self.mode in (SlackMode.WEBHOOK, SlackMode.WEBHOOK_GOV)
+        ):
+            # Be friendly; let the user know why they can't send their
+            # attachments if using the Webhook mode
+            self.logger.warning("Slack Webhooks do not support attachments.")
+
+        # Create a copy of the channel list
+        channels = list(self.channels)
+
+        attach_channel_list = []
+        while len(channels):
+            channel = channels.pop(0)
+            if channel is not None:
+                channel = self._apply_channel(payload, channel)
+                if not channel:
+                    has_error = True
+                    continue
+
+            response = self._send(url, payload)
+            if not response:
+                # Handle any error
+                has_error = True
+                continue
+
+            # Store the valid channel or chat ID (for DMs) that will
+            # be accepted by Slack's attachment method later.
+            if response.get("channel"):
+                attach_channel_list.append(response.get("channel"))
+
+            self.logger.info(
+                "Sent Slack notification{}.".format(
+                    f" to {channel}" if channel is not None else ""
+                )
+            )
+
+        if (
+            attach
+            and self.attachment_support
+            and self.mode is SlackMode.BOT
+            and attach_channel_list
+        ):
+            # Send our attachments (can only be done in bot mode)
+            for no, attachment in enumerate(attach, start=1):
+                # Perform some simple error checking
+                if not attachment:
+                    # We could not access the attachment
+                    self.logger.error(
+                        "Could not access attachment"
+                        f" {attachment.url(privacy=True)}."
+                    )
+                    return False
+
+                self.logger.debug(
+                    f"Posting Slack attachment {attachment.url(privacy=True)}"
+                )
+
+                # Get the URL to which to upload the file.
+                # https://api.slack.com/methods/files.getUploadURLExternal
+                params = {
+                    "filename": (
+                        attachment.name
+                        if attachment.name
+                        else f"file{no:03}.dat"
+                    ),
+                    "length": len(attachment),
+                }
+                url_ = self.api_url.format("files.getUploadURLExternal")
+                response = self._send(
+                    url_, {}, http_method="get", params=params
+                )
+                if not (
+                    response
+                    and response.get("file_id")
+                    and response.get("upload_url")
+                ):
+                    self.logger.error("Could retrieve file upload URL.")
+                    # We failed to get an upload URL, take an early exit
+                    return False
+
+                file_id = response.get("file_id")
+                upload_url = response.get("upload_url")
+
+                # Upload file
+                response = self._send(upload_url, {}, attach=attachment)
+
+                # Send file to channels
+                # https://api.slack.com/methods/files.completeUploadExternal
+                for channel_id in attach_channel_list:
+                    payload_ = {
+                        "files": [
+                            {
+                                "id": file_id,
+                                "title": attachment.name,
+                            }
+                        ],
+                        "channel_id": channel_id,
+                    }
+                    url_ = self.api_url.format("files.completeUploadExternal")
+                    response = self._send(url_, payload_)
+                    # Expected response
+                    # {
+                    #     "ok": true,
+                    #     "files": [
+                    #         {
+                    #             "id": "F123ABC456",
+                    #             "title": "slack-test"
+                    #         }
+                    #     ]
+                    # }
+                    if not (response and response.get("files")):
+                        self.logger.error("Failed to send file to channel.")
+                        # We failed to send the file to the channel,
+                        # take an early exit
+                        return False
+
+        return not has_error
+
+    async def async_send(
+        self,
+        body,
+        title="",
+        notify_type=NotifyType.INFO,
+        attach=None,
+        body_format=None,
+        **kwargs,
+    ):
+        """Perform Slack Notification without blocking the event loop."""
+
+        if (attach and self.attachment_support) or any(
+            channel is not None
+            and is_email(channel)
+            and channel not in self._lookup_users
+            for channel in self.channels
+        ):
+            # Attachment uploads and user lookups involve a blocking
+            # sequence of requests; let our executor based default take care
+            # of these
+            return await super().async_send(
+                body,
+                title=title,
+                notify_type=notify_type,
+                attach=attach,
+                body_format=body_format,
+                **kwargs,
+            )
+
+        prepared = self._prepare_payload(
+            body,
+            title,
+            notify_type=notify_type,
+            body_format=body_format,
+            **kwargs,
+        )
+        if not prepared:
+            return False
+
+        url, payload = prepared
+        if self.mode in (SlackMode.WORKFLOW, SlackMode.WORKFLOW_TRIGGER):
+            # _async_send() returns False on error, non-False on success
+            return await self._async_send(url, payload) is not False
+
+        # error tracking (used for function return)
+        has_error = False
+
+        for channel in self.channels:
+            if channel is not None:
+                channel = self._apply_channel(payload, channel)
+                if not channel:
+                    has_error = True
+                    continue
+
+            if not await self._async_send(url, payload):
+                # Handle any error
+                has_error = True
+                continue
+
+            self.logger.info(
+                "Sent Slack notification{}.".format(
+                    f" to {channel}" if channel is not None else ""
+                )
+            )
+
+        return not has_error
+
+    def _prepare_payload(
+        self,
+        body,
+        title="",
+        notify_type=NotifyType.INFO,
+        body_format=None,
+        **kwargs,
+    ):
+        """Returns a tuple of the Slack URL to post to and the payload to
+        post to it.
+
+        None is returned if our template could not be applied.
+        """
+
         if self.notify_format == NotifyFormat.MARKDOWN and (
             body_format == NotifyFormat.HTML
         ):
@@ -925,7 +1141,7 @@ class NotifySlack(NotifyBase):
                     body, title, notify_type=notify_type, **kwargs
                 )
                 if payload is False:
-                    return False
+                    return None
 
             else:
                 # Default payload: combine title and body into a single
@@ -941,8 +1157,7 @@ class NotifySlack(NotifyBase):
                 else self.workflow_url
             )
             url = "{}/{}".format(wf_base, "/".join(self.workflow_path))
-            # _send() returns False on error, non-False on success
-            return self._send(url, payload) is not False
+            return url, payload
 
         #
         # Prepare JSON Object (applicable to both WEBHOOK and BOT mode)
@@ -955,7 +1170,7 @@ class NotifySlack(NotifyBase):
                 )
                 if template_content is False:
                     # Template loading or parsing failed; abort early
-                    return False
+                    return None
 
                 # Wrap the template attachment content in a full payload
                 payload = {
@@ -1126,14 +1341,6 @@ class NotifySlack(NotifyBase):
                 if self.include_timestamp:
                     # Timestamp
                     payload["attachments"][0]["ts"] = time()
-        if (
-            attach
-            and self.attachment_support
-            and self.mode in (SlackMode.WEBHOOK, SlackMode.WEBHOOK_GOV)
-        ):
-            # Be friendly; let the user know why they can't send their
-            # attachments if using the Webhook mode
-            self.logger.warning("Slack Webhooks do not support attachments.")
 
         if self.user:
             payload["username"] = self.user
@@ -1154,166 +1361,67 @@ class NotifySlack(NotifyBase):
         else:  # SlackMode.BOT
             url = self.api_url.format("chat.postMessage")
 
-        # Create a copy of the channel list
-        channels = list(self.channels)
-
-        attach_channel_list = []
-        while len(channels):
-            channel = channels.pop(0)
-            if channel is not None:
-                # We'll perform a user lookup if we detect an email
-                email = is_email(channel)
-                if email:
-                    payload["channel"] = self.lookup_userid(
-                        email["full_email"]
-                    )
-
-                    if not payload["channel"]:
-                        # Move along; any notifications/logging would have
-                        # come from lookup_userid()
-                        has_error = True
-                        continue
+        return url, payload
 
-                else:  # Channel
-                    result = CHANNEL_RE.match(channel)
+    def _apply_channel(self, payload, channel):
+        """Directs our payload to the specified channel.
 
-                    if not result:
-                        # Channel over-ride was specified
-                        self.logger.warning(
-                            f"The specified Slack target {channel} is invalid;"
-                            "skipping."
-                        )
-
-                        # Mark our failure
-                        has_error = True
-                        continue
+        The channel name (for logging) is returned if successful, otherwise
+        False is returned.
+        """
 
-                    # Store oure content
-                    channel, thread_ts = (
-                        result.group("channel"),
-                        result.group("thread_ts"),
-                    )
-                    if thread_ts:
-                        payload["thread_ts"] = thread_ts
-
-                    elif "thread_ts" in payload:
-                        # Handle situations where one channel has a thread_id
-                        # specified, and the next does not.  We do not want to
-                        # cary forward the last value specified
-                        del payload["thread_ts"]
-
-                    if channel[0] == "+":
-                        # Treat as encoded id if prefixed with a +
-                        payload["channel"] = channel[1:]
-
-                    elif channel[0] == "@":
-                        # Treat @ value 'as is'
-                        payload["channel"] = channel
-
-                    else:
-                        # Prefix with channel hash tag (if not already)
-                        payload["channel"] = (
-                            channel if channel[0] == "#" else f"#{channel}"
-                        )
+        # We'll perform a user lookup if we detect an email
+        email = is_email(channel)
+        if email:
+            payload["channel"] = self.lookup_userid(email["full_email"])
 
-            response = self._send(url, payload)
-            if not response:
-                # Handle any error
-                has_error = True
-                continue
+            if not payload["channel"]:
+                # Move along; any notifications/logging would have
+                # come from lookup_userid()
+                return False
 
-            # Store the valid channel or chat ID (for DMs) that will
-            # be accepted by Slack's attachment method later.
-            if response.get("channel"):
-                attach_channel_list.append(response.get("channel"))
+        else:  # Channel
+            result = CHANNEL_RE.match(channel)
 
-            self.logger.info(
-                "Sent Slack notification{}.".format(
-                    f" to {channel}" if channel is not None else ""
+            if not result:
+                # Channel over-ride was specified
+                self.logger.warning(
+                    f"The specified Slack target {channel} is invalid;"
+                    "skipping."
                 )
-            )
 
-        if (
-            attach
-            and self.attachment_support
-            and self.mode is SlackMode.BOT
-            and attach_channel_list
-        ):
-            # Send our attachments (can only be done in bot mode)
-            for no, attachment in enumerate(attach, start=1):
-                # Perform some simple error checking
-                if not attachment:
-                    # We could not access the attachment
-                    self.logger.error(
-                        "Could not access attachment"
-                        f" {attachment.url(privacy=True)}."
-                    )
-                    return False
+                # Mark our failure
+                return False
 
-                self.logger.debug(
-                    f"Posting Slack attachment {attachment.url(privacy=True)}"
-                )
+            # Store oure content
+            channel, thread_ts = (
+                result.group("channel"),
+                result.group("thread_ts"),
+            )
+            if thread_ts:
+                payload["thread_ts"] = thread_ts
 
-                # Get the URL to which to upload the file.
-                # https://api.slack.com/methods/files.getUploadURLExternal
-                params = {
-                    "filename": (
-                        attachment.name
-                        if attachment.name
-                        else f"file{no:03}.dat"
-                    ),
-                    "length": len(attachment),
-                }
-                url_ = self.api_url.format("files.getUploadURLExternal")
-                response = self._send(
-                    url_, {}, http_method="get", params=params
-                )
-                if not (
-                    response
-                    and response.get("file_id")
-                    and response.get("upload_url")
-                ):
-                    self.logger.error("Could retrieve file upload URL.")
-                    # We failed to get an upload URL, take an early exit
-                    return False
+            elif "thread_ts" in payload:
+                # Handle situations where one channel has a thread_id
+                # specified, and the next does not.  We do not want to
+                # cary forward the last value specified
+                del payload["thread_ts"]
 
-                file_id = response.get("file_id")
-                upload_url = response.get("upload_url")
+            if channel[0] == "+":
+                # Treat as encoded id if prefixed with a +
+                payload["channel"] = channel[1:]
 
-                # Upload file
-                response = self._send(upload_url, {}, attach=attachment)
+            elif channel[0] == "@":
+                # Treat @ value 'as is'
+                payload["channel"] = channel
 
-                # Send file to channels
-                # https://api.slack.com/methods/files.completeUploadExternal
-                for channel_id in attach_channel_list:
-                    payload_ = {
-                        "files": [
-                            {
-                                "id": file_id,
-                                "title": attachment.name,
-                            }
-                        ],
-                        "channel_id": channel_id,
-                    }
-                    url_ = self.api_url.format("files.completeUploadExternal")
-                    response = self._send(url_, payload_)
-                    # Expected response
-                    # {
-                    #     "ok": true,
-                    #     "files": [
-                    #         {
-                    #             "id": "F123ABC456",
-                    #             "title": "slack-test"
-                    #         }
-                    #     ]
-                    # }
-                    if not (response and response.get("files")):
-                        self.logger.error("Failed to send file to channel.")
-                        # We failed to send the file to the channel,
-                        # take an early exit
-                        return False
+            else:
+                # Prefix with channel hash tag (if not already)
+                payload["channel"] = (
+                    channel if channel[0] == "#" else f"#{channel}"
+                )
 
-        return not has_error
+        return channel
 
     def lookup_userid(self, email):
         """Takes an email address and attempts to resolve/acquire it's user id
@@ -1357,7 +1465,7 @@ class NotifySlack(NotifyBase):
         # Always call throttle before any remote server i/o is made
         self.throttle()
         try:
-            r = requests.get(
+            r = self.http.get(
                 lookup_url,
                 headers=headers,
                 params=params,
@@ -1484,24 +1592,8 @@ class NotifySlack(NotifyBase):
         **kwargs,
     ):
         """Wrapper to the requests (post) object."""
-        self.logger.debug(
-            f"Slack POST URL: {url} (cert_verify={self.verify_certificate!r})"
-        )
-        self.logger.debug(f"Slack Payload: {payload!s}")
 
-        headers = {
-            "User-Agent": self.app_id,
-            "Accept": "application/json",
-        }
-
-        if not attach:
-            headers["Content-Type"] = "application/json; charset=utf-8"
-
-        if self.mode is SlackMode.BOT:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-
-        # Our response object
-        response = {"ok": False}
+        headers = self._prepare_headers(url, payload, attach=attach)
 
         # Always call throttle before any remote server i/o is made
         self.throttle()
@@ -1522,7 +1614,7 @@ class NotifySlack(NotifyBase):
                     ),
                 }
 
-            r = requests.request(
+            r = self.http.request(
                 http_method,
                 url,
                 data=payload if attach else dumps(payload),
@@ -1534,95 +1626,6 @@ class NotifySlack(NotifyBase):
                 params=params if params else None,
             )
 
-            # Posts return a JSON string
-            with contextlib.suppress(AttributeError, TypeError, ValueError):
-                # Load our JSON object if we can
-                # ValueError = r.content is Unparsable
-                # TypeError = r.content is None
-                # AttributeError = r is None
-                response = loads(r.content)
-
-            # Another response type is:
-            # {
-            #   'ok': False,
-            #   'error': 'not_in_channel',
-            # }
-            status_okay = False
-            if self.mode is SlackMode.BOT:
-                status_okay = (
-                    (response and response.get("ok", False))
-                    or
-                    # Responses for file uploads look like this
-                    # 'OK - <file length>'
-                    (
-                        r.content
-                        and isinstance(r.content, bytes)
-                        and b"OK" in r.content
-                    )
-                )
-            elif self.mode in (
-                SlackMode.WORKFLOW,
-                SlackMode.WORKFLOW_TRIGGER,
-            ):
-                # Workflow trigger webhooks confirm success via HTTP 200;
-                # the response body may be empty or non-standard JSON.
-                status_okay = r.status_code == requests.codes.ok
-            elif r.content == b"ok":
-                # The text 'ok' is returned if this is a Webhook request
-                # So the below captures that as well.
-                status_okay = True
-
-            if r.status_code != requests.codes.ok or not status_okay:
-                # We had a problem
-                status_str = NotifySlack.http_response_code_lookup(
-                    r.status_code, SLACK_HTTP_ERROR_MAP
-                )
-
-                self.logger.warning(
-                    "Failed to send{} to Slack: {}{}error={}.".format(
-                        (" " + attach.name) if attach else "",
-                        status_str,
-                        ", " if status_str else "",
-                        r.status_code,
-                    )
-                )
-
-                self.logger.debug(f"Response Details:\r\n{r.content}")
-                return False
-
-            # Message Post Response looks like this:
-            # {
-            #   "attachments": [
-            #     {
-            #       "color": "3AA3E3",
-            #       "fallback": "test",
-            #       "id": 1,
-            #       "text": "my body",
-            #       "title": "my title",
-            #       "ts": 1573694687
-            #     }
-            #   ],
-            #   "bot_id": "BAK4K23G5",
-            #   "icons": {
-            #     "image_48": "https://s3-us-west-2.amazonaws.com/...
-            #   },
-            #   "subtype": "bot_message",
-            #   "text": "",
-            #   "ts": "1573694689.003700",
-            #   "type": "message",
-            #   "username": "Apprise"
-            # }
-
-            # files.completeUploadExternal responses look like this:
-            # {
-            #     "ok": true,
-            #     "files": [
-            #         {
-            #             "id": "F123ABC456",
-            #             "title": "slack-test"
-            #         }
-            #     ]
-            # }
         except requests.RequestException as e:
             self.logger.warning(
                 "A Connection error occurred posting {}to Slack.".format(
@@ -1648,6 +1651,154 @@ class NotifySlack(NotifyBase):
                 files["file"][1].close()
 
         # Return the response for processing
+        return self._handle_response(r, attach=attach)
+
+    async def _async_send(self, url, payload):
+        """The asynchronous counterpart of _send() for message posts."""
+
+        headers = self._prepare_headers(url, payload)
+
+        # Always call throttle before any remote server i/o is made
+        await self.async_throttle()
+
+        try:
+            r = await self.async_http.request(
+                "post",
+                url,
+                data=dumps(payload),
+                headers=headers,
+                verify=self.verify_certificate,
+                timeout=self.request_timeout,
+                allow_redirects=self.redirects,
+            )
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                "A Connection error occurred posting to Slack."
+            )
+            self.logger.debug(f"Socket Exception: {e!s}")
+            return False
+
+        return self._handle_response(r)
+
+    def _prepare_headers(self, url, payload, attach=None):
+        """Returns the headers to post our payload to Slack with."""
+
+        self.logger.debug(
+            f"Slack POST URL: {url} (cert_verify={self.verify_certificate!r})"
+        )
+        self.logger.debug(f"Slack Payload: {payload!s}")
+
+        headers = {
+            "User-Agent": self.app_id,
+            "Accept": "application/json",
+        }
+
+        if not attach:
+            headers["Content-Type"] = "application/json; charset=utf-8"
+
+        if self.mode is SlackMode.BOT:
+            headers["Authorization"] = f"Bearer {self.access_token}"
+
+        return headers
+
+    def _handle_response(self, r, attach=None):
+        """Interprets the response returned by Slack; our parsed response is
+        returned if successful, otherwise False is returned."""
+
+        # Our response object
+        response = {"ok": False}
+
+        # Posts return a JSON string
+        with contextlib.suppress(AttributeError, TypeError, ValueError):
+            # Load our JSON object if we can
+            # ValueError = r.content is Unparsable
+            # TypeError = r.content is None
+            # AttributeError = r is None
+            response = loads(r.content)
+
+        # Another response type is:
+        # {
+        #   'ok': False,
+        #   'error': 'not_in_channel',
+        # }
+        status_okay = False
+        if self.mode is SlackMode.BOT:
+            status_okay = (
+                (response and response.get("ok", False))
+                or
+                # Responses for file uploads look like this
+                # 'OK - <file length>'
+                (
+                    r.content
+                    and isinstance(r.content, bytes)
+                    and b"OK" in r.content
+                )
+            )
+        elif self.mode in (
+            SlackMode.WORKFLOW,
+            SlackMode.WORKFLOW_TRIGGER,
+        ):
+            # Workflow trigger webhooks confirm success via HTTP 200;
+            # the response body may be empty or non-standard JSON.
+            status_okay = r.status_code == requests.codes.ok
+        elif r.content == b"ok":
+            # The text 'ok' is returned if this is a Webhook request
+            # So the below captures that as well.
+            status_okay = True
+
+        if r.status_code != requests.codes.ok or not status_okay:
+            # We had a problem
+            status_str = NotifySlack.http_response_code_lookup(
+                r.status_code, SLACK_HTTP_ERROR_MAP
+            )
+
+            self.logger.warning(
+                "Failed to send{} to Slack: {}{}error={}.".format(
+                    (" " + attach.name) if attach else "",
+                    status_str,
+                    ", " if status_str else "",
+                    r.status_code,
+                )
+            )
+
+            self.logger.debug(f"Response Details:\r\n{r.content}")
+            return False
+
+        # Message Post Response looks like this:
+        # {
+        #   "attachments": [
+        #     {
+        #       "color": "3AA3E3",
+        #       "fallback": "test",
+        #       "id": 1,
+        #       "text": "my body",
+        #       "title": "my title",
+        #       "ts": 1573694687
+        #     }
+        #   ],
+        #   "bot_id": "BAK4K23G5",
+        #   "icons": {
+        #     "image_48": "https://s3-us-west-2.amazonaws.com/...
+        #   },
+        #   "subtype": "bot_message",
+        #   "text": "",
+        #   "ts": "1573694689.003700",
+        #   "type": "message",
+        #   "username": "Apprise"
+        # }
+
+        # files.completeUploadExternal responses look like this:
+        # {
+        #     "ok": true,
+        #     "files": [
+        #         {
+        #             "id": "F123ABC456",
+        #             "title": "slack-test"
+        #         }
+        #     ]
+        # }
+
         return response
 
     @property
@@ -298,7 +298,7 @@ class NotifySMSC(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=params,
                 verify=self.verify_certificate,
@@ -417,7 +417,7 @@ class NotifySMSC(NotifyBase):
             try:
                 # Send multipart/form-data; do NOT set Content-Type --
                 # requests sets the multipart boundary automatically.
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=params,
                     files=files,
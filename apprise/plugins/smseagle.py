@@ -516,7 +516,7 @@ class NotifySMSEagle(NotifyBase):
                 # Always call throttle before any remote server i/o is made
                 self.throttle()
                 try:
-                    r = requests.post(
+                    r = self.http.post(
                         notify_url,
                         data=dumps(payload),
                         headers=headers,
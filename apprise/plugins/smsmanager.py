@@ -289,7 +289,7 @@ class NotifySMSManager(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.get(
+                r = self.http.get(
                     self.notify_url,
                     params=payload,
                     headers=headers,
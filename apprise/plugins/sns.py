@@ -25,19 +25,15 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-from collections import OrderedDict
-from datetime import datetime, timezone
-from hashlib import sha256
-import hmac
 from itertools import chain
 import re
-from xml.etree import ElementTree
 
 import requests
 
-from ..common import NotifyType
+from ..common import NotifyType, PersistentStoreMode
 from ..locale import gettext_lazy as _
 from ..url import PrivacyMode
+from ..utils.aws import aws_response_to_dict, aws_sign_request
 from ..utils.parse import is_phone_no, parse_list, validate_regex
 from .base import NotifyBase
 
@@ -106,6 +102,12 @@ class NotifySNS(NotifyBase):
     # can occur in much shorter bursts
     request_rate_per_sec = 2.5
 
+    # Topic ARNs are cached (see send()) so they survive between runs
+    storage_mode = PersistentStoreMode.AUTO
+
+    # Defines how long we cache the ARN of a created topic for
+    topic_arn_cache_length_sec = 86400
+
     # body_maxlen and title_maxlen are defined as @property methods below
     # since the limits differ by mode: SMS mode caps the body at 160
     # characters and has no title field (title_maxlen = 0 causes the
@@ -263,11 +265,6 @@ class NotifySNS(NotifyBase):
         self.aws_service_name = "sns"
         self.aws_canonical_uri = "/"
 
-        # AWS Authentication Details
-        self.aws_auth_version = "AWS4"
-        self.aws_auth_algorithm = "AWS4-HMAC-SHA256"
-        self.aws_auth_request = "aws4_request"
-
         # Validate targets and drop bad ones:
         for target in parse_list(targets):
             result = is_phone_no(target)
@@ -355,24 +352,33 @@ class NotifySNS(NotifyBase):
             # Get Topic
             topic = topics.pop(0)
 
-            # First ensure our topic exists, if it doesn't, it gets created
-            payload = {
-                "Action": "CreateTopic",
-                "Version": "2010-03-31",
-                "Name": topic,
-            }
-
-            (result, response) = self._post(payload=payload, to=topic)
-            if not result:
-                error_count += 1
-                continue
-
-            # Get the Amazon Resource Name
-            topic_arn = response.get("topic_arn")
+            # Get the Amazon Resource Name; CreateTopic only needs to be
+            # issued when we haven't already resolved it
+            key = f"topic-{topic}"
+            topic_arn = self.store.get(key)
             if not topic_arn:
-                # Could not acquire our topic; we're done
-                error_count += 1
-                continue
+                # First ensure our topic exists, if it doesn't, it gets
+                # created
+                payload = {
+                    "Action": "CreateTopic",
+                    "Version": "2010-03-31",
+                    "Name": topic,
+                }
+
+                (result, response) = self._post(payload=payload, to=topic)
+                if not result:
+                    error_count += 1
+                    continue
+
+                topic_arn = response.get("topic_arn")
+                if not topic_arn:
+                    # Could not acquire our topic; we're done
+                    error_count += 1
+                    continue
+
+                self.store.set(
+                    key, topic_arn, expires=self.topic_arn_cache_length_sec
+                )
 
             # Build our payload now that we know our topic_arn
             payload = {
@@ -391,6 +397,9 @@ class NotifySNS(NotifyBase):
             # Send our payload to AWS
             (result, _) = self._post(payload=payload, to=topic)
             if not result:
+                # The topic may have since been removed; resolve it again
+                # the next time around
+                self.store.clear(key)
                 error_count += 1
 
         return error_count == 0
@@ -424,7 +433,7 @@ class NotifySNS(NotifyBase):
         self.logger.debug(f"AWS Payload: {payload!s}")
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=payload,
                 headers=headers,
@@ -478,121 +487,21 @@ class NotifySNS(NotifyBase):
         headers = {
             "User-Agent": self.app_id,
             "Content-Type": "application/x-www-form-urlencoded; charset=utf-8",
-            # Populated below
-            "Content-Length": 0,
-            "Authorization": None,
-            "X-Amz-Date": None,
         }
 
-        # Get a reference time (used for header construction)
-        reference = datetime.now(timezone.utc)
-
-        # Provide Content-Length
-        headers["Content-Length"] = str(len(payload))
-
-        # Amazon Date Format
-        amzdate = reference.strftime("%Y%m%dT%H%M%SZ")
-        headers["X-Amz-Date"] = amzdate
-
-        # Credential Scope
-        scope = "{date}/{region}/{service}/{request}".format(
-            date=reference.strftime("%Y%m%d"),
+        return aws_sign_request(
+            payload,
+            headers,
+            host=f"sns.{self.aws_region_name}.amazonaws.com",
+            access_key_id=self.aws_access_key_id,
+            secret_access_key=self.aws_secret_access_key,
             region=self.aws_region_name,
             service=self.aws_service_name,
-            request=self.aws_auth_request,
-        )
-
-        # Similar to headers; but a subset.  keys must be lowercase
-        signed_headers = OrderedDict(
-            [
-                ("content-type", headers["Content-Type"]),
-                (
-                    "host",
-                    f"{self.aws_service_name}"
-                    f".{self.aws_region_name}.amazonaws.com",
-                ),
-                ("x-amz-date", headers["X-Amz-Date"]),
-            ]
-        )
-
-        # Include session token in signed headers for temporary credentials;
-        # x-amz-security-token sorts after x-amz-date alphabetically and
-        # must appear after it to keep the canonical request valid.
-        if self.aws_session_token:
-            headers["X-Amz-Security-Token"] = self.aws_session_token
-            signed_headers["x-amz-security-token"] = self.aws_session_token
-
-        #
-        # Build Canonical Request Object
-        #
-        canonical_request = "\n".join(
-            [
-                # Method
-                "POST",
-                # URL
-                self.aws_canonical_uri,
-                # Query String (none set for POST)
-                "",
-                # Header Content (must include \n at end!)
-                # All entries except characters in amazon date must be
-                # lowercase
-                "\n".join([f"{k}:{v}" for k, v in signed_headers.items()])
-                + "\n",
-                # Header Entries (in same order identified above)
-                ";".join(signed_headers.keys()),
-                # Payload
-                sha256(payload.encode("utf-8")).hexdigest(),
-            ]
+            session_token=self.aws_session_token,
+            canonical_uri=self.aws_canonical_uri,
+            reference=reference,
         )
 
-        # Prepare Unsigned Signature
-        to_sign = "\n".join(
-            [
-                self.aws_auth_algorithm,
-                amzdate,
-                scope,
-                sha256(canonical_request.encode("utf-8")).hexdigest(),
-            ]
-        )
-
-        # Our Authorization header
-        headers["Authorization"] = ", ".join(
-            [
-                (
-                    f"{self.aws_auth_algorithm} "
-                    f"Credential={self.aws_access_key_id}/{scope}"
-                ),
-                "SignedHeaders={signed_headers}".format(
-                    signed_headers=";".join(signed_headers.keys()),
-                ),
-                f"Signature={self.aws_auth_signature(to_sign, reference)}",
-            ]
-        )
-
-        return headers
-
-    def aws_auth_signature(self, to_sign, reference):
-        """Generates a AWS v4 signature based on provided payload which should
-        be in the form of a string."""
-
-        def _sign(key, msg, to_hex=False):
-            """Perform AWS Signing."""
-            if to_hex:
-                return hmac.new(key, msg.encode("utf-8"), sha256).hexdigest()
-            return hmac.new(key, msg.encode("utf-8"), sha256).digest()
-
-        date = _sign(
-            (self.aws_auth_version + self.aws_secret_access_key).encode(
-                "utf-8"
-            ),
-            reference.strftime("%Y%m%d"),
-        )
-
-        region = _sign(date, self.aws_region_name)
-        service = _sign(region, self.aws_service_name)
-        signed = _sign(service, self.aws_auth_request)
-        return _sign(signed, to_sign, to_hex=True)
-
     @staticmethod
     def aws_response_to_dict(aws_response):
         """Takes an AWS Response object as input and returns it as a dictionary
@@ -631,43 +540,7 @@ class NotifySNS(NotifyBase):
             "Message": "error_message",
         }
 
-        # A default response object that we'll manipulate as we pull more data
-        # from our AWS Response object
-        response = {
-            "type": None,
-            "request_id": None,
-        }
-
-        try:
-            # we build our tree, but not before first eliminating any
-            # reference to namespacing (if present) as it makes parsing
-            # the tree so much easier.
-            root = ElementTree.fromstring(
-                re.sub(r' xmlns="[^"]+"', "", aws_response, count=1)
-            )
-
-            # Store our response tag object name
-            response["type"] = str(root.tag)
-
-            def _xml_iter(root, response):
-                if len(root) > 0:
-                    for child in root:
-                        # use recursion to parse everything
-                        _xml_iter(child, response)
-
-                elif root.tag in aws_keep_map:
-                    response[aws_keep_map[root.tag]] = (root.text).strip()
-
-            # Recursivly iterate over our AWS Response to extract the
-            # fields we're interested in in efforts to populate our response
-            # object.
-            _xml_iter(root, response)
-
-        except (ElementTree.ParseError, TypeError):
-            # bad data just causes us to generate a bad response
-            pass
-
-        return response
+        return aws_response_to_dict(aws_response, aws_keep_map)
 
     @property
     def url_identifier(self):
@@ -435,7 +435,7 @@ class NotifySessionOGS(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=body_bytes,
                 headers=headers,
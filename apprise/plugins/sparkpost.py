@@ -413,7 +413,7 @@ class NotifySparkPost(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle(wait=wait)
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=dumps(payload),
                     headers=headers,
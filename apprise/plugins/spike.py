@@ -123,7 +123,7 @@ class NotifySpike(NotifyBase):
         self.throttle()
 
         try:
-            response = requests.post(
+            response = self.http.post(
                 self.webhook_url,
                 headers=headers,
                 data=json.dumps(payload),
@@ -354,7 +354,7 @@ class NotifySplunk(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 notify_url,
                 data=dumps(payload).encode("utf-8"),
                 headers=headers,
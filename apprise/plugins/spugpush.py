@@ -117,7 +117,7 @@ class NotifySpugpush(NotifyBase):
 
         self.throttle()
         try:
-            response = requests.post(
+            response = self.http.post(
                 self.webhook_url,
                 headers=headers,
                 data=json.dumps(payload),
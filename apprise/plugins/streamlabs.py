@@ -290,7 +290,7 @@ class NotifyStreamlabs(NotifyBase):
             }
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url + self.call.lower(),
                     headers=headers,
                     data=data,
@@ -339,7 +339,7 @@ class NotifyStreamlabs(NotifyBase):
             }
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url + self.call.lower(),
                     headers=headers,
                     data=data,
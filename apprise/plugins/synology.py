@@ -284,7 +284,7 @@ class NotifySynology(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=f"payload={dumps(payload)}",
                 params=params,
@@ -674,7 +674,7 @@ class NotifyTelegram(NotifyBase):
                     f"(cert_verify={self.verify_certificate!r})"
                 )
 
-                r = requests.post(
+                r = self.http.post(
                     url,
                     headers=headers,
                     files=files,
@@ -743,7 +743,7 @@ class NotifyTelegram(NotifyBase):
         response = None
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 headers=headers,
                 verify=self.verify_certificate,
@@ -1379,59 +1379,10 @@ class NotifyTelegram(NotifyBase):
                 body, title, notify_type=notify_type, attach=attach
             )
 
-        headers = {
-            "User-Agent": self.app_id,
-            "Content-Type": "application/json",
-        }
-
         # error tracking (used for function return)
         has_error = False
 
-        url = "{}{}/{}".format(self.notify_url, self.bot_token, "sendMessage")
-
-        payload_ = {
-            # Notification Audible Control
-            "disable_notification": self.silent,
-            # Display Web Page Preview (if possible)
-            "disable_web_page_preview": not self.preview,
-        }
-
-        # Prepare Message Body
-        if self.notify_format == NotifyFormat.MARKDOWN:
-            if (
-                body_format == NotifyFormat.TEXT
-                and self.markdown_ver == TelegramMarkdownVersion.TWO
-            ):
-                # Escape MarkdownV2-only reserved characters in plain text.
-                # See: https://stackoverflow.com/a/69892704/355584
-                # Also: https://core.telegram.org/bots/api#markdownv2-style
-                # HTML bodies were already escaped during dialect adaptation.
-                body = re.sub(r"(?<!\\)([_*[\]()~`>#+=|{}.!-])", r"\\\1", body)
-
-            # HTML was converted to Telegram Markdown before splitting so no
-            # further transformation is required here; direct Telegram Markdown
-            # input is left unchanged regardless of version.
-            payload_["parse_mode"] = self.markdown_ver
-            payload_["text"] = body
-
-        else:  # HTML
-            # Use Telegram's HTML mode
-            payload_["parse_mode"] = "HTML"
-            for r, v, m in self.__telegram_escape_html_entries:
-                if "html" in m:
-                    # Handle special cases where we need to alter new lines for
-                    # presentation purposes
-                    v = v.format(
-                        m["html"]
-                        if body_format
-                        in (NotifyFormat.HTML, NotifyFormat.MARKDOWN)
-                        else ""
-                    )
-
-                body = r.sub(v, body)
-
-            # Prepare our payload based on HTML or TEXT
-            payload_["text"] = body
+        payload_ = self._prepare_payload(body, body_format=body_format)
 
         # Prepare our caption payload
         caption_payload = (
@@ -1459,15 +1410,9 @@ class NotifyTelegram(NotifyBase):
         targets = list(self.targets)
         while len(targets):
             target = targets.pop(0)
-            chat_id, topic = target
 
             # Printable chat_id details
-            pchat_id = f"{chat_id}" if not topic else f"{chat_id}:{topic}"
-
-            payload = payload_.copy()
-            payload["chat_id"] = chat_id
-            if topic:
-                payload["message_thread_id"] = topic
+            pchat_id = self._printable_target(target)
 
             if self.include_image is True and not self.send_media(
                 target, notify_type
@@ -1501,69 +1446,27 @@ class NotifyTelegram(NotifyBase):
                 # nothing further to do; move along to the next attachment
                 continue
 
+            url, request = self._prepare_request(payload_, target)
+
             # Always call throttle before any remote server i/o is made;
             # Telegram throttles to occur before sending the image so that
             # content can arrive together.
             self.throttle()
 
-            self.logger.debug(
-                f"Telegram POST URL: {url} "
-                f"(cert_verify={self.verify_certificate!r})"
-            )
-            self.logger.debug(f"Telegram Payload: {payload!s}")
-
             try:
-                r = requests.post(
-                    url,
-                    data=dumps(payload),
-                    headers=headers,
-                    verify=self.verify_certificate,
-                    timeout=self.request_timeout,
-                    allow_redirects=self.redirects,
-                )
-
-                if r.status_code != requests.codes.ok:
-                    # We had a problem
-                    status_str = NotifyTelegram.http_response_code_lookup(
-                        r.status_code
-                    )
-
-                    try:
-                        # Try to get the error message if we can:
-                        error_msg = loads(r.content).get(
-                            "description", "unknown"
-                        )
-
-                    except (AttributeError, TypeError, ValueError):
-                        # ValueError = r.content is Unparsable
-                        # TypeError = r.content is None
-                        # AttributeError = r is None
-                        error_msg = None
-
-                    self.logger.warning(
-                        f"Failed to send Telegram notification to {pchat_id}: "
-                        f"{error_msg if error_msg else status_str}, "
-                        f"error={r.status_code}."
-                    )
-
-                    self.logger.debug(f"Response Details:\r\n{r.content}")
-
-                    # Flag our error
-                    has_error = True
-                    continue
+                r = self.http.post(url, **request)
 
             except requests.RequestException as e:
-                self.logger.warning(
-                    f"A connection error occurred sending Telegram:{pchat_id} "
-                    + "notification."
-                )
-                self.logger.debug(f"Socket Exception: {e!s}")
+                self._handle_exception(e, pchat_id)
 
                 # Flag our error
                 has_error = True
                 continue
 
-            self.logger.info("Sent Telegram notification.")
+            if not self._handle_response(r, pchat_id):
+                # Flag our error
+                has_error = True
+                continue
 
             if (
                 attach
@@ -1582,6 +1485,192 @@ class NotifyTelegram(NotifyBase):
 
         return not has_error
 
+    async def async_send(
+        self,
+        body,
+        title="",
+        notify_type=NotifyType.INFO,
+        attach=None,
+        body_format=None,
+        **kwargs,
+    ):
+        """Perform Telegram Notification without blocking the event loop."""
+
+        if (
+            (attach and self.attachment_support)
+            or self.template
+            or self.include_image is True
+            or len(self.targets) == 0
+        ):
+            # Media uploads, templates and bot owner detection involve
+            # blocking i/o; let our executor based default take care of these
+            return await super().async_send(
+                body,
+                title=title,
+                notify_type=notify_type,
+                attach=attach,
+                body_format=body_format,
+                **kwargs,
+            )
+
+        # error tracking (used for function return)
+        has_error = False
+
+        payload_ = self._prepare_payload(body, body_format=body_format)
+
+        for target in self.targets:
+            # Printable chat_id details
+            pchat_id = self._printable_target(target)
+
+            url, request = self._prepare_request(payload_, target)
+
+            # Always call throttle before any remote server i/o is made
+            await self.async_throttle()
+
+            try:
+                r = await self.async_http.post(url, **request)
+
+            except requests.RequestException as e:
+                self._handle_exception(e, pchat_id)
+
+                # Flag our error
+                has_error = True
+                continue
+
+            if not self._handle_response(r, pchat_id):
+                # Flag our error
+                has_error = True
+                continue
+
+        return not has_error
+
+    @staticmethod
+    def _printable_target(target):
+        """Returns the (chat_id, topic) target provided as a string."""
+        chat_id, topic = target
+        return f"{chat_id}" if not topic else f"{chat_id}:{topic}"
+
+    def _prepare_request(self, payload_, target):
+        """Returns a tuple of the URL to post to and the keyword arguments to
+        pass along with it to deliver the sendMessage payload (as prepared by
+        _prepare_payload()) to the target specified."""
+
+        chat_id, topic = target
+
+        payload = payload_.copy()
+        payload["chat_id"] = chat_id
+        if topic:
+            payload["message_thread_id"] = topic
+
+        url = "{}{}/{}".format(self.notify_url, self.bot_token, "sendMessage")
+
+        self.logger.debug(
+            f"Telegram POST URL: {url} "
+            f"(cert_verify={self.verify_certificate!r})"
+        )
+        self.logger.debug(f"Telegram Payload: {payload!s}")
+
+        return url, {
+            "data": dumps(payload),
+            "headers": {
+                "User-Agent": self.app_id,
+                "Content-Type": "application/json",
+            },
+            "verify": self.verify_certificate,
+            "timeout": self.request_timeout,
+            "allow_redirects": self.redirects,
+        }
+
+    def _handle_exception(self, e, pchat_id):
+        """Reports a connection error that occurred notifying a target."""
+        self.logger.warning(
+            f"A connection error occurred sending Telegram:{pchat_id} "
+            + "notification."
+        )
+        self.logger.debug(f"Socket Exception: {e!s}")
+
+    def _prepare_payload(self, body, body_format=None):
+        """Returns the sendMessage payload (less the chat details) for the
+        specified body."""
+
+        payload = {
+            # Notification Audible Control
+            "disable_notification": self.silent,
+            # Display Web Page Preview (if possible)
+            "disable_web_page_preview": not self.preview,
+        }
+
+        # Prepare Message Body
+        if self.notify_format == NotifyFormat.MARKDOWN:
+            if (
+                body_format == NotifyFormat.TEXT
+                and self.markdown_ver == TelegramMarkdownVersion.TWO
+            ):
+                # Escape MarkdownV2-only reserved characters in plain text.
+                # See: https://stackoverflow.com/a/69892704/355584
+                # Also: https://core.telegram.org/bots/api#markdownv2-style
+                # HTML bodies were already escaped during dialect adaptation.
+                body = re.sub(r"(?<!\\)([_*[\]()~`>#+=|{}.!-])", r"\\\1", body)
+
+            # HTML was converted to Telegram Markdown before splitting so no
+            # further transformation is required here; direct Telegram Markdown
+            # input is left unchanged regardless of version.
+            payload["parse_mode"] = self.markdown_ver
+            payload["text"] = body
+
+        else:  # HTML
+            # Use Telegram's HTML mode
+            payload["parse_mode"] = "HTML"
+            for r, v, m in self.__telegram_escape_html_entries:
+                if "html" in m:
+                    # Handle special cases where we need to alter new lines for
+                    # presentation purposes
+                    v = v.format(
+                        m["html"]
+                        if body_format
+                        in (NotifyFormat.HTML, NotifyFormat.MARKDOWN)
+                        else ""
+                    )
+
+                body = r.sub(v, body)
+
+            # Prepare our payload based on HTML or TEXT
+            payload["text"] = body
+
+        return payload
+
+    def _handle_response(self, r, pchat_id):
+        """Interprets the response returned by Telegram."""
+
+        if r.status_code != requests.codes.ok:
+            # We had a problem
+            status_str = NotifyTelegram.http_response_code_lookup(
+                r.status_code
+            )
+
+            try:
+                # Try to get the error message if we can:
+                error_msg = loads(r.content).get("description", "unknown")
+
+            except (AttributeError, TypeError, ValueError):
+                # ValueError = r.content is Unparsable
+                # TypeError = r.content is None
+                # AttributeError = r is None
+                error_msg = None
+
+            self.logger.warning(
+                f"Failed to send Telegram notification to {pchat_id}: "
+                f"{error_msg if error_msg else status_str}, "
+                f"error={r.status_code}."
+            )
+
+            self.logger.debug(f"Response Details:\r\n{r.content}")
+
+            return False
+
+        self.logger.info("Sent Telegram notification.")
+        return True
+
     def _send_attachments(self, target, notify_type, attach, payload=None):
         """Sends our attachments."""
         if payload is None:
@@ -1760,7 +1849,7 @@ class NotifyTelegram(NotifyBase):
             self.logger.debug(f"Telegram Payload: {payload!s}")
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=dumps(payload),
                     headers=headers,
@@ -250,7 +250,7 @@ class NotifyThreema(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     params=payload,
                     headers=headers,
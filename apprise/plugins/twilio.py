@@ -435,7 +435,7 @@ class NotifyTwilio(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     auth=auth,
                     data=payload,
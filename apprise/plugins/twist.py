@@ -653,7 +653,7 @@ class NotifyTwist(NotifyBase):
         content = {}
 
         # acquire our request mode
-        fn = requests.post if method == "POST" else requests.get
+        fn = self.http.post if method == "POST" else self.http.get
         try:
             r = fn(
                 api_url,
@@ -776,7 +776,7 @@ class NotifyTwitter(NotifyBase):
         self.throttle(wait=wait)
 
         # acquire our request mode
-        fn = requests.post if method == "POST" else requests.get
+        fn = self.http.post if method == "POST" else self.http.get
         try:
             r = fn(
                 url,
@@ -419,7 +419,7 @@ class NotifyVapid(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     notify_url,
                     data=encrypted_payload,
                     headers=headers,
@@ -229,7 +229,7 @@ class NotifyViber(NotifyBase):
 
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=dumps(payload),
                     headers=headers,
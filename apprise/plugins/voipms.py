@@ -244,7 +244,7 @@ class NotifyVoipms(NotifyBase):
             response = {"status": "unknown", "message": ""}
 
             try:
-                r = requests.get(
+                r = self.http.get(
                     self.notify_url,
                     params=payload,
                     headers=headers,
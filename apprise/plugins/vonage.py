@@ -259,7 +259,7 @@ class NotifyVonage(NotifyBase):
             self.throttle()
 
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.notify_url,
                     data=payload,
                     headers=headers,
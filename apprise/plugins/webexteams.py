@@ -319,7 +319,7 @@ class NotifyWebexTeams(NotifyBase):
         # Always call throttle before any remote server i/o is made
         self.throttle()
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=dumps(payload),
                 headers=headers,
@@ -411,7 +411,7 @@ class NotifyWebexTeams(NotifyBase):
 
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     self.api_url,
                     data=dumps(payload),
                     headers=headers,
@@ -494,7 +494,7 @@ class NotifyWebexTeams(NotifyBase):
                     )
 
                     self.throttle()
-                    r = requests.post(
+                    r = self.http.post(
                         self.api_url,
                         data=data,
                         headers=headers,
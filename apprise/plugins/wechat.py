@@ -331,7 +331,7 @@ class NotifyWeChat(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.get(
+            r = self.http.get(
                 self.token_url,
                 params=params,
                 verify=self.verify_certificate,
@@ -478,7 +478,7 @@ class NotifyWeChat(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 send_url,
                 data=json.dumps(payload, ensure_ascii=False).encode("utf-8"),
                 headers=headers,
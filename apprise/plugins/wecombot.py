@@ -181,7 +181,7 @@ class NotifyWeComBot(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.api_url,
                 data=dumps(payload).encode("utf-8"),
                 headers=headers,
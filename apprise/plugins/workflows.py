@@ -541,6 +541,65 @@ class NotifyWorkflows(NotifyBase):
     def send(self, body, title="", notify_type=NotifyType.INFO, **kwargs):
         """Perform Microsoft Teams Notification."""
 
+        prepared = self._prepare_request(body, title, notify_type, **kwargs)
+        if prepared is None:
+            # Logging already handled
+            return False
+
+        notify_url, request = prepared
+
+        # Always call throttle before any remote server i/o is made
+        self.throttle()
+        try:
+            r = self.http.post(notify_url, **request)
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                "A Connection error occurred sending Workflows notification."
+            )
+            self.logger.debug(f"Socket Exception: {e!s}")
+
+            # We failed
+            return False
+
+        return self._handle_response(r)
+
+    async def async_send(
+        self, body, title="", notify_type=NotifyType.INFO, **kwargs
+    ):
+        """Perform Microsoft Teams Notification without blocking the event
+        loop."""
+
+        prepared = self._prepare_request(body, title, notify_type, **kwargs)
+        if prepared is None:
+            # Logging already handled
+            return False
+
+        notify_url, request = prepared
+
+        # Always call throttle before any remote server i/o is made
+        await self.async_throttle()
+        try:
+            r = await self.async_http.post(notify_url, **request)
+
+        except requests.RequestException as e:
+            self.logger.warning(
+                "A Connection error occurred sending Workflows notification."
+            )
+            self.logger.debug(f"Socket Exception: {e!s}")
+
+            # We failed
+            return False
+
+        return self._handle_response(r)
+
+    def _prepare_request(self, body, title, notify_type, **kwargs):
+        """Returns a tuple of the URL to notify and the keyword arguments to
+        pass along with it.
+
+        None is returned if the request could not be prepared.
+        """
+
         headers = {
             "User-Agent": self.app_id,
             "Content-Type": "application/json",
@@ -578,7 +637,7 @@ class NotifyWorkflows(NotifyBase):
         if not payload:
             # No need to present a reason; that will come from the
             # gen_payload() function itself
-            return False
+            return None
 
         self.logger.debug(
             "Workflows POST URL:"
@@ -586,53 +645,41 @@ class NotifyWorkflows(NotifyBase):
         )
         self.logger.debug(f"Workflows Payload: {payload!s}")
 
-        # Always call throttle before any remote server i/o is made
-        self.throttle()
-        try:
-            r = requests.post(
-                notify_url,
-                params=params,
-                data=json.dumps(payload),
-                headers=headers,
-                verify=self.verify_certificate,
-                timeout=self.request_timeout,
-                allow_redirects=self.redirects,
-            )
-            if r.status_code not in (
-                requests.codes.ok,
-                requests.codes.accepted,
-            ):
-                # We had a problem
-                status_str = NotifyWorkflows.http_response_code_lookup(
-                    r.status_code
-                )
-
-                self.logger.warning(
-                    "Failed to send Workflows notification: "
-                    "{}{}error={}.".format(
-                        status_str, ", " if status_str else "", r.status_code
-                    )
-                )
-
-                self.logger.debug(
-                    "Response Details:\r\n%r", (r.content or b"")[:2000]
-                )
+        return notify_url, {
+            "params": params,
+            "data": json.dumps(payload),
+            "headers": headers,
+            "verify": self.verify_certificate,
+            "timeout": self.request_timeout,
+            "allow_redirects": self.redirects,
+        }
 
-                # We failed
-                return False
+    def _handle_response(self, r):
+        """Interprets the response returned by Workflows."""
 
-            else:
-                self.logger.info("Sent Workflows notification.")
+        if r.status_code not in (
+            requests.codes.ok,
+            requests.codes.accepted,
+        ):
+            # We had a problem
+            status_str = NotifyWorkflows.http_response_code_lookup(
+                r.status_code
+            )
 
-        except requests.RequestException as e:
             self.logger.warning(
-                "A Connection error occurred sending Workflows notification."
+                "Failed to send Workflows notification: {}{}error={}.".format(
+                    status_str, ", " if status_str else "", r.status_code
+                )
+            )
+
+            self.logger.debug(
+                "Response Details:\r\n%r", (r.content or b"")[:2000]
             )
-            self.logger.debug(f"Socket Exception: {e!s}")
 
             # We failed
             return False
 
+        self.logger.info("Sent Workflows notification.")
         return True
 
     @property
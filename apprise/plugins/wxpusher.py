@@ -246,7 +246,7 @@ class NotifyWxPusher(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 self.notify_url,
                 data=json.dumps(payload).encode("utf-8"),
                 headers=headers,
@@ -286,7 +286,7 @@ class NotifyZoom(NotifyBase):
         self.throttle()
 
         try:
-            r = requests.post(
+            r = self.http.post(
                 url,
                 data=payload,
                 headers=headers,
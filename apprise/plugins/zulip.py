@@ -290,7 +290,7 @@ class NotifyZulip(NotifyBase):
             # Always call throttle before any remote server i/o is made
             self.throttle()
             try:
-                r = requests.post(
+                r = self.http.post(
                     url,
                     data=payload,
                     headers=headers,
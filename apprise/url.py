@@ -25,18 +25,24 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
 from datetime import datetime
 import hashlib
+import os
 import re
 import sys
 import time
 from urllib.parse import quote as _quote, unquote as _unquote
 from xml.sax.saxutils import escape as sax_escape
 
+import requests
+
 from .asset import AppriseAsset
+from .common import PersistentStoreMode
 from .locale import gettext_lazy as _
 from .logger import logger
 from .tag import AppriseTag
+from .utils.http import AsyncRequests, PooledRequests, ResponseHook
 from .utils.parse import (
     URL_PATH_SAFE_CHARS,
     parse_bool,
@@ -45,6 +51,12 @@ from .utils.parse import (
     parse_url,
     urlencode,
 )
+from .utils.ratelimit import (
+    RATELIMIT_STORAGE_DIR,
+    FileRateLimiter,
+    MemoryRateLimiter,
+    TokenBucket,
+)
 
 # Used to break a path list into parts
 PATHSPLIT_LIST_DELIM = re.compile(r"[ \t\r\n,\\/]+")
@@ -101,9 +113,13 @@ class URLBase:
     # This value can be the same as the defined protocol.
     secure_protocol = None
 
-    # Throttle
+    # Throttle; the number of seconds to wait between each request made
     request_rate_per_sec = 0
 
+    # The number of requests that may be made back to back before the above
+    # request rate is enforced
+    request_rate_burst = 1
+
     # The connect timeout is the number of seconds Requests will wait for your
     # client to establish a connection to a remote machine (corresponding to
     # the connect()) call on the socket.
@@ -130,6 +146,10 @@ class URLBase:
     # Secure sites should be verified against a Certificate Authority
     verify_certificate = True
 
+    # Optionally set to a function that is handed every response received
+    # through the http (and async_http) property
+    http_response = None
+
     # By default, HTTP redirects are followed, matching the behaviour of the
     # underlying requests library. Set to False to prevent redirect-chain
     # credential forwarding to destinations not explicitly configured by the
@@ -325,49 +345,132 @@ class URLBase:
         # is automatically set and controlled through the throttle() call.
         self._last_io_datetime = None
 
+        # The rate limit bucket used if we can not be identified (and
+        # therefore can not share one with anyone else)
+        self._ratelimit_bucket = None
+
     def throttle(self, last_io=None, wait=None):
         """A common throttle control.
 
+        Requests are reserved from a token bucket shared by every plugin of
+        the same type using the same credentials (see ratelimit_key()).
+
         if a wait is specified, then it will force a sleep of the specified
         time if it is larger then the calculated throttle time.
         """
 
-        if last_io is not None:
-            # Assume specified last_io
-            self._last_io_datetime = last_io
+        delay = self._throttle_delay(last_io=last_io, wait=wait)
+        if delay:
+            time.sleep(delay)
 
-        # Get ourselves a reference time of 'now'
-        reference = datetime.now()
+        if delay is not None:
+            # Update our timestamp before we leave
+            self._last_io_datetime = datetime.now()
 
-        if self._last_io_datetime is None:
-            # Set time to 'now' and no need to throttle
-            self._last_io_datetime = reference
-            return
+    async def async_throttle(self, last_io=None, wait=None):
+        """The asynchronous counterpart of throttle(); the event loop is never
+        blocked while we wait."""
 
-        if self.request_rate_per_sec <= 0.0 and not wait:
-            # We're done if there is no throttle limit set
-            return
+        delay = self._throttle_delay(last_io=last_io, wait=wait)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if delay is not None:
+            # Update our timestamp before we leave
+            self._last_io_datetime = datetime.now()
 
-        # If we reach here, we need to do additional logic.
-        # If the difference between the reference time and 'now' is less than
-        # the defined request_rate_per_sec then we need to throttle for the
-        # remaining balance of this time.
+    def _throttle_delay(self, last_io=None, wait=None):
+        """Returns the number of seconds throttle() must wait for.
+
+        None is returned if no throttling logic applies at all.
+        """
 
-        elapsed = (reference - self._last_io_datetime).total_seconds()
+        if last_io is not None:
+            # Assume specified last_io
+            self._last_io_datetime = last_io
 
-        if wait is not None:
-            self.logger.debug(f"Throttling forced for {wait}s...")
-            time.sleep(wait)
+        elif self._last_io_datetime is None:
+            # No i/o was made yet; there is nothing a forced wait (which is
+            # always based on a previous response) could apply to
+            self._last_io_datetime = datetime.now()
+            wait = None
 
-        elif elapsed < self.request_rate_per_sec:
-            self.logger.debug(
-                f"Throttling for {self.request_rate_per_sec - elapsed}s..."
+        if self.request_rate_per_sec <= 0.0 and not wait:
+            # There is no throttle limit set; but the upstream server may
+            # have asked everyone sharing our budget to hold off (see defer())
+            delay = self._ratelimit("deferred")
+            if not delay:
+                return None
+
+            self.logger.debug(f"Throttling deferred for {delay}s...")
+            return delay
+
+        # Reserve our request from the budget we share with every other
+        # plugin using the same credentials
+        kwargs = {
+            "interval": max(0.0, self.request_rate_per_sec),
+            "burst": self.request_rate_burst,
+            "wait": wait,
+            "last_io": None if last_io is None else last_io.timestamp(),
+        }
+
+        delay = self._ratelimit("reserve", **kwargs)
+
+        if wait:
+            self.logger.debug(f"Throttling forced for {delay}s...")
+
+        elif delay:
+            self.logger.debug(f"Throttling for {delay}s...")
+
+        return delay
+
+    def defer(self, wait):
+        """Ensures no request is made by anyone sharing our rate limit budget
+        (see ratelimit_key()) for the number of seconds specified."""
+        if wait > 0:
+            self.logger.debug(f"Deferring requests for {wait}s...")
+            self._ratelimit("defer", wait=wait)
+
+    def _ratelimit(self, action, **kwargs):
+        """Applies the action (reserve, defer or deferred) to our rate limit
+        budget."""
+        key = self.ratelimit_key()
+        if key is None:
+            if self._ratelimit_bucket is None:
+                self._ratelimit_bucket = TokenBucket()
+            return getattr(self._ratelimit_bucket, action)(**kwargs)
+
+        return getattr(self.rate_limiter(), action)(key, **kwargs)
+
+    def ratelimit_key(self):
+        """Returns the key identifying the rate limit budget we share with
+        every other plugin of the same type using the same credentials.
+
+        None is returned if we can not be identified; in which case we are
+        given a budget of our own.
+        """
+        url_id = self.url_id()
+        if not url_id:
+            return None
+
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}/{url_id}"
+
+    def rate_limiter(self):
+        """Returns the rate limiter our requests are reserved from."""
+        if self.asset.rate_limiter is not None:
+            return self.asset.rate_limiter
+
+        if (
+            self.asset.persistent_rate_limits
+            and self.asset.storage_path
+            and self.asset.storage_mode != PersistentStoreMode.MEMORY
+        ):
+            return FileRateLimiter.instance(
+                os.path.join(self.asset.storage_path, RATELIMIT_STORAGE_DIR)
             )
-            time.sleep(self.request_rate_per_sec - elapsed)
 
-        # Update our timestamp before we leave
-        self._last_io_datetime = datetime.now()
-        return
+        return MemoryRateLimiter()
 
     def url(self, privacy=False, *args, **kwargs):
         """Assembles the URL associated with the notification based on the
@@ -831,6 +934,56 @@ class URLBase:
         is used by requests.get() and requests.put() calls."""
         return (self.user, self.password) if self.user else None
 
+    @property
+    def http(self):
+        """Returns the object HTTP requests should be issued through; for
+        example:  self.http.post(url, data=payload, ...)
+
+        The returned object exposes the same interface as the requests
+        library (get(), post(), put(), etc).  If pooling is enabled in the
+        AppriseAsset object, calls are routed through a shared pool of
+        keep-alive sessions, otherwise the requests module is used as-is.
+
+        Every response received is handed to http_response() (if defined).
+        """
+        return self._http_hook(self._http_transport())
+
+    @property
+    def async_http(self):
+        """The asynchronous counterpart of the http property; for example:
+            r = await self.async_http.post(url, data=payload, ...)
+
+        Requests are performed natively on the running event loop if the
+        AppriseAsset object enables async_http and the httpx library is
+        available.  Otherwise they are handed off to the http property in the
+        default executor.
+        """
+        return self._http_hook(
+            AsyncRequests(
+                fallback=self._http_transport(),
+                use_native=self.asset.async_http,
+                maxsize=self.asset.http_pool_maxsize,
+            )
+        )
+
+    def _http_transport(self):
+        """Returns the object our HTTP requests are performed with."""
+        if not self.asset.http_pool:
+            return requests
+
+        return PooledRequests(
+            maxsize=self.asset.http_pool_maxsize,
+            idle_timeout=self.asset.http_pool_idle_timeout,
+        )
+
+    def _http_hook(self, transport):
+        """Wraps the transport provided so that our http_response() hook
+        sees every response received."""
+        if self.http_response is None:
+            return transport
+
+        return ResponseHook(transport, self.http_response)
+
     @property
     def request_url(self):
         """Assemble a simple URL that can be used by the requests library."""
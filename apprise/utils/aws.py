@@ -0,0 +1,199 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+# AWS Signature Version 4:
+# - https://docs.aws.amazon.com/IAM/latest/UserGuide/\
+#       reference_sigv-create-signed-request.html
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from hashlib import sha256
+import hmac
+from typing import Optional, Union
+from xml.etree import ElementTree
+
+# AWS Authentication Details
+AWS_AUTH_VERSION = "AWS4"
+AWS_AUTH_ALGORITHM = "AWS4-HMAC-SHA256"
+AWS_AUTH_REQUEST = "aws4_request"
+
+
+def _hmac(key: bytes, msg: str) -> bytes:
+    """Perform AWS Signing."""
+    return hmac.new(key, msg.encode("utf-8"), sha256).digest()
+
+
+@lru_cache(maxsize=32)
+def aws_signing_key(
+    secret_access_key: str, date: str, region: str, service: str
+) -> bytes:
+    """Returns the AWS v4 signing key for the provided credential scope.
+
+    The key only changes once a day (per region and service), so it is
+    derived once and cached rather than re-running the four HMAC rounds for
+    every request made.
+    """
+    key = _hmac((AWS_AUTH_VERSION + secret_access_key).encode("utf-8"), date)
+    key = _hmac(key, region)
+    key = _hmac(key, service)
+    return _hmac(key, AWS_AUTH_REQUEST)
+
+
+def aws_sign_request(
+    payload: str,
+    headers: dict,
+    host: str,
+    access_key_id: str,
+    secret_access_key: str,
+    region: str,
+    service: str,
+    session_token: Optional[str] = None,
+    canonical_uri: str = "/",
+    reference: Optional[datetime] = None,
+) -> dict:
+    """Signs a (urlencoded) POST payload and returns the headers to send.
+
+    The headers provided must already identify the Content-Type; the
+    Content-Length, X-Amz-Date, X-Amz-Security-Token (if a session token
+    was provided) and Authorization entries are populated here.
+    """
+
+    # Get a reference time (used for header construction)
+    if reference is None:
+        reference = datetime.now(timezone.utc)
+
+    date = reference.strftime("%Y%m%d")
+    amzdate = reference.strftime("%Y%m%dT%H%M%SZ")
+
+    headers = dict(headers)
+    headers["Content-Length"] = str(len(payload))
+    headers["X-Amz-Date"] = amzdate
+
+    # Credential Scope
+    scope = f"{date}/{region}/{service}/{AWS_AUTH_REQUEST}"
+
+    # Similar to headers; but a subset.  keys must be lowercase and sorted
+    signed_headers = {
+        "content-type": headers["Content-Type"],
+        "host": host,
+        "x-amz-date": amzdate,
+    }
+
+    # Include session token in signed headers for temporary credentials
+    if session_token:
+        headers["X-Amz-Security-Token"] = session_token
+        signed_headers["x-amz-security-token"] = session_token
+
+    signed_header_keys = ";".join(signed_headers.keys())
+
+    #
+    # Build Canonical Request Object
+    #
+    canonical_request = "\n".join(
+        [
+            # Method
+            "POST",
+            # URL
+            canonical_uri,
+            # Query String (none set for POST)
+            "",
+            # Header Content (must include \n at end!)
+            "".join(f"{k}:{v}\n" for k, v in signed_headers.items()),
+            # Header Entries (in same order identified above)
+            signed_header_keys,
+            # Payload
+            sha256(payload.encode("utf-8")).hexdigest(),
+        ]
+    )
+
+    # Prepare Unsigned Signature
+    to_sign = "\n".join(
+        [
+            AWS_AUTH_ALGORITHM,
+            amzdate,
+            scope,
+            sha256(canonical_request.encode("utf-8")).hexdigest(),
+        ]
+    )
+
+    signature = hmac.new(
+        aws_signing_key(secret_access_key, date, region, service),
+        to_sign.encode("utf-8"),
+        sha256,
+    ).hexdigest()
+
+    # Our Authorization header
+    headers["Authorization"] = (
+        f"{AWS_AUTH_ALGORITHM} Credential={access_key_id}/{scope}, "
+        f"SignedHeaders={signed_header_keys}, Signature={signature}"
+    )
+
+    return headers
+
+
+def aws_response_to_dict(
+    aws_response: Union[str, bytes, None],
+    keep_map: dict,
+    defaults: Optional[dict] = None,
+) -> dict:
+    """Extracts the entries identified by keep_map from an AWS XML response.
+
+    Only leaf elements whose (namespace free) tag is found in keep_map are
+    stored, using the value keep_map maps them to.  The tag of the root
+    element is returned as the 'type'.
+
+    Nothing but the defaults are returned if the response can not be parsed.
+    """
+
+    # A default response object that we'll manipulate as we pull more data
+    # from our AWS Response object
+    response = {"type": None, "request_id": None}
+    if defaults:
+        response.update(defaults)
+
+    if not aws_response or not isinstance(aws_response, (str, bytes)):
+        # Nothing to parse
+        return response
+
+    try:
+        root = ElementTree.fromstring(aws_response)
+
+        # Walk our tree in a single (flat) pass; namespacing (if present) is
+        # stripped from each tag as we go
+        for element in root.iter():
+            tag = element.tag.rpartition("}")[2]
+            if tag in keep_map and not len(element):
+                response[keep_map[tag]] = (element.text or "").strip()
+
+        # Store our response tag object name
+        response["type"] = root.tag.rpartition("}")[2]
+
+    except ElementTree.ParseError:
+        # bad data just causes us to generate a bad response
+        pass
+
+    return response
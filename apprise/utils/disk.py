@@ -79,64 +79,84 @@ def tidy_path(path):
     return path
 
 
-def dir_size(path, max_depth=3, missing_okay=True, _depth=0, _errors=None):
-    """Scans a provided path an returns it's size (in bytes) of path
-    provided."""
+def dir_usage(path, max_depth=3, missing_okay=True):
+    """Scans a provided path and returns it's size (in bytes) along with the
+    modification times of the newest and oldest files found within it.
 
-    if _errors is None:
-        _errors = set()
-
-    if _depth > max_depth:
-        _errors.add(path)
-        return (0, _errors)
+    A tuple of (size, newest, oldest, errors) is returned; newest and oldest
+    are set to None if no files were found.
+    """
 
+    errors = set()
     total = 0
-    try:
-        with os.scandir(path) as it:
-            for entry in it:
-                try:
-                    if entry.is_file(follow_symlinks=False):
-                        total += entry.stat(follow_symlinks=False).st_size
-
-                    elif entry.is_dir(follow_symlinks=False):
-                        (totals, _) = dir_size(
-                            entry.path,
-                            max_depth=max_depth,
-                            _depth=_depth + 1,
-                            _errors=_errors,
+    newest = None
+    oldest = None
+
+    # Our directories are scanned iteratively (depth first)
+    pending = [(path, 0)]
+    while pending:
+        (dirpath, depth) = pending.pop()
+        if depth > max_depth:
+            errors.add(dirpath)
+            continue
+
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            st = entry.stat(follow_symlinks=False)
+                            total += st.st_size
+                            if newest is None or st.st_mtime > newest:
+                                newest = st.st_mtime
+
+                            if oldest is None or st.st_mtime < oldest:
+                                oldest = st.st_mtime
+
+                        elif entry.is_dir(follow_symlinks=False):
+                            pending.append((entry.path, depth + 1))
+
+                    except FileNotFoundError:
+                        # no worries; Nothing to do
+                        continue
+
+                    except OSError as e:
+                        # Permission error of some kind or disk problem...
+                        # There is nothing we can do at this point
+                        errors.add(entry.path)
+                        logger.warning(
+                            "dir_usage detetcted inaccessible path: %s",
+                            os.fsdecode(entry.path),
                         )
-                        total += totals
-
-                except FileNotFoundError:
-                    # no worries; Nothing to do
-                    continue
-
-                except OSError as e:
-                    # Permission error of some kind or disk problem...
-                    # There is nothing we can do at this point
-                    _errors.add(entry.path)
-                    logger.warning(
-                        "dir_size detetcted inaccessible path: %s",
-                        os.fsdecode(entry.path),
-                    )
-                    logger.debug(f"dir_size Exception: {e!s}")
-                    continue
-
-    except FileNotFoundError:
-        if not missing_okay:
-            # Conditional error situation
-            _errors.add(path)
-
-    except OSError as e:
-        # Permission error of some kind or disk problem...
-        # There is nothing we can do at this point
-        _errors.add(path)
-        logger.warning(
-            "dir_size detetcted inaccessible path: %s", os.fsdecode(path)
-        )
-        logger.debug(f"dir_size Exception: {e!s}")
-
-    return (total, _errors)
+                        logger.debug(f"dir_usage Exception: {e!s}")
+                        continue
+
+        except FileNotFoundError:
+            if not missing_okay and dirpath == path:
+                # Conditional error situation
+                errors.add(dirpath)
+
+        except OSError as e:
+            # Permission error of some kind or disk problem...
+            # There is nothing we can do at this point
+            errors.add(dirpath)
+            logger.warning(
+                "dir_usage detetcted inaccessible path: %s",
+                os.fsdecode(dirpath),
+            )
+            logger.debug(f"dir_usage Exception: {e!s}")
+
+    return (total, newest, oldest, errors)
+
+
+def dir_size(path, max_depth=3, missing_okay=True):
+    """Scans a provided path an returns it's size (in bytes) of path
+    provided."""
+
+    (total, _, _, errors) = dir_usage(
+        path, max_depth=max_depth, missing_okay=missing_okay
+    )
+    return (total, errors)
 
 
 def bytes_to_str(value):
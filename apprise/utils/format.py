@@ -29,7 +29,7 @@ from __future__ import annotations
 
 import re
 
-from apprise.common import NotifyFormat
+from apprise.common import LengthUnit, NotifyFormat
 
 # Characters we can apply a new line to if found
 PUNCTUATION_CHARS = ".!?:;"
@@ -37,6 +37,17 @@ PUNCT_SPLIT_PATTERN = re.compile(
     f"[{re.escape(PUNCTUATION_CHARS)}][ \t\r\n\x0b\x0c]+"
 )
 
+# Matches the last punctuation + whitespace sequence of a window; the leading
+# greedy wildcard makes the engine backtrack from the end of the window
+PUNCT_SPLIT_LAST_PATTERN = re.compile(r"(?s:.*)" + PUNCT_SPLIT_PATTERN.pattern)
+
+# The codec (and its bytes per unit) used to measure text against limits
+# that are not expressed in characters
+LENGTH_UNIT_CODECS = {
+    LengthUnit.UTF8: ("utf-8", 1),
+    LengthUnit.UCS2: ("utf-16-le", 2),
+}
+
 # Support HTML entities (&...;)
 HTML_ENTITY_LOOKBACK = 16
 HTML_ENTITY_LOOKAHEAD = 16
@@ -135,10 +146,84 @@ def markdown_adjust(
     return split_at
 
 
+def text_length(text: str, unit: LengthUnit = LengthUnit.CHARS) -> int:
+    """Returns the length of ``text`` measured in ``unit``."""
+    codec = LENGTH_UNIT_CODECS.get(unit)
+    if codec is None:
+        return len(text)
+
+    encoding, width = codec
+    return len(text.encode(encoding, "surrogatepass")) // width
+
+
+def text_fit(
+    text: str,
+    start: int,
+    limit: int,
+    unit: LengthUnit = LengthUnit.CHARS,
+) -> int:
+    """Returns the largest index ``end`` for which ``text[start:end]`` fits
+    within ``limit`` measured in ``unit``.
+
+    Only the window being measured is encoded, so the cost is bound by
+    ``limit`` and not by the length of ``text``. At least one character is
+    always consumed so that callers splitting text make progress.
+    """
+    # Every character costs at least one unit
+    end = min(start + limit, len(text))
+
+    codec = LENGTH_UNIT_CODECS.get(unit)
+    if codec is None or end <= start:
+        return end
+
+    encoding, width = codec
+    encoded = text[start:end].encode(encoding, "surrogatepass")
+    if len(encoded) > limit * width:
+        # Count the characters that fit; a character cut in half by the
+        # budget is dropped by the decoder
+        end = start + len(encoded[: limit * width].decode(encoding, "ignore"))
+
+    return max(end, start + 1)
+
+
+class _BoundaryScanner:
+    """Locates the last occurrence of any of ``chars`` within a window.
+
+    The windows smart_split() asks about only ever move forward, so the text
+    is scanned incrementally and every character is examined at most once no
+    matter how many chunks the text is split into.
+    """
+
+    __slots__ = ("chars", "last", "scanned", "text")
+
+    def __init__(self, text: str, chars: str) -> None:
+        self.text = text
+        self.chars = chars
+
+        # How far into the text we have scanned
+        self.scanned = 0
+
+        # The last boundary found before the scanned position
+        self.last = -1
+
+    def rfind(self, start: int, end: int) -> int:
+        """Returns the last boundary within ``text[start:end]`` or -1."""
+        if end > self.scanned:
+            found = max(
+                self.text.rfind(ch, self.scanned, end) for ch in self.chars
+            )
+            if found != -1:
+                self.last = found
+            self.scanned = end
+
+        return self.last if self.last >= start else -1
+
+
 def smart_split(
     text: str,
     limit: int,
     body_format: NotifyFormat,
+    unit: LengthUnit = LengthUnit.CHARS,
 ) -> list[str]:
     """Split text within ``limit``, preferring natural boundaries.
 
@@ -147,7 +232,11 @@ def smart_split(
     1                    Newline
     2                    Space or tab
     3                    Punctuation followed by whitespace
-    4                    Hard character limit
+    4                    Hard limit
+
+    The ``limit`` is measured in ``unit`` (characters, UTF-8 bytes or UCS-2
+    code units). Candidate boundaries are located in a single forward pass
+    over the text, so the work done is linear in its length.
 
     HTML avoids splitting entities. Markdown additionally protects common
     link constructs when they can fit within a chunk.
@@ -160,55 +249,39 @@ def smart_split(
     start = 0
     length = len(text)
 
+    newlines = _BoundaryScanner(text, "\n\r")
+    spaces = _BoundaryScanner(text, " \t")
+
     while start < length:  # pragma: no branch
-        remaining = length - start
-        if remaining <= limit:
+        window_end = text_fit(text, start, limit, unit)
+        if window_end >= length:
             result.append(text[start:])
             break
 
-        window_end = min(start + limit, length)
         #
         # Priority 1: Search for newline
         #
-        last_nl_idx = max(
-            text.rfind("\n", start, window_end),
-            text.rfind("\r", start, window_end),
-        )
-        split_nl = last_nl_idx + 1 if last_nl_idx != -1 else -1
-
-        #
-        # Priority 2: Search for ending Space and/or Tab
-        #
-        last_space_tab_idx = max(
-            text.rfind(" ", start, window_end),
-            text.rfind("\t", start, window_end),
-        )
-        split_space_tab = (
-            last_space_tab_idx + 1 if last_space_tab_idx != -1 else -1
-        )
-
-        #
-        # Priority 3: Last punctuation + whitespace
-        #
-        split_punct = -1
-        for match in PUNCT_SPLIT_PATTERN.finditer(text, start, window_end):
-            split_punct = match.end()
-
-        # Determine the best soft split point
-        if split_nl != -1:
-            split_at = split_nl
-
-        elif split_space_tab != -1:
-            split_at = split_space_tab
+        boundary = newlines.rfind(start, window_end)
+        if boundary == -1:
+            #
+            # Priority 2: Search for ending Space and/or Tab
+            #
+            boundary = spaces.rfind(start, window_end)
 
-        elif split_punct != -1:
-            split_at = split_punct
+        if boundary != -1:
+            # Split just after the boundary character
+            split_at = boundary + 1
 
         else:
+            #
+            # Priority 3: Last punctuation + whitespace
+            #
+            match = PUNCT_SPLIT_LAST_PATTERN.match(text, start, window_end)
+
             #
             # Priority 4: Hard split (old way of doing things)
             #
-            split_at = window_end
+            split_at = match.end() if match else window_end
 
         #
         # Conditional Content-specific adjustments
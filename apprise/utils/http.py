@@ -0,0 +1,589 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import asyncio
+import contextlib
+import contextvars
+from email.utils import parsedate_to_datetime
+from functools import partial
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+import threading
+import time
+from typing import Any, Callable, Optional, Union
+from urllib.parse import urlsplit
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..logger import logger
+from .singleton import Singleton
+
+try:
+    import httpx
+
+    # Native asyncio HTTP support
+    ASYNC_HTTP_SUPPORT = True
+
+except ImportError:
+    # Asynchronous HTTP requests are performed in the default executor
+    ASYNC_HTTP_SUPPORT = False
+
+# The default number of connections kept alive per pooled destination
+HTTP_POOL_MAXSIZE = 10
+
+# The default number of seconds a pooled session may sit unused before it
+# (and the connections it holds) are released
+HTTP_POOL_IDLE_TIMEOUT = 60.0
+
+# Default ports used when building our pool key
+HTTP_DEFAULT_PORTS = {
+    "http": 80,
+    "https": 443,
+}
+
+# The HTTP status codes returned by servers rate limiting us
+HTTP_RATELIMIT_CODES = (429, 503)
+
+# The (case insensitive) headers servers use to advertise the number of
+# requests remaining and when their rate limit window re-opens
+HTTP_RATELIMIT_HEADERS = (
+    ("X-RateLimit-Remaining", "X-RateLimit-Reset"),
+    ("X-Rate-Limit-Remaining", "X-Rate-Limit-Reset"),
+    ("RateLimit-Remaining", "RateLimit-Reset"),
+)
+
+# A rate limit reset value larger than this is a (unix) timestamp and not a
+# number of seconds
+HTTP_RATELIMIT_EPOCH = 1e9
+
+# The HTTP methods wrapped by ResponseHook
+HTTP_METHODS = (
+    "request",
+    "get",
+    "options",
+    "head",
+    "post",
+    "put",
+    "patch",
+    "delete",
+)
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    """Returns the header specified (or None if it was not provided)."""
+    try:
+        value = headers.get(name)
+        if value is None:
+            value = headers.get(name.lower())
+
+    except (AttributeError, TypeError):
+        return None
+
+    return value.strip() if isinstance(value, str) else None
+
+
+def ratelimit_wait(
+    status_code: Any, headers: Any, now: Optional[float] = None
+) -> tuple[bool, Optional[float]]:
+    """Inspects the status code and headers of an HTTP response for any sign
+    of the server rate limiting us.
+
+    A (throttled, wait) tuple is returned; throttled is set if the server
+    rejected our request (or no further requests can be made until the rate
+    limit window re-opens).  The wait is the number of seconds until we may
+    try again or None if this was not advertised.
+    """
+
+    now = time.time() if now is None else now
+    throttled = status_code in HTTP_RATELIMIT_CODES
+    wait = None
+
+    value = _header(headers, "Retry-After")
+    if value:
+        try:
+            # Delta seconds
+            wait = max(0.0, float(value))
+
+        except ValueError:
+            # An HTTP date; anything else is ignored
+            with contextlib.suppress(TypeError, ValueError, IndexError):
+                wait = max(0.0, parsedate_to_datetime(value).timestamp() - now)
+
+    for remaining, reset in HTTP_RATELIMIT_HEADERS:
+        value = _header(headers, remaining)
+        if value is None:
+            continue
+
+        try:
+            if float(value) > 0:
+                # We have requests left
+                break
+
+            value = float(_header(headers, reset))
+
+        except (TypeError, ValueError):
+            # No (valid) reset time provided
+            break
+
+        throttled = True
+        if wait is None:
+            wait = max(
+                0.0,
+                value - now if value > HTTP_RATELIMIT_EPOCH else value,
+            )
+        break
+
+    return throttled, (wait if throttled else None)
+
+
+class HTTPSessionPool(metaclass=Singleton):
+    """A process-wide registry of pooled :class:`requests.Session` objects.
+
+    Sessions are keyed by (scheme, host, port, verify) so that consecutive
+    requests to the same upstream re-use an already established TCP (and TLS)
+    connection instead of performing a fresh handshake each time.
+
+    Sessions that have not been used for longer than their idle timeout are
+    evicted (and their connections closed) the next time the registry is
+    accessed.
+    """
+
+    def __init__(self) -> None:
+        # Our session registry; each key maps to a [session, last_used] list
+        self._sessions: dict[tuple, list] = {}
+
+        # Sessions can be requested by several worker threads at once
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(url: str, verify: Union[bool, str] = True) -> tuple:
+        """Returns the pool key associated with the provided URL."""
+        parts = urlsplit(url)
+        schema = parts.scheme.lower()
+        try:
+            port = parts.port
+
+        except ValueError:
+            # An invalid port was specified; let requests deal with it
+            port = None
+
+        return (
+            schema,
+            (parts.hostname or "").lower(),
+            port if port else HTTP_DEFAULT_PORTS.get(schema),
+            verify,
+        )
+
+    def acquire(
+        self,
+        url: str,
+        verify: Union[bool, str] = True,
+        maxsize: int = HTTP_POOL_MAXSIZE,
+        idle_timeout: float = HTTP_POOL_IDLE_TIMEOUT,
+    ) -> requests.Session:
+        """Returns the pooled session to use when contacting the provided
+        URL; one is created if it does not already exist."""
+
+        key = HTTPSessionPool.key(url, verify=verify)
+        reference = time.monotonic()
+
+        with self._lock:
+            expired = self._expire(reference, idle_timeout)
+
+            entry = self._sessions.get(key)
+            if entry is None:
+                entry = [
+                    HTTPSessionPool.new_session(maxsize=maxsize),
+                    reference,
+                ]
+                self._sessions[key] = entry
+                logger.trace(
+                    "HTTP session pool created entry for %s://%s:%s",
+                    *key[:3],
+                )
+
+            else:
+                entry[1] = reference
+
+        # Close expired sessions outside of our lock
+        for session in expired:
+            session.close()
+
+        return entry[0]
+
+    def prune(self, idle_timeout: float = HTTP_POOL_IDLE_TIMEOUT) -> int:
+        """Closes and removes all sessions idle for longer than the specified
+        idle_timeout.
+
+        Returns the number of sessions that were released.
+        """
+        with self._lock:
+            expired = self._expire(time.monotonic(), idle_timeout)
+
+        for session in expired:
+            session.close()
+
+        return len(expired)
+
+    def close(self) -> None:
+        """Closes and removes every pooled session."""
+        with self._lock:
+            sessions = [entry[0] for entry in self._sessions.values()]
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    def _expire(self, reference: float, idle_timeout: float) -> list:
+        """Removes expired entries from our registry and returns their
+        sessions; the caller is expected to hold our lock."""
+
+        if idle_timeout is None or idle_timeout < 0:
+            # Eviction disabled
+            return []
+
+        keys = [
+            key
+            for key, (_, last_used) in self._sessions.items()
+            if (reference - last_used) > idle_timeout
+        ]
+
+        return [self._sessions.pop(key)[0] for key in keys]
+
+    @staticmethod
+    def new_session(maxsize: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+        """Prepares a new session suitable for pooling."""
+        session = requests.Session()
+
+        # Each session only ever speaks to a single destination
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=maxsize)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # Pooled sessions are shared by every plugin contacting the same
+        # upstream server; never retain cookies between requests so that no
+        # state leaks from one Apprise URL to another.
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=()))
+        return session
+
+    def __len__(self) -> int:
+        """Returns the number of pooled sessions."""
+        return len(self._sessions)
+
+
+class PooledRequests:
+    """A drop-in replacement for the module-level requests API (post(),
+    get(), etc) which routes each call through the shared HTTPSessionPool.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = HTTP_POOL_MAXSIZE,
+        idle_timeout: float = HTTP_POOL_IDLE_TIMEOUT,
+    ) -> None:
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+
+    def request(
+        self, method: str, url: str, **kwargs: Any
+    ) -> requests.Response:
+        """Performs our request using a pooled session."""
+        session = HTTPSessionPool().acquire(
+            url,
+            verify=kwargs.get("verify", True),
+            maxsize=self.maxsize,
+            idle_timeout=self.idle_timeout,
+        )
+        return session.request(method, url, **kwargs)
+
+    def get(
+        self, url: str, params: Optional[Any] = None, **kwargs: Any
+    ) -> requests.Response:
+        """Sends a GET request."""
+        return self.request("get", url, params=params, **kwargs)
+
+    def options(self, url: str, **kwargs: Any) -> requests.Response:
+        """Sends an OPTIONS request."""
+        return self.request("options", url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        """Sends a HEAD request."""
+        # Match the behaviour of requests.head()
+        kwargs.setdefault("allow_redirects", False)
+        return self.request("head", url, **kwargs)
+
+    def post(
+        self,
+        url: str,
+        data: Optional[Any] = None,
+        json: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Sends a POST request."""
+        return self.request("post", url, data=data, json=json, **kwargs)
+
+    def put(
+        self, url: str, data: Optional[Any] = None, **kwargs: Any
+    ) -> requests.Response:
+        """Sends a PUT request."""
+        return self.request("put", url, data=data, **kwargs)
+
+    def patch(
+        self, url: str, data: Optional[Any] = None, **kwargs: Any
+    ) -> requests.Response:
+        """Sends a PATCH request."""
+        return self.request("patch", url, data=data, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        """Sends a DELETE request."""
+        return self.request("delete", url, **kwargs)
+
+
+class AsyncHTTPClientPool(metaclass=Singleton):
+    """A registry of :class:`httpx.AsyncClient` objects.
+
+    Asynchronous clients are bound to the event loop they were created in,
+    so one client is maintained per (event loop, verify) pair.  Clients are
+    released automatically once their event loop is garbage collected, or
+    explicitly through aclose().
+    """
+
+    def __init__(self) -> None:
+        # Our clients; keyed by event loop and then by verify
+        self._clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def acquire(
+        self,
+        verify: Union[bool, str] = True,
+        maxsize: int = HTTP_POOL_MAXSIZE,
+    ) -> "httpx.AsyncClient":
+        """Returns the client to use within the running event loop."""
+
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get(verify)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                verify=verify,
+                limits=httpx.Limits(max_keepalive_connections=maxsize),
+                # Never retain cookies between requests
+                cookies=httpx.Cookies(
+                    CookieJar(policy=DefaultCookiePolicy(allowed_domains=()))
+                ),
+            )
+            clients[verify] = client
+
+        return client
+
+    async def aclose(self) -> None:
+        """Closes all clients associated with the running event loop."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+
+class AsyncRequests:
+    """The asynchronous counterpart of the requests module API (post(),
+    get(), etc) used by plugins that implement a native async_send().
+
+    When the httpx library is available and use_native is set, requests are
+    performed directly on the running event loop.  Otherwise each call is
+    handed to the synchronous fallback (the requests module or a
+    PooledRequests object) within the default executor.
+
+    Responses expose the status_code, content, text, headers and json()
+    members shared by both libraries and all transport errors are raised as
+    a requests.RequestException.
+    """
+
+    def __init__(
+        self,
+        fallback: Any = requests,
+        use_native: bool = True,
+        maxsize: int = HTTP_POOL_MAXSIZE,
+    ) -> None:
+        self.fallback = fallback
+        self.maxsize = maxsize
+        self.native = bool(use_native and ASYNC_HTTP_SUPPORT)
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Performs an asynchronous request."""
+        if not self.native:
+            return await self._executor(
+                self.fallback.request, method, url, **kwargs
+            )
+
+        return await self._send(method, url, **kwargs)
+
+    async def get(self, url: str, **kwargs: Any) -> Any:
+        """Sends an asynchronous GET request."""
+        if not self.native:
+            return await self._executor(self.fallback.get, url, **kwargs)
+
+        return await self._send("get", url, **kwargs)
+
+    async def head(self, url: str, **kwargs: Any) -> Any:
+        """Sends an asynchronous HEAD request."""
+        if not self.native:
+            return await self._executor(self.fallback.head, url, **kwargs)
+
+        # Match the behaviour of requests.head()
+        kwargs.setdefault("allow_redirects", False)
+        return await self._send("head", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> Any:
+        """Sends an asynchronous POST request."""
+        if not self.native:
+            return await self._executor(self.fallback.post, url, **kwargs)
+
+        return await self._send("post", url, **kwargs)
+
+    async def put(self, url: str, **kwargs: Any) -> Any:
+        """Sends an asynchronous PUT request."""
+        if not self.native:
+            return await self._executor(self.fallback.put, url, **kwargs)
+
+        return await self._send("put", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs: Any) -> Any:
+        """Sends an asynchronous PATCH request."""
+        if not self.native:
+            return await self._executor(self.fallback.patch, url, **kwargs)
+
+        return await self._send("patch", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs: Any) -> Any:
+        """Sends an asynchronous DELETE request."""
+        if not self.native:
+            return await self._executor(self.fallback.delete, url, **kwargs)
+
+        return await self._send("delete", url, **kwargs)
+
+    @staticmethod
+    async def _executor(fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Runs a blocking request within the default executor; our context
+        is carried over to it."""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, contextvars.copy_context().run, partial(fn, *args, **kwargs)
+        )
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Any] = None,
+        verify: Union[bool, str] = True,
+        timeout: Optional[Any] = None,
+        allow_redirects: Optional[bool] = None,
+        stream: bool = False,
+        **kwargs: Any,
+    ) -> "httpx.Response":
+        """Translates our requests styled arguments to their httpx
+        equivalent and performs the request.
+
+        Responses are always read in full; the stream flag is accepted for
+        compatibility with the requests API only.
+        """
+
+        if isinstance(data, (str, bytes)):
+            # Raw payloads are passed in as content
+            kwargs["content"] = data
+
+        elif hasattr(data, "__aiter__"):
+            # Streamed payloads (such as a StreamBody) are sent as they are
+            # read; their length spares us a chunked transfer
+            kwargs["content"] = data.__aiter__()
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                "Content-Length": str(len(data)),
+            }
+
+        elif data is not None:
+            # Form data
+            kwargs["data"] = data
+
+        if isinstance(timeout, tuple):
+            # requests style (connect, read) timeout
+            timeout = httpx.Timeout(timeout[1], connect=timeout[0])
+
+        client = AsyncHTTPClientPool().acquire(
+            verify=verify, maxsize=self.maxsize
+        )
+
+        try:
+            return await client.request(
+                method.upper(),
+                url,
+                timeout=timeout,
+                follow_redirects=(
+                    (method.lower() != "head")
+                    if allow_redirects is None
+                    else allow_redirects
+                ),
+                **kwargs,
+            )
+
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            raise requests.ConnectionError(str(e)) from e
+
+
+class ResponseHook:
+    """Wraps a requests styled object (such as the requests module itself,
+    PooledRequests or AsyncRequests) so that every response received is also
+    handed to the hook provided.
+
+    Everything else is passed through to the object wrapped as is.
+    """
+
+    def __init__(self, transport: Any, hook: Callable[[Any], None]) -> None:
+        self.transport = transport
+        self.hook = hook
+
+    def __getattr__(self, name: str) -> Any:
+        """Returns the (wrapped) attribute of our transport."""
+        fn = getattr(self.transport, name)
+        if name not in HTTP_METHODS:
+            return fn
+
+        if asyncio.iscoroutinefunction(fn):
+
+            async def _async_call(*args: Any, **kwargs: Any) -> Any:
+                response = await fn(*args, **kwargs)
+                self.hook(response)
+                return response
+
+            return _async_call
+
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            response = fn(*args, **kwargs)
+            self.hook(response)
+            return response
+
+        return _call
@@ -38,6 +38,8 @@ def _token_matches_data(tok, data, match_all):
     entries that are AppriseTag objects with that exact priority match.  When
     the token has no priority prefix, any data entry with the same tag name
     matches regardless of its stored priority.
+
+    The token may also be an AppriseTag that was already parsed.
     """
     ft = AppriseTag.parse(tok)
     tag_name = str(ft)
@@ -62,6 +64,343 @@ def _token_matches_data(tok, data, match_all):
     return False
 
 
+class TagMatcher:
+    """A tag filter compiled once so that it can be matched against any number
+    of services without being parsed again.
+
+    The logic supported is identical to is_exclusive_match().  The tokens of
+    the filter are additionally made available (already parsed) to those
+    needing to inspect the priorities and retries they carry.
+
+    Objects of this class are immutable.
+    """
+
+    __slots__ = (
+        "_steps",
+        "chain_names",
+        "has_priority",
+        "is_all",
+        "logic",
+        "match_all",
+        "match_always",
+        "names",
+        "retry_tokens",
+    )
+
+    # Markers used within our compiled steps
+    _EMPTY = object()
+    _INVALID = object()
+
+    def __init__(
+        self,
+        logic,
+        match_all=common.MATCH_ALL_TAG,
+        match_always=common.MATCH_ALWAYS_TAG,
+    ):
+        """Compile the logic provided (see is_exclusive_match())."""
+        set_ = object.__setattr__
+        set_(self, "logic", logic)
+        set_(self, "match_all", match_all)
+        set_(self, "match_always", match_always)
+
+        #
+        # Matching; each step is or'ed with the next
+        #
+        if isinstance(logic, str):
+            # Update our logic to support our delimiters
+            logic = set(parse_list(logic))
+
+        steps = []
+        if not logic:
+            # If there is no logic to apply then we only match if there is
+            # also no data to match against
+            steps.append(self._EMPTY)
+
+        elif not isinstance(logic, (list, tuple, set)):
+            # garbage input
+            steps.append(self._INVALID)
+
+        else:
+            for entry in (
+                chain(logic, [match_always]) if match_always else logic
+            ):
+                if not isinstance(entry, (str, list, tuple, set)):
+                    # Garbage entry in our logic found
+                    steps.append(self._INVALID)
+                    break
+
+                # All tokens within an entry are AND-ed
+                raw = parse_list(entry)
+                if not raw:
+                    # We got a bogus set of tags to parse; match only if data
+                    # is empty
+                    steps.append(self._EMPTY)
+                    break
+
+                steps.append(tuple(AppriseTag.parse(tok) for tok in raw))
+
+        set_(self, "_steps", tuple(steps))
+
+        #
+        # Token details (used when dispatching our notifications)
+        #
+        logic = self.logic
+        is_all = logic is None or logic == common.MATCH_ALL_TAG
+        set_(self, "is_all", is_all)
+
+        # Flatten our OR tokens; AND groups are kept as a single entry
+        # (identified by an empty name) in chain_names.
+        chain_names = []
+        tokens = []
+        for entry in (
+            ()
+            if is_all
+            else [logic]
+            if isinstance(logic, (str, AppriseTag))
+            else list(logic)
+            if isinstance(logic, (list, tuple, set))
+            else ()
+        ):
+            if isinstance(entry, (list, tuple, set)):
+                flat = [AppriseTag.parse(t) for t in parse_list(entry)]
+                # A single-element list is always a plain OR token (there is
+                # nothing to AND against; this is also the CLI convention)
+                chain_names.append(str(flat[0]) if len(flat) == 1 else "")
+
+            else:
+                flat = [AppriseTag.parse(t) for t in parse_list(str(entry))]
+                chain_names.extend(str(ft) for ft in flat)
+
+            tokens.extend(flat)
+
+        set_(self, "chain_names", tuple(chain_names))
+        set_(self, "names", frozenset(str(ft) for ft in tokens))
+        set_(self, "has_priority", any(ft.has_priority for ft in tokens))
+        set_(
+            self,
+            "retry_tokens",
+            tuple(ft for ft in tokens if ft.retry is not None),
+        )
+
+    @classmethod
+    def compile(
+        cls,
+        logic,
+        match_all=common.MATCH_ALL_TAG,
+        match_always=common.MATCH_ALWAYS_TAG,
+    ):
+        """Returns a TagMatcher for the logic provided; the logic is returned
+        as is if it was already compiled."""
+        if isinstance(logic, cls):
+            return logic
+
+        return cls(logic, match_all=match_all, match_always=match_always)
+
+    def match(self, data):
+        """Returns True if the data (a set of tags) matches our logic."""
+        for step in self._steps:
+            if step is self._INVALID:
+                return False
+
+            if step is self._EMPTY:
+                return not data
+
+            if all(
+                _token_matches_data(ft, data, self.match_all) for ft in step
+            ):
+                return True
+
+        return False
+
+    def candidates(self, index):
+        """Returns the services found in the TagIndex provided that could
+        possibly match our logic.
+
+        None is returned if our logic can not be resolved using the index
+        alone (such as when all services are to be matched).
+        """
+        result = {}
+        for step in self._steps:
+            if not isinstance(step, tuple) or any(
+                str(ft) == self.match_all for ft in step
+            ):
+                return None
+
+            # Every token must match; start with the smallest group
+            groups = sorted((index.lookup(str(ft)) for ft in step), key=len)
+            result.update(
+                (key, server)
+                for key, server in groups[0].items()
+                if all(key in group for group in groups[1:])
+            )
+
+        return result
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} objects are immutable")
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.logic!r})"
+
+
+class TagIndex:
+    """An inverted index of tag names to the services that carry them.
+
+    Services are tracked by identity and in the order they were added so that
+    a TagMatcher can resolve the services it may apply to without having to
+    inspect every one of them.  Configuration entries are only counted; the
+    services they contain are not indexed.
+    """
+
+    def __init__(self):
+        """Initialize our (empty) index."""
+        self.clear()
+
+    def clear(self):
+        """Removes everything from our index."""
+        # Tag name to {id(server): server}
+        self._tags = {}
+
+        # id(server) to [order, tag names, reference count, tags]
+        self._entries = {}
+
+        # The number of configuration entries tracked
+        self.configs = 0
+
+        # The number of services added more than once
+        self.duplicates = 0
+
+        # The total number of entries tracked
+        self.size = 0
+
+        # Used to track the order services were added in
+        self._order = 0
+
+        # The list of services we reflect (and a copy of what it contained)
+        self._source = None
+        self._snapshot = []
+
+    def sync(self, servers):
+        """Ensures our index reflects the list of services provided.
+
+        The index is rebuilt if the list was modified without our knowledge
+        (such as when it is manipulated directly).  Services whose tags were
+        changed since they were indexed are indexed again.
+        """
+        if self._source is not servers or self._snapshot != servers:
+            self.clear()
+            for server in servers:
+                self.add(server)
+
+            self._source = servers
+            return self
+
+        for server in servers:
+            tags = getattr(server, "tags", None)
+            if tags is None:
+                # Configuration entry
+                continue
+
+            entry = self._entries.get(id(server))
+            if entry is None:
+                # This service was given tags after it was added
+                self._source = None
+                return self.sync(servers)
+
+            if entry[3] != tags:
+                self._index(id(server), server, entry, tags)
+
+        return self
+
+    def add(self, server):
+        """Adds a service to our index."""
+        self.size += 1
+        self._snapshot.append(server)
+        tags = getattr(server, "tags", None)
+        if tags is None:
+            # Configuration entry
+            self.configs += 1
+            return
+
+        key = id(server)
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[2] += 1
+            self.duplicates += 1
+            return
+
+        entry = [self._order, set(), 1, None]
+        self._entries[key] = entry
+        self._order += 1
+        self._index(key, server, entry, tags)
+
+    def remove(self, server):
+        """Removes a service from our index."""
+        self.size -= 1
+        try:
+            self._snapshot.remove(server)
+
+        except ValueError:
+            # We are out of sync; we will be rebuilt when next used
+            self._source = None
+
+        if getattr(server, "tags", None) is None:
+            # Configuration entry
+            self.configs -= 1
+            return
+
+        key = id(server)
+        entry = self._entries.get(key)
+        if entry is None:
+            # We are out of sync; we will be rebuilt when next used
+            self._source = None
+            return
+
+        if entry[2] > 1:
+            entry[2] -= 1
+            self.duplicates -= 1
+            return
+
+        del self._entries[key]
+        for name in entry[1]:
+            servers = self._tags[name]
+            del servers[key]
+            if not servers:
+                del self._tags[name]
+
+    def _index(self, key, server, entry, tags):
+        """(Re-)indexes a service under the tags provided."""
+        # Tag names are indexed in lowercase; plain string tags can match a
+        # filter regardless of their case
+        names = {str(tag).lower() for tag in tags}
+        for name in entry[1] - names:
+            servers = self._tags[name]
+            del servers[key]
+            if not servers:
+                del self._tags[name]
+
+        for name in names - entry[1]:
+            self._tags.setdefault(name, {})[key] = server
+
+        # Keep a copy of the tags we indexed so that changes made to them
+        # afterwards can be detected
+        entry[1] = names
+        entry[3] = frozenset(tags)
+
+    def lookup(self, name):
+        """Returns the services ({id(server): server}) tagged with the name
+        specified."""
+        return self._tags.get(name, {})
+
+    def ordered(self, servers):
+        """Returns the services ({id(server): server}) provided in the order
+        they were added to our index."""
+        return [
+            servers[key]
+            for key in sorted(servers, key=lambda k: self._entries[k][0])
+        ]
+
+
 def is_exclusive_match(
     logic,
     data,
@@ -88,50 +427,14 @@ def is_exclusive_match(
 
     If `match_always` is not set to None, then its value is added as an 'or'
     to all specified logic searches.
-    """
 
-    if isinstance(logic, str):
-        # Update our logic to support our delimiters
-        logic = set(parse_list(logic))
-
-    if not logic:
-        # If there is no logic to apply then we're done early; we only match
-        # if there is also no data to match against
-        return not data
-
-    if not isinstance(logic, (list, tuple, set)):
-        # garbage input
-        return False
-
-    if match_always:
-        # Add our match_always to our logic searching if specified
-        logic = chain(logic, [match_always])
-
-    # Track what we match against; but by default we do not match
-    # against anything
-    matched = False
-
-    # Every entry here will be or'ed with the next
-    for entry in logic:
-        if not isinstance(entry, (str, list, tuple, set)):
-            # Garbage entry in our logic found
-            return False
-
-        # All tokens within an entry are AND-ed: every token must match data.
-        raw = parse_list(entry)
-        if not raw:
-            # We got a bogus set of tags to parse; match only if data is empty
-            return not data
-
-        if all(_token_matches_data(tok, data, match_all) for tok in raw):
-            matched = True
-            break
-
-        # else: keep looking
+    The logic may also be a TagMatcher that was previously compiled, in which
+    case match_all and match_always are those it was compiled with.
+    """
 
-    # Return True if we matched against our logic (or simply none was
-    # specified).
-    return matched
+    return TagMatcher.compile(
+        logic, match_all=match_all, match_always=match_always
+    ).match(data)
 
 
 def dict_full_update(dict1, dict2):
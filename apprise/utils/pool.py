@@ -0,0 +1,203 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+from collections import deque
+from collections.abc import Hashable
+import concurrent.futures as cf
+import threading
+from typing import Any, Callable, Optional
+
+from ..logger import logger
+
+
+class WorkerPool:
+    """A long-lived, bounded thread pool used to dispatch notifications.
+
+    The underlying executor is created the first time work is submitted and
+    is re-used by every subsequent call until close() is called; this keeps
+    the thread count steady no matter how often notifications are sent.
+
+    Optionally, the number of workers a single key (such as a notification
+    service) may occupy at any given time can be capped.  Work held back by
+    this cap waits outside of the pool; it never occupies a worker that could
+    otherwise be serving another key.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        key_max_workers: int = 0,
+    ) -> None:
+        """Initialize our pool.
+
+        If no max_workers is specified, the ThreadPoolExecutor default is
+        used.  Setting key_max_workers to a value larger than zero limits
+        the number of workers that can be processing work submitted under the
+        same key at once.
+        """
+
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(
+                "WorkerPool max_workers must be greater than zero."
+            )
+
+        self.max_workers = max_workers
+        self.key_max_workers = max(0, key_max_workers)
+
+        # Our executor (lazily created)
+        self._executor: Optional[cf.ThreadPoolExecutor] = None
+
+        # The number of workers each key currently occupies
+        self._active: dict[Hashable, int] = {}
+
+        # The work held back (per key) until one of its slots frees up
+        self._pending: dict[Hashable, deque] = {}
+
+        # Guards our executor and our per-key accounting
+        self._lock = threading.Lock()
+
+        # Signalled whenever a key releases its last worker
+        self._idle = threading.Condition(self._lock)
+
+    @property
+    def executor(self) -> cf.ThreadPoolExecutor:
+        """Returns our executor; one is created if it does not exist yet."""
+        with self._lock:
+            if self._executor is None:
+                logger.trace(
+                    "Creating notification worker pool (max_workers=%s)",
+                    self.max_workers,
+                )
+                self._executor = cf.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="apprise",
+                )
+
+            return self._executor
+
+    def submit(
+        self,
+        fn: Callable,
+        *args: Any,
+        key: Optional[Hashable] = None,
+        **kwargs: Any,
+    ) -> cf.Future:
+        """Schedules fn(*args, **kwargs) to run within the pool.
+
+        If a key is specified and key_max_workers is set, the call is held
+        back until one of the key's slots frees up.
+        """
+
+        if key is None or not self.key_max_workers:
+            return self.executor.submit(fn, *args, **kwargs)
+
+        future = cf.Future()
+        job = (future, fn, args, kwargs)
+        with self._lock:
+            active = self._active.get(key, 0)
+            if active >= self.key_max_workers:
+                # Wait for one of our running jobs to finish
+                self._pending.setdefault(key, deque()).append(job)
+                return future
+
+            self._active[key] = active + 1
+
+        self._dispatch(key, job)
+        return future
+
+    def close(self, wait: bool = True) -> None:
+        """Shuts down our executor; a new one is created if the pool is used
+        again afterwards.
+
+        Work still being held back by a per-key limit is run first when
+        waiting, otherwise it is cancelled.
+        """
+        with self._lock:
+            if wait:
+                while self._active:
+                    self._idle.wait()
+
+            else:
+                for pending in self._pending.values():
+                    for future, *_ in pending:
+                        future.cancel()
+
+                self._pending.clear()
+
+            executor, self._executor = self._executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _dispatch(self, key: Hashable, job: tuple) -> None:
+        """Hands a job that holds one of the key's slots to our executor."""
+        try:
+            self.executor.submit(self._run, key, job)
+
+        except RuntimeError as e:
+            # Our executor was shut down
+            job[0].set_exception(e)
+            self._release(key)
+
+    def _run(self, key: Hashable, job: tuple) -> None:
+        """Runs a job and passes its slot on to the next one waiting."""
+        future, fn, args, kwargs = job
+        if future.set_running_or_notify_cancel():
+            try:
+                result = fn(*args, **kwargs)
+
+            except BaseException as e:
+                future.set_exception(e)
+
+            else:
+                future.set_result(result)
+
+        self._release(key)
+
+    def _release(self, key: Hashable) -> None:
+        """Frees a key's slot; the next job waiting on the key takes it."""
+        with self._lock:
+            pending = self._pending.get(key)
+            if not pending:
+                self._pending.pop(key, None)
+                self._active[key] -= 1
+                if not self._active[key]:
+                    del self._active[key]
+                    self._idle.notify_all()
+                return
+
+            job = pending.popleft()
+
+        self._dispatch(key, job)
+
+    def __enter__(self) -> "WorkerPool":
+        """Support the 'with' statement."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Release our workers when leaving the 'with' statement."""
+        self.close()
@@ -0,0 +1,426 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, ClassVar, Optional
+
+from ..logger import logger
+from .singleton import Singleton
+
+try:
+    import fcntl
+
+    # Rate limits can be shared between processes
+    FILE_LOCK_SUPPORT = True
+
+except ImportError:
+    # Rate limits stored on disk are only protected within this process
+    FILE_LOCK_SUPPORT = False
+
+# The number of seconds between each sweep of our idle (fully replenished)
+# buckets
+RATELIMIT_PRUNE_INTERVAL = 60.0
+
+# The directory (within the persistent storage path) our buckets are kept in
+# when they are shared between processes; the leading underscore prevents it
+# from being mistaken for a persistent storage namespace
+RATELIMIT_STORAGE_DIR = "_ratelimit"
+
+# The extension used by the buckets stored on disk
+RATELIMIT_FILE_EXTENSION = ".json"
+
+
+class TokenBucket:
+    """A token bucket holding up to burst tokens which are replenished at a
+    rate of one every interval seconds.
+
+    Tokens are reserved rather than waited for; a reservation made while the
+    bucket is empty puts it into debt and returns the number of seconds the
+    caller must wait before its request may be made.  This allows the same
+    bucket to be used by both blocking and asynchronous callers since no lock
+    is ever held while waiting.
+    """
+
+    __slots__ = ("expires", "tokens", "until", "updated")
+
+    def __init__(
+        self,
+        tokens: Optional[float] = None,
+        updated: float = 0.0,
+        until: float = 0.0,
+        expires: float = 0.0,
+    ) -> None:
+        """Initialize our bucket; a bucket with no tokens defined is full."""
+
+        # The tokens available as of our last update (None if full)
+        self.tokens = tokens
+
+        # The time our tokens were last calculated
+        self.updated = updated
+
+        # Nothing may be reserved before this time (used for forced waits)
+        self.until = until
+
+        # The time our bucket is full again (and can be discarded)
+        self.expires = expires
+
+    def reserve(
+        self,
+        interval: float,
+        burst: int = 1,
+        wait: Optional[float] = None,
+        last_io: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> float:
+        """Reserves a token and returns the number of seconds the caller must
+        wait for before making its request.
+
+        A wait forces the caller (and anyone else reserving from this bucket
+        until it elapses) to wait for at least the specified number of
+        seconds.  A last_io identifies the time the last request was made,
+        overriding whatever the bucket was tracking.
+        """
+
+        now = time.time() if now is None else now
+        burst = max(1, int(burst))
+        delay = 0.0
+
+        if interval > 0.0:
+            if last_io is not None:
+                # A request was made at the time specified
+                self.tokens = float(burst - 1)
+                self.updated = last_io
+
+            if self.tokens is None:
+                self.tokens = float(burst)
+
+            elif now > self.updated:
+                # Replenish our tokens
+                self.tokens = min(
+                    float(burst),
+                    self.tokens + (now - self.updated) / interval,
+                )
+
+            self.updated = max(self.updated, now)
+            self.tokens -= 1.0
+            if self.tokens < 0.0:
+                delay = -self.tokens * interval
+
+            self.expires = self.updated + (burst - self.tokens) * interval
+
+        if wait:
+            delay = max(delay, wait)
+            self.until = max(self.until, now + wait)
+
+        elif self.until > now:
+            delay = max(delay, self.until - now)
+
+        self.expires = max(self.expires, self.until)
+        return delay
+
+    def defer(self, wait: float, now: Optional[float] = None) -> None:
+        """Ensures nothing is reserved from our bucket for the number of
+        seconds specified."""
+        now = time.time() if now is None else now
+        self.until = max(self.until, now + wait)
+        self.expires = max(self.expires, self.until)
+
+    def deferred(self, now: Optional[float] = None) -> float:
+        """Returns the number of seconds nothing may be reserved from our
+        bucket for (see defer())."""
+        now = time.time() if now is None else now
+        return max(0.0, self.until - now)
+
+    def dumps(self) -> str:
+        """Returns our bucket as a string."""
+        return json.dumps(
+            [self.tokens, self.updated, self.until, self.expires]
+        )
+
+    @staticmethod
+    def loads(content: str) -> "TokenBucket":
+        """Returns the bucket represented by the string provided; a full
+        bucket is returned if the content can not be interpreted."""
+        try:
+            tokens, updated, until, expires = json.loads(content)
+            return TokenBucket(
+                tokens=None if tokens is None else float(tokens),
+                updated=float(updated),
+                until=float(until),
+                expires=float(expires),
+            )
+
+        except (TypeError, ValueError):
+            # Corrupt or empty content
+            return TokenBucket()
+
+
+class RateLimiter:
+    """The base class of all rate limiters.
+
+    A rate limiter manages a TokenBucket for each key it is provided; all of
+    the plugins reserving tokens under the same key share the same budget.
+    """
+
+    def reserve(
+        self,
+        key: str,
+        interval: float,
+        burst: int = 1,
+        wait: Optional[float] = None,
+        last_io: Optional[float] = None,
+    ) -> float:
+        """Reserves a token from the bucket identified by the key provided
+        and returns the number of seconds the caller must wait for (see
+        TokenBucket.reserve())."""
+
+        now = time.time()
+        return self._update(
+            key,
+            lambda bucket: bucket.reserve(
+                interval, burst=burst, wait=wait, last_io=last_io, now=now
+            ),
+            now,
+        )
+
+    def defer(self, key: str, wait: float) -> None:
+        """Ensures nothing is reserved from the bucket identified by the key
+        provided for the number of seconds specified."""
+        now = time.time()
+        self._update(key, lambda bucket: bucket.defer(wait, now=now), now)
+
+    def deferred(self, key: str) -> float:
+        """Returns the number of seconds nothing may be reserved from the
+        bucket identified by the key provided for (see defer())."""
+        now = time.time()
+        return self._update(key, lambda bucket: bucket.deferred(now=now), now)
+
+    def prune(self) -> int:
+        """Removes every bucket that is full again and returns the number of
+        buckets removed."""
+        return 0
+
+    def _update(
+        self, key: str, fn: Callable[[TokenBucket], Any], now: float
+    ) -> Any:
+        """Applies fn to the bucket identified by key (while no one else is
+        able to) and returns its result."""
+        raise NotImplementedError("_update() is not implemented")
+
+
+class MemoryRateLimiter(RateLimiter, metaclass=Singleton):
+    """A process-wide rate limiter; buckets are shared by every thread (and
+    event loop) of this process."""
+
+    def __init__(self) -> None:
+        # Our buckets
+        self._buckets: dict[str, TokenBucket] = {}
+
+        # The time we last pruned our idle buckets
+        self._pruned = time.time()
+
+        # Buckets are updated by several worker threads at once
+        self._lock = threading.Lock()
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Removes every bucket that is full again and returns the number of
+        buckets removed."""
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._prune(now)
+
+    def clear(self) -> None:
+        """Removes all of our buckets."""
+        with self._lock:
+            self._buckets.clear()
+
+    def _prune(self, now: float) -> int:
+        """Removes every bucket that is full again; the caller is expected to
+        hold our lock."""
+        keys = [k for k, b in self._buckets.items() if b.expires <= now]
+        for key in keys:
+            del self._buckets[key]
+
+        self._pruned = now
+        return len(keys)
+
+    def _update(
+        self, key: str, fn: Callable[[TokenBucket], Any], now: float
+    ) -> Any:
+        """Applies fn to the bucket identified by key."""
+        with self._lock:
+            if (now - self._pruned) > RATELIMIT_PRUNE_INTERVAL:
+                self._prune(now)
+
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket()
+
+            return fn(bucket)
+
+    def deferred(self, key: str) -> float:
+        """Returns the number of seconds nothing may be reserved from the
+        bucket identified by the key provided for (see defer())."""
+        with self._lock:
+            bucket = self._buckets.get(key)
+            return 0.0 if bucket is None else bucket.deferred()
+
+    def __len__(self) -> int:
+        """Returns the number of buckets being tracked."""
+        return len(self._buckets)
+
+
+class FileRateLimiter(RateLimiter):
+    """A rate limiter that keeps its buckets in the directory provided so
+    that they can be shared by every process using it.
+
+    Each bucket is stored in its own file and is locked while it is being
+    updated; the limiter falls back to the MemoryRateLimiter should the
+    directory not be accessible.
+
+    Use instance() to acquire the limiter shared by everyone (within our
+    process) using the same directory.
+    """
+
+    # Our rate limiters by directory
+    _instances: ClassVar[dict[str, "FileRateLimiter"]] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: str) -> None:
+        """Initialize our rate limiter."""
+
+        # The directory our buckets are kept in
+        self.path = path
+
+        # Protects our buckets from the other threads of this process (and
+        # from other processes too if file locking is not supported)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def instance(cls, path: str) -> "FileRateLimiter":
+        """Returns the rate limiter shared by everyone using the directory
+        provided."""
+        with cls._instances_lock:
+            limiter = cls._instances.get(path)
+            if limiter is None:
+                limiter = cls._instances[path] = cls(path)
+            return limiter
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Removes every bucket that is full again and returns the number of
+        buckets removed."""
+        now = time.time() if now is None else now
+        try:
+            entries = [
+                e.path
+                for e in os.scandir(self.path)
+                if e.name.endswith(RATELIMIT_FILE_EXTENSION)
+            ]
+
+        except OSError:
+            # Nothing to prune
+            return 0
+
+        removed = 0
+        with self._lock:
+            for path in entries:
+                with contextlib.suppress(OSError), self._open(path) as fp:
+                    if TokenBucket.loads(fp.read()).expires > now:
+                        continue
+
+                    os.unlink(path)
+                    removed += 1
+
+        return removed
+
+    def deferred(self, key: str) -> float:
+        """Returns the number of seconds nothing may be reserved from the
+        bucket identified by the key provided for (see defer())."""
+        if not os.path.exists(self._path(key)):
+            # Nothing was ever deferred
+            return 0.0
+
+        return super().deferred(key)
+
+    def _path(self, key: str) -> str:
+        """Returns the path of the file the bucket identified by the key
+        provided is kept in."""
+        return os.path.join(
+            self.path,
+            hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+            + RATELIMIT_FILE_EXTENSION,
+        )
+
+    def _update(
+        self, key: str, fn: Callable[[TokenBucket], Any], now: float
+    ) -> Any:
+        """Applies fn to the bucket identified by key."""
+        path = self._path(key)
+
+        try:
+            with self._lock, self._open(path) as fp:
+                bucket = TokenBucket.loads(fp.read())
+                result = fn(bucket)
+
+                fp.seek(0)
+                fp.truncate()
+                fp.write(bucket.dumps())
+                return result
+
+        except OSError as e:
+            logger.warning(
+                "Could not access the rate limits stored in %s; "
+                "they are only tracked in memory",
+                self.path,
+            )
+            logger.debug("Rate limit storage exception: %s", e)
+
+        return MemoryRateLimiter()._update(key, fn, now)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _open(path: str):
+        """Opens (creating if needed) and locks the file specified."""
+        try:
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        except FileNotFoundError:
+            # Our directory is (re)created only when it is found missing
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+
+        with os.fdopen(fd, "r+", encoding="utf-8") as fp:
+            if FILE_LOCK_SUPPORT:
+                # Released when our file is closed
+                fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+
+            yield fp
@@ -0,0 +1,261 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterable, Iterator
+from functools import partial
+import json
+import re
+from typing import Any, Callable, Optional, Union
+import uuid
+
+from .. import exception
+from ..attachment.base import AttachBase
+from .json import AppriseJSONEncoder
+
+# The amount of attachment content read at once while a body is streamed;
+# a multiple of 3 so that base64 encoded chunks can simply be concatenated
+# 768KB = 786432 bytes
+STREAM_CHUNK_SIZE = 786432
+
+# A part of a StreamBody; either its content or a callable returning an
+# iterator of it
+StreamPart = Union[bytes, Callable[[], Iterable[bytes]]]
+
+
+def base64_length(size: int) -> int:
+    """Returns the length of ``size`` bytes once they are base64 encoded."""
+    return -(-size // 3) * 4
+
+
+class StreamBody:
+    """A request body assembled from its parts while it is being sent.
+
+    Every part is accompanied by its length so that the body can be sent
+    with a Content-Length header, yet only a chunk of it is ever held in
+    memory; the memory used is the same no matter how large the attachments
+    making it up are.
+
+    The object can be handed to the http (or async_http) property as the
+    data of a request.
+    """
+
+    def __init__(
+        self,
+        parts: list[tuple[int, StreamPart]],
+        content_type: str,
+    ) -> None:
+        # A list of (length, part) tuples
+        self.parts = parts
+
+        # The Content-Type to send the body with
+        self.content_type = content_type
+
+        # The total length of our body
+        self.length = sum(length for length, _ in parts)
+
+        # Prepare ourselves for reading
+        self.seek(0)
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yields the content of our body one chunk at a time."""
+        for _, part in self.parts:
+            if isinstance(part, bytes):
+                if part:
+                    yield part
+                continue
+
+            yield from part()
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Yields the content of our body one chunk at a time."""
+        for chunk in self:
+            yield chunk
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Reads (at most) size bytes from our body; everything remaining is
+        read if no size is specified."""
+        if size is None or size < 0:
+            data = self._chunk[self._offset :] + b"".join(self._chunks)
+            self._chunk, self._offset = b"", 0
+            self._position += len(data)
+            return data
+
+        pieces = []
+        while size > 0:
+            if self._offset >= len(self._chunk):
+                self._chunk, self._offset = next(self._chunks, b""), 0
+                if not self._chunk:
+                    # We're done
+                    break
+
+            piece = self._chunk[self._offset : self._offset + size]
+            self._offset += len(piece)
+            size -= len(piece)
+            pieces.append(piece)
+
+        data = b"".join(pieces)
+        self._position += len(data)
+        return data
+
+    def tell(self) -> int:
+        """Returns how much of our body has been read."""
+        return self._position
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        """Rewinds our body (such as when a request is redirected); seeking
+        anywhere else than its start is not supported."""
+        if offset or whence:
+            raise OSError("A streamed body can only be rewound to its start")
+
+        self._chunks = iter(self)
+        self._chunk = b""
+        self._offset = 0
+        self._position = 0
+        return 0
+
+    def __len__(self) -> int:
+        """Returns the length of our body."""
+        return self.length
+
+
+def _verify(attachment: AttachBase) -> AttachBase:
+    """Ensures the attachment about to be streamed is accessible."""
+    if not attachment:
+        raise exception.AppriseFileNotFound("Attachment Missing")
+
+    return attachment
+
+
+def json_body(
+    payload: Any,
+    content_type: str = "application/json",
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> StreamBody:
+    """Returns the payload serialized as a JSON StreamBody.
+
+    The content of every attachment (AttachBase) found in the payload is
+    streamed as a base64 encoded string in its place. An
+    AppriseFileNotFound exception is thrown if one can not be accessed.
+    """
+
+    # A token no payload should otherwise contain
+    token = uuid.uuid4().hex
+    attachments = []
+
+    class StreamEncoder(AppriseJSONEncoder):
+        def default(self, entry):
+            # Anything able to stream its base64 encoded content (such as
+            # an AttachBase) is streamed
+            if callable(getattr(entry, "base64_chunks", None)):
+                attachments.append(_verify(entry))
+                return f"{token}{len(attachments) - 1}"
+
+            return super().default(entry)
+
+    parts = []
+    content = json.dumps(payload, cls=StreamEncoder)
+    for no, piece in enumerate(re.split(f"{token}([0-9]+)", content)):
+        if no % 2:
+            attachment = attachments[int(piece)]
+            parts.append(
+                (
+                    base64_length(len(attachment)),
+                    partial(attachment.base64_chunks, chunk_size),
+                )
+            )
+
+        else:
+            piece = piece.encode("utf-8")
+            parts.append((len(piece), piece))
+
+    return StreamBody(parts, content_type)
+
+
+def multipart_body(
+    fields: Optional[dict[str, Any]] = None,
+    files: Optional[Iterable[tuple[str, tuple[str, AttachBase, str]]]] = None,
+    boundary: Optional[str] = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> StreamBody:
+    """Returns a multipart/form-data StreamBody.
+
+    The files are specified like they would be to the requests library, a
+    list of (name, (filename, attachment, mimetype)) tuples, except that an
+    attachment takes the place of the file object. An AppriseFileNotFound
+    exception is thrown if one can not be accessed.
+    """
+
+    if not boundary:
+        boundary = uuid.uuid4().hex
+
+    def quote(value: Any) -> str:
+        """Escapes a header parameter the way browsers (and requests) do."""
+        return (
+            str(value)
+            .replace("\\", "\\\\")
+            .replace('"', "%22")
+            .replace("\r", "%0D")
+            .replace("\n", "%0A")
+        )
+
+    parts = []
+    for name, value in (fields or {}).items():
+        for entry in value if isinstance(value, (list, tuple)) else [value]:
+            content = (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{quote(name)}"'
+                "\r\n\r\n"
+            ).encode()
+            content += (
+                entry if isinstance(entry, bytes) else str(entry).encode()
+            ) + b"\r\n"
+            parts.append((len(content), content))
+
+    for name, (filename, attachment, mimetype) in files or ():
+        header = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{quote(name)}"; '
+            f'filename="{quote(filename)}"\r\n'
+            f"Content-Type: {mimetype}\r\n\r\n"
+        ).encode()
+        parts.extend(
+            (
+                (len(header), header),
+                (
+                    len(_verify(attachment)),
+                    partial(attachment.chunk, chunk_size),
+                ),
+                (2, b"\r\n"),
+            )
+        )
+
+    closing = f"--{boundary}--\r\n".encode()
+    parts.append((len(closing), closing))
+
+    return StreamBody(parts, f"multipart/form-data; boundary={boundary}")
@@ -98,6 +98,7 @@ class AppriseWKDController:
         verify_certificate=True,
         request_timeout=(4, 4),
         allow_redirects=True,
+        http=None,
     ):
         """Initialise the WKD controller.
 
@@ -110,6 +111,9 @@ class AppriseWKDController:
                 deployments commonly redirect (e.g. shared hosting), so
                 this defaults to True.  Set to False to require a direct
                 response from the WKD host.
+            http: Optional requests styled object our requests are made
+                through (such as the http property of a plugin); the
+                requests module is used by default.
         """
 
         # Prepare our Asset Object
@@ -126,6 +130,9 @@ class AppriseWKDController:
         # Whether to follow HTTP redirects
         self.allow_redirects = allow_redirects
 
+        # The object our HTTP requests are made through
+        self.http = requests if http is None else http
+
         # In-memory cache: lower-cased email -> {data, expires}
         self._cache = {}
 
@@ -275,7 +282,7 @@ class AppriseWKDController:
         logger.debug("WKD GET %s", url)
 
         try:
-            with requests.get(
+            with self.http.get(
                 url,
                 headers={"User-Agent": self.asset.app_id},
                 verify=self.verify_certificate,
@@ -0,0 +1,366 @@
+#!/usr/bin/env python
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Startup-time and import-cost benchmarks for the Apprise library and CLI.
+
+Every benchmark runs offline; remote configuration and notifications are
+served by a local stand-in HTTP server.  The results are written as JSON so
+that they can be kept and compared against later runs:
+
+    python bin/benchmark.py --output baseline.json
+    python bin/benchmark.py --baseline baseline.json
+
+When a baseline is provided, the script exits with a non-zero return code if
+any benchmark is slower than the baseline by more than the tolerance allowed.
+"""
+
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+from os.path import abspath, dirname, join
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Always benchmark the source code found alongside this script
+ROOT_PATH = dirname(dirname(abspath(__file__)))
+sys.path.insert(0, ROOT_PATH)
+
+import apprise  # noqa: E402
+
+# The number of times each benchmark is run by default
+DEFAULT_RUNS = 5
+
+# The slowdown (as a fraction of the baseline) tolerated before a benchmark
+# is reported as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# The number of services defined in our generated configuration files
+CONFIG_ENTRIES = 1000
+
+# The plugins our generated URLs are spread across
+SCHEMAS = ("json", "xml", "form")
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves our generated configuration and accepts any notification."""
+
+    def do_GET(self):
+        content = self.server.content.get(self.path)
+        if content is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        self._respond(content)
+
+    def do_POST(self):
+        # Consume (and ignore) our payload
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+        # Configuration is also retrieved using a POST
+        self._respond(self.server.content.get(self.path, ""))
+
+    def _respond(self, content):
+        content = content.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        # Keep our output clean
+        pass
+
+
+def generate_urls(count, port):
+    """Returns a list of URLs pointing to our stand-in server."""
+    return [
+        f"{SCHEMAS[no % len(SCHEMAS)]}://127.0.0.1:{port}/{no}"
+        for no in range(count)
+    ]
+
+
+def generate_text_config(count, port):
+    """Returns a TEXT configuration defining the number of services
+    specified."""
+    return "\n".join(
+        f"tag{no % 10}={url}"
+        for no, url in enumerate(generate_urls(count, port))
+    )
+
+
+def generate_yaml_config(count, port):
+    """Returns a YAML configuration defining the number of services
+    specified."""
+    lines = ["version: 1", "urls:"]
+    for no, url in enumerate(generate_urls(count, port)):
+        lines.extend((f"  - {url}:", f"      tag: tag{no % 10}"))
+
+    return "\n".join(lines)
+
+
+def run_python(code, *args, env=None):
+    """Runs the code provided in a fresh Python interpreter and returns how
+    long it took."""
+    t_start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code, *args],
+        env=env,
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - t_start
+
+
+def build_benchmarks(port, tmp_path):
+    """Returns a dictionary of our benchmarks.
+
+    Each benchmark is a callable returning the number of seconds a single
+    run took.
+    """
+
+    # Our child processes must not pick up the developer's own configuration
+    # or plugins and must load the source code being benchmarked.
+    env = dict(
+        os.environ,
+        PYTHONPATH=os.pathsep.join(
+            [ROOT_PATH, *filter(None, [os.environ.get("PYTHONPATH")])]
+        ),
+        APPRISE_PLUGIN_PATH=join(tmp_path, "plugins"),
+        APPRISE_STORAGE_PATH=join(tmp_path, "storage"),
+        APPRISE_PLUGIN_INDEX_PATH="",
+    )
+    indexed_env = dict(
+        env, APPRISE_PLUGIN_INDEX_PATH=join(tmp_path, "plugins.json")
+    )
+
+    cli = "from apprise.cli import main; main()"
+    cli_args = ("--dry-run", "-b", "benchmark", *generate_urls(3, port))
+
+    text_config = generate_text_config(CONFIG_ENTRIES, port)
+    yaml_config = generate_yaml_config(CONFIG_ENTRIES, port)
+
+    def add(count):
+        urls = generate_urls(count, port)
+
+        def _run():
+            t_start = time.perf_counter()
+            apprise.Apprise().add(urls)
+            return time.perf_counter() - t_start
+
+        return _run
+
+    def config(content, fmt):
+        def _run():
+            t_start = time.perf_counter()
+            ac = apprise.AppriseConfig()
+            ac.add_config(content, format=fmt)
+            assert len(ac.servers()) == CONFIG_ENTRIES
+            return time.perf_counter() - t_start
+
+        return _run
+
+    def config_http():
+        t_start = time.perf_counter()
+        ac = apprise.AppriseConfig(
+            f"http://127.0.0.1:{port}/config.txt", cache=False
+        )
+        assert len(ac.servers()) == CONFIG_ENTRIES
+        return time.perf_counter() - t_start
+
+    def notify(count):
+        a = apprise.Apprise()
+        a.add(generate_urls(count, port))
+
+        def _run():
+            t_start = time.perf_counter()
+            assert a.notify("benchmark")
+            return time.perf_counter() - t_start
+
+        return _run
+
+    def cli_indexed():
+        # Ensure our index is built before we time anything
+        if not os.path.exists(indexed_env["APPRISE_PLUGIN_INDEX_PATH"]):
+            run_python(cli, *cli_args, env=indexed_env)
+        return run_python(cli, *cli_args, env=indexed_env)
+
+    return {
+        "import": lambda: run_python("import apprise", env=env),
+        "add.1": add(1),
+        "add.100": add(100),
+        "add.10000": add(10000),
+        f"config.text.{CONFIG_ENTRIES}": config(text_config, "text"),
+        f"config.yaml.{CONFIG_ENTRIES}": config(yaml_config, "yaml"),
+        f"config.http.{CONFIG_ENTRIES}": config_http,
+        "notify.10": notify(10),
+        "cli.dry_run": lambda: run_python(cli, *cli_args, env=env),
+        "cli.dry_run.indexed": cli_indexed,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Returns a list of the benchmarks that regressed compared to the
+    baseline provided."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+
+        ratio = result["median"] / previous["median"]
+        if ratio > 1.0 + tolerance:
+            regressions.append(
+                {
+                    "name": name,
+                    "median": result["median"],
+                    "baseline": previous["median"],
+                    "ratio": round(ratio, 3),
+                }
+            )
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the Apprise library and CLI."
+    )
+    parser.add_argument(
+        "-r",
+        "--runs",
+        type=int,
+        default=DEFAULT_RUNS,
+        help="The number of times each benchmark is run "
+        f"(default: {DEFAULT_RUNS}).",
+    )
+    parser.add_argument(
+        "-k",
+        "--keyword",
+        action="append",
+        default=[],
+        help="Only run the benchmarks whose name contains this keyword; "
+        "can be specified more than once.",
+    )
+    parser.add_argument(
+        "-o", "--output", help="Write our results to this file."
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        help="Compare our results against a previously written file.",
+    )
+    parser.add_argument(
+        "-t",
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="The slowdown tolerated when comparing against a baseline "
+        f"(default: {DEFAULT_TOLERANCE}).",
+    )
+    args = parser.parse_args()
+
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+
+    # Start our stand-in server
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    server.daemon_threads = True
+    port = server.server_address[1]
+    server.content = {
+        "/config.txt": generate_text_config(CONFIG_ENTRIES, port),
+    }
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    results = {}
+    try:
+        with tempfile.TemporaryDirectory() as tmp_path:
+            benchmarks = build_benchmarks(port, tmp_path)
+            for name, fn in benchmarks.items():
+                if args.keyword and not any(k in name for k in args.keyword):
+                    continue
+
+                timings = [fn() for _ in range(args.runs)]
+                results[name] = {
+                    "median": round(statistics.median(timings), 6),
+                    "min": round(min(timings), 6),
+                    "max": round(max(timings), 6),
+                    "runs": args.runs,
+                }
+                sys.stderr.write(
+                    f"{name:<24} {results[name]['median']:.4f}s\n"
+                )
+
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    report = {
+        "apprise": apprise.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": int(time.time()),
+        "results": results,
+    }
+
+    status = 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fp:
+            report["regressions"] = compare(
+                results, json.load(fp), args.tolerance
+            )
+
+        for entry in report["regressions"]:
+            sys.stderr.write(
+                f"REGRESSION: {entry['name']} took {entry['median']:.4f}s"
+                f" (baseline {entry['baseline']:.4f}s)\n"
+            )
+        status = 1 if report["regressions"] else 0
+
+    content = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fp:
+            fp.write(content + "\n")
+
+    else:
+        sys.stdout.write(content + "\n")
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -68,6 +68,7 @@ def no_throttling_everywhere(mocker):
     teardown effectively O(n^2).
     """
     # Ensure we're working with a clean slate for each test
+    N_MGR.index_path = None
     N_MGR.unload_modules()
     C_MGR.unload_modules()
     A_MGR.unload_modules()
@@ -27,11 +27,13 @@
 
 from .asyncio import OuterEventLoop
 from .environment import environ
+from .http import AsyncHTTPMock
 from .module import reload_plugin
 from .rest import AppriseURLTester
 
 __all__ = [
     "AppriseURLTester",
+    "AsyncHTTPMock",
     "OuterEventLoop",
     "environ",
     "reload_plugin",
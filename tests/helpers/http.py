@@ -0,0 +1,69 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+from unittest import mock
+
+from apprise.utils.http import ASYNC_HTTP_SUPPORT, AsyncHTTPClientPool
+
+if ASYNC_HTTP_SUPPORT:
+    import httpx
+
+
+class AsyncHTTPMock:
+    """Routes every request made over the native (httpx) async transport to
+    a mock handler for the duration of a with block.
+
+    Each request received is kept (in order) in ``requests``; the
+    ``status_code`` and ``content`` returned can be altered at any time and
+    setting ``error`` causes a connection error to be raised instead.
+    """
+
+    def __init__(self, status_code=200, content=b"{}"):
+        self.status_code = status_code
+        self.content = content
+        self.error = False
+        self.requests = []
+        self._patch = mock.patch.object(
+            AsyncHTTPClientPool, "acquire", self._acquire
+        )
+
+    def __enter__(self):
+        self._patch.start()
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self._patch.stop()
+
+    def _acquire(self, verify=True, maxsize=10):
+        return httpx.AsyncClient(transport=httpx.MockTransport(self._handler))
+
+    def _handler(self, request):
+        self.requests.append(request)
+        if self.error:
+            raise httpx.ConnectError("refused", request=request)
+
+        return httpx.Response(self.status_code, content=self.content)
@@ -46,6 +46,7 @@ from apprise import (
     Apprise,
     AppriseAsset,
     AppriseAttachment,
+    AppriseConfig,
     NotificationManager,
     NotifyBase,
     NotifyFormat,
@@ -57,6 +58,7 @@ from apprise import (
 )
 from apprise.locale import LazyTranslation, gettext_lazy as _
 from apprise.plugins.base import RequirementsSpec
+from apprise.utils.logic import TagMatcher
 from apprise.utils.parse import parse_list
 
 logging.disable(logging.CRITICAL)
@@ -831,6 +833,86 @@ def apprise_tagging_test(mock_request, do_notify):
     )
 
 
+def test_apprise_find_tag_index():
+    """
+    API: Apprise() find() resolves services using a tag index
+
+    """
+    a = Apprise()
+    assert a.add(
+        [
+            "json://localhost/a/",
+            "json://localhost/b/",
+            "json://localhost/c/",
+        ],
+        tag="TagA",
+    )
+    assert a.add("json://localhost/d/", tag="TagB, TagC")
+    assert a.add("json://localhost/e/", tag="TagC")
+    assert a.add("json://localhost/f/")
+
+    urls = [s.url(privacy=True) for s in a.servers]
+
+    def found(*args, **kwargs):
+        return [
+            urls.index(s.url(privacy=True)) for s in a.find(*args, **kwargs)
+        ]
+
+    # Services are always returned in the order they were added
+    assert found("TagA") == [0, 1, 2]
+    assert found("TagC") == [3, 4]
+    assert found(["TagC", "TagA"]) == [0, 1, 2, 3, 4]
+    assert found([("TagB", "TagC")]) == [3]
+    assert found("absent") == []
+    assert found() == [0, 1, 2, 3, 4, 5]
+    assert found(None) == [5]
+    assert found("all") == [0, 1, 2, 3, 4, 5]
+
+    # A pre-compiled matcher can be used too
+    matcher = TagMatcher.compile("TagC")
+    assert found(matcher) == [3, 4]
+
+    # Removing services keeps our index up to date
+    a.pop(0)
+    urls.pop(0)
+    assert found("TagA") == [0, 1]
+
+    # Services manipulated directly are still found
+    a.servers.insert(0, Apprise.instantiate("json://localhost/h/", tag="TagC"))
+    urls.insert(0, a.servers[0].url(privacy=True))
+    assert found("TagC") == [0, 3, 4]
+    del a.servers[0]
+    del urls[0]
+
+    # Services added more than once are returned more than once
+    a.servers.append(a.servers[0])
+    urls.append(urls[0])
+    assert len(list(a.find("TagA"))) == 3
+    a.servers.pop()
+    urls.pop()
+
+    # Configuration entries are still inspected
+    ac = AppriseConfig()
+    assert ac.add_config("TagA=json://localhost/g/", format="text")
+    a.add(ac)
+    assert len(list(a.find("TagA"))) == 3
+    assert len(list(a.find("TagC"))) == 2
+
+    a.clear()
+    assert found("TagA") == []
+    assert found("all") == []
+
+    # Tags changed after a service was added are honoured
+    a = Apprise()
+    assert a.add("json://localhost/", tag="old")
+    assert len(list(a.find("old"))) == 1
+    a.servers[0].tags = {"new"}
+    assert list(a.find("new")) == [a.servers[0]]
+    assert list(a.find("old")) == []
+    a.servers[0].tags.add("other")
+    assert list(a.find("other")) == [a.servers[0]]
+
+
 def test_apprise_schemas():
     """
     API: Apprise().schema() tests
@@ -25,12 +25,15 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
+import base64
 from inspect import cleandoc
 import json
 
 # Disable logging for a cleaner testing output
 import logging
 from os.path import dirname, getsize, join
+import threading
 from unittest import mock
 
 import pytest
@@ -39,6 +42,7 @@ import requests
 from apprise import Apprise, AppriseAsset, AttachmentManager
 from apprise.apprise_attachment import AppriseAttachment
 from apprise.attachment import AttachBase
+from apprise.attachment.http import AttachHTTP
 from apprise.common import ContentLocation
 from apprise.logger import LogCapture
 
@@ -354,6 +358,175 @@ def test_apprise_attachment_truncate(mock_request):
     assert len(dataset["attachments"]) == 2
 
 
+@mock.patch("requests.request")
+def test_apprise_attachment_shared(mock_request, tmpdir):
+    """
+    API: AppriseAttachment encodes its content once while shared
+
+    """
+
+    # Prepare our response
+    response = requests.Request()
+    response.status_code = requests.codes.ok
+    mock_request.return_value = response
+
+    path = tmpdir.join("content.txt")
+    path.write("apprise" * 1000)
+
+    aa = AppriseAttachment(str(path))
+    attachment = aa[0]
+    expected = attachment.base64()
+
+    with mock.patch("base64.b64encode", wraps=base64.b64encode) as mock_enc:
+        # Outside of a shared context content is encoded on every call
+        assert attachment.base64() == expected
+        assert attachment.base64() == expected
+        assert mock_enc.call_count == 2
+        mock_enc.reset_mock()
+
+        with aa.shared():
+            assert attachment.base64() == expected
+            assert attachment.base64(encoding=None) == expected.encode()
+
+            # Contexts can be nested; the encoding is kept until the
+            # outermost one is left
+            with aa.shared():
+                assert attachment.base64() == expected
+            assert attachment.base64() == expected
+            assert mock_enc.call_count == 1
+
+            # Changed content is detected and re-encoded
+            path.write("changed")
+            assert attachment.base64() == "Y2hhbmdlZA=="
+            assert mock_enc.call_count == 2
+
+        # Our encoding was released
+        assert attachment.base64() == "Y2hhbmdlZA=="
+        assert mock_enc.call_count == 3
+        mock_enc.reset_mock()
+
+        # Large encodings are spooled to disk rather than held in memory
+        path.write("apprise" * 1000)
+        with (
+            mock.patch.object(attachment, "max_shared_memory_size", 10),
+            aa.shared(),
+        ):
+            assert attachment.base64() == expected
+            assert attachment.base64() == expected
+            assert mock_enc.call_count == 1
+
+            # Invalidating the attachment releases its encoding too
+            attachment.invalidate()
+            assert attachment.base64() == expected
+            assert mock_enc.call_count == 2
+        mock_enc.reset_mock()
+
+        # Every service notified shares the same encoding
+        ap_obj = Apprise()
+        for idx in range(3):
+            assert ap_obj.add(f"json://localhost/{idx}")
+
+        assert ap_obj.notify(body="body", attach=str(path))
+        assert mock_request.call_count == 3
+        assert mock_enc.call_count == 1
+        for call in mock_request.call_args_list:
+            dataset = json.loads(call[1]["data"])
+            assert dataset["attachments"][0]["base64"] == expected
+        mock_request.reset_mock()
+        mock_enc.reset_mock()
+
+        # The same applies to asynchronous notifications
+        assert asyncio.run(ap_obj.async_notify(body="body", attach=aa))
+        assert mock_request.call_count == 3
+        assert mock_enc.call_count == 1
+
+
+@mock.patch("requests.request")
+def test_apprise_attachment_prefetch(mock_request, tmpdir):
+    """
+    API: AppriseAttachment retrieves its remote attachments concurrently
+
+    """
+
+    # Prepare our response
+    response = requests.Request()
+    response.status_code = requests.codes.ok
+    mock_request.return_value = response
+
+    path = tmpdir.join("content.txt")
+    path.write("apprise")
+
+    # Every download has to be in progress at once for any of them to finish
+    barrier = threading.Barrier(3, timeout=5)
+
+    def download(self, **kwargs):
+        barrier.wait()
+        self.download_path = str(path)
+        return True
+
+    urls = [f"http://localhost/{idx}.txt" for idx in range(3)]
+    aa = AppriseAttachment([*urls, str(path)])
+    with mock.patch.object(
+        AttachHTTP, "download", autospec=True, side_effect=download
+    ) as mock_download:
+        assert aa.prefetch()
+        assert mock_download.call_count == 3
+        assert all(
+            a.exists(retrieve_if_missing=False) for a in aa.attachments[:3]
+        )
+
+        # Nothing left to retrieve
+        assert aa.prefetch()
+        assert mock_download.call_count == 3
+
+    # Failed retrievals are reported
+    aa = AppriseAttachment(urls[:2])
+    with mock.patch.object(AttachHTTP, "download", return_value=False):
+        assert not aa.prefetch()
+
+    with mock.patch.object(AttachHTTP, "download", side_effect=OSError()):
+        assert not aa.prefetch()
+
+    # Retrievals are left to carry on past our timeout
+    release = threading.Event()
+
+    def slow_download(self, **kwargs):
+        release.wait(5)
+        self.download_path = str(path)
+        return True
+
+    aa = AppriseAttachment(urls)
+    with mock.patch.object(
+        AttachHTTP, "download", autospec=True, side_effect=slow_download
+    ):
+        assert not aa.prefetch(timeout=0.01, max_workers=1)
+        release.set()
+
+        # Accessing our attachments waits on them
+        assert all(a.exists() for a in aa)
+
+    # notify() retrieves its attachments up front
+    asset = AppriseAsset(attach_prefetch_timeout=10.0, attach_max_workers=2)
+    ap_obj = Apprise(asset=asset)
+    assert ap_obj.add("json://localhost")
+    aa = AppriseAttachment(str(path))
+    with mock.patch.object(
+        AppriseAttachment, "prefetch", autospec=True, return_value=True
+    ) as mock_prefetch:
+        assert ap_obj.notify(body="body", attach=aa)
+        mock_prefetch.assert_called_once_with(aa, timeout=10.0, max_workers=2)
+        mock_prefetch.reset_mock()
+
+        assert asyncio.run(ap_obj.async_notify(body="body", attach=aa))
+        mock_prefetch.assert_called_once_with(aa, timeout=10.0, max_workers=2)
+        mock_prefetch.reset_mock()
+
+        # Nothing is retrieved without attachments
+        assert ap_obj.notify(body="body")
+        assert asyncio.run(ap_obj.async_notify(body="body"))
+        assert mock_prefetch.call_count == 0
+
+
 def test_apprise_attachment_instantiate():
     """
     API: AppriseAttachment.instantiate()
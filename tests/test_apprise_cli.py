@@ -2674,6 +2674,51 @@ def test_apprise_cli_windows_env(mock_system):
     reload(cli)
 
 
+def test_apprise_cli_plugin_index(tmpdir):
+    """
+    CLI: Plugin Index
+
+    """
+    runner = CliRunner()
+    path = tmpdir.join("index", "plugins.json")
+
+    # Start with no plugins loaded (as the CLI would)
+    N_MGR.unload_modules()
+
+    try:
+        with environ(APPRISE_PLUGIN_INDEX_PATH=str(path)):
+            result = runner.invoke(
+                cli.main,
+                ["-b", "test", "--dry-run", "json://localhost"],
+            )
+            assert result.exit_code == 0
+            assert N_MGR.index_path == str(path)
+            assert path.isfile()
+
+            # Our index is used the next time around
+            N_MGR.unload_modules()
+            result = runner.invoke(
+                cli.main,
+                ["-b", "test", "--dry-run", "json://localhost"],
+            )
+            assert result.exit_code == 0
+            assert "json" in N_MGR._schema_map
+            assert "xml" not in N_MGR._schema_map
+
+        # The index can be disabled
+        with environ(APPRISE_PLUGIN_INDEX_PATH=""):
+            result = runner.invoke(
+                cli.main,
+                ["-b", "test", "--dry-run", "json://localhost"],
+            )
+            assert result.exit_code == 0
+            assert N_MGR.index_path is None
+
+    finally:
+        N_MGR.index_path = None
+        N_MGR.unload_modules()
+
+
 @mock.patch("apprise.cli.NotificationManager")
 @mock.patch("importlib.metadata.packages_distributions", create=True)
 @mock.patch("importlib.metadata.version")
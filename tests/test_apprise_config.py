@@ -27,7 +27,9 @@
 
 # Disable logging for a cleaner testing output
 import logging
+import os
 import sys
+import threading
 import time
 from unittest import mock
 
@@ -905,6 +907,90 @@ include strict://{cfg04!s}""")
     assert len(ac.servers()) == 3
 
 
+def test_parallel_config_inclusion(tmpdir):
+    """
+    API: AppriseConfig() includes are retrieved concurrently
+
+    """
+    suite = tmpdir.mkdir("apprise_config_parallel")
+    shared = suite.join("shared.cfg")
+    shared.write("json://shared\n")
+
+    teams = []
+    for no in range(3):
+        team = suite.join(f"team{no}.cfg")
+        team.write(
+            f"json://team{no}\n"
+            # Two of our teams include the same file
+            + ("include shared.cfg\n" if no else "")
+        )
+        teams.append(team)
+
+    root = suite.join("root.cfg")
+    root.write(
+        "json://root\n"
+        + "".join(f"include {team!s}\n" for team in teams)
+        + "xml://root\n"
+    )
+
+    read = ConfigFile.read
+    barrier = threading.Barrier(len(teams), timeout=10)
+    calls = []
+
+    def concurrent_read(self, **kwargs):
+        calls.append(os.path.basename(self.path))
+        if "team" in self.path:
+            # Only passes if all of our teams are read at the same time
+            barrier.wait()
+        return read(self, **kwargs)
+
+    with mock.patch.object(ConfigFile, "read", concurrent_read):
+        ac = AppriseConfig(recursion=2)
+        assert ac.add(configs=str(root)) is True
+        servers = ac.servers()
+
+    # Our order is preserved; the shared file is only read once but its
+    # services are found wherever it was included
+    assert [s.host for s in servers] == [
+        "root",
+        "root",
+        "team0",
+        "team1",
+        "shared",
+        "team2",
+        "shared",
+    ]
+    assert servers[0].protocol == "json"
+    assert servers[1].protocol == "xml"
+    assert servers[4] is servers[6]
+    assert sorted(calls) == [
+        "root.cfg",
+        "shared.cfg",
+        "team0.cfg",
+        "team1.cfg",
+        "team2.cfg",
+    ]
+
+    # Our recursion limits are still honoured
+    ac = AppriseConfig(recursion=1)
+    assert ac.add(configs=str(root)) is True
+    assert [s.host for s in ac.servers()] == [
+        "root",
+        "root",
+        "team0",
+        "team1",
+        "team2",
+    ]
+
+    # Includes can be retrieved one after another as well
+    barrier = threading.Barrier(1)
+    ac = AppriseConfig(recursion=2, asset=AppriseAsset(config_max_workers=1))
+    assert ac.add(configs=str(root)) is True
+    with mock.patch("apprise.config.base.WorkerPool.submit") as mock_submit:
+        assert len(ac.servers()) == 7
+        assert mock_submit.call_count == 0
+
+
 def test_apprise_config_file_loading(tmpdir):
     """
     API: AppriseConfig() URL Testing
@@ -27,6 +27,7 @@
 
 # Disable logging for a cleaner testing output
 import logging
+import re
 import sys
 
 from apprise import emojis
@@ -109,19 +110,45 @@ def test_emojis_alternation_aliases():
     assert emojis.apply_emojis(":running:") == "🏃"
 
 
-def test_emojis_lookup_no_pattern_match():
-    """emojis: _lookup() returns the raw token when _EMOJI_PATTERN_LIST is
-    empty (defensive fallback -- return text branch)."""
+def test_emojis_aliases():
+    """emojis: every EMOJI_MAP pattern expands into the aliases it matches"""
 
-    # Ensure the engine is initialised first.
-    emojis.apply_emojis(":smile:")
+    assert emojis.expand_aliases(":smile:") == [":smile:"]
+    assert emojis.expand_aliases(r":(\+1|thumbsup):") == [":+1:", ":thumbsup:"]
+    assert emojis.expand_aliases(":e-?mail:") == [":email:", ":e-mail:"]
+    assert sorted(
+        emojis.expand_aliases(":(fist_(raised|oncoming)|(face)?punch):")
+    ) == [":facepunch:", ":fist_oncoming:", ":fist_raised:", ":punch:"]
 
-    original = emojis._EMOJI_PATTERN_LIST
-    emojis._EMOJI_PATTERN_LIST = []
+    for pattern in emojis.EMOJI_MAP:
+        for alias in emojis.expand_aliases(pattern):
+            # The aliases we generate are exactly what the pattern matches
+            assert re.fullmatch(pattern, alias)
+            assert emojis.DELIM not in alias[1:-1]
+
+
+def test_emojis_tokenizer():
+    """emojis: apply_emojis() resolves aliases in a single pass"""
+
+    # Case is ignored
+    assert emojis.apply_emojis(":SMILE:") == "😄"
+
+    # A closing delimiter that does not complete an alias may open the next
+    assert emojis.apply_emojis("time: 10:smile:") == "time: 10😄"
+    assert emojis.apply_emojis("::smile::") == ":😄:"
+    assert emojis.apply_emojis(":nope:smile:") == ":nope😄"
+    assert emojis.apply_emojis(":smile:nope:") == "😄nope:"
+    assert emojis.apply_emojis(":e-mail: :email:") == "📧 📧"
+
+    # Text between far apart delimiters is never looked up
+    content = ":" + "a" * 10000 + ":smile:"
+    assert emojis.apply_emojis(content) == content[:-7] + "😄"
+
+    # With no aliases to resolve, our content is returned unchanged
+    original = emojis.EMOJI_ALIAS_MAP
+    emojis.EMOJI_ALIAS_MAP = {}
     try:
-        # With no patterns to match against, _lookup falls through to
-        # "return text", so the matched token is passed back unchanged.
-        result = emojis.apply_emojis(":smile:")
-        assert result == ":smile:"
+        assert emojis.apply_emojis(":smile:") == ":smile:"
+
     finally:
-        emojis._EMOJI_PATTERN_LIST = original
+        emojis.EMOJI_ALIAS_MAP = original
@@ -37,6 +37,8 @@ import time
 from unittest import mock
 from urllib.parse import unquote
 
+import pytest
+
 from apprise import NotificationManager, utils
 from apprise.tag import AppriseTag
 
@@ -3189,6 +3191,198 @@ def test_exclusive_match_priority_tokens():
     assert utils.logic.is_exclusive_match(logic="all", data=data) is True
 
 
+def test_tag_matcher():
+    """utils: TagMatcher() testing"""
+
+    TagMatcher = utils.logic.TagMatcher
+
+    data = {"abc", "def", "efg", "xyz"}
+    for logic in (
+        None,
+        "",
+        "abc",
+        "ABC, xyz",
+        "all",
+        "absent",
+        ["abc", "absent"],
+        [("abc", "def")],
+        [("abc", "absent")],
+        [("abc", "def"), "absent"],
+        [()],
+        [object()],
+        object(),
+        {"efg"},
+    ):
+        # Our compiled logic is always identical to is_exclusive_match()
+        matcher = TagMatcher(logic)
+        for entry in (data, set(), {"always"}):
+            assert matcher.match(entry) is utils.logic.is_exclusive_match(
+                logic=logic, data=entry
+            )
+
+    # Already compiled logic is returned as is
+    matcher = TagMatcher.compile("abc")
+    assert TagMatcher.compile(matcher) is matcher
+    assert repr(matcher) == "TagMatcher('abc')"
+
+    # Our object is immutable
+    with pytest.raises(AttributeError):
+        matcher.logic = "def"
+
+    # Token details
+    matcher = TagMatcher([("1:abc", "def"), "2:xyz:3", ("efg",)])
+    assert matcher.is_all is False
+    assert matcher.chain_names == ("", "xyz", "efg")
+    assert matcher.names == {"abc", "def", "xyz", "efg"}
+    assert matcher.has_priority is True
+    assert [str(t) for t in matcher.retry_tokens] == ["xyz"]
+    assert matcher.retry_tokens[0].retry == 3
+
+    matcher = TagMatcher("abc, def")
+    assert matcher.chain_names == ("abc", "def")
+    assert matcher.has_priority is False
+    assert matcher.retry_tokens == ()
+
+    for logic in (None, "all"):
+        matcher = TagMatcher(logic)
+        assert matcher.is_all is True
+        assert matcher.names == frozenset()
+
+    # Garbage is never matched
+    assert TagMatcher(object()).names == frozenset()
+
+
+def test_tag_index():
+    """utils: TagIndex() testing"""
+
+    TagMatcher = utils.logic.TagMatcher
+
+    class Service:
+        def __init__(self, *tags):
+            self.tags = set(tags)
+
+    class Config:
+        pass
+
+    s1 = Service("abc", "def")
+    s2 = Service("ABC")
+    s3 = Service("xyz")
+    s4 = Service()
+
+    servers = [s1, s2, s3, s4]
+    index = utils.logic.TagIndex().sync(servers)
+    assert index.size == 4
+    assert index.configs == 0
+    assert index.duplicates == 0
+
+    # Syncing an unchanged list does not rebuild anything
+    assert index.sync(servers) is index
+    assert index.lookup("absent") == {}
+
+    def candidates(logic, match_always=None):
+        result = TagMatcher(logic, match_always=match_always).candidates(index)
+        return None if result is None else index.ordered(result)
+
+    # Tags are indexed in lowercase
+    assert candidates("abc") == [s1, s2]
+    assert candidates("def, xyz") == [s1, s3]
+    assert candidates([("abc", "def")]) == [s1]
+    assert candidates([("abc", "xyz")]) == []
+    assert candidates("absent") == []
+
+    # The 'always' tag is still considered
+    s5 = Service("always")
+    servers.append(s5)
+    index.sync(servers)
+    assert index.size == 5
+    assert candidates("xyz") == [s3]
+    assert candidates("xyz", match_always="always") == [s3, s5]
+
+    # Matching everything (or nothing) can not be resolved by our index
+    assert candidates("all") is None
+    assert candidates(None) is None
+    assert candidates("") is None
+    assert candidates(object()) is None
+    assert candidates(["abc", ("def", "all")]) is None
+
+    # Configuration entries and duplicates are tracked
+    config = Config()
+    index.add(config)
+    index.add(s1)
+    assert index.size == 7
+    assert index.configs == 1
+    assert index.duplicates == 1
+    assert candidates("abc") == [s1, s2]
+
+    index.remove(config)
+    index.remove(s1)
+    assert index.size == 5
+    assert index.configs == 0
+    assert index.duplicates == 0
+    assert candidates("abc") == [s1, s2]
+
+    # Removing an entry drops it from every tag it was indexed under
+    index.remove(s1)
+    servers.remove(s1)
+    assert candidates("abc") == [s2]
+    assert candidates("def") == []
+    assert index.lookup("def") == {}
+
+    # Removing something we do not know about forces a rebuild
+    index.remove(Service("abc"))
+    index.sync(servers)
+    assert index.size == 4
+    assert candidates("abc") == [s2]
+
+    # A list modified without our knowledge is detected
+    servers.append(s1)
+    index.sync(servers)
+    assert candidates("abc") == [s2, s1]
+
+    # Tags changed after a service was indexed are detected
+    s2.tags = {"new"}
+    index.sync(servers)
+    assert candidates("abc") == [s1]
+    assert candidates("new") == [s2]
+
+    s2.tags.add("abc")
+    index.sync(servers)
+    assert candidates("abc") == [s2, s1]
+    assert candidates("new") == [s2]
+
+    s2.tags.clear()
+    index.sync(servers)
+    assert candidates("abc") == [s1]
+    assert index.lookup("new") == {}
+
+    # A configuration entry that is given tags is indexed as a service
+    s6 = Config()
+    servers.append(s6)
+    index.sync(servers)
+    assert index.configs == 1
+    s6.tags = {"abc"}
+    index.sync(servers)
+    assert index.configs == 0
+    assert candidates("abc") == [s1, s6]
+    servers.remove(s6)
+    index.sync(servers)
+
+    # Even when its length remains the same
+    servers[0] = s3
+    index.sync(servers)
+    assert candidates("abc") == [s1]
+    servers[0] = s2
+
+    # So is a different list
+    index.sync([s3])
+    assert index.size == 1
+    assert candidates("abc") == []
+
+    index.clear()
+    assert index.size == 0
+    assert candidates("xyz") == []
+
+
 def test_apprise_validate_regex():
     """
     API: Apprise() Validate Regex tests
@@ -3557,6 +3751,42 @@ def test_dir_size(tmpdir):
         assert len(errors) == 0
 
 
+def test_dir_usage(tmpdir):
+    """Test dir usage tool."""
+
+    # Nothing to find/see
+    assert utils.disk.dir_usage(str(tmpdir)) == (0, None, None, set())
+
+    tmpdir.join("old.psdata").write("0" * 1024)
+    subdir = tmpdir.mkdir("abcdefg")
+    subdir.join("new.psdata").write("0" * 2048)
+    os.utime(str(tmpdir.join("old.psdata")), (1000, 1000))
+    os.utime(str(subdir.join("new.psdata")), (2000, 2000))
+
+    size, newest, oldest, errors = utils.disk.dir_usage(str(tmpdir))
+    assert size == 1024 * 3
+    assert newest == 2000
+    assert oldest == 1000
+    assert not errors
+
+    # Our depth is limited
+    size, newest, oldest, errors = utils.disk.dir_usage(
+        str(tmpdir), max_depth=0
+    )
+    assert size == 1024
+    assert newest == oldest == 1000
+    assert errors == {str(subdir)}
+
+    # Missing directories
+    assert utils.disk.dir_usage("invalid-directory") == (0, None, None, set())
+    assert utils.disk.dir_usage("invalid-directory", missing_okay=False) == (
+        0,
+        None,
+        None,
+        {"invalid-directory"},
+    )
+
+
 def test_bytes_to_str():
     """Test Bytes to String representation."""
     # Garbage Entry
@@ -36,8 +36,14 @@ from unittest import mock
 import pytest
 import requests
 
-from apprise import Apprise, AppriseAttachment, NotificationManager, exception
-from apprise.attachment.http import AttachHTTP
+from apprise import (
+    Apprise,
+    AppriseAsset,
+    AppriseAttachment,
+    NotificationManager,
+    exception,
+)
+from apprise.attachment.http import AttachHTTP, HTTPContentCache
 from apprise.common import ContentLocation
 from apprise.plugins import NotifyBase
 
@@ -575,3 +581,164 @@ def test_attach_http(mock_get, mock_request):
         mock_file.side_effect = OSError
         with pytest.raises(exception.AppriseDiskIOError):
             obj.base64()
+
+
+@mock.patch("requests.get")
+def test_attach_http_cache(mock_get, tmpdir):
+    """
+    API: AttachHTTP() revalidates content cached in persistent storage
+
+    """
+
+    class Response:
+        """A response that is either our content or a 304."""
+
+        def __init__(self, status_code=requests.codes.ok, headers=None):
+            self.status_code = status_code
+            self.headers = {
+                "Content-Length": "7",
+                "Content-Type": "image/png",
+                "ETag": '"abc"',
+                "Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT",
+                **(headers or {}),
+            }
+
+        def iter_content(self, chunk_size=1024):
+            if self.status_code == requests.codes.ok:
+                yield b"content"
+
+        def raise_for_status(self):
+            return
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args, **kwargs):
+            return
+
+    asset = AppriseAsset(storage_path=str(tmpdir))
+    url = "http://localhost/snapshot.png"
+
+    mock_get.return_value = Response()
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+    assert attachment.download()
+    assert attachment.open().read() == b"content"
+    headers = mock_get.call_args[1]["headers"]
+    assert "If-None-Match" not in headers
+    assert "If-Modified-Since" not in headers
+    assert attachment.mimetype == "image/png"
+
+    # Our next retrieval (even by another object) revalidates our content
+    mock_get.reset_mock()
+    mock_get.return_value = Response(status_code=304)
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+    assert attachment.download()
+    assert attachment.open().read() == b"content"
+    assert attachment.name == "snapshot.png"
+    assert attachment.mimetype == "image/png"
+    headers = mock_get.call_args[1]["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+
+    # Different content (or credentials) are cached independently of it
+    mock_get.reset_mock()
+    mock_get.return_value = Response(status_code=304)
+    attachment = AttachHTTP(
+        **AttachHTTP.parse_url("http://user@localhost/snapshot.png"),
+        asset=asset,
+    )
+    attachment.download()
+    assert "If-None-Match" not in mock_get.call_args[1]["headers"]
+
+    # Our cache is not used when caching is disabled
+    mock_get.reset_mock()
+    attachment = AttachHTTP(
+        **AttachHTTP.parse_url(f"{url}?cache=no"), asset=asset
+    )
+    attachment.download()
+    assert "If-None-Match" not in mock_get.call_args[1]["headers"]
+
+    # Changed content replaces what was cached
+    mock_get.return_value = Response(headers={"ETag": '"def"'})
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+    assert attachment.download()
+    mock_get.return_value = Response(status_code=304)
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+    assert attachment.download()
+    assert mock_get.call_args[1]["headers"]["If-None-Match"] == '"def"'
+
+    # Content that can not be revalidated (or asks not to be stored) is not
+    # cached
+    for headers in (
+        {"ETag": "", "Last-Modified": ""},
+        {"Cache-Control": "private, no-store"},
+    ):
+        url = "http://localhost/other.png"
+        mock_get.return_value = Response(headers=headers)
+        attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+        assert attachment.download()
+        attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+        assert attachment.download()
+        assert "If-None-Match" not in mock_get.call_args[1]["headers"]
+
+    # Content larger than our cache is not kept
+    url = "http://localhost/large.png"
+    mock_get.return_value = Response()
+    with mock.patch.object(HTTPContentCache, "max_size", 6):
+        attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+        assert attachment.download()
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+    assert attachment.download()
+    assert "If-None-Match" not in mock_get.call_args[1]["headers"]
+
+    # Our cache is cleared out to make room for new content
+    url = "http://localhost/snapshot.png"
+    mock_get.return_value = Response(headers={"ETag": '"ghi"'})
+    with mock.patch.object(HTTPContentCache, "max_size", 200):
+        attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+        assert attachment.download()
+
+    # Content that could not be cached is not revalidated
+    with mock.patch(
+        "apprise.persistent_store.PersistentStore.write", return_value=False
+    ):
+        attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+        assert attachment.download()
+
+    with mock.patch("builtins.open", side_effect=OSError()):
+        attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+        assert attachment.download()
+
+    mock_get.return_value = Response(status_code=304)
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+    assert attachment.download()
+    assert mock_get.call_args[1]["headers"]["If-None-Match"] == '"ghi"'
+
+    # Cached content larger than what we accept is downloaded again
+    mock_get.return_value = Response()
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+    attachment.max_file_size = 5
+    assert not attachment.download()
+    assert "If-None-Match" not in mock_get.call_args[1]["headers"]
+
+    # Cached content that can not be read is downloaded again
+    for path in tmpdir.join("_attach").visit("*.psdata"):
+        path.write_binary(b'{"etag": null}\nreplaced')
+
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+    assert attachment.download()
+    assert "If-None-Match" not in mock_get.call_args[1]["headers"]
+
+    # Cached content that went missing is downloaded again
+    for path in tmpdir.join("_attach").visit("*.psdata"):
+        path.remove()
+
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url), asset=asset)
+    assert attachment.download()
+    assert "If-None-Match" not in mock_get.call_args[1]["headers"]
+
+    # Nothing is cached without persistent storage
+    mock_get.return_value = Response(status_code=304)
+    attachment = AttachHTTP(**AttachHTTP.parse_url(url))
+    assert attachment.download()
+    assert "If-None-Match" not in mock_get.call_args[1]["headers"]
@@ -34,8 +34,8 @@ from unittest import mock
 import pytest
 import requests
 
-from apprise import NotificationManager
-from apprise.common import ConfigFormat
+from apprise import AppriseAsset, NotificationManager
+from apprise.common import ConfigFormat, PersistentStoreMode
 from apprise.config.http import ConfigHTTP
 from apprise.plugins import NotifyBase
 
@@ -374,3 +374,189 @@ def test_config_http(mock_post):
 
     # Restore buffer size count
     ch.max_buffer_size = max_buffer_size
+
+
+class ConfigResponse:
+    """A configurable response used to manage our object."""
+
+    def __init__(self, text="", status_code=requests.codes.ok, headers=None):
+        self.text = text
+        self.status_code = status_code
+        self.headers = {} if headers is None else headers
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(self.status_code)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        return
+
+
+@mock.patch("requests.post")
+def test_config_http_conditional(mock_post):
+    """
+    API: ConfigHTTP() conditional retrieval
+
+    """
+    content = "json://localhost"
+    mock_post.return_value = ConfigResponse(
+        content,
+        headers={
+            "Content-Type": "text/yaml",
+            "ETag": '"abcd"',
+            "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT",
+        },
+    )
+
+    ch = ConfigHTTP(**ConfigHTTP.parse_url("http://localhost/?cache=no"))
+    assert ch.read() == content
+    assert ch.default_config_format == ConfigFormat.YAML
+    headers = mock_post.call_args[1]["headers"]
+    assert "If-None-Match" not in headers
+    assert "If-Modified-Since" not in headers
+
+    # Our content is revalidated; not retrieved again
+    mock_post.return_value = ConfigResponse(
+        status_code=requests.codes.not_modified
+    )
+    assert ch.read() == content
+    headers = mock_post.call_args[1]["headers"]
+    assert headers["If-None-Match"] == '"abcd"'
+    assert headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    # A failed precondition means our ETag matched too
+    mock_post.return_value = ConfigResponse(
+        status_code=requests.codes.precondition_failed
+    )
+    assert ch.read() == content
+
+    # New content (without any validators)
+    mock_post.return_value = ConfigResponse("json://hostname")
+    assert ch.read() == "json://hostname"
+    assert ch.default_config_format == ConfigFormat.YAML
+    assert ch.read() == "json://hostname"
+    headers = mock_post.call_args[1]["headers"]
+    assert "If-None-Match" not in headers
+    assert "If-Modified-Since" not in headers
+
+    # Without an ETag, a failed precondition is an error
+    mock_post.return_value = ConfigResponse(
+        status_code=requests.codes.precondition_failed
+    )
+    assert ch.read() is None
+
+    # Nothing is written to disk without persistent storage
+    assert ch.store is None
+
+
+@mock.patch("requests.post")
+def test_config_http_persistent(mock_post, tmpdir):
+    """
+    API: ConfigHTTP() persistent storage
+
+    """
+    content = "urls:\n  - json://localhost"
+    mock_post.return_value = ConfigResponse(
+        content, headers={"Content-Type": "text/yaml", "ETag": '"abcd"'}
+    )
+
+    asset = AppriseAsset(storage_path=str(tmpdir))
+    results = ConfigHTTP.parse_url("http://localhost/")
+    ch = ConfigHTTP(asset=asset, **results)
+    assert ch.read() == content
+
+    # A new object (in a new process) starts from what we retrieved
+    mock_post.return_value = ConfigResponse(
+        status_code=requests.codes.not_modified
+    )
+    ch = ConfigHTTP(asset=asset, **results)
+    assert ch.default_config_format == ConfigFormat.TEXT
+    assert ch.read() == content
+    assert ch.default_config_format == ConfigFormat.YAML
+    assert mock_post.call_args[1]["headers"]["If-None-Match"] == '"abcd"'
+    assert len(ch.servers()) == 1
+
+    # Different headers are kept apart
+    ch = ConfigHTTP(
+        asset=asset,
+        **ConfigHTTP.parse_url("http://localhost/?+X-Key=value"),
+    )
+    assert ch.read() is None
+    assert "If-None-Match" not in mock_post.call_args[1]["headers"]
+
+    # Invalid content on disk is ignored
+    for data in (b"garbage", b"{}", b'{"content": 42}'):
+        ch = ConfigHTTP(asset=asset, **results)
+        assert ch.store.write(data, key="config")
+        assert ch.read() is None
+
+    # Memory based storage is never used
+    asset = AppriseAsset(
+        storage_path=str(tmpdir), storage_mode=PersistentStoreMode.MEMORY
+    )
+    assert ConfigHTTP(asset=asset, **results).store is None
+
+
+@mock.patch("requests.post")
+def test_config_http_swr(mock_post, tmpdir):
+    """
+    API: ConfigHTTP() stale-while-revalidate
+
+    """
+    asset = AppriseAsset(storage_path=str(tmpdir))
+    results = ConfigHTTP.parse_url("http://localhost/?swr=yes")
+    assert results["swr"] is True
+
+    ch = ConfigHTTP(asset=asset, **results)
+    assert ch.swr is True
+    assert "swr=yes" in ch.url()
+    assert ConfigHTTP.parse_url(ch.url())["swr"] is True
+    assert (
+        "swr="
+        not in ConfigHTTP(
+            asset=asset, **ConfigHTTP.parse_url("http://localhost/")
+        ).url()
+    )
+
+    # Nothing is known yet; we must wait for our content
+    mock_post.return_value = ConfigResponse(
+        "json://localhost", headers={"ETag": '"abcd"'}
+    )
+    assert len(ch.servers()) == 1
+    assert mock_post.call_count == 1
+
+    # A new object uses the content on disk right away
+    mock_post.reset_mock()
+    mock_post.return_value = ConfigResponse(
+        "json://localhost\njson://hostname", headers={"ETag": '"efgh"'}
+    )
+    ch = ConfigHTTP(asset=asset, **results)
+    assert len(ch.servers()) == 1
+
+    # ... while it is revalidated in the background
+    ch._refresh.join()
+    assert mock_post.call_count == 1
+    assert ch.expired() is True
+    assert len(ch.servers()) == 2
+    ch._refresh.join()
+    assert ch.expired() is False
+
+    # Unchanged (or unavailable) content does not expire our servers
+    for response in (
+        ConfigResponse(status_code=requests.codes.not_modified),
+        ConfigResponse(status_code=requests.codes.internal_server_error),
+    ):
+        mock_post.return_value = response
+        assert ch.read() == "json://localhost\njson://hostname"
+        ch._refresh.join()
+        assert ch.expired() is False
+
+    # Only one refresh runs at a time
+    with mock.patch("threading.Thread") as mock_thread:
+        mock_thread.return_value.is_alive.return_value = True
+        assert ch.read()
+        assert ch.read()
+        assert mock_thread.call_count == 1
@@ -33,11 +33,14 @@ from timeit import default_timer
 
 import pytest
 
+import apprise
 from apprise import NotifyFormat
 from apprise.conversion import (
     BLOCKQUOTE_DEPTH_MAX,
+    CONVERSION_CACHE,
     LIST_DEPTH_MAX,
     MAX_FRAME_DEPTH,
+    ConversionCache,
     HTMLMarkdownConverter,
     build_backtick_run_index,
     convert_between,
@@ -1822,3 +1825,107 @@ def test_conversion_markdown_to_html():
     assert "<td>Content Cell2</td>" in response
     assert "<td>Content Cell3</td>" in response
     assert "<td>Content Cell4</td>" in response
+
+
+def test_conversion_cache():
+    """conversion: ConversionCache bookkeeping"""
+
+    cache = ConversionCache(max_size=10)
+    assert len(cache) == 0
+    assert cache.get("a") is None
+    assert cache.misses == 1
+
+    cache.put("a", "A", 4)
+    cache.put("b", "B", 4)
+    assert cache.get("a") == "A"
+    assert cache.hits == 1
+    assert cache.size == 8
+
+    # Our least recently used entry (b) is evicted to make room
+    cache.put("c", "C", 4)
+    assert len(cache) == 2
+    assert cache.size == 8
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+    # Replacing an entry accounts for the size it previously took up
+    cache.put("c", "CC", 6)
+    assert cache.size == 10
+
+    # Entries larger than the cache itself are never kept
+    cache.put("d", "D", 11)
+    assert cache.get("d") is None
+    assert cache.get("a") == "A"
+
+    # Content is measured by its encoded size
+    assert cache.sizeof() == 0
+    assert cache.sizeof("abc", "\u00e9") == 5
+    assert cache.sizeof("\ud800") == 3
+
+    # Identical content shares a digest
+    assert cache.digest("body") == ConversionCache.digest("body")
+    assert cache.digest("body") != cache.digest("other")
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert cache.hits == cache.misses == 0
+
+
+def test_conversion_cache_notify(mocker):
+    """conversion: Prepared content is re-used across notify() calls"""
+
+    CONVERSION_CACHE.clear()
+    mocker.patch(
+        "requests.request",
+        return_value=mocker.Mock(status_code=200, content=b"", headers={}),
+    )
+    convert = mocker.spy(apprise.apprise, "convert_between")
+    emojis = mocker.spy(apprise.apprise, "apply_emojis")
+
+    # Nothing is cached unless we ask for it
+    apobj = apprise.Apprise()
+    assert apobj.add("xml://localhost?format=html")
+    for _ in range(2):
+        assert apobj.notify(
+            "**body**", title="title", body_format=NotifyFormat.MARKDOWN
+        )
+    assert convert.call_count == 2
+    assert len(CONVERSION_CACHE) == 0
+    convert.reset_mock()
+
+    apobj = apprise.Apprise(asset=apprise.AppriseAsset(conversion_cache=True))
+    assert apobj.add("json://localhost?emojis=yes")
+    assert apobj.add("xml://localhost?format=html")
+
+    for _ in range(3):
+        assert apobj.notify(
+            "**body** :smile:",
+            title="title",
+            body_format=NotifyFormat.MARKDOWN,
+        )
+
+    # One conversion per format, no matter how many times we notify
+    assert convert.call_count == 2
+    assert emojis.call_count == 2
+    assert CONVERSION_CACHE.hits == 4
+    assert CONVERSION_CACHE.misses == 2
+
+    # Different content (or flags) is prepared on its own
+    assert apobj.notify(
+        "**body** :smile:",
+        title="title",
+        body_format=NotifyFormat.MARKDOWN,
+        interpret_escapes=True,
+    )
+    assert convert.call_count == 4
+
+    # Our prepared content is measured by its encoded size
+    assert len(CONVERSION_CACHE) == 4
+    assert CONVERSION_CACHE.size < 1024
+
+    # Our cache can be released at any time
+    CONVERSION_CACHE.clear()
+    assert len(CONVERSION_CACHE) == 0
+    assert CONVERSION_CACHE.size == 0
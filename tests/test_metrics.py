@@ -0,0 +1,302 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import asyncio
+
+# Disable logging for a cleaner testing output
+import logging
+import os
+from unittest import mock
+
+import pytest
+import requests
+
+from apprise import (
+    Apprise,
+    AppriseAsset,
+    AppriseMetrics,
+    MetricsAggregator,
+    MetricsExporter,
+)
+from apprise.metrics import CURRENT_SPAN, Span, request_size, span
+
+logging.disable(logging.CRITICAL)
+
+TEST_VAR_DIR = os.path.join(os.path.dirname(__file__), "var")
+
+
+def _span(name, duration, service=None, success=True, **kwargs):
+    """Returns a closed span."""
+    s = Span(name, service)
+    s.duration = duration
+    s.success = success
+    for key, value in kwargs.items():
+        setattr(s, key, value)
+    return s
+
+
+def test_metrics_aggregator():
+    """
+    Metrics: Aggregator
+
+    """
+    agg = MetricsAggregator()
+    assert agg.stats("send") is None
+    assert agg.summary() == {}
+
+    for n in range(1, 101):
+        agg.export(
+            _span(
+                "send",
+                n / 100.0,
+                service="A" if n % 2 else "B",
+                success=n > 10,
+                retries=1 if n > 90 else 0,
+                bytes_sent=10,
+            )
+        )
+
+    stats = agg.stats("send")
+    assert stats["count"] == 100
+    assert stats["failures"] == 10
+    assert stats["retries"] == 10
+    assert stats["bytes_sent"] == 1000
+    assert stats["total"] == pytest.approx(50.5)
+    assert stats["mean"] == pytest.approx(0.505)
+    assert stats["p50"] == 0.5
+    assert stats["p95"] == 0.95
+    assert stats["p99"] == 0.99
+
+    # Per service
+    stats = agg.stats("send", "A")
+    assert stats["count"] == 50
+    assert stats["p50"] == 0.49
+    assert agg.stats("send", "C") is None
+    assert agg.stats("notify") is None
+
+    summary = agg.summary()
+    assert set(summary) == {("send", "A"), ("send", "B")}
+    assert summary["send", "B"]["count"] == 50
+
+    # A single sample
+    agg.export(_span("find", 0.25))
+    stats = agg.stats("find")
+    assert stats["p50"] == stats["p99"] == 0.25
+
+    # Only the most recent samples are kept for our percentiles
+    agg = MetricsAggregator(samples=2)
+    for duration in (10.0, 1.0, 2.0):
+        agg.export(_span("send", duration))
+    stats = agg.stats("send")
+    assert stats["count"] == 3
+    assert stats["p99"] == 2.0
+
+    agg.clear()
+    assert agg.stats("send") is None
+
+
+def test_metrics_exporters():
+    """
+    Metrics: Exporters
+
+    """
+    spans = []
+    metrics = AppriseMetrics(spans.append)
+    assert len(metrics.exporters) == 1
+
+    # Exporters must be callable (or a MetricsExporter)
+    with pytest.raises(TypeError):
+        metrics.add("invalid")
+
+    with pytest.raises(NotImplementedError):
+        MetricsExporter().export(Span("send"))
+
+    class BadExporter(MetricsExporter):
+        def export(self, span):
+            raise ValueError("failure")
+
+    bad = metrics.add(BadExporter())
+
+    with metrics.span("send", "Test", "abcd") as s:
+        assert CURRENT_SPAN.get() is s
+    assert CURRENT_SPAN.get() is None
+
+    # Our failing exporter does not prevent the others from being called
+    assert spans == [s]
+    assert s.name == "send"
+    assert s.service == "Test"
+    assert s.url_id == "abcd"
+    assert s.success is True
+    assert s.duration >= 0.0
+    assert "send" in repr(s)
+
+    metrics.remove(bad)
+    metrics.remove(spans.append)
+    assert not metrics.exporters
+
+    # Spans raising an exception are never successful; the bytes sent are
+    # accounted to the span opened around them too
+    metrics.add(spans.append)
+    del spans[:]
+    with (
+        metrics.span("notify") as outer,
+        pytest.raises(ValueError),
+        metrics.span("send") as inner,
+    ):
+        inner.bytes_sent = 5
+        raise ValueError()
+
+    assert spans == [inner, outer]
+    assert inner.success is False
+    assert inner.parent is outer
+    assert outer.success is True
+    assert outer.bytes_sent == 5
+
+    # Nothing is emitted without metrics
+    del spans[:]
+    with span(None, "find") as s:
+        assert isinstance(s, Span)
+        assert CURRENT_SPAN.get() is None
+    assert not spans
+
+
+def test_metrics_request_size():
+    """
+    Metrics: Request Size
+
+    """
+    r = mock.Mock()
+    r.request.body = "abcé"
+    assert request_size(r) == 5
+    r.request.body = b"abc"
+    assert request_size(r) == 3
+
+    # Streamed (or unknown) content
+    r.request.body = iter([b"abc"])
+    assert request_size(r) == 0
+
+    # httpx requests keep their content elsewhere
+    r = mock.Mock()
+    r.request.body = None
+    r.request.content = b"abcd"
+    assert request_size(r) == 4
+
+    type(r.request).content = mock.PropertyMock(side_effect=RuntimeError())
+    assert request_size(r) == 0
+
+    assert request_size(object()) == 0
+
+
+@mock.patch("requests.request")
+def test_metrics_notify(mock_request):
+    """
+    Metrics: Notifications
+
+    """
+    response = requests.Response()
+    response.status_code = requests.codes.ok
+    response.request = requests.Request(
+        "POST", "http://localhost", data="payload"
+    ).prepare()
+    mock_request.return_value = response
+
+    spans = []
+    agg = MetricsAggregator()
+    asset = AppriseAsset(metrics=AppriseMetrics(agg, spans.append))
+    apobj = Apprise(asset=asset)
+    assert apobj.add("json://localhost/?:emoji=:smile:&emojis=yes")
+    assert apobj.add("form://localhost/?retry=2&wait=0")
+
+    assert apobj.notify("body :smile:", title="title") is True
+    names = [s.name for s in spans]
+    assert names.count("find") == 1
+    assert names.count("convert") == 2
+    assert names.count("emojis") == 1
+    assert names.count("overflow") == 2
+    assert names.count("send") == 2
+    assert names.count("notify") == 2
+
+    stats = agg.stats("notify", "JSON")
+    assert stats["count"] == 1
+    assert stats["failures"] == 0
+    assert stats["retries"] == 0
+    assert stats["bytes_sent"] == len("payload")
+    assert agg.stats("send")["bytes_sent"] == 2 * len("payload")
+
+    notify = next(s for s in spans if s.name == "notify")
+    assert notify.url_id == apobj[0].url_id()
+
+    # Retries and failures are accounted for
+    agg.clear()
+    response.status_code = requests.codes.internal_server_error
+    assert apobj.notify("body", tag="all") is False
+    stats = agg.stats("notify", "Form")
+    assert stats["failures"] == 1
+    assert stats["retries"] == 2
+    assert agg.stats("send", "Form")["count"] == 3
+    assert agg.stats("send", "Form")["failures"] == 3
+
+    # Our threaded (parallel) path
+    agg.clear()
+    response.status_code = requests.codes.ok
+    asset.async_mode = True
+    assert apobj.notify("body") is True
+    assert agg.stats("notify")["count"] == 2
+    assert agg.stats("notify")["bytes_sent"] == 2 * len("payload")
+
+    # Our asynchronous path
+    agg.clear()
+    assert asyncio.run(apobj.async_notify("body")) is True
+    assert agg.stats("notify")["count"] == 2
+    assert agg.stats("send")["count"] == 2
+    assert agg.stats("send")["bytes_sent"] == 2 * len("payload")
+
+    # Attachments being retrieved
+    agg.clear()
+    attach = os.path.join(TEST_VAR_DIR, "apprise-test.gif")
+    assert apobj.notify("body", attach=attach) is True
+    stats = agg.stats("attach", "Local File")
+    assert stats["count"] >= 1
+    assert stats["failures"] == 0
+
+
+@mock.patch("requests.request")
+def test_metrics_disabled(mock_request):
+    """
+    Metrics: Disabled
+
+    """
+    response = requests.Response()
+    response.status_code = requests.codes.ok
+    mock_request.return_value = response
+
+    apobj = Apprise()
+    assert apobj.add("json://localhost")
+    with mock.patch("apprise.metrics.AppriseMetrics.span") as mock_span:
+        assert apobj.notify("body") is True
+        assert asyncio.run(apobj.async_notify("body")) is True
+        assert mock_span.call_count == 0
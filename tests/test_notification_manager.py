@@ -26,6 +26,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 from inspect import cleandoc
+import json
 
 # Disable logging for a cleaner testing output
 import logging
@@ -1059,3 +1060,95 @@ def test_notification_manager_no_import_failures():
 
     # Leave the manager in a clean state for subsequent tests
     N_MGR.unload_modules()
+
+
+def test_notification_manager_index(tmpdir):
+    """N_MGR: Loading our plugins on demand using a schema index."""
+
+    path = tmpdir.join("index", "plugins.json")
+
+    N_MGR.unload_modules()
+    N_MGR.index_path = str(path)
+
+    try:
+        # No index exists yet; all of our modules are loaded and our index
+        # is written
+        assert "json" in N_MGR
+        assert path.isfile()
+        schemas = set(N_MGR.schemas())
+        modules = len(N_MGR)
+
+        # Our index is now used; nothing is imported up front
+        N_MGR.unload_modules()
+        N_MGR.load_modules()
+        assert bool(N_MGR)
+        assert N_MGR._schema_map == {}
+        assert set(N_MGR._index) == schemas
+
+        # Only the module providing our schema is imported
+        assert "json" in N_MGR
+        assert "json" in N_MGR._schema_map
+        assert "json" not in N_MGR._index
+        assert "xml" not in N_MGR._schema_map
+        assert N_MGR["xml"].enabled is True
+        assert "xml" in N_MGR._schema_map
+
+        # Unknown schemas are handled as before
+        assert "invalid" not in N_MGR
+        with pytest.raises(KeyError):
+            N_MGR["invalid"]
+
+        # Everything else is loaded on demand
+        assert len(N_MGR) == modules
+        assert not N_MGR._pending
+        assert not N_MGR._index
+
+        # Disabling and removing schemas that are not loaded yet
+        N_MGR.unload_modules()
+        N_MGR.disable("form")
+        assert N_MGR["form"].enabled is False
+        N_MGR.remove("mailto")
+        assert "mailto" not in N_MGR
+        assert len(N_MGR) == modules - 1
+
+        N_MGR.unload_modules()
+        assert N_MGR["form"].enabled is True
+        assert set(N_MGR.schemas()) == schemas
+
+        # An out of date index is ignored and re-written
+        content = json.loads(path.read())
+        content["signature"]["custom_json.py"] = 0
+        path.write(json.dumps(content))
+
+        N_MGR.unload_modules()
+        N_MGR.load_modules()
+        assert not N_MGR._index
+        assert set(N_MGR._schema_map) == schemas
+        assert json.loads(path.read())["signature"] != content["signature"]
+
+        N_MGR.unload_modules()
+        N_MGR.load_modules()
+        assert set(N_MGR._index) == schemas
+
+        # A corrupted index is ignored and re-written
+        path.write("{")
+        N_MGR.unload_modules()
+        N_MGR.load_modules()
+        assert not N_MGR._index
+        assert set(N_MGR._schema_map) == schemas
+
+        N_MGR.unload_modules()
+        N_MGR.load_modules()
+        assert set(N_MGR._index) == schemas
+
+        # An index that can not be written does not prevent our plugins from
+        # loading
+        tmpdir.join("blocker").write("")
+        N_MGR.index_path = str(tmpdir.join("blocker", "plugins.json"))
+        N_MGR.unload_modules()
+        assert set(N_MGR.schemas()) == schemas
+        assert not tmpdir.join("blocker", "plugins.json").exists()
+
+    finally:
+        N_MGR.index_path = None
+        N_MGR.unload_modules()
@@ -25,6 +25,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
 from datetime import datetime, timedelta
 
 # Disable logging for a cleaner testing output
@@ -476,3 +477,41 @@ def test_notify_base_runtime_deps_override():
     assert deps == ("fakelibA", "fakelibB")
     assert deps[0] == "fakelibA"
     assert deps[1] == "fakelibB"
+
+
+def test_notify_base_async_send():
+    """
+    API: NotifyBase.async_send() default and native implementations
+
+    """
+
+    class SyncNotification(NotifyBase):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.sent = []
+
+        def send(self, body, title="", notify_type=NotifyType.INFO, **kw):
+            self.sent.append((body, title, notify_type))
+            return True
+
+        def url(self, **kwargs):
+            return "sync://"
+
+    # send() is driven from the executor by default
+    obj = SyncNotification()
+    assert asyncio.run(obj.async_notify(body="body", title="title")) is True
+    assert obj.sent == [("body", "title", NotifyType.INFO)]
+
+    class AsyncNotification(SyncNotification):
+        async def async_send(
+            self, body, title="", notify_type=NotifyType.INFO, **kwargs
+        ):
+            await self.async_throttle()
+            self.sent.append(("async", body))
+            return body != "fail"
+
+    # Our native implementation takes precedence over send()
+    obj = AsyncNotification()
+    assert asyncio.run(obj.async_notify(body="body")) is True
+    assert obj.sent == [("async", "body")]
+    assert asyncio.run(obj.async_notify(body="fail")) is False
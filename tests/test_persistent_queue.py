@@ -0,0 +1,633 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import json
+
+# Disable logging for a cleaner testing output
+import logging
+import os
+import time
+from unittest import mock
+
+from click.testing import CliRunner
+import requests
+
+from apprise import (
+    Apprise,
+    AppriseAsset,
+    AppriseAttachment,
+    PersistentQueue,
+    PersistentStoreMode,
+    cli,
+)
+from apprise.attachment.memory import AttachMemory
+from apprise.persistent_queue import QUEUE_DIR, dump_tag
+from apprise.tag import AppriseTag
+from apprise.utils.logic import TagMatcher
+
+logging.disable(logging.CRITICAL)
+
+
+def test_persistent_queue_dump_tag():
+    """
+    Persistent Queue: Tag Filter Serialization
+
+    """
+    assert dump_tag(None) is None
+    assert dump_tag("all") == "all"
+    assert dump_tag(AppriseTag.parse("abc")) == "abc"
+    assert dump_tag(AppriseTag.parse("2:abc")) == "2:abc"
+    assert dump_tag(AppriseTag.parse("abc:3")) == "abc:3"
+    assert dump_tag(AppriseTag.parse("2:abc:3")) == "2:abc:3"
+    assert dump_tag(["a", ("b", AppriseTag.parse("1:c"))]) == [
+        "a",
+        ["b", "1:c"],
+    ]
+
+    # Compiled filters are written using the logic they were built from
+    assert dump_tag(TagMatcher.compile(["a", ("b", "c")])) == [
+        "a",
+        ["b", "c"],
+    ]
+
+
+def test_persistent_queue_put_claim(tmpdir):
+    """
+    Persistent Queue: Put, Claim and Complete
+
+    """
+    pq = PersistentQueue(str(tmpdir))
+    assert pq.path == os.path.join(str(tmpdir), QUEUE_DIR)
+
+    # Nothing queued
+    assert len(pq) == 0
+    assert pq.keys() == []
+    assert pq.claim() is None
+
+    k1 = pq.put({"body": "first"})
+    k2 = pq.put({"body": "second"})
+    k3 = pq.put({"body": "later"}, delay=3600)
+    assert k1 and k2 and k3
+
+    # Our keys are ordered by the time they are due
+    assert pq.keys() == sorted([k1, k2, k3])
+    assert len(pq) == 3
+
+    # Jobs are claimed in order
+    key, job = pq.claim()
+    assert key in (k1, k2)
+    assert job["attempts"] == 0
+    assert job["version"] == 1
+    assert "created" in job
+    assert pq.keys(active=True) == [key]
+    assert len(pq) == 3
+
+    pq.complete(key)
+    assert pq.keys(active=True) == []
+    assert len(pq) == 2
+
+    # Completing a job twice is harmless
+    pq.complete(key)
+
+    key, _ = pq.claim()
+    pq.complete(key)
+
+    # Our remaining job is not due yet
+    assert pq.claim() is None
+    assert pq.keys() == [k3]
+
+    # A second queue (e.g. another process) sees the same content
+    assert PersistentQueue(str(tmpdir)).keys() == [k3]
+
+
+def test_persistent_queue_claim_race(tmpdir):
+    """
+    Persistent Queue: Jobs can only be claimed once
+
+    """
+    pq1 = PersistentQueue(str(tmpdir))
+    pq2 = PersistentQueue(str(tmpdir))
+
+    key = pq1.put({"body": "test"})
+
+    # Both queues list the job before either claims it
+    with mock.patch("os.rename", side_effect=FileNotFoundError()):
+        assert pq1.claim() is None
+
+    assert pq2.claim()[0] == key
+    assert pq1.claim() is None
+
+    pq2.complete(key)
+    key = pq1.put({"body": "test"})
+
+    # A failure to claim our job leaves it queued
+    with mock.patch("os.rename", side_effect=OSError()):
+        assert pq1.claim() is None
+
+    assert pq1.keys() == [key]
+
+
+def test_persistent_queue_corrupt(tmpdir):
+    """
+    Persistent Queue: Unreadable jobs are discarded
+
+    """
+    pq = PersistentQueue(str(tmpdir))
+    key = pq.put({"body": "test"})
+    path = os.path.join(pq.path, "var", key + pq.extension)
+
+    with open(path, "w") as fp:
+        fp.write("{garbage")
+
+    assert pq.claim() is None
+    assert len(pq) == 0
+
+    # Valid JSON, but not a job
+    key = pq.put({"body": "test"})
+    path = os.path.join(pq.path, "var", key + pq.extension)
+    with open(path, "w") as fp:
+        json.dump(["not", "a", "job"], fp)
+
+    assert pq.claim() is None
+    assert len(pq) == 0
+
+    # Content we can not write is never queued
+    assert pq.put({"body": object()}) is None
+    assert len(pq) == 0
+    assert os.listdir(os.path.join(pq.path, "tmp")) == []
+
+    with mock.patch("tempfile.NamedTemporaryFile", side_effect=OSError()):
+        assert pq.put({"body": "test"}) is None
+
+
+def test_persistent_queue_release(tmpdir):
+    """
+    Persistent Queue: Failed jobs are retried later and eventually discarded
+
+    """
+    pq = PersistentQueue(str(tmpdir))
+    pq.max_attempts = 3
+
+    key = pq.put({"body": "test"})
+    key, job = pq.claim()
+
+    now = time.time()
+    new_key = pq.release(key, job)
+    assert new_key and new_key != key
+    assert pq.keys(active=True) == []
+
+    # Our job is delayed by our backoff
+    due = int(new_key.split("-", 1)[0]) / 1000
+    assert due >= now + pq.retry_backoff - 1
+
+    # It is not due yet
+    assert pq.claim() is None
+
+    # Our attempts are tracked
+    with open(os.path.join(pq.path, "var", new_key + pq.extension)) as fp:
+        assert json.load(fp)["attempts"] == 1
+
+    # Make our job due again
+    os.rename(
+        os.path.join(pq.path, "var", new_key + pq.extension),
+        os.path.join(pq.path, "var", "0" * 14 + "-a" + pq.extension),
+    )
+    key, job = pq.claim()
+    assert job["attempts"] == 1
+
+    # Our backoff grows with each attempt but never exceeds our maximum
+    pq.retry_backoff = 100.0
+    pq.retry_max_wait = 150.0
+    now = time.time()
+    new_key = pq.release(key, job)
+    due = int(new_key.split("-", 1)[0]) / 1000
+    assert now + 149 <= due <= now + 151
+
+    # Make our job due again; this is our last attempt
+    os.rename(
+        os.path.join(pq.path, "var", new_key + pq.extension),
+        os.path.join(pq.path, "var", "0" * 14 + "-b" + pq.extension),
+    )
+    key, job = pq.claim()
+    assert job["attempts"] == 2
+    assert pq.release(key, job) is None
+
+    # Our job was discarded
+    assert len(pq) == 0
+
+    # A job we fail to re-queue is left to be recovered
+    key = pq.put({"body": "test"})
+    key, job = pq.claim()
+    with mock.patch.object(pq, "put", return_value=None):
+        assert pq.release(key, job) is None
+
+    assert pq.keys(active=True) == [key]
+
+
+def test_persistent_queue_recover(tmpdir):
+    """
+    Persistent Queue: Abandoned jobs are recovered
+
+    """
+    pq = PersistentQueue(str(tmpdir))
+
+    # Nothing to recover
+    assert pq.recover() == 0
+
+    key = pq.put({"body": "test"})
+    assert pq.claim()[0] == key
+
+    # Our lease has not expired
+    assert pq.recover() == 0
+    assert pq.claim() is None
+
+    # Our lease has expired
+    assert pq.recover(lease=-1) == 1
+    assert pq.keys() == [key]
+    assert pq.keys(active=True) == []
+
+    # It can be claimed again
+    assert pq.claim()[0] == key
+
+    with mock.patch("os.rename", side_effect=OSError()):
+        assert pq.recover(lease=-1) == 0
+
+    with mock.patch("os.rename", side_effect=FileNotFoundError()):
+        assert pq.recover(lease=-1) == 0
+
+    assert pq.keys(active=True) == [key]
+
+    # A renewed lease does not expire
+    path = os.path.join(pq.path, "run", key + ".job")
+    old = time.time() - 2 * pq.lease
+    os.utime(path, (old, old))
+    assert pq.renew(key) is True
+    assert pq.recover() == 0
+    assert pq.keys(active=True) == [key]
+
+    # Only claimed jobs can be renewed
+    assert pq.renew("unknown") is False
+    with mock.patch("os.utime", side_effect=OSError()):
+        assert pq.renew(key) is False
+
+
+@mock.patch("requests.request")
+def test_persistent_queue_lease_renewal(mock_request, tmpdir):
+    """
+    Persistent Queue: Leases are renewed while a job is being delivered
+
+    """
+
+    asset = AppriseAsset(storage_path=str(tmpdir))
+    a = Apprise(asset=asset)
+    assert a.add("json://localhost")
+    assert a.add("xml://localhost")
+
+    pq = PersistentQueue(str(tmpdir))
+    assert a.enqueue("body") is True
+    key, job = pq.claim()
+    path = os.path.join(pq.path, "run", key + ".job")
+
+    # Each of our services takes longer than our lease
+    mtimes = []
+
+    def _response(*args, **kwargs):
+        mtimes.append(os.stat(path).st_mtime)
+        old = time.time() - 2 * pq.lease
+        os.utime(path, (old, old))
+
+        response = requests.Request()
+        response.status_code = requests.codes.ok
+        response.content = b""
+        return response
+
+    mock_request.side_effect = _response
+
+    old = time.time() - 2 * pq.lease
+    os.utime(path, (old, old))
+    assert pq.deliver(job, asset=asset, key=key) == []
+
+    # Our lease was renewed before each of our services was notified and
+    # once more when the last of them finished
+    assert len(mtimes) == 2
+    assert all(mtime > old + pq.lease for mtime in mtimes)
+    assert pq.recover() == 0
+    assert pq.keys(active=True) == [key]
+
+    # Without a key there is nothing to renew
+    os.utime(path, (old, old))
+    mtimes.clear()
+    assert pq.deliver(job, asset=asset) == []
+    assert len(mtimes) == 2
+    assert all(mtime < time.time() - pq.lease for mtime in mtimes)
+    assert pq.recover() == 1
+
+
+@mock.patch("requests.request")
+def test_persistent_queue_enqueue(mock_request, tmpdir):
+    """
+    Persistent Queue: Apprise.enqueue() and drain()
+
+    """
+    mock_request.return_value = requests.Request()
+    mock_request.return_value.status_code = requests.codes.ok
+    mock_request.return_value.content = b""
+
+    asset = AppriseAsset(storage_path=str(tmpdir))
+    a = Apprise(asset=asset)
+    assert a.add("json://localhost/?retry=1", tag="2:abc:3, def")
+    assert a.add("xml://localhost", tag="other")
+
+    pq = PersistentQueue(str(tmpdir))
+
+    # Nothing matched
+    assert a.enqueue("body", tag="unknown") is None
+    assert len(pq) == 0
+
+    assert a.enqueue(b"body", title=b"title", tag="abc") is True
+    assert len(pq) == 1
+
+    # Enqueuing never sends anything
+    assert mock_request.call_count == 0
+
+    with open(os.path.join(pq.path, "var", pq.keys()[0] + ".job")) as fp:
+        job = json.load(fp)
+
+    assert job["body"] == "body"
+    assert job["title"] == "title"
+    assert job["tag"] == "abc"
+    assert job["notify_type"] == "info"
+    assert len(job["servers"]) == 1
+    assert job["servers"][0]["url"].startswith("json://localhost/")
+
+    # The priority and retry details of our tags are kept
+    assert sorted(job["servers"][0]["tag"]) == ["2:abc:3", "def"]
+
+    assert pq.drain(asset=asset) == (1, 0)
+    assert mock_request.call_count == 1
+    assert json.loads(mock_request.call_args[1]["data"])["message"] == "body"
+    assert len(pq) == 0
+
+    # Nothing left to drain
+    assert pq.drain(asset=asset) == (0, 0)
+
+    # Failed deliveries are returned to our queue
+    mock_request.reset_mock()
+    mock_request.return_value.status_code = (
+        requests.codes.internal_server_error
+    )
+    assert a.enqueue("body", tag="other") is True
+    with mock.patch("time.sleep"):
+        assert pq.drain(asset=asset, workers=2) == (0, 1)
+
+    assert mock_request.call_count == 1
+    assert len(pq.keys()) == 1
+    assert pq.keys(active=True) == []
+
+    # A job that raises an exception is treated as a failure
+    os.rename(
+        os.path.join(pq.path, "var", pq.keys()[0] + ".job"),
+        os.path.join(pq.path, "var", "0" * 14 + "-a.job"),
+    )
+    with mock.patch.object(pq, "deliver", side_effect=ValueError()):
+        assert pq.drain(asset=asset) == (0, 1)
+
+    # A job with no services (or none we can load) has nothing to deliver
+    assert pq.deliver({"servers": []}) == []
+    assert pq.deliver({"servers": [{"url": "invalid://"}]}) == []
+
+
+@mock.patch("requests.request")
+def test_persistent_queue_partial_delivery(mock_request, tmpdir):
+    """
+    Persistent Queue: Only the services that failed are retried
+
+    """
+
+    def _response(method, url, *args, **kwargs):
+        """Fail all of our xml:// deliveries."""
+        response = requests.Request()
+        response.content = b""
+        response.status_code = (
+            requests.codes.internal_server_error
+            if "xml" in url
+            else requests.codes.ok
+        )
+        return response
+
+    mock_request.side_effect = _response
+
+    asset = AppriseAsset(storage_path=str(tmpdir))
+    a = Apprise(asset=asset)
+    assert a.add("json://json.host", tag="abc")
+    assert a.add("xml://xml.host", tag="abc")
+    assert a.add("form://form.host", tag="abc")
+
+    pq = PersistentQueue(str(tmpdir))
+    assert a.enqueue("body") is True
+    assert pq.drain(asset=asset) == (0, 1)
+    assert mock_request.call_count == 3
+
+    # Only our failed service was returned to the queue
+    key = pq.keys()[0]
+    with open(os.path.join(pq.path, "var", key + ".job")) as fp:
+        job = json.load(fp)
+
+    assert job["attempts"] == 1
+    assert len(job["servers"]) == 1
+    assert job["servers"][0]["url"].startswith("xml://xml.host")
+    assert job["servers"][0]["tag"] == ["abc"]
+
+    # Make our job due again
+    os.rename(
+        os.path.join(pq.path, "var", key + ".job"),
+        os.path.join(pq.path, "var", "0" * 14 + "-a.job"),
+    )
+
+    # Our services that were already notified are not notified again
+    mock_request.reset_mock()
+    mock_request.side_effect = None
+    mock_request.return_value = requests.Request()
+    mock_request.return_value.status_code = requests.codes.ok
+    mock_request.return_value.content = b""
+    assert pq.drain(asset=asset) == (1, 0)
+    assert mock_request.call_count == 1
+    assert "xml.host" in mock_request.call_args[0][1]
+    assert len(pq) == 0
+
+    # Services passed over by a successful escalation chain are not retried
+    mock_request.reset_mock()
+    mock_request.side_effect = _response
+    a = Apprise(asset=asset)
+    assert a.add("json://json.host", tag="1:abc")
+    assert a.add("form://form.host", tag="2:abc")
+    assert a.add("xml://xml.host", tag="def")
+    assert a.enqueue("body", tag=["abc", "def"]) is True
+    assert pq.drain(asset=asset) == (0, 1)
+    assert mock_request.call_count == 2
+
+    with open(os.path.join(pq.path, "var", pq.keys()[0] + ".job")) as fp:
+        job = json.load(fp)
+
+    assert [s["url"].split("/")[2] for s in job["servers"]] == ["xml.host"]
+
+
+def test_persistent_queue_enqueue_errors(tmpdir):
+    """
+    Persistent Queue: Apprise.enqueue() error handling
+
+    """
+    # No persistent storage
+    a = Apprise()
+    assert a.add("json://localhost")
+    assert a.enqueue("body") is False
+
+    a = Apprise(
+        asset=AppriseAsset(
+            storage_path=str(tmpdir), storage_mode=PersistentStoreMode.MEMORY
+        )
+    )
+    assert a.add("json://localhost")
+    assert a.enqueue("body") is False
+
+    a = Apprise(asset=AppriseAsset(storage_path=str(tmpdir)))
+    assert a.add("json://localhost")
+
+    # Memory based attachments only exist within our process
+    attach = AppriseAttachment(AttachMemory(content="abc", name="test.txt"))
+    assert a.enqueue("body", attach=attach) is False
+
+    # File based attachments are queued by their URL
+    path = tmpdir.join("attach.txt")
+    path.write("content")
+    assert a.enqueue("body", attach=str(path)) is True
+
+    pq = PersistentQueue(str(tmpdir))
+    _key, job = pq.claim()
+    assert len(job["attach"]) == 1
+    assert str(path) in job["attach"][0]
+
+    # We fail if we can't write our job
+    with mock.patch("tempfile.NamedTemporaryFile", side_effect=OSError()):
+        assert a.enqueue("body") is False
+
+
+@mock.patch("requests.request")
+def test_persistent_queue_background(mock_request, tmpdir):
+    """
+    Persistent Queue: Background Workers
+
+    """
+    mock_request.return_value = requests.Request()
+    mock_request.return_value.status_code = requests.codes.ok
+    mock_request.return_value.content = b""
+
+    asset = AppriseAsset(storage_path=str(tmpdir))
+    a = Apprise(asset=asset)
+    assert a.add("json://localhost")
+
+    pq = PersistentQueue(str(tmpdir))
+    pq.poll_interval = 0.01
+
+    pq.start(asset=asset, workers=2)
+
+    # Starting twice is harmless
+    pq.start(asset=asset)
+
+    for _ in range(3):
+        assert a.enqueue("body") is True
+
+    # Wait for our workers to catch up
+    for _ in range(500):
+        if not len(pq):
+            break
+        time.sleep(0.01)
+
+    pq.stop(timeout=5)
+
+    assert len(pq) == 0
+    assert mock_request.call_count == 3
+
+    # Stopping twice is harmless
+    pq.stop()
+
+
+@mock.patch("requests.request")
+def test_persistent_queue_cli(mock_request, tmpdir):
+    """
+    Persistent Queue: CLI --queue and --drain
+
+    """
+    mock_request.return_value = requests.Request()
+    mock_request.return_value.status_code = requests.codes.ok
+    mock_request.return_value.content = b""
+
+    runner = CliRunner()
+    storage = ["--storage-path", str(tmpdir)]
+
+    result = runner.invoke(
+        cli.main, [*storage, "--queue", "-b", "test", "json://localhost"]
+    )
+    assert result.exit_code == 0
+    assert mock_request.call_count == 0
+
+    pq = PersistentQueue(str(tmpdir))
+    assert len(pq) == 1
+
+    # A dry run only reports what is queued
+    result = runner.invoke(cli.main, [*storage, "--drain", "--dry-run"])
+    assert result.exit_code == 0
+    assert "1 notification(s) queued" in result.output
+    assert mock_request.call_count == 0
+
+    result = runner.invoke(cli.main, [*storage, "--drain"])
+    assert result.exit_code == 0
+    assert mock_request.call_count == 1
+    assert len(pq) == 0
+
+    # Failures are reported
+    mock_request.reset_mock()
+    mock_request.return_value.status_code = (
+        requests.codes.internal_server_error
+    )
+    result = runner.invoke(
+        cli.main, [*storage, "-Q", "-b", "test", "json://localhost"]
+    )
+    assert result.exit_code == 0
+
+    result = runner.invoke(cli.main, [*storage, "--drain"])
+    assert result.exit_code == 1
+    assert mock_request.call_count == 1
+    assert len(pq) == 1
+
+    # Persistent storage is required
+    for option in ("--queue", "--drain"):
+        result = runner.invoke(
+            cli.main,
+            [*storage, "-SM", "memory", option, "-b", "test", "json://host"],
+        )
+        assert result.exit_code == 2
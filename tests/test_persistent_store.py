@@ -26,6 +26,7 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 from datetime import datetime, timedelta, timezone
+import gc
 import gzip
 import json
 
@@ -35,20 +36,25 @@ import os
 import shutil
 import sys
 import tempfile
+import threading
 import time
 from unittest import mock
 import zlib
 
 import pytest
 
-from apprise import exception
+from apprise import Apprise, exception
 from apprise.asset import AppriseAsset
 from apprise.persistent_store import (
     CacheJSONEncoder,
     CacheObject,
+    NamespaceLock,
     PersistentStore,
+    PersistentStoreCatalog,
     PersistentStoreMode,
 )
+from apprise.utils.disk import dir_size
+from apprise.utils.ratelimit import RATELIMIT_STORAGE_DIR, FileRateLimiter
 
 logging.disable(logging.CRITICAL)
 
@@ -944,7 +950,7 @@ def test_persistent_storage_corruption_handling(tmpdir):
         assert pc.size(exclude=False, lazy=False) == 0
 
     pc = PersistentStore(namespace=namespace, path=str(tmpdir))
-    with mock.patch("glob.glob", side_effect=OSError()):
+    with mock.patch("os.scandir", side_effect=OSError()):
         assert pc.files(exclude=True, lazy=False) == []
         assert pc.files(exclude=False, lazy=False) == []
 
@@ -952,6 +958,9 @@ def test_persistent_storage_corruption_handling(tmpdir):
         namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
     )
 
+    # Have our changes rewritten as a whole (rather than journaled)
+    pc.journal_size = 0
+
     # Causes an initialization
     pc["abc"] = 1
     with mock.patch("os.unlink", side_effect=OSError()):
@@ -1004,6 +1013,797 @@ def test_persistent_storage_corruption_handling(tmpdir):
         assert pc.flush(force=True) is False
 
 
+def test_persistent_storage_journal(tmpdir):
+    """Test the journaling of changes made to our cache."""
+
+    namespace = "journal"
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+
+    # Our first change writes our cache as a whole
+    pc.set("key1", "value1")
+    pc.set("key2", "value2", persistent=False)
+    assert os.path.isfile(pc.cache_file)
+    assert not os.path.isfile(pc.journal_file)
+    with gzip.open(pc.cache_file, "rb") as f:
+        cache_size = len(f.read())
+
+    # Those that follow are journaled
+    pc.set("key3", "value3")
+    pc["key1"] = "value1b"
+    pc.clear("key3")
+    assert os.path.isfile(pc.journal_file)
+    with open(pc.journal_file, "rb") as f:
+        # Our journal is identified by its first entry
+        assert len(f.readlines()) == 4
+
+    # Our cache file was left untouched
+    with gzip.open(pc.cache_file, "rb") as f:
+        assert len(f.read()) == cache_size
+
+    # Our journal counts towards the size of our storage
+    assert pc.journal_file in pc.files(lazy=False)
+
+    # Our journal is applied when our cache is loaded
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert pc.get("key1") == "value1b"
+    assert "key2" not in pc
+    assert "key3" not in pc
+
+    # Entries that are no longer persistent are removed from disk
+    pc.set("key1", "value1c", persistent=False)
+    pc.set("key4", "value4")
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert "key1" not in pc
+    assert pc.get("key4") == "value4"
+
+    # Our journal is merged back into our cache once it grows too large
+    pc.journal_size = 200
+    for no in range(10):
+        pc.set("counter", no)
+
+    if os.path.isfile(pc.journal_file):
+        with open(pc.journal_file, "rb") as f:
+            assert len(f.readlines()) < 10
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert pc.get("counter") == 9
+    assert pc.get("key4") == "value4"
+
+    # A forced flush merges our journal as well
+    assert pc.flush(force=True)
+    assert not os.path.isfile(pc.journal_file)
+
+    # An entry that was only partially written (or is otherwise invalid) is
+    # ignored; our cache is then rewritten as a whole on our next flush
+    pc.set("key5", "value5")
+    del pc["key5"]
+    with open(pc.journal_file, "ab") as f:
+        f.write(b'{"key6": {"v": "value6", "x": null}}\n[]\n{"key7": {')
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert "key5" not in pc
+    assert "key6" not in pc
+    assert pc.get("key4") == "value4"
+    pc.set("key8", "value8")
+    assert not os.path.isfile(pc.journal_file)
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert pc.get("key8") == "value8"
+    assert pc.get("counter") == 9
+
+    # Changes are written as a whole if they can not be journaled
+    with mock.patch("builtins.open", side_effect=OSError()):
+        pc.set("key9", "value9")
+    assert not os.path.isfile(pc.journal_file)
+
+    pc.set("key9", "value9b")
+    with mock.patch("json.dumps", side_effect=(TypeError(), "{}")):
+        assert pc.flush(force=False) is True
+        pc.set("key9", "value9c")
+    assert not os.path.isfile(pc.journal_file)
+
+    # Our journal could not be read
+    pc.set("key10", "value10")
+    _open = open
+
+    def journal_open(path, *args, **kwargs):
+        if path == pc.journal_file:
+            raise OSError()
+        return _open(path, *args, **kwargs)
+
+    with mock.patch("builtins.open", side_effect=journal_open):
+        pc = PersistentStore(
+            namespace=namespace,
+            path=str(tmpdir),
+            mode=PersistentStoreMode.FLUSH,
+        )
+        assert "key10" not in pc
+
+    # Our journal could not be removed
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert pc.get("key10") == "value10"
+    with mock.patch("os.unlink", side_effect=OSError()):
+        assert pc.flush(force=True) is False
+        pc.clear()
+        assert pc.flush() is False
+
+    with mock.patch("os.unlink", side_effect=(FileNotFoundError(), OSError())):
+        assert pc.flush() is False
+
+    # Everything is removed once our cache is emptied
+    assert pc.flush() is True
+    assert not os.path.isfile(pc.cache_file)
+    assert not os.path.isfile(pc.journal_file)
+
+    # A journal left behind once merged is never applied again
+    pc.set("key1", "value1")
+    pc.set("key2", "value2")
+    pc.set("key1", "value1b")
+    assert os.path.isfile(pc.journal_file)
+    pc.clear("key2")
+    with mock.patch.object(
+        PersistentStore, "_PersistentStore__journal_tidy", return_value=False
+    ):
+        assert pc.flush(force=True) is True
+    assert os.path.isfile(pc.journal_file)
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert pc.get("key1") == "value1b"
+    assert "key2" not in pc
+
+    # nor is it appended to
+    pc.set("key3", "value3")
+    assert not os.path.isfile(pc.journal_file)
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert pc.get("key1") == "value1b"
+    assert pc.get("key3") == "value3"
+
+    # Our journal is kept if our new cache file could not be put in place
+    pc.set("key4", "value4")
+    assert os.path.isfile(pc.journal_file)
+    with mock.patch.object(
+        PersistentStore, "_PersistentStore__move", return_value=False
+    ):
+        assert pc.flush(force=True) is False
+    assert os.path.isfile(pc.journal_file)
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert pc.get("key3") == "value3"
+    assert pc.get("key4") == "value4"
+
+    # A journal without a cache file is never applied
+    pc.clear()
+    assert not os.path.isfile(pc.cache_file)
+    with open(pc.journal_file, "wb") as f:
+        f.write(b'{"key5":{"v":"value5","x":null,"c":"str","!":"0"}}\n')
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert "key5" not in pc
+
+    # and is replaced on our next flush
+    with open(pc.journal_file, "wb") as f:
+        f.write(b"garbage\n")
+    pc.set("key6", "value6")
+    assert not os.path.isfile(pc.journal_file)
+    pc.clear()
+
+    # A corrupted cache file takes our journal with it
+    pc.set("key1", "value1")
+    pc.set("key2", "value2")
+    assert os.path.isfile(pc.journal_file)
+    with gzip.open(pc.cache_file, "wb") as f:
+        f.write(b"{")
+
+    pc = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.FLUSH
+    )
+    assert "key2" not in pc
+    assert not os.path.isfile(pc.journal_file)
+
+    # Our journal is removed along with our cache
+    pc.set("key1", "value1")
+    pc.set("key2", "value2")
+    assert os.path.isfile(pc.journal_file)
+    assert pc.delete(cache=True)
+    assert not os.path.isfile(pc.cache_file)
+    assert not os.path.isfile(pc.journal_file)
+
+    # and when it is pruned
+    pc.set("key1", "value1")
+    pc.set("key2", "value2")
+    results = PersistentStore.disk_prune(
+        path=str(tmpdir), namespace=namespace, expires=0, action=True
+    )
+    assert {r["path"] for r in results[namespace]} >= {
+        pc.cache_file,
+        pc.journal_file,
+    }
+    assert not os.path.isfile(pc.journal_file)
+
+
+def test_persistent_storage_concurrency(tmpdir):
+    """Test stores (or processes) sharing the same namespace."""
+
+    namespace = "shared"
+    kwargs = {
+        "namespace": namespace,
+        "path": str(tmpdir),
+        "mode": PersistentStoreMode.FLUSH,
+    }
+
+    pc1 = PersistentStore(**kwargs)
+    pc2 = PersistentStore(**kwargs)
+    assert pc1.get("key") is None
+    assert pc2.get("key") is None
+
+    # Neither store loses the changes made by the other
+    pc1.set("key1", "value1")
+    pc2.set("key2", "value2")
+    pc1.set("key3", "value3")
+    pc2["key1"] = "value1b"
+
+    # Changes made by others are picked up
+    assert pc1.get("key1") == "value1b"
+    assert pc1.get("key2") == "value2"
+    assert "key3" in pc2
+    assert set(pc2.keys()) == {"key1", "key2", "key3"}
+
+    # Removals are merged too
+    pc1.clear("key3")
+    assert "key3" not in pc2
+
+    # Our non-persistent entries survive a merge
+    pc2.set("temp", "value", persistent=False)
+    pc1.set("key4", "value4")
+    assert pc2.get("temp") == "value"
+    assert pc2.get("key4") == "value4"
+
+    assert PersistentStore(**kwargs).get("key1") == "value1b"
+    assert PersistentStore(**kwargs).get("temp") is None
+
+    # Our own (pending) removals are kept when merging
+    pc1 = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.AUTO
+    )
+    assert pc1.get("key4") == "value4"
+    pc1.clear("key4")
+    pc2.set("key5", "value5")
+    assert pc1.flush()
+    assert pc2.get("key4") is None
+    assert pc2.get("key5") == "value5"
+
+    # Our cache can not be read back while merging
+    pc1.set("key6", "value6")
+    pc2.set("key7", "value7")
+    with mock.patch("gzip.open", side_effect=OSError()):
+        assert pc1.get("key7") is None
+        assert pc1.get("key6") == "value6"
+    assert pc1.flush()
+    assert pc2.get("key6") == "value6"
+    assert pc2.get("key7") is None
+
+    # A store rewriting its cache as a whole takes precedence
+    pc3 = PersistentStore(**kwargs)
+    pc3.clear()
+    pc2.set("key5", "value5")
+    pc3.flush(force=True)
+    assert pc1.get("key1") is None
+    assert pc1.get("key5") is None
+
+    # A cache file removed (or left unreadable) from underneath us
+    pc1 = PersistentStore(**kwargs)
+    pc2 = PersistentStore(**kwargs)
+    pc1.set("key1", "value1")
+    pc2.set("key2", "value2")
+    with open(pc2.cache_file, "wb") as f:
+        f.write(b"garbage")
+    pc1.set("key3", "value3")
+    pc1 = PersistentStore(**kwargs)
+    assert pc1.get("key1") is None
+    assert pc1.get("key3") == "value3"
+
+    # Pending changes are merged on an explicit flush
+    pc1 = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.AUTO
+    )
+    pc2 = PersistentStore(
+        namespace=namespace, path=str(tmpdir), mode=PersistentStoreMode.AUTO
+    )
+    pc1.set("key6", "value6")
+    pc2.set("key7", "value7")
+    assert pc1.flush()
+    assert pc2.flush()
+    pc = PersistentStore(**kwargs)
+    assert pc.get("key6") == "value6"
+    assert pc.get("key7") == "value7"
+
+    # Concurrent writers (each with their own store) lose nothing
+    def worker(no):
+        pc = PersistentStore(**kwargs)
+        for i in range(10):
+            pc.set(f"worker{no}-{i}", i)
+
+    threads = [threading.Thread(target=worker, args=(no,)) for no in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    pc = PersistentStore(**kwargs)
+    assert all(
+        pc.get(f"worker{no}-{i}") == i for no in range(4) for i in range(10)
+    )
+
+    # A store in memory is never synchronized
+    pc = PersistentStore(namespace=namespace, mode=PersistentStoreMode.MEMORY)
+    pc.set("key", "value")
+    assert pc.get("key") == "value"
+    assert pc.flush()
+
+
+def test_persistent_storage_shared_threads(tmpdir):
+    """Test a single store shared by threads while it is being refreshed."""
+
+    kwargs = {
+        "namespace": "threads",
+        "path": str(tmpdir),
+        "mode": PersistentStoreMode.AUTO,
+    }
+
+    shared = PersistentStore(**kwargs)
+    other = PersistentStore(**kwargs)
+    assert shared.get("key") is None
+
+    # A change still pending in our shared store
+    shared.set("key0", "value0")
+
+    other.set("key1", "value1")
+    assert other.flush()
+
+    # Another thread sets a value while our cache is being merged with what
+    # is on disk
+    threads = []
+    gzip_open = gzip.open
+
+    def _gzip_open(*args, **kwargs):
+        if not threads:
+            thread = threading.Thread(
+                target=shared.set, args=("key2", "value2")
+            )
+            threads.append(thread)
+            thread.start()
+
+            # Give our thread every chance to get in our way
+            thread.join(timeout=0.5)
+        return gzip_open(*args, **kwargs)
+
+    with mock.patch("gzip.open", side_effect=_gzip_open):
+        assert shared.get("key1") == "value1"
+
+    threads[0].join()
+    assert shared.get("key0") == "value0"
+    assert shared.get("key1") == "value1"
+    assert shared.get("key2") == "value2"
+    assert shared.flush()
+    pc = PersistentStore(**kwargs)
+    assert pc.get("key0") == "value0"
+    assert pc.get("key2") == "value2"
+
+
+def test_persistent_storage_refresh_interval(tmpdir):
+    """Test how often a store looks for changes made by other processes."""
+
+    kwargs = {
+        "namespace": "refresh",
+        "path": str(tmpdir),
+        "mode": PersistentStoreMode.FLUSH,
+    }
+
+    pc = PersistentStore(**kwargs)
+    pc.set("key", "value")
+
+    with mock.patch("os.stat", wraps=os.stat) as mock_stat:
+        for _ in range(100):
+            assert pc.get("key") == "value"
+
+        # Our disk is only looked at once per interval
+        assert mock_stat.call_count <= 2
+
+    # Changes made within our process are always picked up
+    PersistentStore(**kwargs).set("key", "value2")
+    assert pc.get("key") == "value2"
+
+    # Changes made by another process (our lock is not shared with it) are
+    # picked up once our interval has passed
+    with mock.patch.object(
+        NamespaceLock, "instance", side_effect=lambda path: NamespaceLock(path)
+    ):
+        PersistentStore(**kwargs).set("key", "value3")
+
+    assert pc.get("key") == "value2"
+    with mock.patch("time.monotonic", return_value=time.monotonic() + 5):
+        assert pc.get("key") == "value3"
+
+
+def test_persistent_storage_locking(tmpdir):
+    """Test the locking of our namespace."""
+
+    kwargs = {
+        "namespace": "locking",
+        "path": str(tmpdir),
+        "mode": PersistentStoreMode.FLUSH,
+    }
+
+    # Without file locking, changes are still merged within our process
+    with mock.patch("apprise.persistent_store.FILE_LOCK_SUPPORT", False):
+        pc1 = PersistentStore(**kwargs)
+        pc2 = PersistentStore(**kwargs)
+        assert pc1.get("key") is None
+        pc2.set("key2", "value2")
+        pc1.set("key1", "value1")
+        assert pc2.get("key1") == "value1"
+        assert pc1.get("key2") == "value2"
+
+    # Our namespace can not be locked
+    with mock.patch("fcntl.flock", side_effect=OSError()) as mock_flock:
+        pc1.set("key3", "value3")
+        assert pc2.get("key3") == "value3"
+        assert mock_flock.call_count > 0
+
+    # Our namespace directory is (re)created as needed
+    pc = PersistentStore(**kwargs)
+    shutil.rmtree(pc.path)
+    pc.set("key", "value")
+    assert PersistentStore(**kwargs).get("key") == "value"
+
+
+def test_persistent_storage_shared_by_plugins(tmpdir):
+    """Test the sharing of a store between services."""
+
+    asset = AppriseAsset(
+        storage_path=str(tmpdir), storage_mode=PersistentStoreMode.FLUSH
+    )
+    obj1 = Apprise.instantiate("json://localhost/", asset=asset)
+    obj2 = Apprise.instantiate("json://localhost/", asset=asset)
+    obj3 = Apprise.instantiate("json://localhost:8080/", asset=asset)
+    assert obj1.store is obj2.store
+    assert obj1.store is not obj3.store
+
+    obj1.store.set("token", "abcd")
+    assert obj2.store.get("token") == "abcd"
+    assert obj3.store.get("token") is None
+
+    # Stores kept in memory are never shared
+    asset = AppriseAsset(storage_mode=PersistentStoreMode.MEMORY)
+    obj1 = Apprise.instantiate("json://localhost/", asset=asset)
+    obj2 = Apprise.instantiate("json://localhost/", asset=asset)
+    assert obj1.store is not obj2.store
+
+
+def test_persistent_storage_catalog(tmpdir):
+    """Test the catalog of our storage path."""
+
+    path = str(tmpdir)
+    catalog = PersistentStoreCatalog(path)
+    assert not catalog.exists()
+    assert catalog.load() is None
+
+    # Nothing to scan (or catalog)
+    assert PersistentStore.disk_usage(path) == {}
+    assert not catalog.exists()
+
+    for namespace in ("abc", "abd", "xyz"):
+        pc = PersistentStore(
+            namespace=namespace, path=path, mode=PersistentStoreMode.FLUSH
+        )
+        pc.set("key", "value")
+        assert pc.write(b"data")
+
+    # Our stores never create a catalog
+    assert not catalog.exists()
+
+    # A scoped scan does not either
+    usage = PersistentStore.disk_usage(path, namespace="ab")
+    assert set(usage.keys()) == {"abc", "abd"}
+    assert not catalog.exists()
+
+    # Our catalog is created from a full scan
+    usage = PersistentStore.disk_usage(path)
+    assert set(usage.keys()) == {"abc", "abd", "xyz"}
+    assert usage["abc"]["size"] == dir_size(os.path.join(path, "abc"))[0]
+    assert usage["abc"]["newest"] >= usage["abc"]["oldest"]
+    assert catalog.exists()
+    assert set(catalog.load().keys()) == {"abc", "abd", "xyz"}
+
+    # The catalog is not a namespace
+    assert set(PersistentStore.disk_scan(path)) == {"abc", "abd", "xyz"}
+
+    # Our usage is now looked up rather than scanned
+    with mock.patch(
+        "apprise.persistent_store.dir_usage", side_effect=AssertionError()
+    ):
+        assert PersistentStore.disk_usage(path) == usage
+        assert PersistentStore.disk_usage(path, namespace="xyz") == {
+            "xyz": usage["xyz"]
+        }
+
+    # Stores keep our catalog up to date (at most once a minute)
+    pc = PersistentStore(
+        namespace="abc", path=path, mode=PersistentStoreMode.FLUSH
+    )
+    assert pc.write(b"more data", key="other")
+    size = PersistentStore.disk_usage(path)["abc"]["size"]
+    assert size == dir_size(os.path.join(path, "abc"))[0]
+    assert pc.write(b"even more data", key="another")
+    assert PersistentStore.disk_usage(path)["abc"]["size"] == size
+
+    # Pending changes are recorded by a forced flush
+    assert pc.flush(force=True)
+    size = PersistentStore.disk_usage(path)["abc"]["size"]
+    assert size == dir_size(os.path.join(path, "abc"))[0]
+
+    # Destroying our store never touches our catalog
+    assert pc.write(b"yet more data", key="another")
+    with mock.patch.object(
+        PersistentStoreCatalog, "update", side_effect=AssertionError()
+    ):
+        del pc
+        gc.collect()
+    assert PersistentStore.disk_usage(path)["abc"]["size"] == size
+
+    # Pending changes are otherwise recorded when we exit
+    PersistentStore.catalog_flush()
+    size = PersistentStore.disk_usage(path)["abc"]["size"]
+    assert size == dir_size(os.path.join(path, "abc"))[0]
+
+    # Nothing is left to record
+    with mock.patch.object(
+        PersistentStoreCatalog, "update", side_effect=AssertionError()
+    ):
+        PersistentStore.catalog_flush()
+
+    pc = PersistentStore(
+        namespace="abd", path=path, mode=PersistentStoreMode.FLUSH
+    )
+    pc.catalog_interval = 0
+    pc.set("key2", "value2")
+    size = PersistentStore.disk_usage(path)["abd"]["size"]
+    assert size == dir_size(os.path.join(path, "abd"))[0]
+
+    # Namespaces removed from disk
+    assert pc.delete()
+    shutil.rmtree(pc.path)
+    pc.catalog_interval = 60
+    assert pc.delete()
+    assert "abd" not in catalog.load()
+
+    # A namespace created (or removed) behind our back
+    os.mkdir(os.path.join(path, "new"))
+    shutil.rmtree(os.path.join(path, "xyz"))
+    assert "xyz" in catalog.load()
+    usage = PersistentStore.disk_usage(path)
+    assert set(usage.keys()) == {"abc", "new"}
+    assert usage["new"] == {"size": 0, "newest": None, "oldest": None}
+    assert set(catalog.load().keys()) == {"abc", "new"}
+
+    # Our catalog is compacted as it grows
+    catalog.compact_threshold = 2
+    for _ in range(4):
+        assert catalog.update({"abc": (1, 2.0, 1.0)})
+    with open(catalog.catalog_file, "rb") as f:
+        assert len(f.readlines()) > 4
+    assert catalog.load()["abc"] == (1, 2.0, 1.0)
+    with open(catalog.catalog_file, "rb") as f:
+        assert len(f.readlines()) == 2
+    assert catalog.load()["abc"] == (1, 2.0, 1.0)
+
+    # Corrupted records are ignored
+    with open(catalog.catalog_file, "ab") as f:
+        f.write(b"garbage\n")
+        f.write(b'{"n":"abc","s":"bad"}\n')
+        f.write(b'{"n":"abc",\n')
+    assert set(catalog.load().keys()) == {"abc", "new"}
+    assert catalog.update({})
+
+    with mock.patch("builtins.open", side_effect=OSError()):
+        assert catalog.load() is None
+
+    # Our catalog can not be written to
+    with mock.patch("os.open", side_effect=OSError()):
+        assert not catalog.update({"abc": None})
+
+    with mock.patch("os.write", side_effect=OSError()):
+        assert not catalog.update({"abc": None})
+
+    with mock.patch("tempfile.mkstemp", side_effect=OSError()):
+        assert not catalog.save({})
+
+    with mock.patch("os.replace", side_effect=OSError()):
+        assert not catalog.save({})
+    assert set(catalog.load().keys()) == {"abc", "new"}
+
+    catalog.compact_threshold = -10
+    with mock.patch("fcntl.flock", side_effect=OSError()):
+        assert catalog.load()
+    catalog.compact_threshold = 1024
+    assert set(catalog.load().keys()) == {"abc", "new"}
+
+    # Our catalog is rewritten while we append to it
+    real_fstat = os.fstat
+    calls = []
+
+    def fstat(fd):
+        calls.append(fd)
+        return mock.Mock(st_ino=0) if len(calls) == 1 else real_fstat(fd)
+
+    with mock.patch("os.fstat", side_effect=fstat):
+        assert catalog.update({"abc": None})
+        assert len(calls) == 2
+
+    # We never catch up with it
+    with mock.patch("os.fstat", return_value=mock.Mock(st_ino=0)):
+        assert not catalog.update({"abc": None})
+    assert set(catalog.load().keys()) == {"new"}
+
+    # Without file locking
+    with mock.patch("apprise.persistent_store.FILE_LOCK_SUPPORT", False):
+        assert catalog.update({"abc": (1, 2.0, 1.0)})
+        catalog.compact_threshold = 0
+        assert set(catalog.load().keys()) == {"abc", "new"}
+
+    # Our catalog is gone
+    os.unlink(catalog.catalog_file)
+    assert not catalog.update({"abc": None})
+    assert (
+        PersistentStoreCatalog(os.path.join(path, "missing")).save({}) is False
+    )
+
+
+def test_persistent_storage_scan(tmpdir):
+    """Test the scanning of our storage path."""
+
+    path = str(tmpdir)
+    pc = PersistentStore(
+        namespace="abc", path=path, mode=PersistentStoreMode.FLUSH
+    )
+    pc.set("key", "value")
+    assert pc.write(b"data")
+
+    # Hidden files and what is not a regular file are not counted
+    tmpdir.join("abc", ".hidden").write("hidden")
+    os.symlink(
+        os.path.join(path, "missing"), os.path.join(path, "abc", "link")
+    )
+    assert set(pc.files(lazy=False)) == {
+        pc.cache_file,
+        os.path.join(pc.path, "var", "default.psdata"),
+    }
+
+    # A directory we can not get into
+    real_scandir = os.scandir
+
+    def scandir(dirpath):
+        if dirpath == os.path.join(pc.path, "var"):
+            raise PermissionError()
+        return real_scandir(dirpath)
+
+    with mock.patch("os.scandir", side_effect=scandir):
+        assert pc.files(lazy=False) == [pc.cache_file]
+
+    # An entry removed while we scan
+    entry = mock.Mock()
+    entry.name = "xyz"
+    entry.is_dir.side_effect = FileNotFoundError()
+    with mock.patch("os.scandir") as mock_scandir:
+        mock_scandir.return_value.__enter__.return_value = [entry]
+        assert PersistentStore.disk_scan(path) == []
+
+
+def test_persistent_storage_catalog_prune(tmpdir):
+    """Test the pruning of a catalogued storage path."""
+
+    path = str(tmpdir)
+    catalog = PersistentStoreCatalog(path)
+
+    for namespace in ("abc", "def"):
+        pc = PersistentStore(
+            namespace=namespace, path=path, mode=PersistentStoreMode.FLUSH
+        )
+        pc.set("key", "value")
+
+    # Our catalog is built from a full prune
+    results = PersistentStore.disk_prune(path=path, action=True)
+    assert results == {"abc": [], "def": []}
+    assert set(catalog.load().keys()) == {"abc", "def"}
+
+    # Namespaces with nothing old enough to be pruned are never scanned
+    with mock.patch("os.path.getmtime", side_effect=AssertionError()):
+        results = PersistentStore.disk_prune(path=path, action=True)
+        assert results == {"abc": [], "def": []}
+
+    # Our catalog claims a namespace is more recent than it is
+    old = time.time() - 3600
+    os.utime(os.path.join(path, "abc", "cache.psdata"), (old, old))
+    assert not PersistentStore.disk_prune(
+        path=path, namespace="abc", expires=60, action=True
+    )["abc"]
+
+    # It is only trusted for the namespaces it knows of
+    assert catalog.update({"abc": None})
+    results = PersistentStore.disk_prune(
+        path=path, namespace="abc", expires=60, action=True
+    )
+    assert len(results["abc"]) == 1
+    assert results["abc"][0]["removed"]
+    assert "abc" not in catalog.load()
+
+    # Pruning everything
+    assert catalog.update({"xyz": (1, 2.0, 1.0)})
+    results = PersistentStore.disk_prune(path=path, expires=0, action=True)
+    assert set(results.keys()) == {"def"}
+    assert catalog.load() == {}
+
+    # A dry run leaves our catalog alone
+    pc = PersistentStore(
+        namespace="abc", path=path, mode=PersistentStoreMode.FLUSH
+    )
+    pc.set("key", "value")
+    entries = catalog.load()
+    assert set(entries.keys()) == {"abc"}
+    assert catalog.update({"abc": None})
+    assert not PersistentStore.disk_prune(path=path, action=False)["abc"]
+    assert catalog.load() == {}
+
+
+def test_persistent_storage_ratelimit_prune(tmpdir):
+    """Test the pruning of the rate limit buckets kept in a storage path."""
+
+    path = str(tmpdir)
+    ratelimit_dir = os.path.join(path, RATELIMIT_STORAGE_DIR)
+    limiter = FileRateLimiter.instance(ratelimit_dir)
+
+    # A bucket that is full again and one that is not
+    with mock.patch("time.time", return_value=time.time() - 3600):
+        assert limiter.reserve("a", 1.0) == 0.0
+    assert limiter.reserve("b", 3600.0) == 0.0
+    assert len(os.listdir(ratelimit_dir)) == 2
+
+    # Our buckets are never mistaken for a namespace
+    assert PersistentStore.disk_scan(path) == []
+
+    # Nothing is removed when pruning specific namespaces or on a dry run
+    PersistentStore.disk_prune(path=path, namespace="abc", action=True)
+    PersistentStore.disk_prune(path=path, action=False)
+    assert len(os.listdir(ratelimit_dir)) == 2
+
+    # Only our full bucket is removed
+    PersistentStore.disk_prune(path=path, action=True)
+    assert len(os.listdir(ratelimit_dir)) == 1
+    assert limiter.reserve("b", 3600.0) > 0.0
+
+
 def test_persistent_custom_io(tmpdir):
     """Test reading and writing custom files."""
 
@@ -1465,14 +2265,14 @@ def test_persistent_storage_disk_prune(tmpdir):
     assert pc.get("key-t01") == "value"
     assert pc.read() == b"data-t01"
 
-    with mock.patch("os.listdir", side_effect=OSError()):
+    with mock.patch("os.scandir", side_effect=OSError()):
         results = PersistentStore.disk_scan(
             namespace="t01", path=str(tmpdir), closest=True
         )
         assert isinstance(results, list)
         assert len(results) == 0
 
-    with mock.patch("os.listdir", side_effect=FileNotFoundError()):
+    with mock.patch("os.scandir", side_effect=FileNotFoundError()):
         results = PersistentStore.disk_scan(
             namespace="t01", path=str(tmpdir), closest=True
         )
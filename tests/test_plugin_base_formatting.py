@@ -39,6 +39,7 @@ import requests
 from apprise import (
     Apprise,
     AppriseAsset,
+    LengthUnit,
     NotifyBase,
     NotifyFormat,
     OverflowMode,
@@ -3706,6 +3707,43 @@ def test_notify_overflow_split_no_amalgamation_force_title_once():
         )
 
 
+def test_notify_overflow_length_unit():
+    """
+    API: Overflow Handling measured in encoded units
+
+    """
+
+    class TestNotification(NotifyBase):
+        # Our limit is measured in UTF-8 bytes
+        body_maxlen = 10
+        body_maxlen_unit = LengthUnit.UTF8
+        title_maxlen = 0
+
+        def notify(self, *args, **kwargs):
+            # Pretend everything is okay
+            return True
+
+    # 6 characters, but 12 bytes
+    body = "éééééé"
+
+    obj = TestNotification(overflow=OverflowMode.SPLIT)
+    chunks = obj._apply_overflow(body=body)
+    assert [c["body"] for c in chunks] == ["ééééé", "é"]
+
+    obj = TestNotification(overflow=OverflowMode.TRUNCATE)
+    chunks = obj._apply_overflow(body=body)
+    assert [c["body"] for c in chunks] == ["ééééé"]
+
+    # Content that fits is untouched
+    chunks = obj._apply_overflow(body="ééééé")
+    assert [c["body"] for c in chunks] == ["ééééé"]
+
+    # Measured in characters (the default) everything fits
+    TestNotification.body_maxlen_unit = LengthUnit.CHARS
+    chunks = obj._apply_overflow(body=body)
+    assert [c["body"] for c in chunks] == [body]
+
+
 def test_notify_markdown_general():
     """
     API: Markdown General Testing
@@ -25,6 +25,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from json import loads
 
@@ -35,13 +36,20 @@ from random import choice
 from string import ascii_uppercase as str_alpha, digits as str_num
 from unittest import mock
 
-from helpers import AppriseURLTester
+from helpers import AppriseURLTester, AsyncHTTPMock
 import pytest
 import requests
 
-from apprise import Apprise, AppriseAttachment, NotifyFormat, NotifyType
+from apprise import (
+    Apprise,
+    AppriseAsset,
+    AppriseAttachment,
+    NotifyFormat,
+    NotifyType,
+)
 from apprise.common import OverflowMode
 from apprise.plugins.discord import NotifyDiscord
+from apprise.utils.http import ASYNC_HTTP_SUPPORT
 
 logging.disable(logging.CRITICAL)
 
@@ -1825,3 +1833,46 @@ def test_plugin_discord_attach_multi_batch(mock_post):
     assert mock_post.call_count == 3
     mock_post.side_effect = None
     obj.discord_max_attachments = 10
+
+
+@pytest.mark.skipif(not ASYNC_HTTP_SUPPORT, reason="Requires httpx")
+def test_plugin_discord_async_send():
+    """NotifyDiscord() async_send()"""
+
+    webhook_id = "A" * 24
+    webhook_token = "B" * 64
+    obj = Apprise.instantiate(
+        f"discord://{webhook_id}/{webhook_token}/?thread=12345",
+        asset=AppriseAsset(async_http=True),
+    )
+
+    with AsyncHTTPMock(status_code=requests.codes.no_content) as http:
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is True
+        )
+        assert len(http.requests) == 1
+        request = http.requests[0]
+        assert request.url.path == (
+            f"/api/webhooks/{webhook_id}/{webhook_token}"
+        )
+        assert request.url.params["thread_id"] == "12345"
+        payload = loads(request.content)
+        assert payload["embeds"][0]["title"] == "title"
+        assert payload["embeds"][0]["description"] == "body"
+
+        # Bad responses are detected
+        http.status_code = requests.codes.bad_request
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is False
+        )
+
+    # Attachments are handed off to our (blocking) send()
+    attach = AppriseAttachment(os.path.join(TEST_VAR_DIR, "apprise-test.gif"))
+    with mock.patch("requests.post") as mock_post, AsyncHTTPMock() as http:
+        mock_post.return_value = requests.Request()
+        mock_post.return_value.status_code = requests.codes.ok
+        assert (
+            asyncio.run(obj.async_notify(body="body", attach=attach)) is True
+        )
+        assert mock_post.call_count == 2
+        assert not http.requests
@@ -559,7 +559,7 @@ def test_plugin_fcm_oauth_data_parameters(mock_post):
         mock_post.call_args_list[1][0][0]
         == "https://fcm.googleapis.com/v1/projects/mock-project-id/messages:send"
     )
-    payload = mock_post.mock_calls[1][2]
+    payload = mock_post.call_args_list[1][1]
     data = json.loads(payload["data"])
     assert "message" in data
     assert isinstance(data["message"], dict)
@@ -583,7 +583,7 @@ def test_plugin_fcm_oauth_data_parameters(mock_post):
         == "https://fcm.googleapis.com/v1/projects/mock-project-id/messages:send"
     )
 
-    payload = mock_post.mock_calls[2][2]
+    payload = mock_post.call_args_list[2][1]
     data = json.loads(payload["data"])
     assert "message" in data
     assert isinstance(data["message"], dict)
@@ -628,7 +628,7 @@ def test_plugin_fcm_oauth_priorities(mock_post):
         mock_post.call_args_list[1][0][0]
         == "https://fcm.googleapis.com/v1/projects/mock-project-id/messages:send"
     )
-    payload = mock_post.mock_calls[1][2]
+    payload = mock_post.call_args_list[1][1]
     data = json.loads(payload["data"])
     assert "message" in data
     assert isinstance(data["message"], dict)
@@ -666,7 +666,7 @@ def test_plugin_fcm_oauth_no_colors(mock_post):
         mock_post.call_args_list[1][0][0]
         == "https://fcm.googleapis.com/v1/projects/mock-project-id/messages:send"
     )
-    payload = mock_post.mock_calls[1][2]
+    payload = mock_post.call_args_list[1][1]
     data = json.loads(payload["data"])
     assert "message" in data
     assert isinstance(data["message"], dict)
@@ -701,7 +701,7 @@ def test_plugin_fcm_oauth_colors(mock_post):
         mock_post.call_args_list[1][0][0]
         == "https://fcm.googleapis.com/v1/projects/mock-project-id/messages:send"
     )
-    payload = mock_post.mock_calls[1][2]
+    payload = mock_post.call_args_list[1][1]
     data = json.loads(payload["data"])
     assert "message" in data
     assert isinstance(data["message"], dict)
@@ -740,6 +740,33 @@ def test_plugin_fcm_keyfile_parse_default(mock_post):
     assert mock_post.call_count == 0
 
 
+@pytest.mark.skipif(
+    "cryptography" not in sys.modules, reason="Requires cryptography"
+)
+def test_plugin_fcm_keyfile_http_accessor(mock_post):
+    """GoogleOAuth() requests are made through the http object provided."""
+
+    http = mock.Mock()
+    http.post.return_value = mock_post.return_value
+
+    oauth = GoogleOAuth(http=http)
+    assert oauth.load(FCM_KEYFILE) is True
+    assert oauth.access_token is not None
+    assert http.post.call_count == 1
+    assert mock_post.call_count == 0
+
+    # Our plugin hands its own http accessor over
+    with mock.patch.object(
+        NotifyFCM, "http", new_callable=mock.PropertyMock
+    ) as mock_http:
+        mock_http.return_value = http
+        obj = Apprise.instantiate(
+            f"fcm://mock-project-id/device/?keyfile={FCM_KEYFILE!s}"
+        )
+    assert isinstance(obj, NotifyFCM)
+    assert obj.oauth.http is http
+
+
 @pytest.mark.skipif(
     "cryptography" not in sys.modules, reason="Requires cryptography"
 )
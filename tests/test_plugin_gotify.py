@@ -26,17 +26,19 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 # Disable logging for a cleaner testing output
+import asyncio
 from json import loads
 import logging
 from unittest import mock
 
-from helpers import AppriseURLTester
+from helpers import AppriseURLTester, AsyncHTTPMock
 import pytest
 import requests
 
 import apprise
 from apprise import NotifyFormat
 from apprise.plugins.gotify import GotifyPriority, NotifyGotify
+from apprise.utils.http import ASYNC_HTTP_SUPPORT
 
 logging.disable(logging.CRITICAL)
 
@@ -251,3 +253,32 @@ def test_plugin_gotify_html_to_markdown_format(mock_post):
     # The body must arrive as Markdown, not as stripped plain text
     payload = loads(mock_post.call_args_list[0][1]["data"])
     assert payload["message"] == "**hello** *world*"
+
+
+@pytest.mark.skipif(not ASYNC_HTTP_SUPPORT, reason="Requires httpx")
+def test_plugin_gotify_async_send():
+    """NotifyGotify() async_send()"""
+
+    obj = apprise.Apprise.instantiate(
+        "gotifys://hostname/path/abcdefghijklmno?priority=high",
+        asset=apprise.AppriseAsset(async_http=True),
+    )
+
+    with AsyncHTTPMock() as http:
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is True
+        )
+        assert len(http.requests) == 1
+        request = http.requests[0]
+        assert str(request.url) == "https://hostname/path/message"
+        assert request.headers["X-Gotify-Key"] == "abcdefghijklmno"
+        payload = loads(request.content)
+        assert payload["priority"] == GotifyPriority.HIGH
+        assert payload["title"] == "title"
+        assert payload["message"] == "body"
+
+        # Bad responses are detected
+        http.status_code = requests.codes.unauthorized
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is False
+        )
@@ -25,6 +25,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
 import json
 
 # Disable logging for a cleaner testing output
@@ -33,12 +34,14 @@ import os
 import re
 from unittest import mock
 
-from helpers import AppriseURLTester
+from helpers import AppriseURLTester, AsyncHTTPMock
+import pytest
 import requests
 
 import apprise
 from apprise import NotifyFormat
 from apprise.plugins.ntfy import NotifyNtfy, NtfyPriority
+from apprise.utils.http import ASYNC_HTTP_SUPPORT
 
 logging.disable(logging.CRITICAL)
 
@@ -882,3 +885,50 @@ def test_plugin_ntfy_html_to_markdown_format(mock_post):
     # The body must arrive as Markdown, not as stripped plain text
     payload = json.loads(mock_post.call_args_list[0][1]["data"])
     assert payload["message"] == "**hello** *world*"
+
+
+@pytest.mark.skipif(not ASYNC_HTTP_SUPPORT, reason="Requires httpx")
+def test_plugin_ntfy_async_send():
+    """Notifyntfy() async_send()"""
+
+    obj = apprise.Apprise.instantiate(
+        "ntfy://localhost/topic1/topic2?priority=max&tags=a,b",
+        asset=apprise.AppriseAsset(async_http=True),
+    )
+
+    with AsyncHTTPMock() as http:
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is True
+        )
+        assert len(http.requests) == 2
+        assert {json.loads(r.content)["topic"] for r in http.requests} == {
+            "topic1",
+            "topic2",
+        }
+        request = http.requests[0]
+        assert str(request.url) == "http://localhost"
+        assert request.headers["X-Priority"] == NtfyPriority.MAX
+        assert request.headers["X-Tags"] == "a,b"
+
+        # A failure on one topic does not prevent the next from being
+        # notified
+        del http.requests[:]
+        http.status_code = requests.codes.internal_server_error
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is False
+        )
+        assert len(http.requests) == 2
+
+    # Attachments are handed off to our (blocking) send()
+    attach = apprise.AppriseAttachment(
+        os.path.join(TEST_VAR_DIR, "apprise-test.gif")
+    )
+    with mock.patch("requests.post") as mock_post, AsyncHTTPMock() as http:
+        mock_post.return_value = requests.Request()
+        mock_post.return_value.status_code = requests.codes.ok
+        mock_post.return_value.content = b"{}"
+        assert (
+            asyncio.run(obj.async_notify(body="body", attach=attach)) is True
+        )
+        assert mock_post.call_count == 2
+        assert not http.requests
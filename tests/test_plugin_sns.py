@@ -933,3 +933,74 @@ def test_plugin_sns_mode_url_round_trip():
     obj3 = NotifySNS(**results)
     # Auto-detected from phone target
     assert obj3.mode == SNSMode.SMS
+
+
+@mock.patch("requests.post")
+def test_plugin_sns_topic_arn_cache(mock_post):
+    """NotifySNS() Topic ARNs are only resolved once."""
+
+    arn_response = """
+         <CreateTopicResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">
+           <CreateTopicResult>
+             <TopicArn>arn:aws:sns:us-east-2:000000000000:TopicA</TopicArn>
+                </CreateTopicResult>
+            <ResponseMetadata>
+                <RequestId>604bef0f-369c-50c5-a7a4-bbd474c83d6a</RequestId>
+            </ResponseMetadata>
+        </CreateTopicResponse>
+        """
+
+    actions = []
+    publish_status = [requests.codes.ok]
+
+    def post(url, data, **kwargs):
+        robj = mock.Mock()
+        robj.text = ""
+        robj.content = b""
+        robj.status_code = requests.codes.ok
+
+        if data.find("=CreateTopic") >= 0:
+            actions.append("CreateTopic")
+            robj.text = arn_response
+
+        else:
+            actions.append("Publish")
+            assert "TopicArn=arn%3Aaws%3Asns%3Aus-east-2" in data
+            robj.status_code = publish_status[0]
+
+        return robj
+
+    mock_post.side_effect = post
+
+    obj = NotifySNS(
+        access_key_id=TEST_ACCESS_KEY_ID,
+        secret_access_key=TEST_ACCESS_KEY_SECRET,
+        region_name=TEST_REGION,
+        targets="#TopicA",
+    )
+
+    # Our first notification resolves our topic
+    assert obj.notify(body="test") is True
+    assert actions == ["CreateTopic", "Publish"]
+    assert obj.store.get("topic-TopicA") == (
+        "arn:aws:sns:us-east-2:000000000000:TopicA"
+    )
+
+    # Subsequent notifications go straight to publishing
+    actions.clear()
+    assert obj.notify(body="test") is True
+    assert obj.notify(body="test") is True
+    assert actions == ["Publish", "Publish"]
+
+    # A failed publish drops our cached ARN
+    actions.clear()
+    publish_status[0] = requests.codes.not_found
+    assert obj.notify(body="test") is False
+    assert actions == ["Publish"]
+    assert obj.store.get("topic-TopicA") is None
+
+    # So it is resolved again the next time around
+    actions.clear()
+    publish_status[0] = requests.codes.ok
+    assert obj.notify(body="test") is True
+    assert actions == ["CreateTopic", "Publish"]
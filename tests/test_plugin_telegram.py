@@ -25,6 +25,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
 from inspect import cleandoc
 from json import dumps, loads
 
@@ -34,7 +35,7 @@ import os
 import re
 from unittest import mock
 
-from helpers import AppriseURLTester
+from helpers import AppriseURLTester, AsyncHTTPMock
 import pytest
 import requests
 
@@ -46,6 +47,7 @@ from apprise import (
     NotifyType,
 )
 from apprise.plugins.telegram import NotifyTelegram
+from apprise.utils.http import ASYNC_HTTP_SUPPORT
 
 logging.disable(logging.CRITICAL)
 
@@ -2643,3 +2645,54 @@ def test_plugin_telegram_template_request_exception(mock_post, tmpdir):
     assert (
         obj.notify(body="x", title="y", notify_type=NotifyType.INFO) is False
     )
+
+
+@pytest.mark.skipif(not ASYNC_HTTP_SUPPORT, reason="Requires httpx")
+def test_plugin_telegram_async_send():
+    """NotifyTelegram() async_send()"""
+
+    obj = Apprise.instantiate(
+        "tgram://123456789:abcdefg_hijklmnop/12345/-67890:99/?image=no",
+        asset=AppriseAsset(async_http=True),
+    )
+
+    with AsyncHTTPMock() as http:
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is True
+        )
+        assert len(http.requests) == 2
+        assert {r.url.path for r in http.requests} == {
+            "/bot123456789:abcdefg_hijklmnop/sendMessage"
+        }
+        payloads = {
+            p["chat_id"]: p for p in (loads(r.content) for r in http.requests)
+        }
+        assert "message_thread_id" not in payloads[12345]
+        assert payloads[12345]["text"] == "<b>title</b>\r\nbody"
+
+        # Topics are passed along as a message thread
+        assert payloads[-67890]["message_thread_id"] == 99
+
+        # A failure on one chat does not prevent the next from being
+        # notified
+        del http.requests[:]
+        http.status_code = requests.codes.internal_server_error
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is False
+        )
+        assert len(http.requests) == 2
+
+    # Images are uploaded by our (blocking) send()
+    obj = Apprise.instantiate(
+        "tgram://123456789:abcdefg_hijklmnop/12345/?image=yes",
+        asset=AppriseAsset(async_http=True),
+    )
+    with mock.patch("requests.post") as mock_post, AsyncHTTPMock() as http:
+        mock_post.return_value = requests.Request()
+        mock_post.return_value.status_code = requests.codes.ok
+        mock_post.return_value.content = b"{}"
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is True
+        )
+        assert mock_post.call_count == 2
+        assert not http.requests
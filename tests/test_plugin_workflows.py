@@ -25,6 +25,7 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
 from inspect import cleandoc
 import json
 
@@ -33,12 +34,19 @@ import logging
 import sys
 from unittest import mock
 
-from helpers import AppriseURLTester
+from helpers import AppriseURLTester, AsyncHTTPMock
 import pytest
 import requests
 
-from apprise import Apprise, AppriseConfig, NotifyFormat, NotifyType
+from apprise import (
+    Apprise,
+    AppriseAsset,
+    AppriseConfig,
+    NotifyFormat,
+    NotifyType,
+)
 from apprise.plugins.workflows import NotifyWorkflows
+from apprise.utils.http import ASYNC_HTTP_SUPPORT
 
 logging.disable(logging.CRITICAL)
 
@@ -1140,3 +1148,34 @@ def test_plugin_workflows_mention_entities(mock_post):
     entity = payload["attachments"][0]["content"]["msteams"]["entities"][0]
     assert entity["text"] == "<at>  padded@example.com  </at>"
     assert entity["mentioned"]["id"] == "padded@example.com"
+
+
+@pytest.mark.skipif(not ASYNC_HTTP_SUPPORT, reason="Requires httpx")
+def test_plugin_workflows_async_send():
+    """NotifyWorkflows() async_send()"""
+
+    obj = Apprise.instantiate(
+        "workflow://host:443/workflow/signature",
+        asset=AppriseAsset(async_http=True),
+    )
+
+    with AsyncHTTPMock() as http:
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is True
+        )
+        assert len(http.requests) == 1
+        request = http.requests[0]
+        assert request.url.path == (
+            "/workflows/workflow/triggers/manual/paths/invoke"
+        )
+        assert request.url.params["sig"] == "signature"
+        payload = json.loads(request.content)
+        card = payload["attachments"][0]["content"]
+        assert card["type"] == "AdaptiveCard"
+        assert "body" in json.dumps(card["body"])
+
+        # Bad responses are detected
+        http.status_code = requests.codes.internal_server_error
+        assert (
+            asyncio.run(obj.async_notify(body="body", title="title")) is False
+        )
@@ -474,6 +474,171 @@ class TestAsyncioSleep:
             N_MGR.unload_modules()
 
 
+class _RateLimitedNotify(_FailThenSucceedNotify):
+    """Rate limited by its upstream server the first N calls."""
+
+    notify_url = "ratelimited://"
+
+    def __init__(self, retry_after=None, **kwargs):
+        super().__init__(**kwargs)
+        self._retry_after = retry_after
+
+    def send(self, **kwargs):
+        result = super().send(**kwargs)
+        if not result:
+            # Simulate a 429 response received through self.http
+            response = mock.Mock()
+            response.status_code = 429
+            response.headers = (
+                {}
+                if self._retry_after is None
+                else {"Retry-After": str(self._retry_after)}
+            )
+            self.http_response(response)
+        return result
+
+
+class TestRateLimitBackoff:
+    """Services rate limited by their upstream server back off."""
+
+    def test_retry_after_honoured(self):
+        asset = AppriseAsset(async_mode=False)
+        server = _RateLimitedNotify(
+            host="localhost",
+            asset=asset,
+            retry=2,
+            wait=0.5,
+            retry_after=3,
+        )
+        a = Apprise(asset=asset)
+        a.add(server)
+
+        with (
+            mock.patch("apprise.apprise.time.sleep") as mock_sleep,
+            mock.patch.object(server, "defer") as mock_defer,
+        ):
+            assert a.notify(body="test") is True
+
+        mock_defer.assert_called_once_with(3.0)
+        assert mock_sleep.call_count == 1
+        assert 3.0 <= mock_sleep.call_args[0][0] <= 3.3
+
+    def test_exponential_backoff(self):
+        asset = AppriseAsset(async_mode=False)
+        server = _RateLimitedNotify(
+            host="localhost",
+            asset=asset,
+            retry=3,
+            wait=0.5,
+            fail_times=3,
+        )
+        a = Apprise(asset=asset)
+        a.add(server)
+
+        with mock.patch("apprise.apprise.time.sleep") as mock_sleep:
+            assert a.notify(body="test") is True
+
+        delays = [call[0][0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 3
+        for no, delay in enumerate(delays):
+            base = server.ratelimit_backoff * (2**no)
+            assert base <= delay <= base * 1.1
+
+    def test_threadpool_backoff(self):
+        asset = AppriseAsset(async_mode=True)
+        servers = [
+            _RateLimitedNotify(
+                host="localhost",
+                asset=asset,
+                retry=1,
+                wait=0.0,
+                retry_after=2,
+            )
+            for _ in range(2)
+        ]
+        a = Apprise(asset=asset)
+        a.add(servers)
+
+        with mock.patch("apprise.apprise.time.sleep") as mock_sleep:
+            assert a.notify(body="test") is True
+
+        assert mock_sleep.call_count == 2
+        for call in mock_sleep.call_args_list:
+            assert 2.0 <= call[0][0] <= 2.2
+
+    def test_asyncio_backoff(self):
+        asset = AppriseAsset()
+        server = _RateLimitedNotify(
+            host="localhost",
+            asset=asset,
+            retry=1,
+            wait=0.0,
+        )
+        a = Apprise(asset=asset)
+        a.add(server)
+
+        async def run():
+            with mock.patch("apprise.apprise.asyncio.sleep") as mock_sleep:
+                result = await a.async_notify(body="test")
+            return result, mock_sleep
+
+        result, mock_sleep = asyncio.run(run())
+        assert result is True
+        assert mock_sleep.call_count == 1
+        assert 1.0 <= mock_sleep.call_args[0][0] <= 1.1
+
+    def test_concurrent_notifications(self):
+        """The rate limit reported to one notification is never seen (or
+        consumed) by another made through the same service at once."""
+
+        class _Service(_RateLimitedNotify):
+            async def async_send(self, body, **kwargs):
+                # Give the other notification a chance to run
+                await asyncio.sleep(0)
+                if body != "limited":
+                    return True
+
+                response = mock.Mock()
+                response.status_code = 429
+                response.headers = {"Retry-After": "3"}
+                self.http_response(response)
+                return False
+
+        server = _Service(host="localhost", asset=AppriseAsset())
+
+        async def call(body):
+            result = await NotifyBase.async_notify(server, body=body)
+            await asyncio.sleep(0)
+            return result, server.retry_delay(0, 0.5)
+
+        async def run():
+            return await asyncio.gather(call("limited"), call("ok"))
+
+        with mock.patch.object(server, "defer"):
+            (ok1, delay1), (ok2, delay2) = asyncio.run(run())
+
+        assert ok1 is False
+        assert 3.0 <= delay1 <= 3.3
+        assert ok2 is True
+        assert delay2 == 0.5
+
+        # Blocking send() calls run in our executor report their rate limits
+        # to the notification that made them too
+        server = _RateLimitedNotify(
+            host="localhost", asset=AppriseAsset(), retry_after=2
+        )
+
+        async def run_executor():
+            result = await NotifyBase.async_notify(server, body="test")
+            return result, server.retry_delay(0, 0.5)
+
+        with mock.patch.object(server, "defer"):
+            result, delay = asyncio.run(run_executor())
+
+        assert result is False
+        assert 2.0 <= delay <= 2.2
+
+
 class TestAssetDefault:
     def test_asset_wait_default_used(self):
         asset = AppriseAsset(default_service_wait=1.5)
@@ -0,0 +1,195 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+from datetime import datetime, timezone
+import logging
+
+from apprise.utils.aws import (
+    aws_response_to_dict,
+    aws_sign_request,
+    aws_signing_key,
+)
+
+# Disable logging for a cleaner testing output
+logging.disable(logging.CRITICAL)
+
+
+def test_aws_signing_key():
+    """AWS v4 signing keys are derived once per credential scope"""
+    aws_signing_key.cache_clear()
+
+    # The example published in the AWS Signature Version 4 documentation
+    key = aws_signing_key(
+        "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY",
+        "20120215",
+        "us-east-1",
+        "iam",
+    )
+    assert key.hex() == (
+        "f4780e2d9f65fa895f9c67b32ce1baf0b0d8a43505a000a1a9e090d414db404d"
+    )
+
+    assert aws_signing_key.cache_info().misses == 1
+    assert (
+        aws_signing_key(
+            "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY",
+            "20120215",
+            "us-east-1",
+            "iam",
+        )
+        is key
+    )
+    assert aws_signing_key.cache_info().hits == 1
+
+    # Any change to the scope derives a new key
+    assert (
+        aws_signing_key(
+            "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY",
+            "20120216",
+            "us-east-1",
+            "iam",
+        )
+        != key
+    )
+    assert aws_signing_key.cache_info().misses == 2
+
+
+def test_aws_sign_request():
+    """AWS v4 request signing"""
+    aws_signing_key.cache_clear()
+
+    reference = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    headers = {
+        "User-Agent": "Apprise",
+        "Content-Type": "application/x-www-form-urlencoded; charset=utf-8",
+    }
+    kwargs = {
+        "host": "sns.us-east-2.amazonaws.com",
+        "access_key_id": "AKIDEXAMPLE",
+        "secret_access_key": "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY",
+        "region": "us-east-2",
+        "service": "sns",
+        "reference": reference,
+    }
+
+    signed = aws_sign_request("Action=Publish", headers, **kwargs)
+
+    # Our original headers are left untouched
+    assert "Authorization" not in headers
+    assert signed["User-Agent"] == "Apprise"
+    assert signed["Content-Length"] == "14"
+    assert signed["X-Amz-Date"] == "20260102T030405Z"
+    assert "X-Amz-Security-Token" not in signed
+    assert signed["Authorization"].startswith(
+        "AWS4-HMAC-SHA256 "
+        "Credential=AKIDEXAMPLE/20260102/us-east-2/sns/aws4_request, "
+        "SignedHeaders=content-type;host;x-amz-date, Signature="
+    )
+
+    # Signing is deterministic
+    assert aws_sign_request("Action=Publish", headers, **kwargs) == signed
+
+    # The payload is part of the signature
+    assert (
+        aws_sign_request("Action=CreateTopic", headers, **kwargs)[
+            "Authorization"
+        ]
+        != signed["Authorization"]
+    )
+
+    # Our signing key was only derived once
+    assert aws_signing_key.cache_info().misses == 1
+
+    # Session tokens are passed along and signed
+    token = aws_sign_request(
+        "Action=Publish", headers, session_token="abc/123=", **kwargs
+    )
+    assert token["X-Amz-Security-Token"] == "abc/123="
+    assert (
+        "SignedHeaders=content-type;host;x-amz-date;x-amz-security-token, "
+        in token["Authorization"]
+    )
+    assert token["Authorization"] != signed["Authorization"]
+
+    # Without a reference time, the current time is used
+    assert aws_sign_request(
+        "Action=Publish",
+        headers,
+        **{k: v for k, v in kwargs.items() if k != "reference"},
+    )["X-Amz-Date"].endswith("Z")
+
+
+def test_aws_response_to_dict():
+    """AWS XML responses are parsed into a dictionary"""
+    keep_map = {
+        "RequestId": "request_id",
+        "MessageId": "message_id",
+        "Code": "error_code",
+    }
+
+    # Nothing to parse
+    for content in (None, "", b"", 42):
+        assert aws_response_to_dict(content, keep_map) == {
+            "type": None,
+            "request_id": None,
+        }
+
+    # Defaults are always returned
+    assert aws_response_to_dict(None, keep_map, {"message_id": None}) == {
+        "type": None,
+        "request_id": None,
+        "message_id": None,
+    }
+
+    # Partial (and invalid) documents are not parsed
+    assert aws_response_to_dict(
+        "<PublishResponse><RequestId>abcd</RequestId>", keep_map
+    ) == {"type": None, "request_id": None}
+
+    # Namespaces are ignored; empty entries and entries with children are
+    # handled gracefully and unknown entries are not included
+    response = aws_response_to_dict(
+        b"""<?xml version="1.0"?>
+        <PublishResponse xmlns="http://sns.amazonaws.com/doc/2010-03-31/">
+            <PublishResult>
+                <MessageId>
+                    5e16935a-d1fb-5a31-a716-c7805e5c1d2e
+                </MessageId>
+                <Code><Nested>value</Nested></Code>
+                <Unknown>value</Unknown>
+            </PublishResult>
+            <ResponseMetadata>
+                <RequestId/>
+            </ResponseMetadata>
+        </PublishResponse>
+        """,
+        keep_map,
+    )
+    assert response == {
+        "type": "PublishResponse",
+        "request_id": "",
+        "message_id": "5e16935a-d1fb-5a31-a716-c7805e5c1d2e",
+    }
@@ -24,8 +24,14 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
-from apprise import NotifyFormat
-from apprise.utils.format import html_adjust, markdown_adjust, smart_split
+from apprise import LengthUnit, NotifyFormat
+from apprise.utils.format import (
+    html_adjust,
+    markdown_adjust,
+    smart_split,
+    text_fit,
+    text_length,
+)
 
 
 def test_smart_split_prefers_newlines_over_spaces_and_punctuation():
@@ -490,3 +496,87 @@ def test_smart_split_uses_punctuation_branch_on_rare_whitespace() -> None:
     # We expect the first chunk to end after the rare whitespace
     assert chunks[0] == f"Hello.{vt}"
     assert chunks[1] == "World"
+
+
+def test_text_length_and_fit() -> None:
+    """
+    Text can be measured (and fit) in characters, UTF-8 bytes or UCS-2 code
+    units.
+    """
+    text = "aé😀"
+    assert text_length(text) == 3
+    assert text_length(text, LengthUnit.UTF8) == 7
+    assert text_length(text, LengthUnit.UCS2) == 4
+    # Plain strings are accepted too
+    assert text_length(text, "utf-8") == 7
+    assert text_length("") == 0
+
+    # Characters
+    assert text_fit(text, 0, 2) == 2
+    assert text_fit(text, 1, 10) == 3
+
+    # UTF-8 bytes never cut a character in half
+    assert text_fit(text, 0, 1, LengthUnit.UTF8) == 1
+    assert text_fit(text, 0, 2, LengthUnit.UTF8) == 1
+    assert text_fit(text, 0, 3, LengthUnit.UTF8) == 2
+    assert text_fit(text, 0, 6, LengthUnit.UTF8) == 2
+    assert text_fit(text, 0, 7, LengthUnit.UTF8) == 3
+
+    # Nor do UCS-2 code units split a surrogate pair
+    assert text_fit(text, 0, 3, LengthUnit.UCS2) == 2
+    assert text_fit(text, 0, 4, LengthUnit.UCS2) == 3
+
+    # We always make progress, even if a single character does not fit
+    assert text_fit(text, 2, 1, LengthUnit.UTF8) == 3
+    assert text_fit(text, 3, 1, LengthUnit.UTF8) == 3
+
+
+def test_smart_split_length_units() -> None:
+    """
+    The limit can be expressed in encoded units; chunks never exceed it.
+    """
+    text = "héllo wörld ünïcode"
+
+    # Characters (the default) fit two words at a time
+    assert smart_split(text, 12, NotifyFormat.TEXT) == [
+        "héllo wörld ",
+        "ünïcode",
+    ]
+
+    # Measured in bytes, the accented characters take up more room
+    chunks = smart_split(text, 12, NotifyFormat.TEXT, LengthUnit.UTF8)
+    assert chunks == ["héllo ", "wörld ", "ünïcode"]
+    assert all(text_length(c, LengthUnit.UTF8) <= 12 for c in chunks)
+
+    # Emojis count twice as UCS-2 code units and are never split apart
+    text = "😀" * 10
+    chunks = smart_split(text, 5, NotifyFormat.TEXT, LengthUnit.UCS2)
+    assert chunks == ["😀" * 2] * 5
+    chunks = smart_split(text, 5, NotifyFormat.TEXT)
+    assert chunks == ["😀" * 5] * 2
+
+    # A character larger than the limit is still emitted on its own
+    assert smart_split("😀😀", 1, NotifyFormat.TEXT, LengthUnit.UTF8) == [
+        "😀",
+        "😀",
+    ]
+
+
+def test_smart_split_large_body() -> None:
+    """
+    Very large bodies split into many chunks without losing content; a
+    newline found early in a window is honoured even when the remainder of
+    the window has none.
+    """
+    line = "a" * 50 + "\n" + ("word " * 40)
+    text = line * 2000
+
+    chunks = smart_split(text, 180, NotifyFormat.MARKDOWN)
+    assert "".join(chunks) == text
+    assert all(len(c) <= 180 for c in chunks)
+    assert chunks[0] == "a" * 50 + "\n"
+    assert chunks[1] == "word " * 36
+
+    chunks = smart_split(text, 180, NotifyFormat.TEXT, LengthUnit.UTF8)
+    assert "".join(chunks) == text
+    assert all(len(c) <= 180 for c in chunks)
@@ -0,0 +1,529 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import asyncio
+import logging
+from unittest import mock
+
+import pytest
+import requests
+
+from apprise import Apprise, AppriseAsset
+from apprise.plugins.base import NotifyBase
+from apprise.utils.http import (
+    ASYNC_HTTP_SUPPORT,
+    AsyncHTTPClientPool,
+    AsyncRequests,
+    HTTPSessionPool,
+    PooledRequests,
+    ResponseHook,
+    ratelimit_wait,
+)
+from apprise.utils.stream import StreamBody
+
+if ASYNC_HTTP_SUPPORT:
+    import httpx
+
+# Disable logging for a cleaner testing output
+logging.disable(logging.CRITICAL)
+
+
+def test_http_session_pool_key():
+    """HTTPSessionPool() key generation"""
+
+    key = HTTPSessionPool.key
+    assert key("https://Example.COM/path") == (
+        "https",
+        "example.com",
+        443,
+        True,
+    )
+    assert key("http://example.com/") == ("http", "example.com", 80, True)
+    assert key("http://example.com:8080/", verify=False) == (
+        "http",
+        "example.com",
+        8080,
+        False,
+    )
+    # Invalid ports are gracefully handled
+    assert key("http://example.com:invalid/") == (
+        "http",
+        "example.com",
+        80,
+        True,
+    )
+
+
+def test_http_session_pool_acquire():
+    """HTTPSessionPool() acquire, prune and close"""
+
+    pool = HTTPSessionPool()
+    pool.close()
+    assert len(pool) == 0
+
+    s1 = pool.acquire("https://example.com/a")
+    assert isinstance(s1, requests.Session)
+    assert len(pool) == 1
+
+    # Same destination re-uses the same session
+    assert pool.acquire("https://example.com/b?c=d") is s1
+    assert len(pool) == 1
+
+    # A different verification setting or destination does not
+    s2 = pool.acquire("https://example.com/a", verify=False)
+    s3 = pool.acquire("https://example.ca/a")
+    assert s2 is not s1
+    assert s3 is not s1
+    assert len(pool) == 3
+
+    # Nothing has been idle long enough to be released
+    assert pool.prune(idle_timeout=60) == 0
+    # A negative idle timeout disables eviction
+    assert pool.prune(idle_timeout=-1) == 0
+    assert len(pool) == 3
+
+    # Acquiring a session also evicts anything idle for too long
+    with mock.patch("time.monotonic", return_value=10**10):
+        s4 = pool.acquire("https://example.net/", idle_timeout=1)
+
+    assert len(pool) == 1
+    assert pool.acquire("https://example.net/") is s4
+
+    # Cookies returned by the upstream server are never retained
+    assert s4.cookies._policy.is_not_allowed("example.net")
+
+    # Age everything so that it is all considered idle
+    with mock.patch("time.monotonic", return_value=10**11):
+        assert pool.prune(idle_timeout=0) == 1
+    assert len(pool) == 0
+
+    pool.acquire("https://example.net/")
+    with mock.patch.object(requests.Session, "close") as mock_close:
+        pool.close()
+        assert mock_close.call_count == 1
+    assert len(pool) == 0
+
+
+@mock.patch("requests.Session.request")
+def test_pooled_requests(mock_request):
+    """PooledRequests() behaves like the requests module"""
+
+    pool = HTTPSessionPool()
+    pool.close()
+
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    mock_request.return_value = response
+
+    obj = PooledRequests(maxsize=2, idle_timeout=30)
+    assert obj.get("https://localhost/", verify=False) is response
+    assert obj.post("https://localhost/", data="a", json=None) is response
+    assert obj.put("https://localhost/", data="b") is response
+    assert obj.patch("https://localhost/", data="c") is response
+    assert obj.delete("https://localhost/") is response
+    assert obj.options("https://localhost/") is response
+    assert obj.head("https://localhost/") is response
+
+    assert mock_request.call_count == 7
+    methods = [c[0][0] for c in mock_request.call_args_list]
+    assert methods == [
+        "get",
+        "post",
+        "put",
+        "patch",
+        "delete",
+        "options",
+        "head",
+    ]
+
+    # head() does not follow redirects by default; just like requests.head()
+    assert mock_request.call_args_list[-1][1]["allow_redirects"] is False
+
+    # get() was made with verify=False; everything else was verified
+    assert len(pool) == 2
+    pool.close()
+
+
+@mock.patch("requests.Session.request")
+@mock.patch("requests.request")
+def test_url_base_http_accessor(mock_module_request, mock_request):
+    """URLBase.http accessor honours the AppriseAsset() settings"""
+
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    response.content = b""
+    mock_module_request.return_value = response
+    mock_request.return_value = response
+
+    HTTPSessionPool().close()
+
+    # By default the requests module is used directly
+    obj = Apprise.instantiate("json://localhost")
+    assert isinstance(obj, NotifyBase)
+    assert obj.http.transport is requests
+    assert obj.notify("body") is True
+    assert mock_module_request.call_count == 1
+    assert mock_request.call_count == 0
+
+    mock_module_request.reset_mock()
+
+    # Enable our pool
+    asset = AppriseAsset(http_pool=True, http_pool_maxsize=4)
+    obj = Apprise.instantiate("json://localhost", asset=asset)
+    assert isinstance(obj.http.transport, PooledRequests)
+    assert obj.http.maxsize == 4
+
+    assert obj.notify("body") is True
+    assert obj.notify("body") is True
+    assert mock_module_request.call_count == 0
+    assert mock_request.call_count == 2
+
+    # Both notifications shared the same session
+    assert len(HTTPSessionPool()) == 1
+    HTTPSessionPool().close()
+
+
+@mock.patch("requests.request")
+@mock.patch("requests.post")
+@mock.patch("requests.get")
+def test_async_requests_fallback(mock_get, mock_post, mock_request):
+    """AsyncRequests() hands off to the fallback in the executor"""
+
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    mock_get.return_value = response
+    mock_post.return_value = response
+    mock_request.return_value = response
+
+    obj = AsyncRequests(use_native=False)
+    assert obj.native is False
+
+    async def run():
+        assert await obj.get("http://localhost/", params={"a": "b"}) is (
+            response
+        )
+        assert await obj.post("http://localhost/", data="body") is response
+        assert await obj.request("put", "http://localhost/") is response
+
+    asyncio.run(run())
+
+    assert mock_get.call_count == 1
+    assert mock_get.call_args[1]["params"] == {"a": "b"}
+    assert mock_post.call_count == 1
+    assert mock_post.call_args[1]["data"] == "body"
+    assert mock_request.call_count == 1
+    assert mock_request.call_args[0] == ("put", "http://localhost/")
+
+    # A PooledRequests object can act as our fallback too
+    fallback = mock.Mock()
+    fallback.delete.return_value = response
+    obj = AsyncRequests(fallback=fallback, use_native=False)
+    assert asyncio.run(obj.delete("http://localhost/")) is response
+    assert fallback.delete.call_count == 1
+
+
+@pytest.mark.skipif(not ASYNC_HTTP_SUPPORT, reason="Requires httpx")
+def test_async_requests_native():
+    """AsyncRequests() native httpx transport"""
+
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        if request.url.path == "/redirect":
+            return httpx.Response(302, headers={"Location": "/"})
+
+        if request.url.path == "/timeout":
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        if request.url.path == "/error":
+            raise httpx.ConnectError("refused", request=request)
+
+        return httpx.Response(200, content=b'{"ok": true}')
+
+    def acquire(self, verify=True, maxsize=10):
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    obj = AsyncRequests()
+    assert obj.native is True
+
+    async def run():
+        r = await obj.post(
+            "http://localhost/",
+            data='{"a": "b"}',
+            headers={"X-Test": "yes"},
+            timeout=(4, 2.5),
+        )
+        assert r.status_code == requests.codes.ok
+        assert r.json() == {"ok": True}
+        assert requests_seen[-1].content == b'{"a": "b"}'
+        assert requests_seen[-1].headers["X-Test"] == "yes"
+
+        # Form data
+        await obj.put("http://localhost/", data={"a": "b"})
+        assert requests_seen[-1].content == b"a=b"
+
+        # Redirects are followed unless told otherwise
+        r = await obj.get("http://localhost/redirect")
+        assert r.status_code == requests.codes.ok
+        r = await obj.get("http://localhost/redirect", allow_redirects=False)
+        assert r.status_code == 302
+        # head() never follows redirects by default
+        r = await obj.head("http://localhost/redirect")
+        assert r.status_code == 302
+
+        await obj.patch("http://localhost/", data=b"raw")
+        assert requests_seen[-1].content == b"raw"
+
+        # Streamed payloads are sent (with their length) as they are read
+        body = StreamBody(
+            [(3, b"abc"), (3, lambda: iter([b"d", b"ef"]))], "text/plain"
+        )
+        await obj.post("http://localhost/", data=body)
+        assert requests_seen[-1].content == b"abcdef"
+        assert requests_seen[-1].headers["Content-Length"] == "6"
+        assert "Transfer-Encoding" not in requests_seen[-1].headers
+        await obj.delete("http://localhost/")
+        assert requests_seen[-1].method == "DELETE"
+        await obj.request("options", "http://localhost/")
+        assert requests_seen[-1].method == "OPTIONS"
+
+        # Transport errors are raised as requests exceptions
+        with pytest.raises(requests.Timeout):
+            await obj.get("http://localhost/timeout")
+
+        with pytest.raises(requests.ConnectionError):
+            await obj.get("http://localhost/error")
+
+    with mock.patch.object(AsyncHTTPClientPool, "acquire", acquire):
+        asyncio.run(run())
+
+
+@pytest.mark.skipif(not ASYNC_HTTP_SUPPORT, reason="Requires httpx")
+def test_async_http_client_pool():
+    """AsyncHTTPClientPool() shares clients within an event loop"""
+
+    async def run():
+        pool = AsyncHTTPClientPool()
+        c1 = pool.acquire()
+        assert isinstance(c1, httpx.AsyncClient)
+        assert pool.acquire() is c1
+        c2 = pool.acquire(verify=False)
+        assert c2 is not c1
+
+        await pool.aclose()
+        assert c1.is_closed
+        assert c2.is_closed
+
+        # A new client is generated afterwards
+        c3 = pool.acquire()
+        assert c3 is not c1
+        await pool.aclose()
+
+    asyncio.run(run())
+
+
+@mock.patch("requests.post")
+def test_url_base_async_http_accessor(mock_post):
+    """URLBase.async_http accessor honours the AppriseAsset() settings"""
+
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    response.content = b""
+    mock_post.return_value = response
+
+    # By default our requests are handed off to the requests module
+    obj = Apprise.instantiate("gotify://localhost/abcdefghijklmno")
+    assert isinstance(obj.async_http.transport, AsyncRequests)
+    assert obj.async_http.native is False
+    assert obj.async_http.fallback is requests
+
+    assert asyncio.run(obj.async_notify("body")) is True
+    assert mock_post.call_count == 1
+
+    asset = AppriseAsset(async_http=True)
+    obj = Apprise.instantiate(
+        "gotify://localhost/abcdefghijklmno", asset=asset
+    )
+    assert obj.async_http.native is ASYNC_HTTP_SUPPORT
+
+
+def test_ratelimit_wait():
+    """ratelimit_wait() response inspection"""
+
+    now = 1700000000.0
+
+    # Nothing to report
+    assert ratelimit_wait(200, {}, now=now) == (False, None)
+    assert ratelimit_wait(200, None, now=now) == (False, None)
+    assert ratelimit_wait(None, object(), now=now) == (False, None)
+
+    # A Retry-After is only meaningful if we were rate limited
+    assert ratelimit_wait(200, {"Retry-After": "5"}, now=now) == (False, None)
+
+    # Rejected without being told for how long
+    assert ratelimit_wait(429, {}, now=now) == (True, None)
+    assert ratelimit_wait(503, {"Retry-After": "garbage"}, now=now) == (
+        True,
+        None,
+    )
+
+    # Delta seconds
+    assert ratelimit_wait(429, {"Retry-After": " 2.5 "}, now=now) == (
+        True,
+        2.5,
+    )
+    assert ratelimit_wait(429, {"retry-after": "-1"}, now=now) == (True, 0.0)
+
+    # HTTP Date
+    throttled, wait = ratelimit_wait(
+        503, {"Retry-After": "Tue, 14 Nov 2023 22:13:30 GMT"}, now=now
+    )
+    assert throttled is True
+    assert wait == pytest.approx(10.0)
+
+    # A window with requests remaining
+    headers = {"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "10"}
+    assert ratelimit_wait(200, headers, now=now) == (False, None)
+
+    # An exhausted window; the reset can be in seconds or a timestamp
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "10"}
+    assert ratelimit_wait(200, headers, now=now) == (True, 10.0)
+
+    headers = {
+        "X-Rate-Limit-Remaining": "0",
+        "X-Rate-Limit-Reset": str(now + 30),
+    }
+    assert ratelimit_wait(200, headers, now=now) == (True, 30.0)
+
+    headers = {"ratelimit-remaining": "0", "ratelimit-reset": str(now - 30)}
+    assert ratelimit_wait(200, headers, now=now) == (True, 0.0)
+
+    # Retry-After takes priority
+    headers = {
+        "Retry-After": "1",
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": "10",
+    }
+    assert ratelimit_wait(429, headers, now=now) == (True, 1.0)
+
+    # An exhausted window without a (valid) reset time can not be acted on
+    headers = {"X-RateLimit-Remaining": "0"}
+    assert ratelimit_wait(200, headers, now=now) == (False, None)
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "soon"}
+    assert ratelimit_wait(200, headers, now=now) == (False, None)
+    headers = {"X-RateLimit-Remaining": "none"}
+    assert ratelimit_wait(200, headers, now=now) == (False, None)
+
+    # Case insensitive headers (as used by requests) are supported
+    headers = requests.structures.CaseInsensitiveDict({"RETRY-AFTER": "4"})
+    assert ratelimit_wait(429, headers, now=now) == (True, 4.0)
+
+    # Mocked responses are ignored
+    assert ratelimit_wait(mock.Mock(), mock.Mock(), now=now) == (False, None)
+
+
+def test_response_hook():
+    """ResponseHook() hands every response to its hook"""
+
+    responses = []
+    transport = mock.Mock()
+    transport.post.return_value = "post"
+    transport.maxsize = 4
+
+    obj = ResponseHook(transport, responses.append)
+    assert obj.post("http://localhost/", data="body") == "post"
+    assert responses == ["post"]
+    transport.post.assert_called_once_with("http://localhost/", data="body")
+
+    # Everything else is passed through
+    assert obj.maxsize == 4
+    with pytest.raises(AttributeError):
+        ResponseHook(requests, responses.append).invalid  # noqa: B018
+
+    # Asynchronous transports are supported too
+    async def post(url, **kwargs):
+        return "async"
+
+    transport = mock.Mock()
+    transport.post = post
+    obj = ResponseHook(transport, responses.append)
+    assert asyncio.run(obj.post("http://localhost/")) == "async"
+    assert responses == ["post", "async"]
+
+
+@mock.patch("requests.request")
+def test_notify_base_http_response(mock_request):
+    """NotifyBase.http_response() honours upstream rate limits"""
+
+    response = mock.Mock()
+    response.status_code = 429
+    response.headers = {"Retry-After": "2"}
+    response.content = b""
+    mock_request.return_value = response
+
+    obj = Apprise.instantiate("json://localhost")
+    assert isinstance(obj, NotifyBase)
+
+    with mock.patch.object(obj, "defer") as mock_defer:
+        assert obj.notify("body") is False
+
+    # Everyone sharing our rate limit budget is held back
+    mock_defer.assert_called_once_with(2.0)
+
+    # Our retry honours the time we were asked to wait for (plus a little
+    # jitter); the hint is only used once
+    assert 2.0 <= obj.retry_delay(0, 0.5) <= 2.2
+    assert obj.retry_delay(0, 0.5) == 0.5
+
+    # Without a Retry-After we back off exponentially
+    response.headers = {}
+    with mock.patch.object(obj, "defer") as mock_defer:
+        assert obj.notify("body") is False
+    assert mock_defer.call_count == 0
+    assert 4.0 <= obj.retry_delay(2, 0.5) <= 4.4
+
+    # Our backoff is capped
+    assert obj.notify("body") is False
+    assert obj.retry_delay(10, 0.5) <= obj.ratelimit_max_wait * 1.1
+
+    # The hint is forgotten by the next notification
+    assert obj.notify("body") is False
+    response.status_code = 200
+    assert obj.notify("body") is True
+    assert obj.retry_delay(0, 0.5) == 0.5
+
+    # An exhausted window defers our next request but our notification was
+    # otherwise successful
+    response.headers = {
+        "X-RateLimit-Remaining": "0",
+        "X-RateLimit-Reset": "300",
+    }
+    with mock.patch.object(obj, "defer") as mock_defer:
+        assert obj.notify("body") is True
+    mock_defer.assert_called_once_with(obj.ratelimit_max_wait)
+    assert obj.retry_delay(0, 0.5) == 0.5
@@ -0,0 +1,188 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import concurrent.futures as cf
+import logging
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+from apprise import Apprise, AppriseAsset
+from apprise.utils.pool import WorkerPool
+
+# Disable logging for a cleaner testing output
+logging.disable(logging.CRITICAL)
+
+
+def test_worker_pool():
+    """WorkerPool() executor re-use and close()"""
+
+    with pytest.raises(ValueError):
+        WorkerPool(max_workers=0)
+
+    pool = WorkerPool(max_workers=2)
+    assert pool._executor is None
+
+    assert pool.submit(pow, 2, 3).result() == 8
+    executor = pool.executor
+    assert isinstance(executor, cf.ThreadPoolExecutor)
+
+    # Our executor is re-used
+    assert pool.submit(pow, 2, 4).result() == 16
+    assert pool.executor is executor
+
+    # Closing our pool releases the executor
+    pool.close()
+    assert pool._executor is None
+
+    # Closing twice is harmless
+    pool.close()
+
+    # The pool can be re-used after being closed
+    assert pool.submit(pow, 2, 5).result() == 32
+    assert pool.executor is not executor
+
+    with WorkerPool() as pool:
+        assert pool.submit(pow, 3, 2).result() == 9
+    assert pool._executor is None
+
+
+def test_worker_pool_key_limits():
+    """WorkerPool() per key concurrency limits"""
+
+    lock = threading.Lock()
+    active = {}
+    peak = {}
+
+    def work(key):
+        with lock:
+            active[key] = active.get(key, 0) + 1
+            peak[key] = max(peak.get(key, 0), active[key])
+        time.sleep(0.05)
+        with lock:
+            active[key] -= 1
+        return key
+
+    with WorkerPool(max_workers=6, key_max_workers=1) as pool:
+        assert pool.key_max_workers == 1
+        futures = [pool.submit(work, "a", key="a") for _ in range(3)]
+        futures.extend(pool.submit(work, "b", key="b") for _ in range(3))
+        assert sorted(f.result() for f in futures) == ["a"] * 3 + ["b"] * 3
+
+    # Each key was limited to a single concurrent worker
+    assert peak == {"a": 1, "b": 1}
+
+    # No limits are applied if no key is provided
+    peak.clear()
+    with WorkerPool(max_workers=3, key_max_workers=1) as pool:
+        futures = [pool.submit(work, "c") for _ in range(3)]
+        cf.wait(futures)
+    assert peak["c"] > 1
+
+    # Negative limits are treated as no limit at all
+    assert WorkerPool(key_max_workers=-1).key_max_workers == 0
+
+
+def test_worker_pool_key_limits_no_starvation():
+    """WorkerPool() work held back by a key does not occupy workers"""
+
+    release = threading.Event()
+
+    with WorkerPool(max_workers=2, key_max_workers=1) as pool:
+        # One worker is busy with 'a'; the other 'a' jobs are held back
+        blocked = [pool.submit(release.wait, 5, key="a") for _ in range(3)]
+
+        # ... so another key still has a worker available to it
+        assert pool.submit(pow, 2, 3, key="b").result(timeout=2) == 8
+        assert pool.submit(pow, 2, 4).result(timeout=2) == 16
+        assert not any(f.done() for f in blocked)
+
+        release.set()
+        assert all(f.result(timeout=5) for f in blocked)
+
+    # Exceptions are passed back to the caller
+    with WorkerPool(max_workers=1, key_max_workers=1) as pool:
+        future = pool.submit(int, "invalid", key="a")
+        assert pool.submit(int, "5", key="a").result() == 5
+        with pytest.raises(ValueError):
+            future.result()
+
+    # Closing without waiting cancels work that is still held back
+    release.clear()
+    pool = WorkerPool(max_workers=1, key_max_workers=1)
+    running = pool.submit(release.wait, 5, key="a")
+    held = pool.submit(pow, 2, 3, key="a")
+    pool.close(wait=False)
+    assert held.cancelled()
+    release.set()
+    assert running.result(timeout=5) is True
+
+    # Work can not be scheduled on an executor that was shut down
+    pool = WorkerPool(max_workers=1, key_max_workers=1)
+    executor = mock.Mock(submit=mock.Mock(side_effect=RuntimeError))
+    with (
+        mock.patch.object(pool, "_executor", executor),
+        pytest.raises(RuntimeError),
+    ):
+        pool.submit(pow, 2, 3, key="a").result()
+
+    assert pool._active == {}
+
+
+@mock.patch("requests.request")
+def test_apprise_worker_pool(mock_request):
+    """Apprise() shares one worker pool across notify() calls"""
+
+    mock_request.return_value = requests.Request()
+    mock_request.return_value.status_code = requests.codes.ok
+    mock_request.return_value.content = b""
+
+    asset = AppriseAsset(notify_max_workers=2, notify_service_max_workers=1)
+    with Apprise(asset=asset) as a:
+        a.add(["json://localhost", "json://localhost/path", "xml://host"])
+
+        assert a.notify("body") is True
+        executor = a._pool.executor
+        assert executor._max_workers == 2
+        assert a._pool.key_max_workers == 1
+
+        # The very same workers are used for the next notification
+        assert a.notify("body") is True
+        assert a._pool.executor is executor
+        assert mock_request.call_count == 6
+
+        # Multiple tag chains are dispatched through the same pool too
+        a.add("json://localhost/a", tag="a")
+        a.add("json://localhost/b", tag="b")
+        assert a.notify("body", tag=["a", "b"]) is True
+        assert a._pool.executor is executor
+
+    # Our workers were released
+    assert a._pool._executor is None
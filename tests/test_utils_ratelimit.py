@@ -0,0 +1,449 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+import os
+from unittest import mock
+
+import pytest
+
+from apprise import AppriseAsset, NotifyBase, PersistentStoreMode
+from apprise.utils.ratelimit import (
+    RATELIMIT_STORAGE_DIR,
+    FileRateLimiter,
+    MemoryRateLimiter,
+    RateLimiter,
+    TokenBucket,
+)
+
+# Disable logging for a cleaner testing output
+logging.disable(logging.CRITICAL)
+
+
+@pytest.fixture(autouse=True)
+def clean_rate_limiter():
+    """Ensure every test starts with no shared rate limits."""
+    MemoryRateLimiter().clear()
+    yield
+    MemoryRateLimiter().clear()
+
+
+def test_token_bucket():
+    """TokenBucket() reservations"""
+
+    bucket = TokenBucket()
+
+    # A new bucket is full; our first request never waits
+    assert bucket.reserve(2.0, now=100.0) == 0.0
+
+    # Requests made thereafter are spaced out by our interval
+    assert bucket.reserve(2.0, now=100.5) == pytest.approx(1.5)
+    assert bucket.reserve(2.0, now=100.5) == pytest.approx(3.5)
+
+    # Once replenished, no waiting is required
+    assert bucket.reserve(2.0, now=200.0) == 0.0
+    assert bucket.expires == pytest.approx(202.0)
+
+    # A burst allows several requests to be made back to back
+    bucket = TokenBucket()
+    assert bucket.reserve(1.0, burst=3, now=10.0) == 0.0
+    assert bucket.reserve(1.0, burst=3, now=10.0) == 0.0
+    assert bucket.reserve(1.0, burst=3, now=10.0) == 0.0
+    assert bucket.reserve(1.0, burst=3, now=10.0) == pytest.approx(1.0)
+    assert bucket.expires == pytest.approx(14.0)
+
+    # Our tokens never exceed the burst allowed
+    assert bucket.reserve(1.0, burst=3, now=100.0) == 0.0
+    assert bucket.tokens == pytest.approx(2.0)
+
+    # A last_io overrides what we were tracking
+    bucket = TokenBucket()
+    assert bucket.reserve(1.0, last_io=9.5, now=10.0) == pytest.approx(0.5)
+    assert bucket.reserve(1.0, last_io=0.0, now=10.0) == 0.0
+
+    # A forced wait applies even if we have tokens to spare
+    bucket = TokenBucket()
+    assert bucket.reserve(1.0, burst=5, wait=3.0, now=10.0) == 3.0
+
+    # ... and to everyone sharing the bucket until it elapses
+    assert bucket.reserve(1.0, burst=5, now=11.0) == pytest.approx(2.0)
+    assert bucket.reserve(1.0, burst=5, now=13.0) == 0.0
+    assert bucket.expires == pytest.approx(14.0)
+
+    # Forced waits do not require an interval
+    bucket = TokenBucket()
+    assert bucket.reserve(0.0, wait=2.0, now=10.0) == 2.0
+    assert bucket.reserve(0.0, now=11.0) == pytest.approx(1.0)
+    assert bucket.reserve(0.0, now=12.0) == 0.0
+    assert bucket.tokens is None
+
+    # Buckets can be serialized
+    bucket = TokenBucket()
+    bucket.reserve(1.0, burst=2, wait=1.0, now=10.0)
+    restored = TokenBucket.loads(bucket.dumps())
+    for attr in ("tokens", "updated", "until", "expires"):
+        assert getattr(restored, attr) == getattr(bucket, attr)
+
+    # Garbage is treated as a full bucket
+    for content in ("", "garbage", "[1, 2]", '["a", 1, 2, 3]', "null"):
+        restored = TokenBucket.loads(content)
+        assert restored.tokens is None
+        assert restored.reserve(1.0, now=10.0) == 0.0
+
+
+def test_rate_limiter_base():
+    """RateLimiter() base class"""
+
+    limiter = RateLimiter()
+    assert limiter.prune() == 0
+    with pytest.raises(NotImplementedError):
+        limiter.reserve("key", 1.0)
+
+
+def test_memory_rate_limiter():
+    """MemoryRateLimiter() shared buckets"""
+
+    # We are a singleton
+    limiter = MemoryRateLimiter()
+    assert limiter is MemoryRateLimiter()
+    assert len(limiter) == 0
+
+    with mock.patch("time.time", return_value=1000.0):
+        assert limiter.reserve("a", 1.0) == 0.0
+        assert limiter.reserve("a", 1.0) == pytest.approx(1.0)
+
+        # Each key has a budget of its own
+        assert limiter.reserve("b", 1.0) == 0.0
+        assert len(limiter) == 2
+
+        # Nothing is full yet
+        assert limiter.prune() == 0
+
+    # Full buckets are discarded
+    assert limiter.prune(now=1001.5) == 1
+    assert len(limiter) == 1
+    assert limiter.prune(now=1002.0) == 1
+    assert len(limiter) == 0
+
+    # Pruning also takes place periodically on its own
+    with mock.patch("time.time", return_value=1000.0):
+        limiter.reserve("a", 1.0)
+
+    with mock.patch("time.time", return_value=2000.0):
+        limiter.reserve("b", 1.0)
+
+    assert len(limiter) == 1
+
+
+def test_file_rate_limiter(tmpdir):
+    """FileRateLimiter() buckets stored on disk"""
+
+    path = str(tmpdir.join("ratelimit"))
+    limiter = FileRateLimiter(path)
+
+    # Nothing to prune
+    assert limiter.prune() == 0
+
+    with mock.patch("time.time", return_value=1000.0):
+        assert limiter.reserve("a", 1.0) == 0.0
+        assert len(os.listdir(path)) == 1
+
+        # Another limiter (such as one in another process) sharing the same
+        # path shares the same budget
+        assert FileRateLimiter(path).reserve("a", 1.0) == pytest.approx(1.0)
+
+        assert limiter.reserve("b", 1.0) == 0.0
+        assert len(os.listdir(path)) == 2
+
+        # Files we do not recognize are left alone
+        tmpdir.join("ratelimit", "other.txt").write("")
+
+    # Full buckets are removed from disk
+    assert limiter.prune(now=1001.5) == 1
+    assert limiter.prune(now=1002.0) == 1
+    assert sorted(os.listdir(path)) == ["other.txt"]
+
+    # Our directory is recreated should it be removed from under us
+    os.unlink(os.path.join(path, "other.txt"))
+    os.rmdir(path)
+    with mock.patch("time.time", return_value=1000.0):
+        assert limiter.reserve("a", 1.0) == 0.0
+        assert len(os.listdir(path)) == 1
+    assert limiter.prune(now=1002.0) == 1
+    tmpdir.join("ratelimit", "other.txt").write("")
+
+    # Corrupt buckets are treated as full
+    with mock.patch("time.time", return_value=1000.0):
+        assert limiter.reserve("a", 1.0) == 0.0
+        (entry,) = (e for e in os.listdir(path) if e != "other.txt")
+        tmpdir.join("ratelimit", entry).write("garbage")
+        assert limiter.reserve("a", 1.0) == 0.0
+        assert limiter.reserve("a", 1.0) == pytest.approx(1.0)
+
+    # We fall back to tracking our buckets in memory if we can not write to
+    # our path
+    limiter = FileRateLimiter(str(tmpdir.join("other.txt")))
+    tmpdir.join("other.txt").write("")
+    with mock.patch("time.time", return_value=1000.0):
+        assert limiter.reserve("a", 1.0) == 0.0
+        assert limiter.reserve("a", 1.0) == pytest.approx(1.0)
+
+    assert len(MemoryRateLimiter()) == 1
+
+
+def test_file_rate_limiter_instance(tmpdir):
+    """FileRateLimiter.instance() sharing"""
+
+    path = str(tmpdir.join("ratelimit"))
+    limiter = FileRateLimiter.instance(path)
+    assert isinstance(limiter, FileRateLimiter)
+    assert limiter.path == path
+
+    # One limiter is kept per path
+    assert FileRateLimiter.instance(path) is limiter
+    assert FileRateLimiter.instance(str(tmpdir.join("other"))) is not limiter
+
+
+def test_throttle_shared_budget():
+    """URLBase.throttle() shares a budget between identical credentials"""
+
+    class RateNotification(NotifyBase):
+        request_rate_per_sec = 2.0
+        url_identifier = ("rate", "token")
+
+        def url(self, **kwargs):
+            return "rate://"
+
+    a = RateNotification()
+    b = RateNotification()
+    assert a.ratelimit_key() == b.ratelimit_key()
+    assert a.ratelimit_key().startswith(
+        f"{RateNotification.__module__}.{RateNotification.__qualname__}/"
+    )
+
+    with mock.patch("time.sleep") as mock_sleep:
+        a.throttle()
+        assert mock_sleep.call_count == 0
+
+        # Our second instance shares the same budget
+        b.throttle()
+        assert mock_sleep.call_count == 1
+        assert 1.5 < mock_sleep.call_args[0][0] <= 2.0
+
+        # A forced wait is honoured; it is never shorter than the time our
+        # budget requires us to wait for
+        mock_sleep.reset_mock()
+        a.throttle(wait=10.0)
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args[0][0] == 10.0
+
+        # Everyone sharing our budget honours the wait too; even those with
+        # no throttle limit of their own
+        mock_sleep.reset_mock()
+        c = RateNotification()
+        c.request_rate_per_sec = 0
+        c.throttle()
+        assert mock_sleep.call_count == 1
+        assert 9.0 < mock_sleep.call_args[0][0] <= 10.0
+
+        # A wait on an instance that has not made any i/o yet is ignored
+        MemoryRateLimiter().clear()
+        mock_sleep.reset_mock()
+        c = RateNotification()
+        c.request_rate_per_sec = 0
+        c.throttle(wait=10.0)
+        assert mock_sleep.call_count == 0
+
+        # ... but applied thereafter (and to everyone sharing our budget)
+        c.throttle(wait=1.0)
+        assert mock_sleep.call_count == 1
+        assert mock_sleep.call_args[0][0] == 1.0
+
+    # Plugins that can not be identified have a budget of their own
+    class AnonymousNotification(RateNotification):
+        url_identifier = False
+
+    a = AnonymousNotification()
+    b = AnonymousNotification()
+    assert a.ratelimit_key() is None
+
+    with mock.patch("time.sleep") as mock_sleep:
+        a.throttle()
+        b.throttle()
+        assert mock_sleep.call_count == 0
+
+        a.throttle(last_io=datetime.now() - timedelta(seconds=1))
+        assert mock_sleep.call_count == 1
+        assert 0.5 < mock_sleep.call_args[0][0] <= 1.0
+
+    # Our asynchronous throttle never blocks the event loop
+    MemoryRateLimiter().clear()
+    a = RateNotification()
+    b = RateNotification()
+
+    async def throttle():
+        await a.async_throttle()
+        await b.async_throttle()
+
+    with (
+        mock.patch("time.sleep") as mock_sleep,
+        mock.patch(
+            "asyncio.sleep", new_callable=mock.AsyncMock
+        ) as mock_async_sleep,
+    ):
+        asyncio.run(throttle())
+        assert mock_sleep.call_count == 0
+        assert mock_async_sleep.call_count == 1
+        assert 1.5 < mock_async_sleep.call_args[0][0] <= 2.0
+
+
+def test_throttle_deferred_without_rate_limit(tmpdir):
+    """URLBase.throttle() honours deferrals when no rate limit is set"""
+
+    class NoRateNotification(NotifyBase):
+        request_rate_per_sec = 0
+        url_identifier = ("norate", "token")
+
+        def url(self, **kwargs):
+            return "norate://"
+
+    a = NoRateNotification()
+    b = NoRateNotification()
+
+    with mock.patch("time.sleep") as mock_sleep:
+        # Nothing was deferred; no bucket is created just to check
+        a.throttle()
+        b.throttle()
+        assert mock_sleep.call_count == 0
+        assert len(MemoryRateLimiter()) == 0
+
+        # Our upstream server asked us to hold off
+        a.defer(5.0)
+        b.throttle()
+        assert mock_sleep.call_count == 1
+        assert 4.0 < mock_sleep.call_args[0][0] <= 5.0
+
+    # Our asynchronous throttle honours it too
+    async def throttle():
+        await a.async_throttle()
+
+    with mock.patch(
+        "asyncio.sleep", new_callable=mock.AsyncMock
+    ) as mock_async_sleep:
+        asyncio.run(throttle())
+        assert mock_async_sleep.call_count == 1
+        assert 4.0 < mock_async_sleep.call_args[0][0] <= 5.0
+
+    # Plugins that can not be identified track deferrals on their own
+    class AnonymousNotification(NoRateNotification):
+        url_identifier = False
+
+    c = AnonymousNotification()
+    with mock.patch("time.sleep") as mock_sleep:
+        c.throttle()
+        assert mock_sleep.call_count == 0
+        c.defer(3.0)
+        c.throttle()
+        assert mock_sleep.call_count == 1
+        assert 2.0 < mock_sleep.call_args[0][0] <= 3.0
+
+    # Deferrals are shared through our persistent storage too
+    asset = AppriseAsset(
+        storage_path=str(tmpdir),
+        storage_mode=PersistentStoreMode.AUTO,
+        persistent_rate_limits=True,
+    )
+    a = NoRateNotification(asset=asset)
+    b = NoRateNotification(asset=asset)
+    path = os.path.join(str(tmpdir), RATELIMIT_STORAGE_DIR)
+    with mock.patch("time.sleep") as mock_sleep:
+        a.throttle()
+        assert mock_sleep.call_count == 0
+
+        # No file is written just to check
+        assert not os.path.exists(path)
+
+        a.defer(5.0)
+        b.throttle()
+        assert mock_sleep.call_count == 1
+        assert 4.0 < mock_sleep.call_args[0][0] <= 5.0
+
+
+def test_throttle_rate_limiter_selection(tmpdir):
+    """URLBase.rate_limiter() selection"""
+
+    path = str(tmpdir)
+
+    obj = NotifyBase()
+    assert obj.rate_limiter() is MemoryRateLimiter()
+
+    # Persistent rate limits require persistent storage
+    obj = NotifyBase(asset=AppriseAsset(persistent_rate_limits=True))
+    assert obj.rate_limiter() is MemoryRateLimiter()
+
+    obj = NotifyBase(
+        asset=AppriseAsset(
+            persistent_rate_limits=True,
+            storage_path=path,
+            storage_mode=PersistentStoreMode.MEMORY,
+        )
+    )
+    assert obj.rate_limiter() is MemoryRateLimiter()
+
+    obj = NotifyBase(
+        asset=AppriseAsset(persistent_rate_limits=True, storage_path=path)
+    )
+    limiter = obj.rate_limiter()
+    assert isinstance(limiter, FileRateLimiter)
+    assert limiter.path == os.path.join(path, RATELIMIT_STORAGE_DIR)
+
+    # The same limiter is shared by everyone using the same path
+    assert obj.rate_limiter() is limiter
+    obj = NotifyBase(
+        asset=AppriseAsset(persistent_rate_limits=True, storage_path=path)
+    )
+    assert obj.rate_limiter() is limiter
+
+    # A rate limiter of our own always takes priority
+    custom = mock.Mock(spec=RateLimiter)
+    custom.reserve.return_value = 0.0
+    obj = NotifyBase(
+        asset=AppriseAsset(
+            rate_limiter=custom, persistent_rate_limits=True, storage_path=path
+        )
+    )
+    assert obj.rate_limiter() is custom
+
+    obj.request_rate_per_sec = 1.0
+    with mock.patch("time.sleep") as mock_sleep:
+        obj.throttle()
+        obj.throttle()
+        assert mock_sleep.call_count == 0
+
+    assert custom.reserve.call_count == 2
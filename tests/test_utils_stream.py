@@ -0,0 +1,269 @@
+# BSD 2-Clause License
+#
+# Apprise - Push Notification Library.
+# Copyright (c) 2026, Chris Caron <lead2gold@gmail.com>
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import asyncio
+import base64
+import json
+import logging
+from unittest import mock
+
+import pytest
+import requests
+from urllib3 import encode_multipart_formdata
+
+from apprise import Apprise, exception
+from apprise.attachment.file import AttachFile
+from apprise.attachment.memory import AttachMemory
+from apprise.plugins.custom_form import NotifyForm
+from apprise.plugins.custom_json import NotifyJSON
+from apprise.utils.stream import (
+    StreamBody,
+    base64_length,
+    json_body,
+    multipart_body,
+)
+
+# Disable logging for a cleaner testing output
+logging.disable(logging.CRITICAL)
+
+
+def test_base64_length():
+    """Base64 lengths are computed without encoding anything"""
+    for size in range(10):
+        assert base64_length(size) == len(base64.b64encode(b"a" * size))
+
+
+def test_attach_base64_chunks(tmpdir):
+    """Attachments can be base64 encoded one chunk at a time"""
+    path = tmpdir.join("content.bin")
+    path.write_binary(bytes(range(256)) * 10)
+
+    for attachment in (
+        AttachFile(str(path)),
+        AttachMemory(content=bytes(range(256)) * 10),
+    ):
+        expected = attachment.base64(encoding=None)
+        for size in (1, 2, 3, 100, 1000, 5000):
+            chunks = list(attachment.base64_chunks(size))
+            assert b"".join(chunks) == expected
+            # Padding only ever appears at the very end
+            assert all(b"=" not in chunk for chunk in chunks[:-1])
+
+        # Memory attachments remain usable once they have been streamed
+        assert attachment.base64(encoding=None) == expected
+
+
+def test_stream_body():
+    """StreamBody() reads its parts as it is sent"""
+    produced = []
+
+    def factory():
+        for chunk in (b"de", b"fgh"):
+            produced.append(chunk)
+            yield chunk
+
+    body = StreamBody(
+        [(3, b"abc"), (0, b""), (5, factory), (1, b"i")], "text/plain"
+    )
+    assert len(body) == 9
+    assert body.content_type == "text/plain"
+
+    # Nothing is produced until it is read
+    assert not produced
+    assert body.read(2) == b"ab"
+    assert not produced
+    assert body.read(2) == b"cd"
+    assert produced == [b"de"]
+    assert body.tell() == 4
+    assert body.read(100) == b"efghi"
+    assert body.read(100) == b""
+    assert body.read() == b""
+    assert body.tell() == 9
+
+    # Bodies can be rewound (such as when a request is redirected)
+    assert body.seek(0) == 0
+    assert body.tell() == 0
+    assert body.read(4) == b"abcd"
+    assert body.read() == b"efghi"
+    assert body.read(0) == b""
+
+    with pytest.raises(OSError):
+        body.seek(1)
+
+    with pytest.raises(OSError):
+        body.seek(0, 2)
+
+    assert b"".join(body) == b"abcdefghi"
+
+    async def collect():
+        return [chunk async for chunk in body]
+
+    assert b"".join(asyncio.run(collect())) == b"abcdefghi"
+
+
+def test_json_body(tmpdir):
+    """json_body() streams attachments as base64 strings"""
+    path = tmpdir.join("content.bin")
+    path.write_binary(b"\x00\x01\x02" * 1000)
+
+    file_attach = AttachFile(str(path))
+    memory_attach = AttachMemory(content="apprise")
+
+    payload = {
+        "title": "Hello • World",
+        "attachments": [
+            {"name": "content.bin", "base64": file_attach},
+            {"name": "memory.txt", "base64": memory_attach},
+        ],
+        "tags": {"a"},
+    }
+
+    body = json_body(payload, chunk_size=100)
+    assert body.content_type == "application/json"
+
+    content = body.read()
+    assert len(content) == len(body)
+    assert json.loads(content) == {
+        "title": "Hello • World",
+        "attachments": [
+            {"name": "content.bin", "base64": file_attach.base64()},
+            {"name": "memory.txt", "base64": memory_attach.base64()},
+        ],
+        "tags": ["a"],
+    }
+
+    # Payloads without attachments work too
+    body = json_body({"a": "b"}, content_type="application/vnd+json")
+    assert body.read() == b'{"a": "b"}'
+    assert body.content_type == "application/vnd+json"
+
+    # Objects we can't otherwise serialize are still rejected
+    with pytest.raises(TypeError):
+        json_body({"a": object()})
+
+    # Missing attachments are detected up front
+    with pytest.raises(exception.AppriseFileNotFound):
+        json_body({"a": AttachFile(str(tmpdir.join("missing")))})
+
+
+def test_multipart_body(tmpdir):
+    """multipart_body() matches what the requests library would send"""
+    path = tmpdir.join("content.bin")
+    path.write_binary(b"\x00\x01\x02" * 1000)
+
+    fields = {"title": "Hello • World", "tags": ["a", "b"], "id": 1}
+    body = multipart_body(
+        fields,
+        [
+            ("file01", ('my "file".bin', AttachFile(str(path)), "a/b")),
+            ("file02", ("memory.txt", AttachMemory("apprise"), "text/plain")),
+        ],
+        boundary="apprise-boundary",
+        chunk_size=100,
+    )
+    assert (
+        body.content_type == "multipart/form-data; boundary=apprise-boundary"
+    )
+
+    expected, content_type = encode_multipart_formdata(
+        [
+            ("title", "Hello • World"),
+            ("tags", "a"),
+            ("tags", "b"),
+            ("id", "1"),
+            ("file01", ('my "file".bin', b"\x00\x01\x02" * 1000, "a/b")),
+            ("file02", ("memory.txt", b"apprise", "text/plain")),
+        ],
+        boundary="apprise-boundary",
+    )
+    assert content_type == body.content_type
+    content = body.read()
+    assert len(content) == len(body)
+    assert content == expected
+
+    # A boundary is otherwise generated for us
+    body = multipart_body({"a": b"b"})
+    assert body.read().startswith(b"--")
+    assert body.content_type.startswith("multipart/form-data; boundary=")
+
+    # Missing attachments are detected up front
+    with pytest.raises(exception.AppriseFileNotFound):
+        multipart_body(
+            files=[
+                ("file", ("a", AttachFile(str(tmpdir.join("missing"))), "a/b"))
+            ]
+        )
+
+
+@mock.patch("requests.request")
+def test_stream_plugins(mock_request, tmpdir):
+    """json:// and form:// stream attachments above their threshold"""
+    response = mock.Mock()
+    response.status_code = requests.codes.ok
+    response.content = b""
+    mock_request.return_value = response
+
+    path = tmpdir.join("content.bin")
+    path.write_binary(b"\x00\x01\x02" * 1000)
+    expected = base64.b64encode(b"\x00\x01\x02" * 1000).decode()
+
+    json_obj = Apprise()
+    assert json_obj.add("json://localhost/")
+    form_obj = Apprise()
+    assert form_obj.add("form://localhost/")
+
+    # Small attachments are loaded as they always were
+    assert json_obj.notify(body="body", attach=str(path))
+    assert form_obj.notify(body="body", attach=str(path))
+    assert mock_request.call_count == 2
+    json_call, form_call = mock_request.call_args_list
+    assert isinstance(json_call[1]["data"], str)
+    assert form_call[1]["files"]
+    mock_request.reset_mock()
+
+    with (
+        mock.patch.object(NotifyJSON, "attachment_stream_threshold", 100),
+        mock.patch.object(NotifyForm, "attachment_stream_threshold", 100),
+    ):
+        assert json_obj.notify(body="body", attach=str(path))
+        assert form_obj.notify(body="body", attach=str(path))
+
+    assert mock_request.call_count == 2
+    json_call, form_call = mock_request.call_args_list
+
+    body = json_call[1]["data"]
+    assert isinstance(body, StreamBody)
+    dataset = json.loads(body.read())
+    assert dataset["message"] == "body"
+    assert dataset["attachments"][0]["base64"] == expected
+
+    assert form_call[1]["files"] is None
+    body = form_call[1]["data"]
+    assert isinstance(body, StreamBody)
+    assert form_call[1]["headers"]["Content-Type"] == body.content_type
+    content = body.read()
+    assert b'name="message"\r\n\r\nbody\r\n' in content
+    assert b"\x00\x01\x02" * 1000 in content
@@ -328,6 +328,21 @@ def test_fetch_subdomain_success(mock_get):
     assert mock_get.call_count == 1
 
 
+def test_fetch_http_accessor():
+    """fetch() makes its requests through the http object provided."""
+    key_bytes = b"\x99fake-openpgp-key-data"
+
+    http = mock.Mock()
+    http.get.return_value = _make_resp(requests.codes.ok, chunks=[key_bytes])
+
+    with mock.patch("requests.get") as mock_get:
+        ctrl = AppriseWKDController(http=http)
+        assert ctrl.fetch("user@example.com") == key_bytes
+        assert mock_get.call_count == 0
+
+    assert http.get.call_count == 1
+
+
 @mock.patch("requests.get")
 def test_fetch_direct_fallback(mock_get):
     """fetch() tries the direct URL when the subdomain URL fails."""